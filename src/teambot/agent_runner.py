@@ -2,12 +2,14 @@
 
 from __future__ import annotations
 
+import asyncio
 import logging
 from multiprocessing import Queue
 from pathlib import Path
 from queue import Empty
 from typing import Any
 
+from teambot.copilot.cli_pool import get_cli_worker_pool
 from teambot.copilot.client import CopilotClient, CopilotConfig
 from teambot.history.frontmatter import HistoryMetadata
 from teambot.history.manager import HistoryFileManager
@@ -28,6 +30,7 @@ class AgentRunner:
         main_queue: Queue[AgentMessage],
         teambot_dir: Path,
         copilot_client: CopilotClient | None = None,
+        config: dict[str, Any] | None = None,
     ):
         self.agent_id = agent_id
         self.persona = persona
@@ -37,16 +40,19 @@ class AgentRunner:
         self.history_manager = HistoryFileManager(teambot_dir)
         self.running = False
         self.current_task: str | None = None
+        # Event loop for CLI calls; kept across tasks so pooled CLI workers survive
+        self._loop: asyncio.AbstractEventLoop | None = None
 
         # Initialize Copilot client
         if copilot_client is None:
-            config = CopilotConfig(
+            copilot_config = CopilotConfig(
                 allow_all_tools=True,
                 additional_dirs=[str(teambot_dir.parent)],
             )
             self.copilot_client = CopilotClient(
                 working_dir=teambot_dir.parent,
-                config=config,
+                config=copilot_config,
+                worker_pool=get_cli_worker_pool(config),
             )
         else:
             self.copilot_client = copilot_client
@@ -75,8 +81,18 @@ class AgentRunner:
                 logger.error(f"Agent {self.agent_id} error: {e}")
                 self._send_error(str(e))
 
+        self.close()
         logger.info(f"Agent {self.agent_id} stopped")
 
+    def close(self) -> None:
+        """Stop pooled CLI workers and close the event loop used for CLI calls."""
+        if self._loop is None:
+            return
+        if self.copilot_client.worker_pool is not None:
+            self._loop.run_until_complete(self.copilot_client.worker_pool.close())
+        self._loop.close()
+        self._loop = None
+
     def _handle_message(self, message: AgentMessage) -> None:
         """Handle an incoming message."""
         if message.type == MessageType.SHUTDOWN:
@@ -129,8 +145,14 @@ class AgentRunner:
                 "task": task,
             }
 
-        # Execute via Copilot CLI
-        result = self.copilot_client.execute(prompt)
+        # Execute via Copilot CLI, forwarding output as it is produced
+        if self._loop is None:
+            self._loop = asyncio.new_event_loop()
+        result = self._loop.run_until_complete(
+            self.copilot_client.execute_async(
+                prompt, on_chunk=lambda chunk: self._send_status("working", task, output=chunk)
+            )
+        )
 
         # Create history entry for this execution
         self._create_task_history(task, result.output, result.success)
@@ -173,13 +195,16 @@ class AgentRunner:
         _ = message.payload  # Store context for use in future tasks
         logger.debug(f"Agent {self.agent_id} received context from {message.source_agent}")
 
-    def _send_status(self, status: str, task: str | None = None) -> None:
-        """Send status update to orchestrator."""
+    def _send_status(self, status: str, task: str | None = None, output: str | None = None) -> None:
+        """Send status update to orchestrator, with output streamed so far if any."""
+        payload: dict[str, Any] = {"status": status, "task": task}
+        if output is not None:
+            payload["output"] = output
         msg = AgentMessage(
             type=MessageType.STATUS_UPDATE,
             source_agent=self.agent_id,
             target_agent="orchestrator",
-            payload={"status": status, "task": task},
+            payload=payload,
         )
         self.main_queue.put(msg)
 
@@ -272,10 +272,12 @@ async def _run_orchestration_async(
     """Async implementation of orchestration run."""
     from teambot.copilot.sdk_client import CopilotSDKClient
 
-    sdk_client = CopilotSDKClient()
+    sdk_client = CopilotSDKClient(config=loop.config)
     if not sdk_client.is_available():
         display.print_error("Copilot SDK not available - install github-copilot-sdk")
         raise RuntimeError("SDK not available")
+    # Retries and circuit breaker changes reach the console and notifications
+    sdk_client.set_event_callback(on_progress)
 
     try:
         await sdk_client.start()
@@ -372,6 +374,19 @@ def _run_orchestration(
         elif event_type == "acceptance_test_max_iterations_reached":
             iterations = data.get("iterations_used", 4)
             display.print_error(f"Acceptance tests still failing after {iterations} fix attempts")
+        elif event_type == "sdk_retry":
+            attempt = data.get("attempt", 2)
+            max_attempts = data.get("max_attempts", 3)
+            display.print_warning(
+                f"Retrying {data.get('agent_id')} ({attempt}/{max_attempts}): {data.get('error')}"
+            )
+        elif event_type == "circuit_open":
+            display.print_error(f"Model {data.get('model')} failing - circuit breaker opened")
+        elif event_type == "circuit_closed":
+            display.print_success(f"Model {data.get('model')} recovered - circuit breaker closed")
+        elif event_type == "model_fallback":
+            model, fallback = data.get("model"), data.get("fallback")
+            display.print_warning(f"Falling back from {model} to {fallback}")
 
         # Emit to EventBus for notifications (non-blocking)
         if event_bus is not None:
@@ -410,10 +425,12 @@ async def _run_orchestration_resume_async(
     """Async implementation of orchestration resume."""
     from teambot.copilot.sdk_client import CopilotSDKClient
 
-    sdk_client = CopilotSDKClient()
+    sdk_client = CopilotSDKClient(config=loop.config)
     if not sdk_client.is_available():
         display.print_error("Copilot SDK not available - install github-copilot-sdk")
         raise RuntimeError("SDK not available")
+    # Retries and circuit breaker changes reach the console and notifications
+    sdk_client.set_event_callback(on_progress)
 
     try:
         await sdk_client.start()
@@ -506,6 +523,19 @@ def _run_orchestration_resume(
         elif event_type == "acceptance_test_max_iterations_reached":
             iterations = data.get("iterations_used", 4)
             display.print_error(f"Acceptance tests still failing after {iterations} fix attempts")
+        elif event_type == "sdk_retry":
+            attempt = data.get("attempt", 2)
+            max_attempts = data.get("max_attempts", 3)
+            display.print_warning(
+                f"Retrying {data.get('agent_id')} ({attempt}/{max_attempts}): {data.get('error')}"
+            )
+        elif event_type == "circuit_open":
+            display.print_error(f"Model {data.get('model')} failing - circuit breaker opened")
+        elif event_type == "circuit_closed":
+            display.print_success(f"Model {data.get('model')} recovered - circuit breaker closed")
+        elif event_type == "model_fallback":
+            model, fallback = data.get("model"), data.get("fallback")
+            display.print_warning(f"Falling back from {model} to {fallback}")
 
         # Emit to EventBus for notifications (non-blocking)
         if event_bus is not None:
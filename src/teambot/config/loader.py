@@ -150,6 +150,40 @@ class ConfigLoader:
         if "notifications" in config:
             self._validate_notifications(config["notifications"])
 
+        # Validate task retention limits if present
+        if "task_retention" in config:
+            self._validate_task_retention(config["task_retention"])
+
+        # Validate session pool sizes if present
+        if "session_pool" in config:
+            self._validate_session_pool(config["session_pool"])
+
+        # Validate streaming chunk coalescing if present
+        if "streaming" in config:
+            self._validate_streaming(config["streaming"])
+
+        # Validate request telemetry settings if present
+        if "telemetry" in config:
+            self._validate_telemetry(config["telemetry"])
+
+        # Validate response cache settings if present
+        if "response_cache" in config:
+            self._validate_response_cache(config["response_cache"])
+
+        # Validate SDK retry and circuit breaker settings if present
+        if "retry" in config:
+            self._validate_retry(config["retry"])
+        if "circuit_breaker" in config:
+            self._validate_circuit_breaker(config["circuit_breaker"])
+
+        # Validate request deadline settings if present
+        if "timeouts" in config:
+            self._validate_timeouts(config["timeouts"])
+
+        # Validate CLI worker pool settings if present
+        if "cli_pool" in config:
+            self._validate_cli_pool(config["cli_pool"])
+
     def _validate_agent(self, agent: dict[str, Any], seen_ids: set[str]) -> None:
         """Validate a single agent configuration."""
         if "id" not in agent:
@@ -178,6 +212,29 @@ class ConfigLoader:
                 f"Use '/models' command to see available models."
             )
 
+        # Validate per-agent concurrency if present
+        if "max_concurrent" in agent:
+            max_concurrent = agent["max_concurrent"]
+            if (
+                not isinstance(max_concurrent, int)
+                or isinstance(max_concurrent, bool)
+                or max_concurrent < 1
+            ):
+                raise ConfigError(
+                    f"'max_concurrent' for agent '{agent_id}' must be a positive integer"
+                )
+
+        # Validate per-agent session pool sizes if present
+        self._validate_pool_sizes(agent, f"for agent '{agent_id}'")
+
+        # Validate per-agent request deadline if present
+        if "timeout_seconds" in agent:
+            value = agent["timeout_seconds"]
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+                raise ConfigError(
+                    f"'timeout_seconds' for agent '{agent_id}' must be a positive number"
+                )
+
     def _validate_default_agent(self, default_agent: str, seen_ids: set[str]) -> None:
         """Validate default_agent configuration."""
         if not isinstance(default_agent, str):
@@ -199,6 +256,195 @@ class ConfigLoader:
                 f"Use '/models' command to see available models."
             )
 
+    def _validate_task_retention(self, retention: dict[str, Any]) -> None:
+        """Validate task_retention configuration (null disables a limit)."""
+        if not isinstance(retention, dict):
+            raise ConfigError("'task_retention' must be an object")
+
+        for key in ("max_tasks", "max_output_bytes", "archive_max_bytes"):
+            value = retention.get(key)
+            if value is not None and (
+                not isinstance(value, int) or isinstance(value, bool) or value < 1
+            ):
+                raise ConfigError(f"'task_retention.{key}' must be a positive integer or null")
+
+        for key in ("max_age_seconds", "archive_max_age_seconds"):
+            max_age = retention.get(key)
+            if max_age is not None and (
+                not isinstance(max_age, (int, float)) or isinstance(max_age, bool) or max_age <= 0
+            ):
+                raise ConfigError(f"'task_retention.{key}' must be a positive number or null")
+
+    def _validate_session_pool(self, session_pool: dict[str, Any]) -> None:
+        """Validate session_pool configuration."""
+        if not isinstance(session_pool, dict):
+            raise ConfigError("'session_pool' must be an object")
+
+        self._validate_pool_sizes(session_pool, "in 'session_pool'")
+
+        timeout = session_pool.get("idle_timeout_seconds")
+        if timeout is not None and (
+            not isinstance(timeout, (int, float)) or isinstance(timeout, bool) or timeout <= 0
+        ):
+            raise ConfigError(
+                "'session_pool.idle_timeout_seconds' must be a positive number or null"
+            )
+
+        if "prewarm" in session_pool and not isinstance(session_pool["prewarm"], bool):
+            raise ConfigError("'session_pool.prewarm' must be a boolean")
+
+        cap = session_pool.get("max_live_sessions")
+        if cap is not None and (not isinstance(cap, int) or isinstance(cap, bool) or cap < 1):
+            raise ConfigError("'session_pool.max_live_sessions' must be a positive integer or null")
+
+    def _validate_pool_sizes(self, section: dict[str, Any], where: str) -> None:
+        """Validate min_sessions/max_sessions in a config section."""
+        for key, minimum in (("min_sessions", 0), ("max_sessions", 1)):
+            if key not in section:
+                continue
+            value = section[key]
+            if not isinstance(value, int) or isinstance(value, bool) or value < minimum:
+                kind = "a non-negative" if minimum == 0 else "a positive"
+                raise ConfigError(f"'{key}' {where} must be {kind} integer")
+
+        if (
+            "min_sessions" in section
+            and "max_sessions" in section
+            and section["min_sessions"] > section["max_sessions"]
+        ):
+            raise ConfigError(f"'min_sessions' {where} must not exceed 'max_sessions'")
+
+    def _validate_streaming(self, streaming: dict[str, Any]) -> None:
+        """Validate streaming configuration (coalesce_ms of 0 disables coalescing)."""
+        if not isinstance(streaming, dict):
+            raise ConfigError("'streaming' must be an object")
+
+        window = streaming.get("coalesce_ms", 0)
+        if not isinstance(window, (int, float)) or isinstance(window, bool) or window < 0:
+            raise ConfigError("'streaming.coalesce_ms' must be a non-negative number")
+
+        if "coalesce_bytes" in streaming:
+            value = streaming["coalesce_bytes"]
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise ConfigError("'streaming.coalesce_bytes' must be a positive integer")
+
+        if "flush_on_newline" in streaming and not isinstance(streaming["flush_on_newline"], bool):
+            raise ConfigError("'streaming.flush_on_newline' must be a boolean")
+
+    def _validate_telemetry(self, telemetry: dict[str, Any]) -> None:
+        """Validate telemetry configuration."""
+        if not isinstance(telemetry, dict):
+            raise ConfigError("'telemetry' must be an object")
+
+        if "enabled" in telemetry and not isinstance(telemetry["enabled"], bool):
+            raise ConfigError("'telemetry.enabled' must be a boolean")
+
+        for key, minimum in (("max_bytes", 1), ("backups", 0)):
+            if key not in telemetry:
+                continue
+            value = telemetry[key]
+            if not isinstance(value, int) or isinstance(value, bool) or value < minimum:
+                kind = "a non-negative" if minimum == 0 else "a positive"
+                raise ConfigError(f"'telemetry.{key}' must be {kind} integer")
+
+    def _validate_response_cache(self, cache: dict[str, Any]) -> None:
+        """Validate response_cache configuration (null ttl_seconds disables expiry)."""
+        if not isinstance(cache, dict):
+            raise ConfigError("'response_cache' must be an object")
+
+        for key in ("enabled", "workspace_fingerprint"):
+            if key in cache and not isinstance(cache[key], bool):
+                raise ConfigError(f"'response_cache.{key}' must be a boolean")
+
+        if "max_bytes" in cache:
+            value = cache["max_bytes"]
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise ConfigError("'response_cache.max_bytes' must be a positive integer")
+
+        ttl = cache.get("ttl_seconds")
+        if ttl is not None and (
+            not isinstance(ttl, (int, float)) or isinstance(ttl, bool) or ttl <= 0
+        ):
+            raise ConfigError("'response_cache.ttl_seconds' must be a positive number or null")
+
+    def _validate_retry(self, retry: dict[str, Any]) -> None:
+        """Validate retry configuration (max_attempts of 1 disables retries)."""
+        if not isinstance(retry, dict):
+            raise ConfigError("'retry' must be an object")
+
+        if "max_attempts" in retry:
+            value = retry["max_attempts"]
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise ConfigError("'retry.max_attempts' must be a positive integer")
+
+        for key in ("base_delay_seconds", "max_delay_seconds"):
+            if key not in retry:
+                continue
+            value = retry[key]
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+                raise ConfigError(f"'retry.{key}' must be a non-negative number")
+
+        if "jitter" in retry:
+            value = retry["jitter"]
+            is_number = isinstance(value, (int, float)) and not isinstance(value, bool)
+            if not is_number or not 0 <= value <= 1:
+                raise ConfigError("'retry.jitter' must be a number between 0 and 1")
+
+    def _validate_circuit_breaker(self, breaker: dict[str, Any]) -> None:
+        """Validate circuit_breaker configuration."""
+        if not isinstance(breaker, dict):
+            raise ConfigError("'circuit_breaker' must be an object")
+
+        if "failure_threshold" in breaker:
+            value = breaker["failure_threshold"]
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise ConfigError("'circuit_breaker.failure_threshold' must be a positive integer")
+
+        if "reset_seconds" in breaker:
+            value = breaker["reset_seconds"]
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0:
+                raise ConfigError("'circuit_breaker.reset_seconds' must be a positive number")
+
+        fallbacks = breaker.get("fallback_models", {})
+        if not isinstance(fallbacks, dict) or not all(
+            isinstance(k, str) and isinstance(v, str) and v for k, v in fallbacks.items()
+        ):
+            raise ConfigError(
+                "'circuit_breaker.fallback_models' must map model names to model names"
+            )
+
+    def _validate_timeouts(self, timeouts: dict[str, Any]) -> None:
+        """Validate timeouts configuration (null disables a timeout)."""
+        if not isinstance(timeouts, dict):
+            raise ConfigError("'timeouts' must be an object")
+
+        for key in ("request_seconds", "inactivity_seconds"):
+            value = timeouts.get(key)
+            if value is not None and (
+                not isinstance(value, (int, float)) or isinstance(value, bool) or value <= 0
+            ):
+                raise ConfigError(f"'timeouts.{key}' must be a positive number or null")
+
+    def _validate_cli_pool(self, cli_pool: dict[str, Any]) -> None:
+        """Validate cli_pool configuration."""
+        if not isinstance(cli_pool, dict):
+            raise ConfigError("'cli_pool' must be an object")
+
+        if "enabled" in cli_pool and not isinstance(cli_pool["enabled"], bool):
+            raise ConfigError("'cli_pool.enabled' must be a boolean")
+
+        for key in ("workers_per_directory", "max_requests_per_worker"):
+            if key not in cli_pool:
+                continue
+            value = cli_pool[key]
+            if not isinstance(value, int) or isinstance(value, bool) or value < 1:
+                raise ConfigError(f"'cli_pool.{key}' must be a positive integer")
+
+        if "health_check_seconds" in cli_pool:
+            value = cli_pool["health_check_seconds"]
+            if not isinstance(value, (int, float)) or isinstance(value, bool) or value < 0:
+                raise ConfigError("'cli_pool.health_check_seconds' must be a non-negative number")
+
     def _validate_notifications(self, notifications: dict[str, Any]) -> None:
         """Validate notifications configuration."""
         if not isinstance(notifications, dict):
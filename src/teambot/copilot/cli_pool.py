@@ -0,0 +1,305 @@
+"""Pool of long-lived Copilot CLI processes for the CLI backend.
+
+CopilotClient used to start a new ``copilot -p`` process for every prompt,
+paying CLI startup, authentication and tool discovery each time; for short
+tasks that dominated latency. A CLIWorkerPool instead keeps a few CLI
+processes running in server mode per working directory, each driven
+through the Copilot SDK, and sends prompts to them. Every prompt gets a
+fresh session, so requests don't share conversation state.
+
+Workers are recycled after a number of requests and after any failed or
+timed-out request, and a worker that has been idle for a while is
+health-checked with a ping before it is reused.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+import time
+from collections.abc import AsyncIterator, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any
+
+from teambot.copilot.sdk_client import EventKind, event_kind
+
+try:
+    from copilot import CopilotClient as SDKClient  # type: ignore
+except ImportError:
+    SDKClient = None  # SDK not installed
+
+logger = logging.getLogger(__name__)
+
+# Defaults applied when a configuration has no cli_pool section
+DEFAULT_WORKERS_PER_DIRECTORY = 2
+DEFAULT_MAX_REQUESTS = 50
+DEFAULT_HEALTH_CHECK_SECONDS = 60.0
+# How long a worker may take to answer a health check ping
+PING_TIMEOUT = 5.0
+
+# Creates the SDK client of a worker from CopilotClientOptions
+ClientFactory = Callable[[dict[str, Any]], Any]
+
+
+class CLIWorkerError(Exception):
+    """Error reported by a CLI worker while running a prompt."""
+
+    pass
+
+
+@dataclass
+class CLIPoolConfig:
+    """Size and recycling policy of the CLI worker pool.
+
+    Attributes:
+        enabled: Whether prompts go to pooled workers at all. Off unless
+            configured, since workers run through the SDK rather than
+            ``copilot -p``.
+        workers_per_directory: Workers kept per working directory; also the
+            number of prompts that run at once in one directory.
+        max_requests: Requests after which a worker is replaced.
+        health_check_seconds: Idle time after which a worker is pinged
+            before reuse.
+    """
+
+    enabled: bool = False
+    workers_per_directory: int = DEFAULT_WORKERS_PER_DIRECTORY
+    max_requests: int = DEFAULT_MAX_REQUESTS
+    health_check_seconds: float = DEFAULT_HEALTH_CHECK_SECONDS
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> CLIPoolConfig:
+        """Build settings from the ``cli_pool`` configuration section.
+
+        Args:
+            config: TeamBot configuration dict.
+
+        Returns:
+            Settings using configured values, falling back to the defaults.
+        """
+        section = (config or {}).get("cli_pool", {})
+        return cls(
+            enabled=section.get("enabled", False),
+            workers_per_directory=section.get(
+                "workers_per_directory", DEFAULT_WORKERS_PER_DIRECTORY
+            ),
+            max_requests=section.get("max_requests_per_worker", DEFAULT_MAX_REQUESTS),
+            health_check_seconds=section.get("health_check_seconds", DEFAULT_HEALTH_CHECK_SECONDS),
+        )
+
+
+class CLIWorker:
+    """One long-lived CLI process, driven through an SDK client."""
+
+    def __init__(self, client: Any, working_dir: Path, now: float):
+        """Initialize worker.
+
+        Args:
+            client: Started SDK client owning the CLI process.
+            working_dir: Directory the CLI runs in.
+            now: Current time of the pool's clock.
+        """
+        self.client = client
+        self.working_dir = working_dir
+        self.requests = 0
+        self.last_used = now
+
+    async def run(
+        self,
+        prompt: str,
+        session_config: dict[str, Any],
+        on_chunk: Callable[[str], None] | None = None,
+    ) -> str:
+        """Run a prompt on a new session and collect the streamed reply.
+
+        Args:
+            prompt: Prompt to send.
+            session_config: SDK session configuration.
+            on_chunk: Optional callback invoked for each streamed chunk.
+
+        Returns:
+            The complete reply.
+
+        Raises:
+            CLIWorkerError: If the CLI reports an error or aborts the request.
+        """
+        session = await self.client.create_session(
+            {**session_config, "streaming": True, "working_directory": str(self.working_dir)}
+        )
+        output: list[str] = []
+        done = asyncio.Event()
+        error: list[CLIWorkerError | None] = [None]
+
+        def on_event(event):
+            kind = event_kind(event.type)
+            if kind is EventKind.DELTA:
+                chunk = getattr(event.data, "delta_content", None) or getattr(
+                    event.data, "content", None
+                )
+                if chunk:
+                    output.append(chunk)
+                    if on_chunk:
+                        on_chunk(chunk)
+            elif kind is EventKind.ERROR:
+                error_type = getattr(event.data, "error_type", "Unknown")
+                message = getattr(event.data, "message", "Unknown error")
+                error[0] = CLIWorkerError(f"{error_type}: {message}")
+                done.set()
+            elif kind is EventKind.ABORT:
+                error[0] = CLIWorkerError("Request aborted")
+                done.set()
+            elif kind is EventKind.IDLE:
+                done.set()
+
+        unsubscribe = session.on(on_event)
+        try:
+            await session.send({"prompt": prompt})
+            await done.wait()
+        finally:
+            unsubscribe()
+            try:
+                await session.destroy()
+            except Exception as e:
+                logger.debug(f"Could not destroy CLI worker session: {e}")
+
+        if error[0]:
+            raise error[0]
+        return "".join(output)
+
+
+class CLIWorkerPool:
+    """Long-lived CLI workers, kept per working directory and CLI executable.
+
+    A request checks out an idle worker (starting one if there is none) and
+    holds it until the request finishes; at most ``workers_per_directory``
+    requests run at once per directory, later ones wait for a worker.
+    Must be used from a single event loop.
+    """
+
+    def __init__(
+        self,
+        config: CLIPoolConfig | None = None,
+        client_factory: ClientFactory | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize an empty pool.
+
+        Args:
+            config: Pool settings (defaults if None).
+            client_factory: Creates a worker's SDK client (the SDK's
+                CopilotClient by default).
+            clock: Monotonic time source (for testing).
+        """
+        self.config = config or CLIPoolConfig()
+        self._factory = client_factory or SDKClient
+        self._clock = clock
+        self._idle: dict[tuple[str, str], list[CLIWorker]] = {}
+        self._slots: dict[tuple[str, str], asyncio.Semaphore] = {}
+        self._busy: set[CLIWorker] = set()
+        self.started = 0
+        self.recycled = 0
+
+    @property
+    def live_workers(self) -> int:
+        """Number of running workers, idle or busy."""
+        return len(self._busy) + sum(len(idle) for idle in self._idle.values())
+
+    @asynccontextmanager
+    async def worker(self, working_dir: Path, cli_path: str) -> AsyncIterator[CLIWorker]:
+        """Check out a worker for the duration of a block.
+
+        A worker whose block raises (including on timeout or cancellation)
+        is stopped rather than reused, since its CLI may still be busy.
+
+        Args:
+            working_dir: Directory the CLI should run in.
+            cli_path: Path to the Copilot CLI executable.
+
+        Yields:
+            A healthy worker.
+        """
+        key = (str(Path(working_dir).resolve()), cli_path)
+        slots = self._slots.setdefault(key, asyncio.Semaphore(self.config.workers_per_directory))
+        async with slots:
+            worker = await self._checkout(key, Path(working_dir), cli_path)
+            self._busy.add(worker)
+            try:
+                yield worker
+            except BaseException:
+                self._busy.discard(worker)
+                await self._retire(worker, "failed request")
+                raise
+            self._busy.discard(worker)
+            worker.requests += 1
+            worker.last_used = self._clock()
+            if worker.requests >= self.config.max_requests:
+                await self._retire(worker, f"{worker.requests} requests", graceful=True)
+            else:
+                self._idle.setdefault(key, []).append(worker)
+
+    async def _checkout(self, key: tuple[str, str], working_dir: Path, cli_path: str) -> CLIWorker:
+        """Take a healthy idle worker, or start a new one."""
+        idle = self._idle.get(key, [])
+        while idle:
+            # Most recently used first: it is the least likely to need a ping
+            worker = idle.pop()
+            if self._clock() - worker.last_used < self.config.health_check_seconds:
+                return worker
+            if await self._is_healthy(worker):
+                return worker
+            await self._retire(worker, "failed health check")
+
+        client = self._factory({"cli_path": cli_path, "cwd": str(working_dir)})
+        await client.start()
+        self.started += 1
+        logger.debug(f"Started CLI worker in {working_dir}")
+        return CLIWorker(client, working_dir, self._clock())
+
+    async def _is_healthy(self, worker: CLIWorker) -> bool:
+        """Check that a worker's CLI still answers."""
+        try:
+            await asyncio.wait_for(worker.client.ping(), timeout=PING_TIMEOUT)
+        except Exception as e:
+            logger.debug(f"CLI worker in {worker.working_dir} failed health check: {e}")
+            return False
+        return True
+
+    async def _retire(self, worker: CLIWorker, reason: str, graceful: bool = False) -> None:
+        """Stop a worker's CLI process (killing it unless graceful)."""
+        self.recycled += 1
+        logger.debug(f"Recycling CLI worker in {worker.working_dir} ({reason})")
+        try:
+            if graceful:
+                await worker.client.stop()
+            else:
+                await worker.client.force_stop()
+        except Exception as e:
+            logger.debug(f"Could not stop CLI worker: {e}")
+
+    async def close(self) -> None:
+        """Stop all idle workers."""
+        idle = [worker for workers in self._idle.values() for worker in workers]
+        self._idle.clear()
+        for worker in idle:
+            try:
+                await worker.client.stop()
+            except Exception as e:
+                logger.debug(f"Could not stop CLI worker: {e}")
+
+
+def get_cli_worker_pool(config: dict | None) -> CLIWorkerPool | None:
+    """Get the CLI worker pool described by the ``cli_pool`` section.
+
+    Args:
+        config: TeamBot configuration dict.
+
+    Returns:
+        A new pool, or None unless pooling is enabled and the SDK that
+        drives the workers is installed.
+    """
+    pool_config = CLIPoolConfig.from_config(config)
+    if not pool_config.enabled or SDKClient is None:
+        return None
+    return CLIWorkerPool(pool_config)
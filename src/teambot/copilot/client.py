@@ -2,14 +2,86 @@
 
 from __future__ import annotations
 
+import asyncio
+import codecs
+import errno
 import logging
+import os
 import shutil
+import signal
 import subprocess
+import tempfile
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
 from dataclasses import dataclass, field
 from pathlib import Path
+from typing import TYPE_CHECKING
+
+if TYPE_CHECKING:
+    from teambot.copilot.cli_pool import CLIWorkerPool
 
 logger = logging.getLogger(__name__)
 
+# Bytes read from the CLI's output at a time when streaming
+READ_CHUNK_SIZE = 4096
+
+# Larger prompts are passed in a file rather than on the command line. Linux
+# refuses single arguments over 128 KiB (E2BIG) and Windows whole command
+# lines over 32K characters; command lines are also visible in the process table.
+DEFAULT_MAX_ARGV_PROMPT_BYTES = 32 * 1024
+
+# How a prompt reaches the CLI
+ARGV = "argv"
+FILE = "file"
+
+# Short prompt pointing the CLI at a prompt passed in a file
+FILE_PROMPT = (
+    "Your complete instructions are in the file {path}. Read the whole file first, "
+    "then carry out the instructions in it as if they had been given here."
+)
+
+# Error for a prompt the OS won't take on the command line when the file
+# transport is unavailable: without tools the CLI can't read the file
+PROMPT_TOO_LARGE = (
+    "Prompt of {size} bytes is too large for the command line ({cause}); "
+    "larger prompts are passed in a file, which requires allow_all_tools"
+)
+
+
+class PromptSizeHistogram:
+    """Counts of prompt sizes in power-of-four buckets, per transport."""
+
+    BUCKETS = (1024, 4096, 16384, 65536, 262144, 1048576)
+
+    def __init__(self):
+        self.counts = [0] * (len(self.BUCKETS) + 1)
+        self.transports: dict[str, int] = {}
+
+    def record(self, size: int, transport: str) -> None:
+        """Count a prompt of ``size`` bytes sent via ``transport``."""
+        index = next((i for i, bound in enumerate(self.BUCKETS) if size <= bound), -1)
+        self.counts[index] += 1
+        self.transports[transport] = self.transports.get(transport, 0) + 1
+
+    def __str__(self) -> str:
+        labels = [f"<={bound // 1024}K" for bound in self.BUCKETS]
+        labels.append(f">{self.BUCKETS[-1] // 1024}K")
+        pairs = zip(labels, self.counts, strict=True)
+        sizes = " ".join(f"{label}:{count}" for label, count in pairs)
+        transports = " ".join(f"{name}:{count}" for name, count in sorted(self.transports.items()))
+        return f"{sizes} ({transports})"
+
+
+# Sizes of the prompts sent to the CLI by this process
+prompt_sizes = PromptSizeHistogram()
+
+
+def _argv_too_long(error: OSError) -> bool:
+    """Check if launching failed because the command line was too long."""
+    return error.errno in (errno.E2BIG, errno.ENAMETOOLONG) or (
+        getattr(error, "winerror", None) == 206  # ERROR_FILENAME_EXCED_RANGE
+    )
+
 
 @dataclass
 class CopilotResult:
@@ -31,18 +103,29 @@ class CopilotConfig:
     additional_dirs: list[str] = field(default_factory=list)
     model: str | None = None
     timeout: int = 300  # 5 minutes default
+    # Prompts larger than this (UTF-8 bytes) are passed in a file, not on argv
+    max_argv_prompt_bytes: int = DEFAULT_MAX_ARGV_PROMPT_BYTES
 
 
 class CopilotClient:
-    """Client for invoking the Copilot CLI."""
+    """Client for invoking the Copilot CLI.
+
+    Prompts larger than ``max_argv_prompt_bytes`` are written to a private
+    temporary file that the CLI is asked to read, instead of being passed
+    on the command line; a prompt the OS rejects as too long is retried
+    that way too. With a worker pool, execute_async() sends prompts to
+    long-lived CLI processes instead of starting ``copilot -p`` for each one.
+    """
 
     def __init__(
         self,
         working_dir: Path | None = None,
         config: CopilotConfig | None = None,
+        worker_pool: CLIWorkerPool | None = None,
     ):
         self.working_dir = working_dir or Path.cwd()
         self.config = config or CopilotConfig()
+        self.worker_pool = worker_pool
         self._copilot_path: str | None = None
 
     @property
@@ -78,18 +161,8 @@ class CopilotClient:
         if context:
             full_prompt = f"{context}\n\n{prompt}"
 
-        cmd = self._build_command(full_prompt)
-        logger.info(f"Executing Copilot CLI: {' '.join(cmd[:3])}...")
-        logger.debug(f"Full command: {cmd}")
-
         try:
-            result = subprocess.run(
-                cmd,
-                cwd=self.working_dir,
-                capture_output=True,
-                text=True,
-                timeout=self.config.timeout,
-            )
+            result = self._run(full_prompt)
 
             success = result.returncode == 0
             return CopilotResult(
@@ -128,6 +201,283 @@ class CopilotClient:
                 prompt=full_prompt,
             )
 
+    def _run(self, full_prompt: str) -> subprocess.CompletedProcess[str]:
+        """Run the CLI on a prompt, retrying via a file if argv is too long."""
+        transport = self._choose_transport(full_prompt)
+        while True:
+            with self._prompt_command(full_prompt, transport) as cmd:
+                logger.info(f"Executing Copilot CLI: {' '.join(cmd[:3])}...")
+                logger.debug(f"Full command: {cmd}")
+                try:
+                    return subprocess.run(
+                        cmd,
+                        cwd=self.working_dir,
+                        capture_output=True,
+                        text=True,
+                        timeout=self.config.timeout,
+                    )
+                except OSError as e:
+                    if transport != ARGV or not _argv_too_long(e):
+                        raise
+                    if not self.config.allow_all_tools:
+                        raise ValueError(self._too_large(full_prompt, e)) from e
+                    logger.warning(f"Prompt too long for the command line ({e}), using a file")
+            transport = FILE
+
+    async def execute_async(
+        self,
+        prompt: str,
+        context: str | None = None,
+        on_chunk: Callable[[str], None] | None = None,
+    ) -> CopilotResult:
+        """Execute a prompt without blocking the event loop.
+
+        Output is passed to ``on_chunk`` as the CLI writes it, and any number
+        of calls can run concurrently on one event loop. The CLI runs in its
+        own process group, which is killed on timeout or when the calling
+        task is cancelled, so tools it started don't outlive the request.
+
+        Args:
+            prompt: The prompt/task to send to Copilot CLI
+            context: Optional additional context to prepend to the prompt
+            on_chunk: Optional callback invoked with each piece of output
+
+        Returns:
+            CopilotResult with output and status
+        """
+        full_prompt = prompt
+        if context:
+            full_prompt = f"{context}\n\n{prompt}"
+
+        if self.worker_pool is not None and self._worker_can_serve():
+            return await self._execute_on_worker(full_prompt, on_chunk)
+
+        transport = self._choose_transport(full_prompt)
+        while True:
+            with self._prompt_command(full_prompt, transport) as cmd:
+                logger.info(f"Executing Copilot CLI: {' '.join(cmd[:3])}...")
+                logger.debug(f"Full command: {cmd}")
+                try:
+                    process = await asyncio.create_subprocess_exec(
+                        *cmd,
+                        cwd=self.working_dir,
+                        stdin=asyncio.subprocess.DEVNULL,
+                        stdout=asyncio.subprocess.PIPE,
+                        stderr=asyncio.subprocess.PIPE,
+                        start_new_session=True,
+                    )
+                except FileNotFoundError:
+                    logger.error("Copilot CLI not found")
+                    return CopilotResult(
+                        success=False,
+                        output="",
+                        error="Copilot CLI not found in PATH",
+                        exit_code=-1,
+                        prompt=full_prompt,
+                    )
+                except Exception as e:
+                    error = str(e)
+                    if transport == ARGV and isinstance(e, OSError) and _argv_too_long(e):
+                        if self.config.allow_all_tools:
+                            logger.warning(
+                                f"Prompt too long for the command line ({e}), using a file"
+                            )
+                            transport = FILE
+                            continue
+                        error = self._too_large(full_prompt, e)
+                    logger.error(f"Copilot CLI error: {error}")
+                    return CopilotResult(
+                        success=False,
+                        output="",
+                        error=error,
+                        exit_code=-1,
+                        prompt=full_prompt,
+                    )
+                # The prompt file must outlive the CLI
+                return await self._collect(process, full_prompt, on_chunk)
+
+    async def _collect(
+        self,
+        process: asyncio.subprocess.Process,
+        full_prompt: str,
+        on_chunk: Callable[[str], None] | None,
+    ) -> CopilotResult:
+        """Stream a running CLI's output until it exits or times out."""
+        output: list[str] = []
+
+        async def communicate() -> tuple[bytes, int]:
+            # stderr is drained alongside stdout so neither pipe can fill up
+            stderr = asyncio.ensure_future(process.stderr.read())
+            try:
+                await self._stream_output(process.stdout, output, on_chunk)
+                return await stderr, await process.wait()
+            finally:
+                stderr.cancel()
+
+        try:
+            stderr, exit_code = await asyncio.wait_for(communicate(), timeout=self.config.timeout)
+        except TimeoutError:
+            logger.error(f"Copilot CLI timed out after {self.config.timeout}s")
+            await self._kill(process)
+            return CopilotResult(
+                success=False,
+                output="".join(output),
+                error=f"Timeout after {self.config.timeout} seconds",
+                exit_code=-1,
+                prompt=full_prompt,
+            )
+        except BaseException:
+            # Cancelled (or the callback failed): don't leave the CLI running
+            await self._kill(process)
+            raise
+
+        error = stderr.decode("utf-8", errors="replace")
+        return CopilotResult(
+            success=exit_code == 0,
+            output="".join(output),
+            error=error if error else None,
+            exit_code=exit_code,
+            prompt=full_prompt,
+        )
+
+    def _worker_can_serve(self) -> bool:
+        """Check that a pooled worker can reach every directory the CLI may use.
+
+        Worker sessions only have access to the working directory; the
+        ``--add-dir`` grants of ``additional_dirs`` need a ``copilot -p`` run.
+        """
+        root = Path(self.working_dir).resolve()
+        return all(Path(d).resolve().is_relative_to(root) for d in self.config.additional_dirs)
+
+    async def _execute_on_worker(
+        self, full_prompt: str, on_chunk: Callable[[str], None] | None
+    ) -> CopilotResult:
+        """Execute a prompt on a pooled CLI worker.
+
+        Tool permissions follow ``allow_all_tools``: all requests are
+        approved, or all are denied as in non-interactive ``copilot -p``.
+        """
+        session_config: dict = {}
+        if self.config.model:
+            session_config["model"] = self.config.model
+        if self.config.allow_all_tools:
+            session_config["on_permission_request"] = lambda request, info: {"kind": "approved"}
+
+        output: list[str] = []
+
+        def relay(chunk: str) -> None:
+            output.append(chunk)
+            if on_chunk:
+                on_chunk(chunk)
+
+        try:
+            async with self.worker_pool.worker(self.working_dir, self.copilot_path) as worker:
+                await asyncio.wait_for(
+                    worker.run(full_prompt, session_config, relay), timeout=self.config.timeout
+                )
+        except TimeoutError:
+            logger.error(f"Copilot CLI timed out after {self.config.timeout}s")
+            return CopilotResult(
+                success=False,
+                output="".join(output),
+                error=f"Timeout after {self.config.timeout} seconds",
+                exit_code=-1,
+                prompt=full_prompt,
+            )
+        except Exception as e:
+            logger.error(f"Copilot CLI error: {e}")
+            return CopilotResult(
+                success=False,
+                output="".join(output),
+                error=str(e),
+                exit_code=-1,
+                prompt=full_prompt,
+            )
+
+        return CopilotResult(success=True, output="".join(output), prompt=full_prompt)
+
+    @staticmethod
+    async def _stream_output(
+        stream: asyncio.StreamReader,
+        output: list[str],
+        on_chunk: Callable[[str], None] | None,
+    ) -> None:
+        """Read a stream until EOF, passing decoded text on as it arrives."""
+        decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+        while True:
+            data = await stream.read(READ_CHUNK_SIZE)
+            text = decoder.decode(data, final=not data)
+            if text:
+                output.append(text)
+                if on_chunk:
+                    on_chunk(text)
+            if not data:
+                return
+
+    @staticmethod
+    async def _kill(process: asyncio.subprocess.Process) -> None:
+        """Kill the CLI's process group and wait for the CLI to exit."""
+        try:
+            if hasattr(os, "killpg"):
+                os.killpg(process.pid, signal.SIGKILL)
+            else:
+                process.kill()
+        except ProcessLookupError:
+            pass  # Already gone
+        await process.wait()
+
+    def _choose_transport(self, prompt: str) -> str:
+        """Decide how to pass a prompt to the CLI, and record its size.
+
+        The file transport relies on the CLI reading the file with a tool, so
+        without ``allow_all_tools`` every prompt goes on the command line, up
+        to what the OS accepts.
+        """
+        size = len(prompt.encode("utf-8"))
+        use_argv = size <= self.config.max_argv_prompt_bytes or not self.config.allow_all_tools
+        transport = ARGV if use_argv else FILE
+        prompt_sizes.record(size, transport)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(f"Prompt of {size} bytes via {transport}; prompt sizes: {prompt_sizes}")
+        return transport
+
+    @staticmethod
+    def _too_large(prompt: str, cause: OSError) -> str:
+        """Describe a prompt rejected by the OS when no file transport is available."""
+        return PROMPT_TOO_LARGE.format(size=len(prompt.encode("utf-8")), cause=cause.strerror)
+
+    @contextmanager
+    def _prompt_command(self, prompt: str, transport: str) -> Iterator[list[str]]:
+        """Build the CLI command for a prompt passed via ``transport``.
+
+        For the file transport the prompt is written to a private temporary
+        directory that the CLI is given access to; it is removed when the
+        block exits. If the file can't be written, the prompt is passed on
+        the command line after all.
+        """
+        if transport == ARGV:
+            yield self._build_command(prompt)
+            return
+
+        directory = None
+        try:
+            directory = tempfile.mkdtemp(prefix="teambot-prompt-")
+            path = Path(directory) / "prompt.md"
+            path.write_text(prompt, encoding="utf-8")
+        except OSError as e:
+            logger.warning(f"Could not write prompt file ({e}), passing prompt on command line")
+            if directory:
+                shutil.rmtree(directory, ignore_errors=True)
+            yield self._build_command(prompt)
+            return
+
+        try:
+            cmd = self._build_command(FILE_PROMPT.format(path=path))
+            cmd.extend(["--add-dir", directory])
+            yield cmd
+        finally:
+            shutil.rmtree(directory, ignore_errors=True)
+
     def _build_command(self, prompt: str) -> list[str]:
         """Build the Copilot CLI command with arguments."""
         cmd = [self.copilot_path, "-p", prompt]
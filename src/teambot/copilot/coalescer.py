@@ -0,0 +1,139 @@
+"""Coalescing of streamed response chunks.
+
+The SDK emits one ASSISTANT_MESSAGE_DELTA per few tokens, and every delta
+used to reach the output pane, the status panel and progress events on its
+own. A ChunkCoalescer sits between the SDK events and those consumers and
+passes chunks on in batches: when a short time window has passed since the
+first buffered chunk, when enough bytes are buffered, or when a line ends.
+Chunks are always delivered in order.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import logging
+from collections.abc import Callable
+from dataclasses import dataclass
+
+logger = logging.getLogger(__name__)
+
+# Defaults applied when a configuration has no streaming section
+DEFAULT_WINDOW_MS = 40
+DEFAULT_MAX_BYTES = 1024
+
+
+@dataclass
+class CoalescingConfig:
+    """How streamed chunks are batched before reaching consumers.
+
+    Attributes:
+        window_ms: Longest time a chunk is held back (0 disables coalescing).
+        max_bytes: Buffered UTF-8 bytes that trigger an immediate flush.
+        flush_on_newline: Whether a chunk containing a newline flushes the buffer.
+    """
+
+    window_ms: float = DEFAULT_WINDOW_MS
+    max_bytes: int = DEFAULT_MAX_BYTES
+    flush_on_newline: bool = True
+
+    @property
+    def enabled(self) -> bool:
+        """Check if chunks are coalesced at all."""
+        return self.window_ms > 0
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> CoalescingConfig:
+        """Build settings from the ``streaming`` configuration section.
+
+        Args:
+            config: TeamBot configuration dict.
+
+        Returns:
+            Settings using configured values, falling back to the defaults.
+        """
+        section = (config or {}).get("streaming", {})
+        return cls(
+            window_ms=section.get("coalesce_ms", DEFAULT_WINDOW_MS),
+            max_bytes=section.get("coalesce_bytes", DEFAULT_MAX_BYTES),
+            flush_on_newline=section.get("flush_on_newline", True),
+        )
+
+
+class ChunkCoalescer:
+    """Buffers streamed chunks and passes them on in batches.
+
+    Must be created and fed on the event loop thread; the flush timer runs
+    on the running loop.
+    """
+
+    def __init__(self, on_chunk: Callable[[str], None], config: CoalescingConfig | None = None):
+        """Initialize coalescer.
+
+        Args:
+            on_chunk: Consumer receiving the batched chunks.
+            config: Coalescing settings (defaults if None).
+        """
+        self._on_chunk = on_chunk
+        self._config = config or CoalescingConfig()
+        self._window = self._config.window_ms / 1000
+        self._buffer: list[str] = []
+        self._buffered_bytes = 0
+        self._timer: asyncio.TimerHandle | None = None
+        self._first_at = 0.0
+        self._loop = asyncio.get_running_loop()
+        self.chunks_in = 0
+        self.chunks_out = 0
+
+    def feed(self, chunk: str) -> None:
+        """Add a chunk, flushing if a threshold is reached.
+
+        Args:
+            chunk: Chunk received from the SDK.
+        """
+        if not chunk:
+            return
+
+        self.chunks_in += 1
+        if not self._buffer:
+            self._first_at = self._loop.time()
+            if self._timer is None:
+                self._timer = self._loop.call_later(self._window, self._on_timer)
+        self._buffer.append(chunk)
+        self._buffered_bytes += len(chunk) if chunk.isascii() else len(chunk.encode("utf-8"))
+
+        if self._buffered_bytes >= self._config.max_bytes or (
+            self._config.flush_on_newline and "\n" in chunk
+        ):
+            self.flush()
+
+    def _on_timer(self) -> None:
+        # The timer is left running across flushes; when it fires, flush
+        # text that has waited a full window and re-arm for younger text.
+        self._timer = None
+        if not self._buffer:
+            return
+        remaining = self._first_at + self._window - self._loop.time()
+        if remaining > 0:
+            self._timer = self._loop.call_later(remaining, self._on_timer)
+        else:
+            self.flush()
+
+    def flush(self) -> None:
+        """Pass all buffered chunks to the consumer as one chunk."""
+        if not self._buffer:
+            return
+
+        text = "".join(self._buffer)
+        self._buffer.clear()
+        self._buffered_bytes = 0
+        self.chunks_out += 1
+        self._on_chunk(text)
+
+    def close(self) -> None:
+        """Flush what is left; no timer stays scheduled afterwards."""
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        self.flush()
+        if self.chunks_in:
+            logger.debug("Coalesced %d chunks into %d", self.chunks_in, self.chunks_out)
@@ -0,0 +1,383 @@
+"""Retry and circuit breaker policy for SDK requests.
+
+A transient failure (a rate limit, a dropped connection, an expired
+session) used to fail the whole stage. The SDK client now retries such
+failures with exponential backoff and jitter, as decided by a RetryPolicy.
+
+Each model also has a CircuitBreaker. After several consecutive transient
+failures the breaker opens and requests for that model fail fast (or move
+to a configured fallback model) until a cool-down has passed, after which
+one trial request is let through to probe whether the model has recovered.
+
+Requests also have deadlines (per call, stage, agent or configuration-wide)
+and an inactivity timeout for streams that stop producing events; see
+RequestTimeouts.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import random
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import dataclass, field
+from enum import Enum
+
+# Defaults applied when a configuration has no retry/circuit_breaker section
+DEFAULT_MAX_ATTEMPTS = 3
+DEFAULT_BASE_DELAY = 1.0
+DEFAULT_MAX_DELAY = 30.0
+DEFAULT_JITTER = 0.5
+DEFAULT_FAILURE_THRESHOLD = 5
+DEFAULT_RESET_SECONDS = 60.0
+DEFAULT_REQUEST_TIMEOUT = 1800.0
+DEFAULT_INACTIVITY_TIMEOUT = 600.0
+
+# Error message fragments of failures that are likely to go away on retry
+RETRYABLE_MARKERS = (
+    "session not found",
+    "rate limit",
+    "ratelimit",
+    "too many requests",
+    "429",
+    "timeout",
+    "timed out",
+    "temporarily unavailable",
+    "service unavailable",
+    "overloaded",
+    "bad gateway",
+    "gateway timeout",
+    "internal server error",
+    "connection reset",
+    "connection refused",
+    "connection error",
+    "connection closed",
+)
+
+
+def is_retryable(error: BaseException) -> bool:
+    """Decide whether an SDK failure is transient.
+
+    Cancellation and aborted requests are never retried. Errors with a
+    ``retryable`` attribute decide for themselves.
+
+    Args:
+        error: Error raised by a request attempt.
+
+    Returns:
+        True if the request is worth retrying.
+    """
+    if isinstance(error, asyncio.CancelledError):
+        return False
+    retryable = getattr(error, "retryable", None)
+    if isinstance(retryable, bool):
+        return retryable
+    if isinstance(error, (TimeoutError, ConnectionError)):
+        return True
+    message = str(error).lower().replace("_", " ")
+    if "aborted" in message:
+        return False
+    return any(marker in message for marker in RETRYABLE_MARKERS)
+
+
+@dataclass
+class RetryPolicy:
+    """How failed SDK requests are retried.
+
+    Attributes:
+        max_attempts: Attempts per request, including the first.
+        base_delay: Delay in seconds before the first retry; doubles per retry.
+        max_delay: Upper bound on the delay before a retry.
+        jitter: Fraction of each delay that is randomized away (0 to 1), so
+            concurrent requests don't retry in lockstep.
+        classifier: Decides which errors are retryable.
+    """
+
+    max_attempts: int = DEFAULT_MAX_ATTEMPTS
+    base_delay: float = DEFAULT_BASE_DELAY
+    max_delay: float = DEFAULT_MAX_DELAY
+    jitter: float = DEFAULT_JITTER
+    classifier: Callable[[BaseException], bool] = field(default=is_retryable)
+
+    def should_retry(self, error: BaseException, attempt: int) -> bool:
+        """Check if a failed attempt should be retried.
+
+        Args:
+            error: Error raised by the attempt.
+            attempt: Number of the attempt that failed (1-based).
+
+        Returns:
+            True if another attempt should be made.
+        """
+        return attempt < self.max_attempts and self.classifier(error)
+
+    def delay(self, attempt: int, rand: Callable[[], float] = random.random) -> float:
+        """Get the delay before retrying a failed attempt.
+
+        Args:
+            attempt: Number of the attempt that failed (1-based).
+            rand: Source of uniform random numbers in [0, 1).
+
+        Returns:
+            Seconds to wait.
+        """
+        delay = min(self.max_delay, self.base_delay * 2 ** (attempt - 1))
+        return delay * (1 - self.jitter * rand())
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> RetryPolicy:
+        """Build a policy from the ``retry`` configuration section.
+
+        Args:
+            config: TeamBot configuration dict.
+
+        Returns:
+            Policy using configured values, falling back to the defaults.
+        """
+        section = (config or {}).get("retry", {})
+        return cls(
+            max_attempts=section.get("max_attempts", DEFAULT_MAX_ATTEMPTS),
+            base_delay=section.get("base_delay_seconds", DEFAULT_BASE_DELAY),
+            max_delay=section.get("max_delay_seconds", DEFAULT_MAX_DELAY),
+            jitter=section.get("jitter", DEFAULT_JITTER),
+        )
+
+
+class CircuitState(Enum):
+    """State of a circuit breaker."""
+
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """Stops sending requests to a model that keeps failing.
+
+    Opens after ``failure_threshold`` consecutive failures. Once
+    ``reset_timeout`` has passed it is half-open: the next request is let
+    through as a trial (and the breaker re-opens for another cool-down
+    meanwhile). A success closes the breaker.
+    """
+
+    def __init__(
+        self,
+        failure_threshold: int = DEFAULT_FAILURE_THRESHOLD,
+        reset_timeout: float = DEFAULT_RESET_SECONDS,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize breaker in the closed state.
+
+        Args:
+            failure_threshold: Consecutive failures that open the breaker.
+            reset_timeout: Seconds before an open breaker allows a trial.
+            clock: Monotonic time source (for testing).
+        """
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self._clock = clock
+        self._failures = 0
+        self._opened_at: float | None = None
+
+    @property
+    def state(self) -> CircuitState:
+        """Get the current state."""
+        if self._opened_at is None:
+            return CircuitState.CLOSED
+        if self._clock() - self._opened_at >= self.reset_timeout:
+            return CircuitState.HALF_OPEN
+        return CircuitState.OPEN
+
+    @property
+    def retry_after(self) -> float:
+        """Seconds until an open breaker allows a trial request."""
+        if self._opened_at is None:
+            return 0.0
+        return max(0.0, self._opened_at + self.reset_timeout - self._clock())
+
+    def allow(self) -> bool:
+        """Check if a request may be sent, claiming the trial if half-open.
+
+        Returns:
+            True if the request may be sent.
+        """
+        state = self.state
+        if state is CircuitState.HALF_OPEN:
+            # One trial per cool-down; others keep failing fast meanwhile
+            self._opened_at = self._clock()
+            return True
+        return state is CircuitState.CLOSED
+
+    def record_success(self) -> bool:
+        """Record a successful request.
+
+        Returns:
+            True if this closed a breaker that was open.
+        """
+        was_open = self._opened_at is not None
+        self._failures = 0
+        self._opened_at = None
+        return was_open
+
+    def record_failure(self) -> bool:
+        """Record a failed request.
+
+        Returns:
+            True if this opened the breaker.
+        """
+        self._failures += 1
+        if self._opened_at is not None:
+            # A failed trial starts another cool-down
+            self._opened_at = self._clock()
+            return False
+        if self._failures >= self.failure_threshold:
+            self._opened_at = self._clock()
+            return True
+        return False
+
+
+@dataclass
+class CircuitBreakerConfig:
+    """Circuit breaker settings shared by all models.
+
+    Attributes:
+        failure_threshold: Consecutive failures that open a model's breaker.
+        reset_timeout: Seconds before an open breaker allows a trial.
+        fallback_models: Model to use while a model's breaker is open
+            (``default`` stands for the SDK default model).
+    """
+
+    failure_threshold: int = DEFAULT_FAILURE_THRESHOLD
+    reset_timeout: float = DEFAULT_RESET_SECONDS
+    fallback_models: dict[str, str] = field(default_factory=dict)
+
+    def fallback_for(self, model: str | None) -> str | None:
+        """Get the fallback model of a model, if one is configured."""
+        return self.fallback_models.get(model or "default")
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> CircuitBreakerConfig:
+        """Build settings from the ``circuit_breaker`` configuration section.
+
+        Args:
+            config: TeamBot configuration dict.
+
+        Returns:
+            Settings using configured values, falling back to the defaults.
+        """
+        section = (config or {}).get("circuit_breaker", {})
+        return cls(
+            failure_threshold=section.get("failure_threshold", DEFAULT_FAILURE_THRESHOLD),
+            reset_timeout=section.get("reset_seconds", DEFAULT_RESET_SECONDS),
+            fallback_models=dict(section.get("fallback_models", {})),
+        )
+
+
+# Deadline applied to requests made in the current block (see timeout_scope)
+_scoped_timeout: ContextVar[float | None] = ContextVar("teambot_request_timeout", default=None)
+
+
+@contextmanager
+def timeout_scope(seconds: float | None) -> Iterator[None]:
+    """Give each request made within the block a deadline.
+
+    Used for per-stage deadlines. Like stage_scope, the deadline follows
+    the current task, including tasks it starts.
+
+    Args:
+        seconds: Deadline of each request (None leaves the deadline unchanged).
+
+    Yields:
+        None.
+    """
+    if seconds is None:
+        yield
+        return
+    token = _scoped_timeout.set(seconds)
+    try:
+        yield
+    finally:
+        _scoped_timeout.reset(token)
+
+
+@dataclass(frozen=True)
+class Deadline:
+    """Event loop time by which a request must have finished.
+
+    Attributes:
+        seconds: Length of the deadline.
+        expires_at: Event loop time at which it expires.
+    """
+
+    seconds: float
+    expires_at: float
+
+    @classmethod
+    def after(cls, seconds: float) -> Deadline:
+        """Start a deadline on the running event loop."""
+        return cls(seconds, asyncio.get_running_loop().time() + seconds)
+
+    def remaining(self) -> float:
+        """Seconds left before the deadline (negative once expired)."""
+        return self.expires_at - asyncio.get_running_loop().time()
+
+
+@dataclass
+class RequestTimeouts:
+    """Deadlines and inactivity timeout of SDK requests.
+
+    Attributes:
+        default: Deadline of requests without a more specific one (None for
+            no deadline).
+        inactivity: Seconds a stream may go without any event before it is
+            considered stalled (None to wait indefinitely).
+        agents: Map of agent_id -> deadline for that agent's requests.
+    """
+
+    default: float | None = DEFAULT_REQUEST_TIMEOUT
+    inactivity: float | None = DEFAULT_INACTIVITY_TIMEOUT
+    agents: dict[str, float] = field(default_factory=dict)
+
+    def deadline_for(self, agent_id: str, timeout: float | None = None) -> Deadline | None:
+        """Start the deadline of a request.
+
+        The call's own timeout wins over the enclosing timeout_scope (the
+        stage), which wins over the agent's and then the default deadline.
+
+        Args:
+            agent_id: Agent the request is for.
+            timeout: Deadline passed with the call, if any.
+
+        Returns:
+            The started deadline, or None if the request has none.
+        """
+        seconds = timeout
+        if seconds is None:
+            seconds = _scoped_timeout.get()
+        if seconds is None:
+            seconds = self.agents.get(agent_id, self.default)
+        return Deadline.after(seconds) if seconds is not None else None
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> RequestTimeouts:
+        """Build timeouts from the ``timeouts`` section and agent entries.
+
+        Args:
+            config: TeamBot configuration dict.
+
+        Returns:
+            Timeouts using configured values, falling back to the defaults.
+        """
+        config = config or {}
+        section = config.get("timeouts", {})
+        return cls(
+            default=section.get("request_seconds", DEFAULT_REQUEST_TIMEOUT),
+            inactivity=section.get("inactivity_seconds", DEFAULT_INACTIVITY_TIMEOUT),
+            agents={
+                agent["id"]: agent["timeout_seconds"]
+                for agent in config.get("agents", [])
+                if "id" in agent and agent.get("timeout_seconds") is not None
+            },
+        )
@@ -0,0 +1,339 @@
+"""On-disk cache of agent responses.
+
+Re-running an objective after a crash, or asking the same question twice in
+the REPL, would otherwise pay full model latency again for an identical
+request. When enabled, the SDK client looks responses up here first.
+
+Entries are keyed by agent, resolved model, the normalized prompt and
+(optionally) a fingerprint of the workspace, so a changed working tree
+misses the cache. Each entry is a ``<key>.json`` file under
+``<teambot_dir>/cache``; the store is bounded by total size (least recently
+used entries are evicted first) and by entry age.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import logging
+import os
+import subprocess
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from pathlib import Path
+
+logger = logging.getLogger(__name__)
+
+# Defaults applied when response_cache is enabled without explicit limits
+DEFAULT_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_TTL_SECONDS = 7 * 24 * 60 * 60
+
+
+@dataclass
+class CacheStats:
+    """Usage of the response cache.
+
+    Attributes:
+        entries: Number of cached responses.
+        size_bytes: Total size of the cache files.
+        max_bytes: Size bound of the cache.
+        hits: Lookups answered from the cache since startup.
+        misses: Lookups not answered from the cache since startup.
+        evictions: Entries removed for size or age since startup.
+    """
+
+    entries: int
+    size_bytes: int
+    max_bytes: int
+    hits: int
+    misses: int
+    evictions: int
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups answered from the cache."""
+        lookups = self.hits + self.misses
+        return self.hits / lookups if lookups else 0.0
+
+
+def normalize_prompt(prompt: str) -> str:
+    """Normalize a prompt so insignificant whitespace doesn't miss the cache.
+
+    Line endings are unified, trailing whitespace is removed from each line
+    and leading/trailing blank lines are dropped.
+
+    Args:
+        prompt: Prompt as sent by the user or a stage.
+
+    Returns:
+        Normalized prompt.
+    """
+    lines = prompt.replace("\r\n", "\n").replace("\r", "\n").split("\n")
+    return "\n".join(line.rstrip() for line in lines).strip("\n")
+
+
+def make_key(
+    agent_id: str,
+    model: str | None,
+    prompt: str,
+    fingerprint: str | None = None,
+) -> str:
+    """Build the cache key of a request.
+
+    Args:
+        agent_id: Agent identifier.
+        model: Resolved model (None for the SDK default).
+        prompt: Prompt sent to the agent.
+        fingerprint: Optional workspace fingerprint.
+
+    Returns:
+        Hex SHA-256 digest identifying the request.
+    """
+    parts = [agent_id, model or "", normalize_prompt(prompt), fingerprint or ""]
+    return hashlib.sha256("\0".join(parts).encode("utf-8")).hexdigest()
+
+
+def workspace_fingerprint(root: Path) -> str | None:
+    """Fingerprint the state of a git working tree.
+
+    Covers the checked-out commit, uncommitted changes to tracked files and
+    the list of untracked files.
+
+    Args:
+        root: Directory inside the working tree.
+
+    Returns:
+        Hex digest of the workspace state, or None if it is not a git
+        repository or git is unavailable.
+    """
+    digest = hashlib.sha256()
+    for args in (
+        ["rev-parse", "HEAD"],
+        ["diff", "HEAD", "--no-ext-diff", "--binary"],
+        ["ls-files", "--others", "--exclude-standard"],
+    ):
+        try:
+            result = subprocess.run(
+                ["git", *args], cwd=root, capture_output=True, timeout=10, check=True
+            )
+        except (OSError, subprocess.SubprocessError):
+            return None
+        digest.update(result.stdout)
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+class ResponseCache:
+    """Size- and age-bounded on-disk store of agent responses.
+
+    An index of entries in least-recently-used order is built from the
+    directory on first use. A hit touches the entry's file, so recency
+    survives restarts.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int = DEFAULT_MAX_BYTES,
+        ttl: float | None = DEFAULT_TTL_SECONDS,
+        workspace: Path | None = None,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize cache.
+
+        Args:
+            directory: Directory holding cached responses.
+            max_bytes: Maximum total size of the cache files.
+            ttl: Seconds after which an entry expires (None to keep entries
+                until evicted for size).
+            workspace: Working tree whose fingerprint is part of each key
+                (None to ignore the workspace).
+            clock: Source of the current time (for testing).
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.ttl = ttl
+        self.workspace = workspace
+        self._clock = clock
+        # key -> file size, least recently used first
+        self._index: OrderedDict[str, int] | None = None
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+
+    def _path(self, key: str) -> Path | None:
+        # Keys are hex digests; refuse anything that could escape the directory
+        if not key or not key.isalnum():
+            return None
+        return self.directory / f"{key}.json"
+
+    def _load_index(self) -> OrderedDict[str, int]:
+        if self._index is not None:
+            return self._index
+
+        entries: list[tuple[float, str, int]] = []
+        try:
+            for path in self.directory.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path.stem, stat.st_size))
+        except OSError as e:
+            logger.warning("Could not read response cache %s: %s", self.directory, e)
+
+        entries.sort()
+        self._index = OrderedDict((key, size) for _, key, size in entries)
+        self._size = sum(self._index.values())
+        return self._index
+
+    def _remove(self, key: str) -> None:
+        index = self._load_index()
+        self._size -= index.pop(key, 0)
+        path = self._path(key)
+        if path is not None:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning("Could not remove cached response %s: %s", key, e)
+
+    def get(self, key: str) -> str | None:
+        """Look up a cached response.
+
+        Expired or unreadable entries are removed and count as misses.
+
+        Args:
+            key: Key from make_key().
+
+        Returns:
+            The cached response, or None on a miss.
+        """
+        index = self._load_index()
+        path = self._path(key)
+        if path is None or key not in index:
+            self._misses += 1
+            return None
+
+        try:
+            entry = json.loads(path.read_text(encoding="utf-8"))
+            response = entry["response"]
+            created_at = float(entry["created_at"])
+        except (OSError, ValueError, KeyError, TypeError) as e:
+            logger.warning("Discarding unreadable cached response %s: %s", key, e)
+            self._remove(key)
+            self._misses += 1
+            return None
+
+        if self.ttl is not None and self._clock() - created_at > self.ttl:
+            self._remove(key)
+            self._evictions += 1
+            self._misses += 1
+            return None
+
+        index.move_to_end(key)
+        try:
+            os.utime(path)
+        except OSError:
+            pass  # Recency is then only tracked for this process
+        self._hits += 1
+        return response
+
+    def put(self, key: str, response: str, agent_id: str, model: str | None) -> bool:
+        """Store a response, evicting least recently used entries to fit.
+
+        Args:
+            key: Key from make_key().
+            response: Response to cache.
+            agent_id: Agent that produced the response.
+            model: Model that produced the response.
+
+        Returns:
+            True if the response was stored.
+        """
+        path = self._path(key)
+        if path is None:
+            return False
+
+        data = json.dumps(
+            {
+                "agent_id": agent_id,
+                "model": model,
+                "created_at": self._clock(),
+                "response": response,
+            }
+        ).encode("utf-8")
+        if len(data) > self.max_bytes:
+            return False
+
+        index = self._load_index()
+        tmp_path = path.with_suffix(".tmp")
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            tmp_path.write_bytes(data)
+            os.replace(tmp_path, path)
+        except OSError as e:
+            logger.warning("Could not cache response %s: %s", key, e)
+            return False
+
+        self._size += len(data) - index.pop(key, 0)
+        index[key] = len(data)
+        while self._size > self.max_bytes:
+            oldest = next(iter(index))
+            self._remove(oldest)
+            self._evictions += 1
+        return True
+
+    def stats(self) -> CacheStats:
+        """Get cache usage.
+
+        Returns:
+            Entry count, size and hit counters.
+        """
+        index = self._load_index()
+        return CacheStats(
+            entries=len(index),
+            size_bytes=self._size,
+            max_bytes=self.max_bytes,
+            hits=self._hits,
+            misses=self._misses,
+            evictions=self._evictions,
+        )
+
+    def clear(self) -> int:
+        """Remove every cached response.
+
+        Returns:
+            Number of entries removed.
+        """
+        index = self._load_index()
+        count = len(index)
+        for key in list(index):
+            self._remove(key)
+        return count
+
+
+def get_response_cache(config: dict | None) -> ResponseCache | None:
+    """Get the response cache described by the ``response_cache`` section.
+
+    The cache is opt-in: it is only created when the section sets
+    ``enabled`` to true. With ``workspace_fingerprint`` set, keys also
+    cover the state of the current working tree.
+
+    Args:
+        config: TeamBot configuration dict.
+
+    Returns:
+        Cache under ``<teambot_dir>/cache``, or None if caching is disabled.
+    """
+    section = (config or {}).get("response_cache", {})
+    if not section.get("enabled", False):
+        return None
+    return ResponseCache(
+        Path(config.get("teambot_dir", ".teambot")) / "cache",
+        max_bytes=section.get("max_bytes", DEFAULT_MAX_BYTES),
+        ttl=section.get("ttl_seconds", DEFAULT_TTL_SECONDS),
+        workspace=Path.cwd() if section.get("workspace_fingerprint", False) else None,
+    )
@@ -3,10 +3,39 @@
 import asyncio
 import logging
 import os
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable, Iterator, Mapping
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import Enum
 from typing import Any
 
 from teambot.copilot.agent_loader import get_agent_loader
+from teambot.copilot.coalescer import ChunkCoalescer, CoalescingConfig
+from teambot.copilot.resilience import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    Deadline,
+    RequestTimeouts,
+    RetryPolicy,
+)
+from teambot.copilot.response_cache import (
+    ResponseCache,
+    get_response_cache,
+    make_key,
+    workspace_fingerprint,
+)
+from teambot.copilot.session_pool import (
+    PooledSession,
+    PoolStats,
+    SessionPool,
+    SessionPoolConfig,
+)
+from teambot.copilot.telemetry import (
+    RequestMetrics,
+    RequestTrace,
+    get_registry,
+    get_telemetry_log,
+)
 
 try:
     from copilot import CopilotClient  # type: ignore
@@ -18,6 +47,34 @@ except ImportError:
     SessionEventType = None
     SDK_AVAILABLE = False
 
+# Key of the request made in the current block (see request_scope)
+_request_key: ContextVar[str | None] = ContextVar("teambot_request_key", default=None)
+
+
+@contextmanager
+def request_scope(key: str | None) -> Iterator[None]:
+    """Tag requests made within the block so they can be cancelled on their own.
+
+    Used with task IDs: cancel_current_request() given the key aborts
+    only the session serving that request, leaving the agent's other
+    requests running. Like timeout_scope, the key follows the current
+    task, including tasks it starts.
+
+    Args:
+        key: Key of the request (None leaves the key unchanged).
+
+    Yields:
+        None.
+    """
+    if key is None:
+        yield
+        return
+    token = _request_key.set(key)
+    try:
+        yield
+    finally:
+        _request_key.reset(token)
+
 
 logger = logging.getLogger(__name__)
 
@@ -69,27 +126,166 @@ def resolve_model(
     return None
 
 
+class EventKind(Enum):
+    """SDK session events the streaming handler acts on."""
+
+    DELTA = "delta"
+    IDLE = "idle"
+    ERROR = "error"
+    ABORT = "abort"
+
+
+# SDK event type -> kind, filled as event types are first seen
+_event_kinds: dict[Any, EventKind | None] = {}
+# Guard against unbounded growth if an SDK produced ad-hoc event types
+_MAX_EVENT_KINDS = 256
+
+
+def _classify_event_type(event_type: Any) -> EventKind | None:
+    """Map an SDK event type (enum member or string) to the kind handled."""
+    # Normalize event type to string for comparison
+    event_type_str = str(event_type)
+    if hasattr(event_type, "value"):
+        event_type_str = str(event_type.value)
+    elif hasattr(event_type, "name"):
+        event_type_str = str(event_type.name)
+
+    # Normalize to uppercase for comparison
+    normalized = event_type_str.upper().replace(".", "_").replace("-", "_")
+
+    # Check specifically for ASSISTANT_MESSAGE_DELTA (not REASONING_DELTA)
+    if "ASSISTANT_MESSAGE_DELTA" in normalized:
+        return EventKind.DELTA
+    if "SESSION_IDLE" in normalized:
+        return EventKind.IDLE
+    if "ERROR" in normalized:
+        return EventKind.ERROR
+    if "ABORT" in normalized:
+        return EventKind.ABORT
+    return None
+
+
+def event_kind(event_type: Any) -> EventKind | None:
+    """Get the kind of an SDK event type.
+
+    The type is normalized once and the result cached, so each streamed
+    delta costs a single dict lookup.
+
+    Args:
+        event_type: The event's ``type`` (SessionEventType member or string).
+
+    Returns:
+        The kind of event, or None for events the client ignores.
+    """
+    try:
+        return _event_kinds[event_type]
+    except KeyError:
+        pass
+    except TypeError:
+        # Unhashable event type: classify every time
+        return _classify_event_type(event_type)
+
+    kind = _classify_event_type(event_type)
+    if len(_event_kinds) < _MAX_EVENT_KINDS:
+        _event_kinds[event_type] = kind
+    logger.debug("SDK event type %r handled as %s", event_type, kind)
+    return kind
+
+
 class SDKClientError(Exception):
     """Error raised by SDK client operations."""
 
     pass
 
 
+class CircuitOpenError(SDKClientError):
+    """Raised when a model's circuit breaker is open and no fallback is usable."""
+
+    def __init__(self, model: str | None, retry_after: float):
+        self.model = model
+        self.retry_after = retry_after
+        super().__init__(
+            f"Circuit open for model '{model or 'default'}' - not retrying for {retry_after:.0f}s"
+        )
+
+
+class SDKTimeoutError(SDKClientError):
+    """Raised when a request passes its deadline or its stream stalls.
+
+    The request is aborted on its session before this is raised. A stalled
+    stream (kind ``inactivity``) may be retried within the deadline; a
+    passed deadline (kind ``deadline``) is final.
+    """
+
+    DEADLINE = "deadline"
+    INACTIVITY = "inactivity"
+
+    def __init__(self, agent_id: str, timeout: float, kind: str = DEADLINE):
+        self.agent_id = agent_id
+        self.timeout = timeout
+        self.kind = kind
+        self.retryable = kind == self.INACTIVITY
+        if kind == self.INACTIVITY:
+            message = f"No response from '{agent_id}' for {timeout:g}s - request aborted"
+        else:
+            message = f"Request for '{agent_id}' timed out after {timeout:g}s"
+        super().__init__(message)
+
+
 class CopilotSDKClient:
     """Wrapper around the Copilot SDK for agent communication.
 
     Provides session management per agent with TeamBot-specific
-    session ID prefixing for persistence across restarts.
+    session ID prefixing for persistence across restarts. Each agent has
+    a pool of sessions, so several requests for the same agent can run at
+    once, each on its own session. With ``response_cache`` enabled,
+    identical requests are answered from an on-disk cache.
+
+    Transient failures are retried according to a RetryPolicy, and each
+    model has a circuit breaker that fails requests fast (or moves them to
+    a fallback model) while the model keeps failing. Requests that pass
+    their deadline, or whose stream goes quiet for too long, are aborted.
     """
 
     SESSION_PREFIX = "teambot-"
+    # How long to wait for the server to acknowledge aborting a timed-out request
+    ABORT_TIMEOUT = 5.0
+
+    def __init__(self, config: dict | None = None, retry_policy: RetryPolicy | None = None):
+        """Initialize the SDK client wrapper.
 
-    def __init__(self):
-        """Initialize the SDK client wrapper."""
+        Args:
+            config: Optional TeamBot configuration; session pool sizes are
+                read from ``session_pool`` and from each agent entry,
+                response caching from ``response_cache``, chunk
+                coalescing from ``streaming``, the request telemetry
+                file from ``telemetry``, retries from ``retry``, circuit
+                breakers from ``circuit_breaker`` and deadlines from
+                ``timeouts`` and each agent entry.
+            retry_policy: Optional policy replacing the configured one.
+        """
         self._client: Any = None
-        self._sessions: dict[str, Any] = {}
+        self._config = config or {}
+        pool_config = SessionPoolConfig.from_config(config)
+        self._prewarm = pool_config.prewarm
+        self._pool = SessionPool(self._create_session, pool_config, prefix=self.SESSION_PREFIX)
+        # Checked-out sessions by the key of the request using them (see request_scope)
+        self._requests: dict[str, PooledSession] = {}
         self._started = False
         self._authenticated = False
+        # Persona bytes not resent because the session already had them
+        self._persona_bytes_saved = 0
+        self._cache = get_response_cache(config)
+        self._coalescing = CoalescingConfig.from_config(config)
+        self._telemetry = get_telemetry_log(config)
+        self._retry = retry_policy or RetryPolicy.from_config(config)
+        self._breaker_config = CircuitBreakerConfig.from_config(config)
+        self._breakers: dict[str, CircuitBreaker] = {}
+        # Models whose requests currently go to their fallback model
+        self._falling_back: set[str] = set()
+        self._timeouts = RequestTimeouts.from_config(config)
+        self._on_event: Callable[[str, dict[str, Any]], None] | None = None
+        self._prewarm_task: asyncio.Task[int] | None = None
 
     def is_available(self) -> bool:
         """Check if the Copilot SDK is available.
@@ -112,6 +308,7 @@ class CopilotSDKClient:
         self._client = CopilotClient()
         await self._client.start()
         self._started = True
+        self._pool.start_eviction()
 
         # Check authentication status
         await self._check_auth()
@@ -165,14 +362,12 @@ class CopilotSDKClient:
         if not self._started:
             return
 
-        # Destroy all active sessions
-        for session in self._sessions.values():
-            try:
-                await session.destroy()
-            except Exception:
-                pass  # Best effort cleanup
+        if self._prewarm_task is not None:
+            self._prewarm_task.cancel()
+            self._prewarm_task = None
 
-        self._sessions.clear()
+        # Destroy all active sessions
+        await self._pool.close()
 
         if self._client:
             await self._client.stop()
@@ -184,7 +379,9 @@ class CopilotSDKClient:
         """Get an existing session or create a new one for an agent.
 
         Configures the session with the agent's custom persona from
-        .github/agents/{agent_id}.agent.md if available.
+        .github/agents/{agent_id}.agent.md if available. Naming a model
+        selects that model's sessions for the agent's later requests; the
+        agent's sessions for its previous model are destroyed.
 
         Args:
             agent_id: The agent identifier (e.g., 'pm', 'builder-1').
@@ -199,21 +396,74 @@ class CopilotSDKClient:
         if not self._started:
             raise SDKClientError("Client not started - call start() first")
 
-        session_id = f"{self.SESSION_PREFIX}{agent_id}"
+        return await self._pool.get(agent_id, model)
 
-        # Return cached session if exists AND model matches
-        if session_id in self._sessions:
-            existing = self._sessions[session_id]
-            # If model changed, destroy old session and create new one
-            if model and getattr(existing, "_model", None) != model:
-                try:
-                    await existing.destroy()
-                except Exception:
-                    pass  # Best effort cleanup
-                del self._sessions[session_id]
+    async def prewarm(
+        self,
+        agent_ids: Iterable[str],
+        models: Mapping[str, str | None] | None = None,
+    ) -> int:
+        """Open sessions for agents ahead of their first request.
+
+        Sessions are created concurrently, so session creation and agent
+        definition parsing are off the critical path of the first request.
+        Agents that already have sessions are skipped; failures are logged
+        and left for the first request to surface.
+
+        Args:
+            agent_ids: Agents to warm.
+            models: Model per agent (agents not listed use their current model).
+
+        Returns:
+            Number of sessions opened.
+        """
+        if not self._started or not self._prewarm:
+            return 0
+
+        models = models or {}
+        agents = list(dict.fromkeys(a for a in agent_ids if a))
+        results = await asyncio.gather(
+            *(self._pool.warm(agent_id, models.get(agent_id)) for agent_id in agents),
+            return_exceptions=True,
+        )
+        opened = 0
+        for agent_id, result in zip(agents, results, strict=True):
+            if isinstance(result, BaseException):
+                logger.warning(f"Could not pre-warm session for '{agent_id}': {result}")
             else:
-                return existing
+                opened += result
+        if opened:
+            logger.debug(f"Pre-warmed {opened} sessions for {len(agents)} agents")
+        return opened
+
+    def start_prewarm(self) -> asyncio.Task[int] | None:
+        """Start warming the sessions of the configured agents in the background.
+
+        Each agent is warmed for its current model, which requests that
+        don't name a model check out, so the first such request reuses the
+        warmed session. The task is cancelled by stop().
+
+        Returns:
+            The warming task, or None if there is nothing to warm.
+        """
+        agent_ids = [a["id"] for a in self._config.get("agents", []) if a.get("id")]
+        if not self._started or not self._prewarm or not agent_ids:
+            return None
+
+        self._prewarm_task = asyncio.get_running_loop().create_task(self.prewarm(agent_ids))
+        return self._prewarm_task
+
+    async def _create_session(self, session_id: str, agent_id: str, model: str | None) -> Any:
+        """Create an SDK session for an agent.
+
+        Args:
+            session_id: Identifier for the new session.
+            agent_id: The agent identifier.
+            model: Optional model to use for this session.
 
+        Returns:
+            The SDK session object.
+        """
         # Load agent definition from .github/agents/
         loader = get_agent_loader()
         agent_def = loader.get_agent(agent_id)
@@ -246,20 +496,271 @@ class CopilotSDKClient:
 
         # Track model for cache invalidation
         session._model = model
-
-        self._sessions[session_id] = session
         return session
 
+    def get_pool_stats(self) -> list[PoolStats]:
+        """Get session pool utilization per agent and model.
+
+        Returns:
+            PoolStats for every sub-pool in use.
+        """
+        return self._pool.get_stats()
+
+    @property
+    def response_cache(self) -> ResponseCache | None:
+        """Get the response cache, or None if caching is disabled."""
+        return self._cache
+
+    async def _cache_key(self, agent_id: str, prompt: str) -> str | None:
+        """Build the response cache key of a request.
+
+        Args:
+            agent_id: The agent identifier.
+            prompt: The user's original prompt.
+
+        Returns:
+            Cache key, or None if caching is disabled.
+        """
+        if self._cache is None:
+            return None
+
+        fingerprint = None
+        if self._cache.workspace is not None:
+            fingerprint = await asyncio.to_thread(workspace_fingerprint, self._cache.workspace)
+        return make_key(agent_id, self._pool.current_model(agent_id), prompt, fingerprint)
+
+    async def _cached(
+        self,
+        agent_id: str,
+        prompt: str,
+        send: Callable[[], Awaitable[tuple[str, str | None]]],
+        on_chunk: Callable[[str], None] | None = None,
+    ) -> str:
+        """Answer a request from the response cache, or send it and cache the reply.
+
+        Cached replies are replayed through on_chunk line by line, so the
+        UI renders them as it would a streamed reply.
+
+        Args:
+            agent_id: The agent identifier.
+            prompt: The user's original prompt.
+            send: Sends the request when it is not cached, returning the
+                response and the model that produced it.
+            on_chunk: Optional callback for replayed chunks.
+
+        Returns:
+            The response content.
+        """
+        key = await self._cache_key(agent_id, prompt)
+        if key is None:
+            response, _ = await send()
+            return response
+
+        trace = RequestTrace(agent_id, self._pool.current_model(agent_id))
+        cached = self._cache.get(key)
+        if cached is not None:
+            logger.debug(f"Response cache hit for {agent_id}")
+            if on_chunk:
+                for chunk in cached.splitlines(keepends=True):
+                    on_chunk(chunk)
+            self._record(trace.finish(cached, cached=True))
+            return cached
+
+        response, model = await send()
+        # A fallback model's reply must not answer later requests for the agent's model
+        if response and model == self._pool.current_model(agent_id):
+            self._cache.put(key, response, agent_id, model)
+        return response
+
+    def _record(self, metrics: RequestMetrics) -> None:
+        """Add a finished request to the metrics registry and telemetry file."""
+        get_registry().record_request(metrics)
+        if self._telemetry:
+            self._telemetry.write(metrics)
+
+    async def _traced(self, agent_id: str, run: Callable[[RequestTrace], Awaitable[str]]) -> str:
+        """Run one request attempt under a trace and record its metrics.
+
+        Args:
+            agent_id: The agent identifier.
+            run: Sends the request, reporting progress on the trace.
+
+        Returns:
+            The response content.
+        """
+        trace = RequestTrace(agent_id, self._pool.current_model(agent_id))
+        try:
+            response = await run(trace)
+        except BaseException as e:
+            self._record(trace.finish(error=e))
+            raise
+        self._record(trace.finish(response))
+        return response
+
+    def set_event_callback(self, callback: Callable[[str, dict[str, Any]], None] | None) -> None:
+        """Set the callback receiving retry and circuit breaker events.
+
+        Events are ``sdk_retry``, ``circuit_open``, ``circuit_closed`` and
+        ``model_fallback``, each with a data dict (agent_id, model, ...).
+
+        Args:
+            callback: Called as callback(event_type, data), or None.
+        """
+        self._on_event = callback
+
+    def _emit(self, event_type: str, data: dict[str, Any]) -> None:
+        """Report an event to the callback, never failing the request."""
+        if self._on_event is None:
+            return
+        try:
+            self._on_event(event_type, data)
+        except Exception as e:
+            logger.warning(f"Event callback failed for {event_type}: {e}")
+
+    def _breaker(self, model: str | None) -> CircuitBreaker:
+        """Get the circuit breaker of a model."""
+        key = model or "default"
+        breaker = self._breakers.get(key)
+        if breaker is None:
+            breaker = self._breakers[key] = CircuitBreaker(
+                self._breaker_config.failure_threshold, self._breaker_config.reset_timeout
+            )
+        return breaker
+
+    def _select_model(self, agent_id: str) -> str | None:
+        """Choose the model for a request attempt, honouring circuit breakers.
+
+        Args:
+            agent_id: The agent identifier.
+
+        Returns:
+            The agent's model, or its fallback while the model's breaker is open.
+
+        Raises:
+            CircuitOpenError: If the breaker is open and no fallback is usable.
+        """
+        model = self._pool.current_model(agent_id)
+        breaker = self._breaker(model)
+        if breaker.allow():
+            return model
+
+        fallback = self._breaker_config.fallback_for(model)
+        if fallback and fallback != model and self._breaker(fallback).allow():
+            key = model or "default"
+            if key not in self._falling_back:
+                self._falling_back.add(key)
+                logger.warning(f"Model '{key}' unavailable, falling back to '{fallback}'")
+                self._emit(
+                    "model_fallback",
+                    {"agent_id": agent_id, "model": key, "fallback": fallback},
+                )
+            return fallback
+        raise CircuitOpenError(model, breaker.retry_after)
+
+    async def _resilient(
+        self,
+        agent_id: str,
+        attempt: Callable[[str | None], Awaitable[str]],
+        can_retry: Callable[[], bool] = lambda: True,
+        deadline: Deadline | None = None,
+    ) -> tuple[str, str | None]:
+        """Send a request under the retry policy and the circuit breakers.
+
+        Expired sessions are retried at once on a fresh session; other
+        retryable failures after a backoff delay. Failures other than
+        expired sessions count towards the model's circuit breaker.
+
+        Args:
+            agent_id: The agent identifier.
+            attempt: Sends the request once on the given model.
+            can_retry: Checked after a failure; returns False if the failed
+                attempt had effects a retry would repeat.
+            deadline: Deadline of the request; no retry is started that
+                could not begin before it.
+
+        Returns:
+            The response content and the model that produced it.
+
+        Raises:
+            CircuitOpenError: If the model's breaker is open and no fallback
+                is usable.
+        """
+        number = 0
+        while True:
+            number += 1
+            model = self._select_model(agent_id)
+            breaker = self._breaker(model)
+            try:
+                response = await attempt(model)
+            except Exception as e:
+                session_expired = self._is_session_not_found(e)
+                if not session_expired and self._retry.classifier(e) and breaker.record_failure():
+                    logger.warning(f"Circuit opened for model '{model or 'default'}': {e}")
+                    self._emit(
+                        "circuit_open",
+                        {
+                            "model": model or "default",
+                            "failures": breaker.failure_threshold,
+                            "reset_seconds": breaker.reset_timeout,
+                            "fallback": self._breaker_config.fallback_for(model),
+                        },
+                    )
+                if not (self._retry.should_retry(e, number) and can_retry()):
+                    raise
+
+                delay = 0.0 if session_expired else self._retry.delay(number)
+                if deadline is not None and delay >= deadline.remaining():
+                    raise
+                logger.warning(
+                    f"Request for '{agent_id}' failed ({e}), retrying in {delay:.1f}s "
+                    f"(attempt {number + 1}/{self._retry.max_attempts})"
+                )
+                self._emit(
+                    "sdk_retry",
+                    {
+                        "agent_id": agent_id,
+                        "model": model or "default",
+                        "attempt": number + 1,
+                        "max_attempts": self._retry.max_attempts,
+                        "delay": round(delay, 1),
+                        "error": str(e),
+                    },
+                )
+                await asyncio.sleep(delay)
+                continue
+
+            if breaker.record_success():
+                key = model or "default"
+                self._falling_back.discard(key)
+                logger.info(f"Circuit closed for model '{key}'")
+                self._emit("circuit_closed", {"model": key})
+            return response, model
+
+    def _is_broken_session(self, error: BaseException) -> bool:
+        """Check if a failed request left its session unfit for reuse.
+
+        Besides expired sessions, this covers timed-out requests: their
+        late events could otherwise end the next request on the session.
+        The pool destroys such sessions before reusing their IDs.
+        """
+        return isinstance(error, SDKTimeoutError) or self._is_session_not_found(error)
+
+    async def _abort_timed_out(self, lease: PooledSession, error: SDKTimeoutError) -> None:
+        """Abort a timed-out request on its session (best effort)."""
+        logger.warning(f"{error} (session {lease.session_id})")
+        try:
+            await asyncio.wait_for(lease.session.abort(), timeout=self.ABORT_TIMEOUT)
+        except Exception as e:
+            logger.debug(f"Abort of timed-out request on {lease.session_id} failed: {e}")
+
     def _invalidate_session(self, agent_id: str) -> None:
-        """Remove a cached session so it will be recreated on next use.
+        """Forget an agent's sessions so they will be recreated on next use.
 
         Args:
             agent_id: The agent identifier.
         """
-        session_id = f"{self.SESSION_PREFIX}{agent_id}"
-        if session_id in self._sessions:
-            del self._sessions[session_id]
-            logger.info(f"Invalidated stale session for '{agent_id}'")
+        self._pool.invalidate(agent_id)
+        logger.info(f"Invalidated sessions for '{agent_id}'")
 
     @staticmethod
     def _is_session_not_found(error: Exception) -> bool:
@@ -267,12 +768,38 @@ class CopilotSDKClient:
         msg = str(error).lower()
         return "session not found" in msg
 
+    @property
+    def persona_bytes_saved(self) -> int:
+        """Get the persona bytes not resent to sessions that already had them."""
+        return self._persona_bytes_saved
+
+    def _prompt_for_session(self, lease: PooledSession, user_prompt: str) -> str:
+        """Build the prompt to send on a session.
+
+        The persona is included only in a session's first prompt; later
+        prompts rely on it already being in the conversation. Recreated
+        sessions and sessions for another model start without it.
+
+        Args:
+            lease: Checked-out session.
+            user_prompt: The user's original prompt.
+
+        Returns:
+            Prompt to send.
+        """
+        full_prompt = self._build_prompt_with_persona(lease.agent_id, user_prompt)
+        if not lease.persona_sent or full_prompt == user_prompt:
+            return full_prompt
+
+        self._persona_bytes_saved += len(full_prompt.encode()) - len(user_prompt.encode())
+        return user_prompt
+
     def _build_prompt_with_persona(self, agent_id: str, user_prompt: str) -> str:
         """Build a prompt that includes the agent's persona context.
 
         Since the SDK doesn't reliably use custom_agents, we prepend
-        the agent's persona to every prompt to ensure the LLM knows
-        its identity and constraints.
+        the agent's persona to a session's first prompt to ensure the
+        LLM knows its identity and constraints.
 
         Args:
             agent_id: The agent identifier.
@@ -294,22 +821,22 @@ class CopilotSDKClient:
 
 User request: {user_prompt}"""
 
-    async def execute(self, agent_id: str, prompt: str, timeout: float = 120.0) -> str:
+    async def execute(self, agent_id: str, prompt: str, timeout: float | None = None) -> str:
         """Execute a prompt for a specific agent.
 
         Uses streaming internally but returns complete response.
-        The timeout parameter is kept for API compatibility but is not
-        enforced when streaming is enabled.
 
         Args:
             agent_id: The agent identifier.
             prompt: The prompt to send.
-            timeout: Timeout in seconds (kept for API compatibility).
+            timeout: Deadline in seconds, overriding the stage, agent and
+                configured deadlines.
 
         Returns:
             The response content from the SDK.
 
         Raises:
+            SDKTimeoutError: If the request timed out and was aborted.
             SDKClientError: If client is not started or error occurs.
         """
         if not self._started:
@@ -318,153 +845,300 @@ User request: {user_prompt}"""
         # Check if streaming is disabled via env var
         if os.environ.get("TEAMBOT_STREAMING", "").lower() == "false":
             # Fallback to blocking mode - inject persona here
-            full_prompt = self._build_prompt_with_persona(agent_id, prompt)
+            return await self._cached(
+                agent_id, prompt, lambda: self._execute_blocking(agent_id, prompt, timeout)
+            )
+
+        # Use streaming (default) - persona injection happens in execute_streaming
+        return await self.execute_streaming(
+            agent_id, prompt, on_chunk=lambda _: None, timeout=timeout
+        )
+
+    async def _execute_blocking(
+        self, agent_id: str, prompt: str, timeout: float | None = None
+    ) -> tuple[str, str | None]:
+        """Execute a prompt in blocking mode under the retry policy."""
+        deadline = self._timeouts.deadline_for(agent_id, timeout)
+
+        async def attempt(model: str | None) -> str:
             try:
-                session = await self.get_or_create_session(agent_id)
-                response = await session.send_and_wait({"prompt": full_prompt, "timeout": timeout})
-                return response.data.content
-            except TimeoutError as e:
-                raise SDKClientError(f"Request timed out after {timeout}s") from e
+                return await self._send_and_wait(agent_id, prompt, deadline, model)
+            except SDKClientError:
+                raise
             except Exception as e:
-                if self._is_session_not_found(e):
-                    logger.warning(f"Session expired for '{agent_id}', recreating and retrying")
-                    self._invalidate_session(agent_id)
-                    try:
-                        session = await self.get_or_create_session(agent_id)
-                        response = await session.send_and_wait(
-                            {"prompt": full_prompt, "timeout": timeout}
-                        )
-                        return response.data.content
-                    except Exception as retry_e:
-                        raise SDKClientError(f"SDK error: {retry_e}") from retry_e
                 raise SDKClientError(f"SDK error: {e}") from e
 
-        # Use streaming (default) - persona injection happens in execute_streaming
-        return await self.execute_streaming(agent_id, prompt, on_chunk=lambda _: None)
+        return await self._resilient(agent_id, attempt, deadline=deadline)
 
     async def execute_streaming(
         self,
         agent_id: str,
         prompt: str,
         on_chunk: Callable[[str], None] | None = None,
+        timeout: float | None = None,
     ) -> str:
         """Execute a prompt with streaming output.
 
         Sends prompt and streams response chunks via callback.
-        Does not timeout - runs until completion or cancellation.
-        Automatically retries once with a fresh session if the server
-        reports the session as expired/not found.
+        Runs until completion, cancellation or the request's deadline: the
+        call's timeout, else the enclosing stage's (see timeout_scope), the
+        agent's or the configured ``timeouts.request_seconds``. A stream
+        that produces no event for ``timeouts.inactivity_seconds`` is
+        aborted as stalled.
+        Transient failures are retried according to the retry policy, on a
+        fresh session if the server reports the session as expired/not
+        found. Responses found in the response cache are replayed through
+        the callback instead.
 
         Args:
             agent_id: The agent identifier.
             prompt: The prompt to send.
             on_chunk: Optional callback invoked for each streaming chunk.
+            timeout: Deadline in seconds, overriding the stage, agent and
+                configured deadlines.
 
         Returns:
             Complete accumulated response content.
 
         Raises:
+            SDKTimeoutError: If the request timed out and was aborted.
             SDKClientError: If client is not started or error occurs.
         """
         if not self._started:
             raise SDKClientError("Client not started - call start() first")
 
-        try:
-            return await self._execute_streaming_once(agent_id, prompt, on_chunk)
-        except SDKClientError as e:
-            if self._is_session_not_found(e):
-                logger.warning(f"Session expired for '{agent_id}', recreating and retrying")
-                self._invalidate_session(agent_id)
-                return await self._execute_streaming_once(agent_id, prompt, on_chunk)
-            raise
+        return await self._cached(
+            agent_id,
+            prompt,
+            lambda: self._execute_streaming_with_retry(agent_id, prompt, on_chunk, timeout),
+            on_chunk,
+        )
+
+    async def _execute_streaming_with_retry(
+        self,
+        agent_id: str,
+        prompt: str,
+        on_chunk: Callable[[str], None] | None = None,
+        timeout: float | None = None,
+    ) -> tuple[str, str | None]:
+        """Execute a streaming request under the retry policy.
+
+        An attempt that already streamed output is not retried, so the
+        consumer never receives a reply twice. All attempts share one
+        deadline.
+        """
+        deadline = self._timeouts.deadline_for(agent_id, timeout)
+        streamed = False
+        relay = None
+        if on_chunk:
+
+            def relay(chunk: str) -> None:
+                nonlocal streamed
+                streamed = True
+                on_chunk(chunk)
+
+        return await self._resilient(
+            agent_id,
+            lambda model: self._execute_streaming_once(agent_id, prompt, relay, model, deadline),
+            can_retry=lambda: not streamed,
+            deadline=deadline,
+        )
+
+    async def _send_and_wait(
+        self,
+        agent_id: str,
+        prompt: str,
+        deadline: Deadline | None = None,
+        model: str | None = None,
+    ) -> str:
+        """Send a prompt in blocking mode on a checked-out session."""
+
+        async def run(trace: RequestTrace) -> str:
+            async with self._session(agent_id, model) as lease:
+                trace.session_acquired(lease.model)
+                full_prompt = self._prompt_for_session(lease, prompt)
+                # Without a deadline the SDK applies its own default timeout
+                timeout = max(deadline.remaining(), 0.0) if deadline else None
+                try:
+                    response = await lease.session.send_and_wait(
+                        {"prompt": full_prompt}, timeout=timeout
+                    )
+                except TimeoutError as e:
+                    # send_and_wait stops waiting but leaves the request running
+                    error = SDKTimeoutError(agent_id, deadline.seconds if deadline else timeout)
+                    await self._abort_timed_out(lease, error)
+                    raise error from e
+                lease.persona_sent = True
+            return response.data.content
+
+        return await self._traced(agent_id, run)
+
+    @asynccontextmanager
+    async def _session(
+        self, agent_id: str, model: str | None = None
+    ) -> AsyncIterator[PooledSession]:
+        """Check out one of an agent's sessions for a single request.
+
+        Sessions the server reports as not found, and sessions of
+        timed-out requests, are discarded instead of being returned to the
+        pool. Within a request_scope the session is recorded under the
+        request's key while checked out.
+
+        Args:
+            agent_id: The agent identifier.
+            model: Model of the session (None for the agent's current model).
+
+        Yields:
+            The checked-out PooledSession.
+        """
+        key = _request_key.get()
+        async with self._pool.session(agent_id, model, is_broken=self._is_broken_session) as lease:
+            if key is not None:
+                self._requests[key] = lease
+            try:
+                yield lease
+            finally:
+                if key is not None and self._requests.get(key) is lease:
+                    del self._requests[key]
 
     async def _execute_streaming_once(
         self,
         agent_id: str,
         prompt: str,
         on_chunk: Callable[[str], None] | None = None,
+        model: str | None = None,
+        deadline: Deadline | None = None,
     ) -> str:
         """Execute a single streaming attempt (no retry)."""
-        session = await self.get_or_create_session(agent_id)
 
-        # Inject agent persona into the prompt
-        full_prompt = self._build_prompt_with_persona(agent_id, prompt)
+        async def run(trace: RequestTrace) -> str:
+            async with self._session(agent_id, model) as lease:
+                trace.session_acquired(lease.model)
+                return await self._stream_on_session(lease, prompt, on_chunk, trace, deadline)
+
+        return await self._traced(agent_id, run)
+
+    async def _stream_on_session(
+        self,
+        lease: PooledSession,
+        prompt: str,
+        on_chunk: Callable[[str], None] | None,
+        trace: RequestTrace | None = None,
+        deadline: Deadline | None = None,
+    ) -> str:
+        """Send a prompt on a checked-out session and collect the streamed reply.
+
+        Any session event (not only deltas; tool calls count too) shows the
+        request is alive for the inactivity timeout.
+        """
+        session = lease.session
+        agent_id = lease.agent_id
+
+        # Inject agent persona into the session's first prompt
+        full_prompt = self._prompt_for_session(lease, prompt)
+
+        # Batch deltas so consumers render once per line or time window
+        coalescer = None
+        if on_chunk and self._coalescing.enabled:
+            coalescer = ChunkCoalescer(on_chunk, self._coalescing)
+            on_chunk = coalescer.feed
 
         accumulated: list[str] = []
         done = asyncio.Event()
         error_holder: list[Exception | None] = [None]
+        debug = logger.isEnabledFor(logging.DEBUG)
+        loop = asyncio.get_running_loop()
+        last_event = loop.time()
+
+        def on_delta(data):
+            # Extract delta content
+            delta_content = getattr(data, "delta_content", None)
+            if delta_content is None:
+                delta_content = getattr(data, "content", None)
+            if delta_content is None:
+                delta_content = getattr(data, "text", None)
+
+            if delta_content:  # Skip None or empty
+                if trace and not accumulated:
+                    trace.first_delta()
+                accumulated.append(delta_content)
+                if on_chunk:
+                    on_chunk(delta_content)
+                if debug:
+                    logger.debug("Chunk received: %s...", delta_content[:50])
+
+        def on_idle(data):
+            logger.debug("Session idle/complete - finishing")
+            done.set()
+
+        def on_error(data):
+            error_type = getattr(data, "error_type", "Unknown")
+            message = getattr(data, "message", "Unknown error")
+            logger.error(f"SDK error: {error_type}: {message}")
+            error_holder[0] = SDKClientError(f"{error_type}: {message}")
+            done.set()
+
+        def on_abort(data):
+            logger.debug("Request aborted")
+            error_holder[0] = SDKClientError("Request aborted")
+            done.set()
+
+        handlers = {
+            EventKind.DELTA: on_delta,
+            EventKind.IDLE: on_idle,
+            EventKind.ERROR: on_error,
+            EventKind.ABORT: on_abort,
+        }
 
         def on_event(event):
             """Handle streaming events from SDK."""
-            event_type = event.type
-
-            # Normalize event type to string for comparison
-            event_type_str = str(event_type)
-            if hasattr(event_type, "value"):
-                event_type_str = str(event_type.value)
-            elif hasattr(event_type, "name"):
-                event_type_str = str(event_type.name)
-
-            # Normalize to uppercase for comparison
-            event_type_upper = event_type_str.upper().replace(".", "_").replace("-", "_")
-
-            logger.debug(f"SDK event received: {event_type} -> normalized: {event_type_upper}")
-
-            # Check specifically for ASSISTANT_MESSAGE_DELTA (not REASONING_DELTA)
-            if "ASSISTANT_MESSAGE_DELTA" in event_type_upper:
-                # Extract delta content
-                delta_content = getattr(event.data, "delta_content", None)
-                if delta_content is None:
-                    delta_content = getattr(event.data, "content", None)
-                if delta_content is None:
-                    delta_content = getattr(event.data, "text", None)
-
-                if delta_content:  # Skip None or empty
-                    accumulated.append(delta_content)
-                    if on_chunk:
-                        on_chunk(delta_content)
-                    logger.debug(f"Chunk received: {delta_content[:50]}...")
-
-            # Check for completion events
-            elif "SESSION_IDLE" in event_type_upper:
-                logger.debug("Session idle/complete - finishing")
-                done.set()
-
-            # Check for error events
-            elif "SESSION_ERROR" in event_type_upper or "ERROR" in event_type_upper:
-                error_type = getattr(event.data, "error_type", "Unknown")
-                message = getattr(event.data, "message", "Unknown error")
-                logger.error(f"SDK error: {error_type}: {message}")
-                error_holder[0] = SDKClientError(f"{error_type}: {message}")
-                done.set()
-
-            # Check for abort events
-            elif "ABORT" in event_type_upper:
-                logger.debug("Request aborted")
-                error_holder[0] = SDKClientError("Request aborted")
-                done.set()
+            nonlocal last_event
+            last_event = loop.time()
+            handler = handlers.get(event_kind(event.type))
+            if handler is not None:
+                handler(event.data)
 
         # Subscribe to events
         unsubscribe = session.on(on_event)
 
         try:
-            # Send prompt with persona context (non-blocking)
-            logger.debug(f"Sending prompt to {agent_id}: {prompt[:50]}...")
+            # Send prompt (non-blocking)
+            if debug:
+                logger.debug("Sending prompt to %s: %s...", agent_id, prompt[:50])
             try:
                 await session.send({"prompt": full_prompt})
             except Exception as e:
                 raise SDKClientError(f"Send failed: {e}") from e
+            lease.persona_sent = True
 
-            # Wait for completion with a very long timeout (30 min)
-            # This is a safety net - streaming should complete naturally
+            # Wait for completion, the deadline or a stall, whichever is first
             logger.debug("Waiting for completion...")
-            try:
-                await asyncio.wait_for(done.wait(), timeout=1800.0)  # 30 min max
-            except TimeoutError as e:
-                logger.warning(f"Streaming timeout after 30 minutes for {agent_id}")
-                raise SDKClientError("Streaming timeout - no completion event received") from e
+            inactivity = self._timeouts.inactivity
+            while not done.is_set():
+                waits = []
+                timed_out = None
+                if deadline is not None:
+                    waits.append(deadline.remaining())
+                    if waits[-1] <= 0:
+                        timed_out = SDKTimeoutError(agent_id, deadline.seconds)
+                if inactivity is not None and timed_out is None:
+                    waits.append(last_event + inactivity - loop.time())
+                    if waits[-1] <= 0:
+                        timed_out = SDKTimeoutError(
+                            agent_id, inactivity, SDKTimeoutError.INACTIVITY
+                        )
+                if timed_out is not None:
+                    await self._abort_timed_out(lease, timed_out)
+                    raise timed_out
+                try:
+                    await asyncio.wait_for(done.wait(), timeout=min(waits, default=None))
+                except TimeoutError:
+                    pass
+
+            logger.debug("Done waiting, accumulated %d chunks", len(accumulated))
 
-            logger.debug(f"Done waiting, accumulated {len(accumulated)} chunks")
+            if trace:
+                trace.chunks = len(accumulated)
 
             # Check for errors
             if error_holder[0]:
@@ -475,30 +1149,43 @@ User request: {user_prompt}"""
         finally:
             # Always unsubscribe to prevent memory leaks
             unsubscribe()
+            if coalescer:
+                coalescer.close()
 
-    async def cancel_current_request(self, agent_id: str) -> bool:
+    async def cancel_current_request(self, agent_id: str, request_key: str | None = None) -> bool:
         """Cancel the current request for an agent.
 
-        Uses session.abort() to stop the in-progress request.
-        The session remains valid for future requests.
+        Uses session.abort() to stop the in-progress request. Given a
+        request key, only the session serving the request made under that
+        key (see request_scope) is aborted; otherwise each of the agent's
+        checked-out sessions (or its open sessions, if none is checked
+        out). The sessions remain valid for future requests.
 
         Args:
             agent_id: The agent identifier.
+            request_key: Key of the request to cancel (None for all of the
+                agent's requests).
 
         Returns:
-            True if request was cancelled, False if no session or error.
+            True if a request was cancelled, False if no session or error.
         """
-        session_id = f"{self.SESSION_PREFIX}{agent_id}"
-        session = self._sessions.get(session_id)
-
-        if not session:
-            return False
+        if request_key is not None:
+            lease = self._requests.get(request_key)
+            # Not holding a session means the request hasn't been sent yet
+            sessions = [lease.session] if lease is not None and lease.agent_id == agent_id else []
+        else:
+            sessions = self._pool.sessions_for(agent_id, in_use=True) or self._pool.sessions_for(
+                agent_id
+            )
 
-        try:
-            await session.abort()
-            return True
-        except Exception:
-            return False
+        cancelled = False
+        for session in sessions:
+            try:
+                await session.abort()
+                cancelled = True
+            except Exception:
+                pass
+        return cancelled
 
     def list_sessions(self) -> list[Any]:
         """List all sessions known to the SDK.
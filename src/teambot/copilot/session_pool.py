@@ -0,0 +1,680 @@
+"""Pool of Copilot SDK sessions per agent.
+
+A session handles one request at a time, so an agent with a single
+session can only serve one task at once. The pool keeps several sessions
+per agent, grouped into sub-pools by model. A request checks a session
+out for its duration and checks it back in afterwards. Sessions the server
+no longer knows about are discarded and replaced by the next checkout.
+
+Session IDs stay stable across restarts: an agent's first session is
+``teambot-<agent>``, further ones ``teambot-<agent>-2``, ``teambot-<agent>-3``
+and so on, reusing the lowest free number.
+
+Idle sessions are not kept forever: those unused for ``idle_timeout`` are
+evicted by a background sweep, and when more than ``max_live_sessions`` are
+open the least recently used idle ones are evicted. Evicted sessions are
+destroyed in the background; the next request for that agent opens a fresh
+session. Sessions dropped because an agent's sessions were invalidated or
+its model changed are destroyed right away as well (checked-out ones when
+they are returned).
+"""
+
+from __future__ import annotations
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import deque
+from collections.abc import AsyncIterator, Awaitable, Callable
+from contextlib import asynccontextmanager
+from dataclasses import dataclass, field
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Defaults applied when a configuration has no session_pool section
+DEFAULT_MIN_SESSIONS = 1
+DEFAULT_MAX_SESSIONS = 1
+DEFAULT_IDLE_TIMEOUT = 30 * 60
+
+# Creates a session: (session_id, agent_id, model) -> SDK session
+SessionFactory = Callable[[str, str, str | None], Awaitable[Any]]
+
+
+@dataclass
+class PoolLimits:
+    """Size limits of one agent's sub-pools.
+
+    Attributes:
+        min_sessions: Sessions opened when a sub-pool is first used.
+        max_sessions: Sessions that may be checked out at once.
+    """
+
+    min_sessions: int = DEFAULT_MIN_SESSIONS
+    max_sessions: int = DEFAULT_MAX_SESSIONS
+
+
+@dataclass
+class SessionPoolConfig:
+    """Session pool limits, with per-agent overrides.
+
+    Attributes:
+        defaults: Limits for agents without an override.
+        agents: Map of agent_id -> limits for that agent.
+        idle_timeout: Seconds after which an unused session is evicted
+            (None to keep idle sessions).
+        max_live_sessions: Open sessions across all agents above which
+            least recently used idle sessions are evicted (None for no cap).
+        prewarm: Whether sessions are opened ahead of agents' first requests.
+    """
+
+    defaults: PoolLimits = field(default_factory=PoolLimits)
+    agents: dict[str, PoolLimits] = field(default_factory=dict)
+    idle_timeout: float | None = DEFAULT_IDLE_TIMEOUT
+    max_live_sessions: int | None = None
+    prewarm: bool = True
+
+    def limits_for(self, agent_id: str) -> PoolLimits:
+        """Get the limits applying to an agent.
+
+        Args:
+            agent_id: Agent identifier.
+
+        Returns:
+            The agent's limits, or the defaults.
+        """
+        return self.agents.get(agent_id, self.defaults)
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> SessionPoolConfig:
+        """Build pool limits from TeamBot configuration.
+
+        Defaults, eviction settings (``idle_timeout_seconds``,
+        ``max_live_sessions``) and ``prewarm`` come from the ``session_pool``
+        section. Agents may set ``min_sessions`` and ``max_sessions``
+        themselves; an agent allowed to run several tasks at once
+        (``max_concurrent``) gets at least that many sessions.
+
+        Args:
+            config: TeamBot configuration dict.
+
+        Returns:
+            Pool configuration.
+        """
+        config = config or {}
+        section = config.get("session_pool", {})
+        defaults = PoolLimits(
+            min_sessions=section.get("min_sessions", DEFAULT_MIN_SESSIONS),
+            max_sessions=section.get("max_sessions", DEFAULT_MAX_SESSIONS),
+        )
+
+        agents: dict[str, PoolLimits] = {}
+        for agent in config.get("agents", []):
+            if "id" not in agent or not (
+                {"min_sessions", "max_sessions", "max_concurrent"} & agent.keys()
+            ):
+                continue
+            max_sessions = agent.get(
+                "max_sessions", max(defaults.max_sessions, agent.get("max_concurrent", 1))
+            )
+            min_sessions = min(agent.get("min_sessions", defaults.min_sessions), max_sessions)
+            agents[agent["id"]] = PoolLimits(min_sessions=min_sessions, max_sessions=max_sessions)
+
+        return cls(
+            defaults=defaults,
+            agents=agents,
+            idle_timeout=section.get("idle_timeout_seconds", DEFAULT_IDLE_TIMEOUT),
+            max_live_sessions=section.get("max_live_sessions"),
+            prewarm=section.get("prewarm", True),
+        )
+
+
+@dataclass
+class PoolStats:
+    """Utilization of one agent/model sub-pool.
+
+    Attributes:
+        agent_id: Agent identifier.
+        model: Model of the sessions (None for the SDK default).
+        in_use: Sessions checked out.
+        idle: Sessions open and available.
+        waiting: Requests waiting for a session.
+        max_sessions: Sessions that may be checked out at once.
+    """
+
+    agent_id: str
+    model: str | None
+    in_use: int
+    idle: int
+    waiting: int
+    max_sessions: int
+
+    @property
+    def utilization(self) -> float:
+        """Fraction of the sub-pool's capacity checked out."""
+        return self.in_use / self.max_sessions if self.max_sessions else 0.0
+
+
+@dataclass(eq=False)
+class PooledSession:
+    """A session owned by the pool.
+
+    Attributes:
+        session: The SDK session.
+        session_id: Session identifier.
+        agent_id: Agent the session serves.
+        model: Model the session was created with.
+        number: Position in the agent's session numbering.
+        persona_sent: Whether the agent's persona is already in the
+            session's conversation.
+        last_used: Pool clock time the session was last returned.
+    """
+
+    session: Any
+    session_id: str
+    agent_id: str
+    model: str | None
+    number: int
+    persona_sent: bool = False
+    last_used: float = 0.0
+
+
+class _SubPool:
+    """Sessions for one agent and model."""
+
+    def __init__(self, limits: PoolLimits):
+        self.limits = limits
+        # Most recently returned last, so the warmest session is reused first
+        self.idle: list[PooledSession] = []
+        self.in_use: list[PooledSession] = []
+        # Sessions open or being created
+        self.size = 0
+        self.waiters: deque[asyncio.Future[None]] = deque()
+
+    def can_checkout(self) -> bool:
+        return bool(self.idle) or self.size < self.limits.max_sessions
+
+    def wake_one(self) -> None:
+        while self.waiters:
+            waiter = self.waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+
+
+class SessionPool:
+    """Sessions per agent, checked out by one request at a time."""
+
+    def __init__(
+        self,
+        factory: SessionFactory,
+        config: SessionPoolConfig | None = None,
+        prefix: str = "teambot-",
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        """Initialize pool.
+
+        Args:
+            factory: Creates a session for (session_id, agent_id, model).
+            config: Pool limits (default: one session per agent and model).
+            prefix: Prefix of session IDs.
+            clock: Monotonic time source for idle tracking (for testing).
+        """
+        self._factory = factory
+        self._config = config or SessionPoolConfig()
+        self._prefix = prefix
+        self._clock = clock
+        # Background tasks: the idle sweep and destroys of evicted sessions
+        self._sweeper: asyncio.Task[None] | None = None
+        self._destroying: set[asyncio.Task[None]] = set()
+        self.evictions = 0
+        self._pools: dict[tuple[str, str | None], _SubPool] = {}
+        # agent_id -> session numbers currently assigned
+        self._numbers: dict[str, set[int]] = {}
+        # agent_id -> model used when a request does not name one
+        self._models: dict[str, str | None] = {}
+
+    def _sub_pool(self, agent_id: str, model: str | None) -> _SubPool:
+        key = (agent_id, model)
+        pool = self._pools.get(key)
+        if pool is None:
+            pool = self._pools[key] = _SubPool(self._config.limits_for(agent_id))
+        return pool
+
+    def _resolve_model(self, agent_id: str, model: str | None) -> str | None:
+        if model:
+            previous = self._models.get(agent_id)
+            self._models[agent_id] = model
+            if previous != model:
+                # The agent has moved on; its old model's sessions won't be used again
+                self._retire((agent_id, previous))
+            return model
+        return self._models.get(agent_id)
+
+    def current_model(self, agent_id: str) -> str | None:
+        """Get the model used for an agent's requests that don't name one.
+
+        Args:
+            agent_id: Agent identifier.
+
+        Returns:
+            The agent's current model, or None for the SDK default.
+        """
+        return self._models.get(agent_id)
+
+    def _session_id(self, agent_id: str, number: int) -> str:
+        if number == 1:
+            return f"{self._prefix}{agent_id}"
+        return f"{self._prefix}{agent_id}-{number}"
+
+    async def _create(self, agent_id: str, model: str | None) -> PooledSession:
+        """Create a session with the lowest free number for the agent."""
+        numbers = self._numbers.setdefault(agent_id, set())
+        number = 1
+        while number in numbers:
+            number += 1
+        numbers.add(number)
+
+        session_id = self._session_id(agent_id, number)
+        try:
+            session = await self._factory(session_id, agent_id, model)
+        except BaseException:
+            numbers.discard(number)
+            raise
+        return PooledSession(session, session_id, agent_id, model, number, last_used=self._clock())
+
+    def _release_number(self, lease: PooledSession) -> None:
+        self._numbers.get(lease.agent_id, set()).discard(lease.number)
+
+    async def get(self, agent_id: str, model: str | None = None) -> Any:
+        """Get a session for an agent without checking it out.
+
+        Used to open an agent's session ahead of a request, or to inspect
+        it. Naming a model also makes it the agent's model for requests
+        that don't name one, and destroys the agent's idle sessions for
+        its previous model.
+
+        Args:
+            agent_id: Agent identifier.
+            model: Model of the session (None for the agent's current model).
+
+        Returns:
+            An idle or in-use session, created if the sub-pool is empty.
+        """
+        previous = self._models.get(agent_id)
+        model = self._resolve_model(agent_id, model)
+        if model != previous and self._destroying:
+            # Let the old model's sessions go first so the new one reuses their IDs
+            await asyncio.gather(*list(self._destroying), return_exceptions=True)
+        pool = self._sub_pool(agent_id, model)
+        while pool.size and not (pool.idle or pool.in_use):
+            # Another caller is still creating the first session
+            await self._wait(pool)
+            pool = self._sub_pool(agent_id, model)
+        if pool.idle or pool.in_use:
+            return (pool.idle or pool.in_use)[-1].session
+
+        self._make_room(1)
+        pool.size += 1
+        try:
+            lease = await self._create(agent_id, model)
+        except BaseException:
+            pool.size -= 1
+            pool.wake_one()
+            raise
+        pool.idle.append(lease)
+        pool.wake_one()
+        return lease.session
+
+    @staticmethod
+    async def _wait(pool: _SubPool) -> None:
+        waiter = asyncio.get_running_loop().create_future()
+        pool.waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                pool.wake_one()  # Pass the wake-up on
+            raise
+
+    async def checkout(self, agent_id: str, model: str | None = None) -> PooledSession:
+        """Take a session for exclusive use, waiting if the sub-pool is full.
+
+        The first checkout of a sub-pool opens ``min_sessions`` sessions at
+        once; later ones reuse idle sessions and open new ones up to
+        ``max_sessions``.
+
+        Unlike get(), naming a model here doesn't change the agent's model,
+        so a request can be sent to another model just once.
+
+        Args:
+            agent_id: Agent identifier.
+            model: Model of the session (None for the agent's current model).
+
+        Returns:
+            The checked-out session; return it with checkin() or discard().
+        """
+        model = model or self._models.get(agent_id)
+        pool = self._sub_pool(agent_id, model)
+        while not pool.can_checkout():
+            await self._wait(pool)
+            # The sub-pool may have been replaced by invalidate()
+            pool = self._sub_pool(agent_id, model)
+
+        if pool.idle:
+            lease = pool.idle.pop()
+            pool.in_use.append(lease)
+            return lease
+
+        # Open this session plus any needed to reach min_sessions
+        extra = max(0, min(pool.limits.min_sessions, pool.limits.max_sessions) - pool.size - 1)
+        sessions = await self._open(pool, agent_id, model, 1 + extra)
+
+        lease = sessions.pop(0)
+        pool.in_use.append(lease)
+        for spare in sessions:
+            pool.idle.append(spare)
+            pool.wake_one()
+        return lease
+
+    async def _open(
+        self, pool: _SubPool, agent_id: str, model: str | None, count: int
+    ) -> list[PooledSession]:
+        """Open sessions for a sub-pool concurrently.
+
+        Returns:
+            The opened sessions, not yet added to the sub-pool.
+
+        Raises:
+            Exception: The first failure, if no session could be opened.
+        """
+        self._make_room(count)
+        pool.size += count
+        created = await asyncio.gather(
+            *(self._create(agent_id, model) for _ in range(count)), return_exceptions=True
+        )
+        sessions = [c for c in created if isinstance(c, PooledSession)]
+        failures = [c for c in created if not isinstance(c, PooledSession)]
+        pool.size -= len(failures)
+        for failure in failures:
+            logger.warning("Could not open session for @%s: %s", agent_id, failure)
+            pool.wake_one()
+        if not sessions:
+            raise failures[0]
+        return sessions
+
+    async def warm(self, agent_id: str, model: str | None = None) -> int:
+        """Open an agent's sessions ahead of its first request.
+
+        Opens ``min_sessions`` (at least one) idle sessions if the sub-pool
+        has none yet. Like checkout(), naming a model doesn't change the
+        agent's model.
+
+        Args:
+            agent_id: Agent identifier.
+            model: Model of the sessions (None for the agent's current model).
+
+        Returns:
+            Number of sessions opened.
+        """
+        model = model or self._models.get(agent_id)
+        pool = self._sub_pool(agent_id, model)
+        if pool.size:
+            return 0
+
+        count = max(1, min(pool.limits.min_sessions, pool.limits.max_sessions))
+        sessions = await self._open(pool, agent_id, model, count)
+        for lease in sessions:
+            pool.idle.append(lease)
+            pool.wake_one()
+        return len(sessions)
+
+    def checkin(self, lease: PooledSession) -> None:
+        """Return a checked-out session to its sub-pool.
+
+        Args:
+            lease: Session from checkout().
+        """
+        pool = self._pools.get((lease.agent_id, lease.model))
+        if pool is None or lease not in pool.in_use:
+            # Sub-pool was retired while the session was out
+            self._destroy_soon(lease)
+            return
+        pool.in_use.remove(lease)
+        lease.last_used = self._clock()
+        pool.idle.append(lease)
+        pool.wake_one()
+
+    def discard(self, lease: PooledSession) -> None:
+        """Drop a broken session so a new one is created in its place.
+
+        The session is destroyed in the background, since it may still be
+        running an aborted request; its ID is only reused once it is gone.
+
+        Args:
+            lease: Session from checkout().
+        """
+        pool = self._pools.get((lease.agent_id, lease.model))
+        if pool is not None and lease in pool.in_use:
+            pool.in_use.remove(lease)
+            pool.size -= 1
+            pool.wake_one()
+        logger.info("Discarded session %s", lease.session_id)
+        self._destroy_soon(lease)
+
+    @asynccontextmanager
+    async def session(
+        self,
+        agent_id: str,
+        model: str | None = None,
+        is_broken: Callable[[BaseException], bool] | None = None,
+    ) -> AsyncIterator[PooledSession]:
+        """Check out a session for the duration of a block.
+
+        Args:
+            agent_id: Agent identifier.
+            model: Model of the session (None for the agent's current model).
+            is_broken: Decides whether an error from the block means the
+                session is unusable; such sessions are discarded.
+
+        Yields:
+            The checked-out session.
+        """
+        lease = await self.checkout(agent_id, model)
+        try:
+            yield lease
+        except BaseException as e:
+            if is_broken is not None and is_broken(e):
+                self.discard(lease)
+            else:
+                self.checkin(lease)
+            raise
+        else:
+            self.checkin(lease)
+
+    @property
+    def live_sessions(self) -> int:
+        """Number of sessions open or being created, across all agents."""
+        return sum(pool.size for pool in self._pools.values())
+
+    def _evict(self, key: tuple[str, str | None], lease: PooledSession) -> None:
+        """Remove an idle session from its sub-pool and destroy it in the background."""
+        pool = self._pools[key]
+        pool.idle.remove(lease)
+        pool.size -= 1
+        pool.wake_one()
+        if pool.size == 0 and not pool.waiters:
+            del self._pools[key]
+        self.evictions += 1
+        logger.info("Evicting idle session %s", lease.session_id)
+        self._destroy_soon(lease)
+
+    def _destroy_soon(self, lease: PooledSession) -> None:
+        """Destroy a session that left the pool, in the background."""
+        try:
+            loop = asyncio.get_running_loop()
+        except RuntimeError:
+            # No event loop to destroy it on; the server expires it eventually
+            self._release_number(lease)
+            return
+        task = loop.create_task(self._destroy(lease))
+        self._destroying.add(task)
+        task.add_done_callback(self._destroying.discard)
+
+    async def _destroy(self, lease: PooledSession) -> None:
+        try:
+            await lease.session.destroy()
+        except Exception as e:
+            logger.debug("Could not destroy session %s: %s", lease.session_id, e)
+        finally:
+            # Only now may a new session reuse the ID
+            self._release_number(lease)
+
+    def _make_room(self, count: int) -> None:
+        """Evict least recently used idle sessions so ``count`` more fit under the cap.
+
+        Busy sessions are never evicted, so the cap may be exceeded while
+        every session is checked out.
+        """
+        cap = self._config.max_live_sessions
+        if cap is None:
+            return
+        excess = self.live_sessions + count - cap
+        if excess <= 0:
+            return
+        idle = sorted(
+            (
+                (lease.last_used, key, lease)
+                for key, pool in self._pools.items()
+                for lease in pool.idle
+            ),
+            key=lambda item: item[0],
+        )
+        for _, key, lease in idle[:excess]:
+            self._evict(key, lease)
+
+    def evict_idle(self) -> int:
+        """Evict sessions left idle for longer than the idle timeout.
+
+        Returns:
+            Number of sessions evicted.
+        """
+        timeout = self._config.idle_timeout
+        if timeout is None:
+            return 0
+        cutoff = self._clock() - timeout
+        expired = [
+            (key, lease)
+            for key, pool in self._pools.items()
+            for lease in pool.idle
+            if lease.last_used <= cutoff
+        ]
+        for key, lease in expired:
+            self._evict(key, lease)
+        return len(expired)
+
+    def start_eviction(self) -> None:
+        """Start the background sweep evicting idle sessions.
+
+        Must be called on the event loop; does nothing without an idle timeout.
+        """
+        timeout = self._config.idle_timeout
+        if timeout is None or self._sweeper is not None:
+            return
+        # Sweep often enough that a session outlives its timeout by at most a quarter
+        interval = min(max(timeout / 4, 1.0), 60.0)
+        self._sweeper = asyncio.get_running_loop().create_task(self._sweep(interval))
+
+    async def _sweep(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            self.evict_idle()
+
+    def sessions_for(self, agent_id: str, in_use: bool | None = None) -> list[Any]:
+        """List an agent's sessions across its sub-pools.
+
+        Args:
+            agent_id: Agent identifier.
+            in_use: True for checked-out sessions only, False for idle only,
+                None for both.
+
+        Returns:
+            SDK sessions.
+        """
+        sessions = []
+        for (pool_agent, _), pool in self._pools.items():
+            if pool_agent != agent_id:
+                continue
+            if in_use is not False:
+                sessions.extend(lease.session for lease in pool.in_use)
+            if in_use is not True:
+                sessions.extend(lease.session for lease in pool.idle)
+        return sessions
+
+    def invalidate(self, agent_id: str) -> None:
+        """Drop an agent's sessions so new ones are created on next use.
+
+        Idle sessions are destroyed now; sessions checked out at the time
+        are destroyed when returned.
+
+        Args:
+            agent_id: Agent identifier.
+        """
+        for key in [key for key in self._pools if key[0] == agent_id]:
+            self._retire(key)
+
+    def _retire(self, key: tuple[str, str | None]) -> None:
+        """Remove a sub-pool, destroying its idle sessions."""
+        pool = self._pools.pop(key, None)
+        if pool is None:
+            return
+        for lease in pool.idle:
+            logger.info("Destroying session %s", lease.session_id)
+            self._destroy_soon(lease)
+        # Let waiters retry against a fresh sub-pool
+        for waiter in pool.waiters:
+            if not waiter.done():
+                waiter.set_result(None)
+
+    def get_stats(self) -> list[PoolStats]:
+        """Get utilization of every sub-pool.
+
+        Returns:
+            PoolStats sorted by agent and model.
+        """
+        stats = [
+            PoolStats(
+                agent_id=agent_id,
+                model=model,
+                in_use=len(pool.in_use),
+                idle=len(pool.idle),
+                waiting=sum(1 for w in pool.waiters if not w.done()),
+                max_sessions=pool.limits.max_sessions,
+            )
+            for (agent_id, model), pool in self._pools.items()
+        ]
+        return sorted(stats, key=lambda s: (s.agent_id, s.model or ""))
+
+    async def close(self) -> None:
+        """Destroy every session, including checked-out ones."""
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await self._sweeper
+            self._sweeper = None
+        if self._destroying:
+            await asyncio.gather(*self._destroying, return_exceptions=True)
+
+        pools = list(self._pools.values())
+        self._pools.clear()
+        self._numbers.clear()
+        for pool in pools:
+            for lease in pool.idle + pool.in_use:
+                try:
+                    await lease.session.destroy()
+                except Exception:
+                    pass  # Best effort cleanup
+            for waiter in pool.waiters:
+                if not waiter.done():
+                    waiter.cancel()
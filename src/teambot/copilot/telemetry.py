@@ -0,0 +1,433 @@
+"""Latency and throughput telemetry for agent requests.
+
+The SDK client traces every request: how long it waited for a session,
+time to the first streamed delta, total duration, chunk count, output size
+and an estimated token rate. Each finished trace is tagged with the agent,
+model and workflow stage, aggregated into histograms in a process-wide
+MetricsRegistry and appended to a rolling JSONL file under the TeamBot
+directory, so models can be compared by the latency they actually deliver.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from bisect import bisect_left
+from collections.abc import Iterator
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Rough size of a token, used to estimate throughput from output size
+CHARS_PER_TOKEN = 4
+
+# Defaults for the rolling telemetry file
+DEFAULT_LOG_MAX_BYTES = 5 * 1024 * 1024
+DEFAULT_LOG_BACKUPS = 3
+
+# Histogram bucket upper bounds
+LATENCY_BUCKETS = (0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0, 120.0, 300.0, 900.0)
+RATE_BUCKETS = (1.0, 2.0, 5.0, 10.0, 20.0, 50.0, 100.0, 200.0, 500.0, 1000.0)
+
+_current_stage: ContextVar[str | None] = ContextVar("teambot_stage", default=None)
+
+
+@contextmanager
+def stage_scope(stage: str) -> Iterator[None]:
+    """Tag requests made within the block with a workflow stage.
+
+    The tag follows the current task, including tasks it starts.
+
+    Args:
+        stage: Stage name (e.g. ``SPEC``).
+
+    Yields:
+        None.
+    """
+    token = _current_stage.set(stage)
+    try:
+        yield
+    finally:
+        _current_stage.reset(token)
+
+
+def current_stage() -> str | None:
+    """Get the workflow stage requests are currently tagged with."""
+    return _current_stage.get()
+
+
+@dataclass
+class RequestMetrics:
+    """Measurements of one finished agent request.
+
+    Attributes:
+        agent_id: Agent the request was sent to.
+        model: Model of the session (None for the SDK default).
+        stage: Workflow stage the request belongs to, if any.
+        started_at: Wall-clock start time (seconds since the epoch).
+        session_wait: Seconds spent waiting for a session.
+        time_to_first_delta: Seconds from start to the first streamed delta.
+        duration: Seconds from start to completion.
+        chunks: Deltas received.
+        output_bytes: UTF-8 size of the response.
+        cached: Whether the response came from the response cache.
+        error: Error message if the request failed.
+    """
+
+    agent_id: str
+    model: str | None
+    stage: str | None
+    started_at: float
+    session_wait: float = 0.0
+    time_to_first_delta: float | None = None
+    duration: float = 0.0
+    chunks: int = 0
+    output_bytes: int = 0
+    cached: bool = False
+    error: str | None = None
+
+    @property
+    def tokens_per_second(self) -> float | None:
+        """Estimated output tokens per second while the reply was generated."""
+        elapsed = self.duration - (self.time_to_first_delta or 0.0)
+        if not self.output_bytes or elapsed <= 0:
+            return None
+        return self.output_bytes / CHARS_PER_TOKEN / elapsed
+
+    def to_dict(self) -> dict[str, Any]:
+        """Serialize for the telemetry file."""
+        data = asdict(self)
+        data["tokens_per_second"] = self.tokens_per_second
+        return data
+
+
+class RequestTrace:
+    """Collects timings while a request runs.
+
+    Only the first delta is timed as it arrives; chunk count and output
+    size are taken from the finished response, so tracing adds nothing to
+    the per-delta path.
+    """
+
+    def __init__(self, agent_id: str, model: str | None, stage: str | None = None):
+        """Start tracing a request.
+
+        Args:
+            agent_id: Agent the request is sent to.
+            model: Model expected to serve the request.
+            stage: Workflow stage (defaults to the current stage scope).
+        """
+        self._start = time.perf_counter()
+        self._first_delta: float | None = None
+        self._session_acquired: float | None = None
+        self.model = model
+        self.chunks: int | None = None
+        self._metrics = RequestMetrics(
+            agent_id=agent_id,
+            model=model,
+            stage=stage if stage is not None else current_stage(),
+            started_at=time.time(),
+        )
+
+    def session_acquired(self, model: str | None = None) -> None:
+        """Mark the moment a session was checked out.
+
+        Args:
+            model: Model of the checked-out session.
+        """
+        self._session_acquired = time.perf_counter()
+        if model is not None:
+            self.model = model
+
+    def first_delta(self) -> None:
+        """Mark the arrival of the first streamed delta."""
+        if self._first_delta is None:
+            self._first_delta = time.perf_counter()
+
+    def finish(
+        self,
+        response: str | None = None,
+        error: BaseException | None = None,
+        cached: bool = False,
+    ) -> RequestMetrics:
+        """Stop tracing and build the request's metrics.
+
+        Args:
+            response: Complete response, if the request succeeded.
+            error: Error the request failed with, if any.
+            cached: Whether the response came from the response cache.
+
+        Returns:
+            The finished measurements.
+        """
+        now = time.perf_counter()
+        metrics = self._metrics
+        metrics.model = self.model
+        metrics.duration = now - self._start
+        metrics.cached = cached
+        if self._session_acquired is not None:
+            metrics.session_wait = self._session_acquired - self._start
+        if response is not None:
+            # Blocking and cached replies arrive in one piece
+            metrics.chunks = self.chunks if self.chunks is not None else 1
+            metrics.output_bytes = len(response.encode("utf-8"))
+            if self._first_delta is None:
+                self._first_delta = now
+        elif self.chunks is not None:
+            metrics.chunks = self.chunks
+        if self._first_delta is not None:
+            metrics.time_to_first_delta = self._first_delta - self._start
+        if error is not None:
+            metrics.error = str(error) or type(error).__name__
+        return metrics
+
+
+class Histogram:
+    """Bucketed distribution of observed values."""
+
+    def __init__(self, buckets: tuple[float, ...] = LATENCY_BUCKETS):
+        """Initialize histogram.
+
+        Args:
+            buckets: Ascending bucket upper bounds; larger values overflow.
+        """
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.total = 0.0
+        self.min: float | None = None
+        self.max: float | None = None
+
+    def observe(self, value: float) -> None:
+        """Add a value.
+
+        Args:
+            value: Observed value.
+        """
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.total += value
+        self.min = value if self.min is None else min(self.min, value)
+        self.max = value if self.max is None else max(self.max, value)
+
+    @property
+    def mean(self) -> float | None:
+        """Average of observed values."""
+        return self.total / self.count if self.count else None
+
+    def quantile(self, q: float) -> float | None:
+        """Estimate a quantile as the upper bound of the bucket holding it.
+
+        Args:
+            q: Quantile between 0 and 1 (e.g. 0.95).
+
+        Returns:
+            Estimated value, capped at the largest observation.
+        """
+        if not self.count:
+            return None
+        rank = q * self.count
+        seen = 0
+        for index, count in enumerate(self.counts):
+            seen += count
+            if seen >= rank and count:
+                bound = self.buckets[index] if index < len(self.buckets) else self.max
+                return min(bound, self.max)
+        return self.max
+
+    def to_dict(self) -> dict[str, Any]:
+        """Summarize the distribution."""
+        return {
+            "count": self.count,
+            "mean": self.mean,
+            "min": self.min,
+            "max": self.max,
+            "p50": self.quantile(0.5),
+            "p95": self.quantile(0.95),
+        }
+
+
+TagKey = tuple[tuple[str, str], ...]
+
+
+class MetricsRegistry:
+    """Process-wide histograms and counters keyed by name and tags."""
+
+    def __init__(self):
+        """Initialize an empty registry."""
+        self._histograms: dict[tuple[str, TagKey], Histogram] = {}
+        self._counters: dict[tuple[str, TagKey], int] = {}
+
+    @staticmethod
+    def _key(name: str, tags: dict[str, str | None]) -> tuple[str, TagKey]:
+        return name, tuple(sorted((k, v) for k, v in tags.items() if v is not None))
+
+    def histogram(
+        self,
+        name: str,
+        buckets: tuple[float, ...] = LATENCY_BUCKETS,
+        **tags: str | None,
+    ) -> Histogram:
+        """Get (or create) a histogram.
+
+        Args:
+            name: Metric name.
+            buckets: Bucket bounds used if the histogram is created.
+            **tags: Tag values; None values are left out.
+
+        Returns:
+            The histogram for the name and tags.
+        """
+        key = self._key(name, tags)
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = Histogram(buckets)
+        return histogram
+
+    def increment(self, name: str, amount: int = 1, **tags: str | None) -> None:
+        """Add to a counter.
+
+        Args:
+            name: Metric name.
+            amount: Amount to add.
+            **tags: Tag values; None values are left out.
+        """
+        key = self._key(name, tags)
+        self._counters[key] = self._counters.get(key, 0) + amount
+
+    def counter(self, name: str, **tags: str | None) -> int:
+        """Get a counter's value (0 if never incremented)."""
+        return self._counters.get(self._key(name, tags), 0)
+
+    def record_request(self, metrics: RequestMetrics) -> None:
+        """Aggregate a finished request.
+
+        Latencies of cached requests are left out of the histograms, so
+        they describe the models rather than the cache.
+
+        Args:
+            metrics: Finished request measurements.
+        """
+        tags = {"agent": metrics.agent_id, "model": metrics.model or "default"}
+        self.increment("requests", **tags)
+        if metrics.error is not None:
+            self.increment("request_errors", **tags)
+            return
+        if metrics.cached:
+            self.increment("requests_cached", **tags)
+            return
+
+        self.increment("output_bytes", metrics.output_bytes, **tags)
+        self.histogram("session_wait_seconds", **tags).observe(metrics.session_wait)
+        self.histogram("duration_seconds", **tags).observe(metrics.duration)
+        if metrics.time_to_first_delta is not None:
+            self.histogram("first_delta_seconds", **tags).observe(metrics.time_to_first_delta)
+        rate = metrics.tokens_per_second
+        if rate is not None:
+            self.histogram("tokens_per_second", RATE_BUCKETS, **tags).observe(rate)
+
+    def snapshot(self) -> list[dict[str, Any]]:
+        """Get every metric with its tags.
+
+        Returns:
+            One dict per histogram (with its summary) and per counter.
+        """
+        entries: list[dict[str, Any]] = []
+        for (name, tags), histogram in sorted(self._histograms.items()):
+            entries.append({"name": name, "tags": dict(tags), **histogram.to_dict()})
+        for (name, tags), value in sorted(self._counters.items()):
+            entries.append({"name": name, "tags": dict(tags), "value": value})
+        return entries
+
+    def reset(self) -> None:
+        """Drop all metrics."""
+        self._histograms.clear()
+        self._counters.clear()
+
+
+_registry = MetricsRegistry()
+
+
+def get_registry() -> MetricsRegistry:
+    """Get the process-wide metrics registry."""
+    return _registry
+
+
+class TelemetryLog:
+    """Rolling JSONL file of finished requests.
+
+    When the file grows past ``max_bytes`` it is renamed to ``<name>.1``
+    (shifting older files up to ``backups``) and a new file is started.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        max_bytes: int = DEFAULT_LOG_MAX_BYTES,
+        backups: int = DEFAULT_LOG_BACKUPS,
+    ):
+        """Initialize log.
+
+        Args:
+            path: File requests are appended to.
+            max_bytes: Size at which the file is rotated.
+            backups: Rotated files kept.
+        """
+        self.path = path
+        self.max_bytes = max_bytes
+        self.backups = backups
+
+    def _rotate(self) -> None:
+        for index in range(self.backups - 1, 0, -1):
+            older = self.path.with_name(f"{self.path.name}.{index}")
+            if older.exists():
+                older.replace(self.path.with_name(f"{self.path.name}.{index + 1}"))
+        if self.backups > 0:
+            self.path.replace(self.path.with_name(f"{self.path.name}.1"))
+        else:
+            self.path.unlink()
+
+    def write(self, metrics: RequestMetrics) -> None:
+        """Append a request, rotating the file if it is full.
+
+        Args:
+            metrics: Finished request measurements.
+        """
+        line = json.dumps(metrics.to_dict()) + "\n"
+        try:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            if self.path.exists() and self.path.stat().st_size + len(line) > self.max_bytes:
+                self._rotate()
+            with self.path.open("a", encoding="utf-8") as f:
+                f.write(line)
+        except OSError as e:
+            logger.warning("Could not write telemetry to %s: %s", self.path, e)
+
+
+def get_telemetry_log(config: dict | None) -> TelemetryLog | None:
+    """Get the telemetry file described by the ``telemetry`` section.
+
+    Telemetry is written for loaded configurations (those with a
+    ``teambot_dir``) unless the section sets ``enabled`` to false.
+
+    Args:
+        config: TeamBot configuration dict.
+
+    Returns:
+        Log at ``<teambot_dir>/telemetry/requests.jsonl``, or None.
+    """
+    if not config or "teambot_dir" not in config:
+        return None
+    section = config.get("telemetry", {})
+    if not section.get("enabled", True):
+        return None
+    return TelemetryLog(
+        Path(config["teambot_dir"]) / "telemetry" / "requests.jsonl",
+        max_bytes=section.get("max_bytes", DEFAULT_LOG_MAX_BYTES),
+        backups=section.get("backups", DEFAULT_LOG_BACKUPS),
+    )
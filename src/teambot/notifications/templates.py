@@ -45,6 +45,16 @@ class MessageTemplates:
         "orchestration_completed": (
             "✅ <b>Completed</b>: {objective_name}\n⏱️ Duration: {duration}"
         ),
+        # SDK resilience events
+        "sdk_retry": (
+            "🔁 <b>Retrying {agent_id}</b> ({model})\n"
+            "Attempt {attempt}/{max_attempts} in {delay}s: <i>{error}</i>"
+        ),
+        "circuit_open": (
+            "🔌 <b>Circuit open: {model}</b>\n{failures} consecutive failures, {fallback_text}"
+        ),
+        "circuit_closed": "✅ <b>Circuit closed: {model}</b>\nModel is responding again.",
+        "model_fallback": "↪️ <b>{agent_id}</b> falling back from {model} to {fallback}",
         "custom_message": "📢 {message}",
     }
 
@@ -95,6 +105,13 @@ class MessageTemplates:
             minutes = int(duration_secs // 60)
             seconds = int(duration_secs % 60)
             context["duration"] = f"{minutes}m {seconds}s"
+        elif event.event_type == "circuit_open":
+            fallback = context.get("fallback")
+            if fallback:
+                context["fallback_text"] = f"using {fallback}"
+            else:
+                reset = int(event.data.get("reset_seconds", 0))
+                context["fallback_text"] = f"failing fast for {reset}s"
 
         # Format stages list if present
         if "stages" in context and isinstance(context["stages"], list):
@@ -2,11 +2,16 @@
 
 from __future__ import annotations
 
-from collections.abc import Callable
+import asyncio
+import logging
+from collections.abc import Callable, Iterable, Iterator
+from contextlib import contextmanager
 from enum import Enum
 from pathlib import Path
 from typing import Any
 
+from teambot.copilot.resilience import timeout_scope
+from teambot.copilot.telemetry import stage_scope
 from teambot.orchestration.acceptance_test_executor import (
     AcceptanceTestExecutor,
     AcceptanceTestResult,
@@ -14,14 +19,13 @@ from teambot.orchestration.acceptance_test_executor import (
 )
 from teambot.orchestration.objective_parser import parse_objective_file
 from teambot.orchestration.review_iterator import ReviewIterator, ReviewStatus
-from teambot.orchestration.stage_config import (
-    ParallelGroupConfig,
-    StagesConfiguration,
-    load_stages_config,
-)
+from teambot.orchestration.stage_config import StagesConfiguration, load_stages_config
 from teambot.orchestration.time_manager import TimeManager
+from teambot.workflow.journal import ContentStore, StateJournal
 from teambot.workflow.stages import STAGE_METADATA, WorkflowStage
 
+logger = logging.getLogger(__name__)
+
 
 class ExecutionResult(Enum):
     """Result of execution loop."""
@@ -83,7 +87,13 @@ STAGE_ORDER = [
 
 
 class ExecutionLoop:
-    """Main driver for file-based orchestration."""
+    """Main driver for file-based orchestration.
+
+    Stages are scheduled by their dependencies (see
+    StagesConfiguration.get_dependencies), so independent stages run
+    concurrently. ``current_stage`` is the first stage in stage order that
+    has not completed; ``completed_stages`` records completion per stage.
+    """
 
     def __init__(
         self,
@@ -107,6 +117,12 @@ class ExecutionLoop:
         # Create artifacts subdirectory
         (self.teambot_dir / "artifacts").mkdir(exist_ok=True)
 
+        # State is saved as a snapshot plus journal; stage outputs are stored
+        # by content hash so each save only refers to them
+        self._journal = StateJournal(self.teambot_dir / "orchestration_state.json")
+        self._outputs = ContentStore(self.teambot_dir / "outputs")
+        self._output_refs: dict[WorkflowStage, tuple[str, str]] = {}
+
         # Load stages configuration
         if stages_config is not None:
             self.stages_config = stages_config
@@ -117,7 +133,9 @@ class ExecutionLoop:
 
         # Current state
         self.current_stage = WorkflowStage.SETUP
+        self.completed_stages: set[WorkflowStage] = set()
         self.stage_outputs: dict[WorkflowStage, str] = {}
+        self._running_stages: set[WorkflowStage] = set()
 
         # Parallel group tracking (for resume mid-parallel-group)
         self.parallel_group_status: dict[str, dict[str, Any]] = {}
@@ -132,6 +150,9 @@ class ExecutionLoop:
         self.sdk_client: Any = None
         self.review_iterator: ReviewIterator | None = None
 
+        # Background session pre-warming for upcoming stages
+        self._warming: set[asyncio.Future[Any]] = set()
+
     async def run(
         self,
         sdk_client: Any,
@@ -166,220 +187,334 @@ class ExecutionLoop:
             )
 
         try:
-            while self.current_stage != WorkflowStage.COMPLETE:
-                # Check cancellation
-                if self.cancelled:
-                    self._emit_completed_event(on_progress, "cancelled")
-                    self._save_state(ExecutionResult.CANCELLED)
-                    return ExecutionResult.CANCELLED
-
-                # Check timeout
-                if self.time_manager.is_expired():
-                    self._emit_completed_event(on_progress, "timeout")
-                    self._save_state(ExecutionResult.TIMEOUT)
-                    return ExecutionResult.TIMEOUT
-
-                stage = self.current_stage
-
-                if on_progress:
-                    on_progress("stage_changed", {"stage": stage.name})
-
-                # Execute stage based on type
-                stage_config = self.stages_config.stages.get(stage)
-
-                # Check for parallel group first - this triggers when we reach
-                # the first stage in a parallel group
-                parallel_group = self._get_parallel_group_for_stage(stage)
-                if parallel_group:
-                    success = await self._execute_parallel_group(parallel_group, on_progress)
-                    if not success:
-                        self._emit_completed_event(on_progress, "error")
-                        self._save_state(ExecutionResult.ERROR)
-                        return ExecutionResult.ERROR
-                    # Skip to the 'before' stage (e.g., PLAN) after parallel group
-                    self.current_stage = parallel_group.before
-                    self._save_state()
-                    continue  # Skip normal stage advancement
-
-                elif stage in self.stages_config.acceptance_test_stages:
-                    # Execute acceptance test stage with retry loop
-                    await self._execute_acceptance_test_with_retry(stage, on_progress)
-                    if not self.acceptance_tests_passed:
-                        self._emit_completed_event(on_progress, "acceptance_test_failed")
-                        self._save_state(ExecutionResult.ACCEPTANCE_TEST_FAILED)
-                        return ExecutionResult.ACCEPTANCE_TEST_FAILED
-                elif stage in self.stages_config.review_stages:
-                    # Check if this review requires acceptance tests to have passed
-                    if (
-                        stage_config
-                        and stage_config.requires_acceptance_tests_passed
-                        and not self.acceptance_tests_passed
-                    ):
-                        # Cannot proceed - acceptance tests haven't passed
-                        self.stage_outputs[stage] = (
-                            "BLOCKED: Cannot proceed with post-review - "
-                            "acceptance tests have not been executed or did not pass."
-                        )
-                        self._emit_completed_event(on_progress, "acceptance_test_failed")
-                        self._save_state(ExecutionResult.ACCEPTANCE_TEST_FAILED)
-                        return ExecutionResult.ACCEPTANCE_TEST_FAILED
-
-                    result = await self._execute_review_stage(stage, on_progress)
-                    if result == ReviewStatus.FAILED:
-                        self._emit_completed_event(on_progress, "review_failed")
-                        self._save_state(ExecutionResult.REVIEW_FAILED)
-                        return ExecutionResult.REVIEW_FAILED
-                else:
-                    await self._execute_work_stage(stage, on_progress)
-
-                # Advance to next stage
-                self.current_stage = self._get_next_stage(stage)
-
-                # Save state after each stage completion for resumability
-                self._save_state()
-
-            self._emit_completed_event(on_progress, "complete")
-            self._save_state(ExecutionResult.COMPLETE)
-            return ExecutionResult.COMPLETE
+            result = await self._run_stages(on_progress)
+            self._emit_completed_event(on_progress, result.value)
+            self._save_state(result)
+            return result
 
         except Exception:
             self._emit_completed_event(on_progress, "error")
             self._save_state(ExecutionResult.ERROR)
             raise
 
-    def _emit_completed_event(
-        self,
-        on_progress: Callable[[str, Any], None] | None,
-        status: str,
-    ) -> None:
-        """Emit orchestration_completed event.
-
-        Args:
-            on_progress: Progress callback (may be None)
-            status: Completion status (complete, cancelled, timeout, error, etc.)
-        """
-        if on_progress:
-            objective_name = (
-                self.objective.title
-                if hasattr(self.objective, "title") and self.objective.title
-                else self.feature_name
-            )
-            on_progress(
-                "orchestration_completed",
-                {
-                    "objective_name": objective_name,
-                    "status": status,
-                    "duration_seconds": self.time_manager.elapsed_seconds,
-                },
-            )
+        finally:
+            for task in self._warming:
+                task.cancel()
 
-    def _get_parallel_group_for_stage(self, stage: WorkflowStage) -> ParallelGroupConfig | None:
-        """Find parallel group that starts with this stage.
+    async def _run_stages(self, on_progress: Callable[[str, Any], None] | None) -> ExecutionResult:
+        """Run every stage once its dependencies have completed.
 
-        Only triggers when the stage is the first stage in a parallel group.
+        Stages whose dependencies are complete start right away, so
+        independent stages overlap; a stage waits while a running stage
+        uses one of its agents. Once a stage fails, or execution is
+        cancelled or out of time, no further stages start, but running
+        stages are allowed to finish.
 
         Args:
-            stage: Current stage to check
+            on_progress: Progress callback
 
         Returns:
-            ParallelGroupConfig if stage is first in a group, None otherwise
+            COMPLETE, or the outcome that stopped execution
+
+        Raises:
+            Exception: The first error raised by a stage, once running
+                stages have finished.
         """
+        if not self.completed_stages:
+            # Fresh start, or state saved before completion was tracked per stage
+            self.completed_stages = self._stages_completed_before(self.current_stage)
 
-        for group in self.stages_config.parallel_groups:
-            # Only trigger on the first stage in the group
-            if group.stages and stage == group.stages[0]:
-                return group
-        return None
+        running: dict[asyncio.Future[ExecutionResult | None], WorkflowStage] = {}
+        result: ExecutionResult | None = None
+        error: Exception | None = None
+        try:
+            while True:
+                if result is None and error is None:
+                    if self.cancelled:
+                        result = ExecutionResult.CANCELLED
+                    elif self.time_manager.is_expired():
+                        result = ExecutionResult.TIMEOUT
+                    else:
+                        for stage in self._ready_stages(running.values()):
+                            self._stage_started(stage, on_progress)
+                            task = asyncio.ensure_future(self._execute_stage(stage, on_progress))
+                            running[task] = stage
+                if not running:
+                    break
+
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                order = self.stages_config.stage_order
+                for task in sorted(done, key=lambda t: order.index(running[t])):
+                    stage = running.pop(task)
+                    try:
+                        stage_result = task.result()
+                    except Exception as e:
+                        self._stage_finished(stage, on_progress, error=str(e))
+                        error = error or e
+                        continue
+                    if stage_result is None:
+                        self._stage_finished(stage, on_progress)
+                        self._save_state()
+                    else:
+                        self._stage_finished(stage, on_progress, error=stage_result.value)
+                        result = result or stage_result
+        finally:
+            # Only reached with stages running if this task itself was cancelled
+            for task in running:
+                task.cancel()
+
+        if error is not None:
+            raise error
+        if result is not None:
+            return result
+
+        blocked = [s.name for s in self._scheduled_stages() if s not in self.completed_stages]
+        if blocked:
+            raise RuntimeError(f"Stages with unmet dependencies: {', '.join(blocked)}")
+        return ExecutionResult.COMPLETE
 
-    async def _execute_parallel_group(
+    async def _execute_stage(
         self,
-        group: ParallelGroupConfig,
+        stage: WorkflowStage,
         on_progress: Callable[[str, Any], None] | None,
-    ) -> bool:
-        """Execute all stages in a parallel group concurrently.
+    ) -> ExecutionResult | None:
+        """Execute one stage according to its type.
 
         Args:
-            group: Parallel group configuration
+            stage: Stage to execute
             on_progress: Progress callback
 
         Returns:
-            True if all stages succeeded, False if any failed
+            None if the stage completed, otherwise the outcome that stops execution
         """
-        from teambot.orchestration.parallel_stage_executor import ParallelStageExecutor
-
         if on_progress:
-            on_progress(
-                "parallel_group_start",
-                {
-                    "group": group.name,
-                    "stages": [s.name for s in group.stages],
-                },
-            )
+            on_progress("stage_changed", {"stage": stage.name})
 
-        # Filter to only incomplete stages (for resume support)
-        stages_to_run = self._filter_incomplete_stages(group)
+        # Open sessions for this stage and those it unblocks while it runs
+        self._warm_ahead(stage)
 
-        if not stages_to_run:
-            # All stages already complete
-            if on_progress:
-                on_progress(
-                    "parallel_group_complete",
-                    {"group": group.name, "all_success": True},
+        stage_config = self.stages_config.stages.get(stage)
+
+        if stage in self.stages_config.acceptance_test_stages:
+            # Execute acceptance test stage with retry loop
+            with self._stage_requests(stage):
+                await self._execute_acceptance_test_with_retry(stage, on_progress)
+            if not self.acceptance_tests_passed:
+                return ExecutionResult.ACCEPTANCE_TEST_FAILED
+        elif stage in self.stages_config.review_stages:
+            # Check if this review requires acceptance tests to have passed
+            if (
+                stage_config
+                and stage_config.requires_acceptance_tests_passed
+                and not self.acceptance_tests_passed
+            ):
+                # Cannot proceed - acceptance tests haven't passed
+                self.stage_outputs[stage] = (
+                    "BLOCKED: Cannot proceed with post-review - "
+                    "acceptance tests have not been executed or did not pass."
                 )
-            return True
+                return ExecutionResult.ACCEPTANCE_TEST_FAILED
 
-        executor = ParallelStageExecutor(max_concurrent=2)
-        results = await executor.execute_parallel(
-            stages=stages_to_run,
-            execution_loop=self,
-            on_progress=on_progress,
-        )
+            status = await self._execute_review_stage(stage, on_progress)
+            if status == ReviewStatus.FAILED:
+                return ExecutionResult.REVIEW_FAILED
+        else:
+            await self._execute_work_stage(stage, on_progress)
+
+        return None
+
+    def _scheduled_stages(self) -> list[WorkflowStage]:
+        """Get the stages to execute, in stage order (COMPLETE is only a marker)."""
+        return [s for s in self.stages_config.stage_order if s != WorkflowStage.COMPLETE]
+
+    def _stages_completed_before(self, stage: WorkflowStage) -> set[WorkflowStage]:
+        """Derive completed stages from a position in the stage order.
+
+        Used when no per-stage completion is known: every stage before
+        ``stage`` counts as complete, plus parallel group stages recorded
+        as completed.
+
+        Args:
+            stage: Stage execution continues from
+
+        Returns:
+            Set of completed stages
+        """
+        scheduled = self._scheduled_stages()
+        if stage == WorkflowStage.COMPLETE:
+            return set(scheduled)
+
+        completed = set(scheduled[: scheduled.index(stage)]) if stage in scheduled else set()
+        for group_status in self.parallel_group_status.values():
+            for name, info in group_status.get("stages", {}).items():
+                if info.get("status") == "completed":
+                    completed.add(WorkflowStage[name])
+        return completed
+
+    def _stage_agent_ids(self, stage: WorkflowStage) -> set[str]:
+        """Get the agents a stage uses."""
+        return {a for a in self.stages_config.get_stage_agents(stage).values() if a}
+
+    def _ready_stages(self, running: Iterable[WorkflowStage]) -> list[WorkflowStage]:
+        """Get stages that can start now.
 
-        # Track results in parallel_group_status
-        if group.name not in self.parallel_group_status:
-            self.parallel_group_status[group.name] = {"stages": {}}
+        A stage is ready when all its dependencies have completed and none
+        of its agents is busy; two stages sharing an agent would share its
+        session.
 
-        for stage, result in results.items():
-            self.parallel_group_status[group.name]["stages"][stage.name] = {
-                "status": "completed" if result.success else "failed",
-                "error": result.error,
+        Args:
+            running: Stages currently executing
+
+        Returns:
+            Stages to start, in stage order
+        """
+        running = set(running)
+        busy = {agent for stage in running for agent in self._stage_agent_ids(stage)}
+        ready = []
+        for stage in self._scheduled_stages():
+            if stage in self.completed_stages or stage in running:
+                continue
+            if not set(self.stages_config.get_dependencies(stage)) <= self.completed_stages:
+                continue
+            agents = self._stage_agent_ids(stage)
+            if agents & busy:
+                continue
+            busy |= agents
+            ready.append(stage)
+        return ready
+
+    def _stage_started(
+        self,
+        stage: WorkflowStage,
+        on_progress: Callable[[str, Any], None] | None,
+    ) -> None:
+        """Record that a stage is starting, reporting parallel group progress."""
+        group = self.stages_config.get_parallel_group(stage)
+        if group:
+            if on_progress and not any(s in self._running_stages for s in group.stages):
+                on_progress(
+                    "parallel_group_start",
+                    {"group": group.name, "stages": [s.name for s in group.stages]},
+                )
+            group_status = self.parallel_group_status.setdefault(group.name, {"stages": {}})
+            group_status.setdefault("stages", {})[stage.name] = {
+                "status": "in_progress",
+                "error": None,
             }
+            if on_progress:
+                agent = self._agent(stage)
+                on_progress("parallel_stage_start", {"stage": stage.name, "agent": agent})
+        self._running_stages.add(stage)
 
-        all_success = all(r.success for r in results.values())
+    def _stage_finished(
+        self,
+        stage: WorkflowStage,
+        on_progress: Callable[[str, Any], None] | None,
+        error: str | None = None,
+    ) -> None:
+        """Record that a stage has finished, successfully unless there is an error.
 
-        if on_progress:
+        Args:
+            stage: Stage that finished
+            on_progress: Progress callback
+            error: Why the stage failed, if it did
+        """
+        self._running_stages.discard(stage)
+        if error is None:
+            self.completed_stages.add(stage)
+            self.current_stage = next(
+                (s for s in self._scheduled_stages() if s not in self.completed_stages),
+                WorkflowStage.COMPLETE,
+            )
+
+        group = self.stages_config.get_parallel_group(stage)
+        if not group:
+            return
+
+        stages_status = self.parallel_group_status[group.name]["stages"]
+        stages_status[stage.name] = {
+            "status": "completed" if error is None else "failed",
+            "error": error,
+        }
+        if not on_progress:
+            return
+
+        event = "parallel_stage_complete" if error is None else "parallel_stage_failed"
+        on_progress(event, {"stage": stage.name, "agent": self._agent(stage)})
+        if any(s in self._running_stages for s in group.stages):
+            return
+        statuses = [stages_status.get(s.name, {}).get("status") for s in group.stages]
+        if all(status in ("completed", "failed") for status in statuses):
             on_progress(
                 "parallel_group_complete",
-                {"group": group.name, "all_success": all_success},
+                {"group": group.name, "all_success": all(s == "completed" for s in statuses)},
             )
 
-        return all_success
+    def _agent(self, stage: WorkflowStage) -> str:
+        """Get the agent reported as running a stage."""
+        agents = self.stages_config.get_stage_agents(stage)
+        return agents.get("work") or agents.get("review") or "builder-1"
+
+    @contextmanager
+    def _stage_requests(self, stage: WorkflowStage) -> Iterator[None]:
+        """Tag SDK requests made within the block with the stage and its deadline."""
+        stage_config = self.stages_config.stages.get(stage)
+        timeout = stage_config.timeout_seconds if stage_config else None
+        with stage_scope(stage.name), timeout_scope(timeout):
+            yield
 
-    def _filter_incomplete_stages(self, group: ParallelGroupConfig) -> list[WorkflowStage]:
-        """Filter parallel group stages to only those not yet completed.
+    def _warm_ahead(self, stage: WorkflowStage) -> None:
+        """Pre-warm sessions of the agents of a stage and the stages it unblocks.
 
-        Used for resume support - only re-run stages that didn't complete.
+        Runs in the background, so the agents of stages that can start as
+        soon as this one completes get their sessions while it is working.
 
         Args:
-            group: Parallel group configuration
-
-        Returns:
-            List of stages that need to be executed
+            stage: Stage about to run.
         """
-        if group.name not in self.parallel_group_status:
-            # No prior status - run all stages
-            return list(group.stages)
-
-        group_status = self.parallel_group_status[group.name]
-        stages_status = group_status.get("stages", {})
+        prewarm = getattr(self.sdk_client, "prewarm", None)
+        if prewarm is None:
+            return
+
+        settled = self.completed_stages | self._running_stages | {stage}
+        stages = [stage]
+        for upcoming in self.stages_config.stage_order:
+            dependencies = set(self.stages_config.get_dependencies(upcoming))
+            if upcoming not in settled and stage in dependencies and dependencies <= settled:
+                stages.append(upcoming)
+        agents = [agent for upcoming in stages for agent in self._stage_agent_ids(upcoming)]
+        if not agents:
+            return
+
+        task = asyncio.ensure_future(prewarm(agents))
+        self._warming.add(task)
+        task.add_done_callback(self._warming.discard)
 
-        incomplete = []
-        for stage in group.stages:
-            stage_info = stages_status.get(stage.name, {})
-            if stage_info.get("status") != "completed":
-                incomplete.append(stage)
+    def _emit_completed_event(
+        self,
+        on_progress: Callable[[str, Any], None] | None,
+        status: str,
+    ) -> None:
+        """Emit orchestration_completed event.
 
-        return incomplete
+        Args:
+            on_progress: Progress callback (may be None)
+            status: Completion status (complete, cancelled, timeout, error, etc.)
+        """
+        if on_progress:
+            objective_name = (
+                self.objective.title
+                if hasattr(self.objective, "title") and self.objective.title
+                else self.feature_name
+            )
+            on_progress(
+                "orchestration_completed",
+                {
+                    "objective_name": objective_name,
+                    "status": status,
+                    "duration_seconds": self.time_manager.elapsed_seconds,
+                },
+            )
 
     def cancel(self) -> None:
         """Request cancellation of execution."""
@@ -810,7 +945,8 @@ class ExecutionLoop:
         context = self._build_stage_context(stage, work_agent)
 
         # Execute the agent
-        output = await self.sdk_client.execute_streaming(work_agent, context, None)
+        with self._stage_requests(stage):
+            output = await self.sdk_client.execute_streaming(work_agent, context, None)
 
         # Store output for later stages
         self.stage_outputs[stage] = output
@@ -839,13 +975,14 @@ class ExecutionLoop:
             if on_progress:
                 on_progress("review_progress", {"stage": stage.name, "message": msg})
 
-        result = await self.review_iterator.execute(
-            stage=stage,
-            work_agent=work_agent,
-            review_agent=review_agent,
-            context=context,
-            on_progress=review_progress,
-        )
+        with self._stage_requests(stage):
+            result = await self.review_iterator.execute(
+                stage=stage,
+                work_agent=work_agent,
+                review_agent=review_agent,
+                context=context,
+                on_progress=review_progress,
+            )
 
         # Store review output for this stage
         if result.final_output:
@@ -1017,28 +1154,16 @@ class ExecutionLoop:
                 return work_stage
         return None
 
-    def _get_next_stage(self, current: WorkflowStage) -> WorkflowStage:
-        """Get the next stage in the workflow."""
-        stage_order = self.stages_config.stage_order
-        try:
-            idx = stage_order.index(current)
-            if idx + 1 < len(stage_order):
-                return stage_order[idx + 1]
-        except ValueError:
-            pass
-        return WorkflowStage.COMPLETE
-
     def _save_state(self, result: ExecutionResult | None = None) -> None:
         """Save orchestration state to workflow state file.
 
+        Saves append the changes to the journal; the final save of a run
+        (with a result) rewrites the snapshot.
+
         Args:
             result: The execution result that caused this save. If None,
                     status is inferred from self.cancelled.
         """
-        state_file = self.teambot_dir / "orchestration_state.json"
-
-        import json
-
         # Determine status from execution result
         if result is not None:
             status = result.value
@@ -1063,11 +1188,26 @@ class ExecutionLoop:
             "acceptance_test_summary": (
                 self.acceptance_test_result.summary if self.acceptance_test_result else None
             ),
-            "stage_outputs": {k.name: v for k, v in self.stage_outputs.items()},
+            "completed_stages": [
+                s.name for s in self.stages_config.stage_order if s in self.completed_stages
+            ],
+            "stage_output_refs": {
+                stage.name: self._output_ref(stage, output)
+                for stage, output in self.stage_outputs.items()
+            },
             "parallel_group_status": self.parallel_group_status,
         }
 
-        state_file.write_text(json.dumps(state, indent=2))
+        self._journal.save(state, checkpoint=result is not None)
+
+    def _output_ref(self, stage: WorkflowStage, output: str) -> str:
+        """Store a stage's output, returning its digest (hashed once per output)."""
+        cached = self._output_refs.get(stage)
+        if cached is not None and cached[0] is output:
+            return cached[1]
+        digest = self._outputs.put(output)
+        self._output_refs[stage] = (output, digest)
+        return digest
 
     @classmethod
     def resume(cls, teambot_dir: Path, config: dict[str, Any]) -> ExecutionLoop:
@@ -1083,8 +1223,6 @@ class ExecutionLoop:
         Returns:
             ExecutionLoop ready to continue execution
         """
-        import json
-
         state_file = teambot_dir / "orchestration_state.json"
 
         # If not found directly, scan subdirectories for state files
@@ -1094,7 +1232,8 @@ class ExecutionLoop:
         if state_file is None or not state_file.exists():
             raise ValueError("No orchestration state to resume")
 
-        state = json.loads(state_file.read_text())
+        journal = StateJournal(state_file)
+        state = journal.load()
 
         objective_path = Path(state["objective_file"])
 
@@ -1113,9 +1252,22 @@ class ExecutionLoop:
         loop.time_manager.resume(state["elapsed_seconds"])
         loop.current_stage = WorkflowStage[state["current_stage"]]
 
-        # Restore stage outputs
+        # Restore per-stage completion; older state files only have current_stage,
+        # from which run() derives it
+        loop.completed_stages = {WorkflowStage[name] for name in state.get("completed_stages", [])}
+
+        # Continue the same journal rather than starting a new snapshot
+        loop._journal = journal
+
+        # Restore stage outputs (older state files hold the text itself)
         for stage_name, output in state.get("stage_outputs", {}).items():
             loop.stage_outputs[WorkflowStage[stage_name]] = output
+        for stage_name, digest in state.get("stage_output_refs", {}).items():
+            output = loop._outputs.get(digest)
+            if output is None:
+                logger.warning(f"Stored output of stage {stage_name} is missing")
+                continue
+            loop.stage_outputs[WorkflowStage[stage_name]] = output
 
         # Restore acceptance test state
         loop.acceptance_tests_passed = state.get("acceptance_tests_passed", False)
@@ -1140,5 +1292,5 @@ class ExecutionLoop:
         candidates = list(teambot_dir.glob("*/orchestration_state.json"))
         if not candidates:
             return None
-        # Return the most recently modified state file
-        return max(candidates, key=lambda p: p.stat().st_mtime)
+        # Return the most recently saved state, counting journal appends
+        return max(candidates, key=lambda p: StateJournal(p).modified_at())
@@ -1,6 +1,11 @@
 """Stage configuration loader for file-based orchestration.
 
 Loads stage configuration from YAML file, with fallback to built-in defaults.
+
+Stages form a dependency graph: a stage may run once every stage it depends
+on has completed. Dependencies are declared per stage with ``depends_on``;
+a stage without them depends on every stage before it in ``stage_order``,
+and a stage in a parallel group depends on the group's ``after`` stage.
 """
 
 from __future__ import annotations
@@ -32,6 +37,8 @@ class StageConfig:
     parallel_agents: list[str] | None = None
     prompt_template: str | None = None
     include_objective: bool = True  # Whether to include objective content in context
+    timeout_seconds: float | None = None  # Deadline of each agent request in this stage
+    depends_on: list[WorkflowStage] | None = None  # None: all earlier stages in stage_order
 
 
 @dataclass
@@ -78,6 +85,30 @@ class StagesConfiguration:
         config = self.stages.get(stage)
         return config.exit_criteria if config else []
 
+    def get_parallel_group(self, stage: WorkflowStage) -> ParallelGroupConfig | None:
+        """Get the parallel group a stage belongs to, if any."""
+        for group in self.parallel_groups:
+            if stage in group.stages:
+                return group
+        return None
+
+    def get_dependencies(self, stage: WorkflowStage) -> list[WorkflowStage]:
+        """Get the stages that must complete before a stage can run.
+
+        Uses the stage's ``depends_on`` if declared. Otherwise a stage in a
+        parallel group depends on the group's ``after`` stage, and any other
+        stage on every stage before it in stage_order.
+        """
+        config = self.stages.get(stage)
+        if config and config.depends_on is not None:
+            return list(config.depends_on)
+        group = self.get_parallel_group(stage)
+        if group:
+            return [group.after]
+        if stage not in self.stage_order:
+            return []
+        return self.stage_order[: self.stage_order.index(stage)]
+
 
 def load_stages_config(config_path: Path | None = None) -> StagesConfiguration:
     """Load stages configuration from YAML file.
@@ -153,7 +184,16 @@ def _parse_configuration(data: dict[str, Any]) -> StagesConfiguration:
             parallel_agents=stage_data.get("parallel_agents"),
             prompt_template=stage_data.get("prompt_template"),
             include_objective=stage_data.get("include_objective", True),
+            timeout_seconds=stage_data.get("timeout_seconds"),
+            depends_on=_parse_depends_on(stage_name, stage_data.get("depends_on")),
         )
+        timeout = config.timeout_seconds
+        if timeout is not None and (
+            isinstance(timeout, bool) or not isinstance(timeout, (int, float)) or timeout <= 0
+        ):
+            raise ValueError(
+                f"Invalid timeout_seconds for stage {stage_name}: must be a positive number"
+            )
         stages[workflow_stage] = config
 
         if config.is_review_stage:
@@ -223,7 +263,7 @@ def _parse_configuration(data: dict[str, Any]) -> StagesConfiguration:
                     f"different agent (e.g., 'builder-2') to one of these stages."
                 )
 
-    return StagesConfiguration(
+    config = StagesConfiguration(
         stages=stages,
         stage_order=stage_order,
         work_to_review_mapping=work_to_review,
@@ -231,6 +271,52 @@ def _parse_configuration(data: dict[str, Any]) -> StagesConfiguration:
         acceptance_test_stages=acceptance_test_stages,
         parallel_groups=parallel_groups,
     )
+    _validate_dependencies(config)
+    return config
+
+
+def _parse_depends_on(stage_name: str, value: Any) -> list[WorkflowStage] | None:
+    """Parse a stage's depends_on list (None if not declared)."""
+    if value is None:
+        return None
+    if not isinstance(value, list):
+        raise ValueError(f"Invalid depends_on for stage {stage_name}: must be a list of stages")
+    try:
+        return [WorkflowStage[name] for name in value]
+    except KeyError as err:
+        raise ValueError(f"Unknown stage in depends_on for stage {stage_name}: {err}") from err
+
+
+def _validate_dependencies(config: StagesConfiguration) -> None:
+    """Check that every dependency is scheduled and that there are no cycles."""
+    scheduled = set(config.stage_order)
+    for stage in config.stage_order:
+        for dependency in config.get_dependencies(stage):
+            if dependency not in scheduled:
+                raise ValueError(
+                    f"Stage {stage.name} depends on {dependency.name}, which is not in stage_order"
+                )
+
+    # Depth-first search; a stage met again while on the path closes a cycle
+    visited: set[WorkflowStage] = set()
+    path: list[WorkflowStage] = []
+
+    def visit(stage: WorkflowStage) -> None:
+        if stage in path:
+            cycle = path[path.index(stage) :] + [stage]
+            raise ValueError(
+                "Stage dependencies form a cycle: " + " -> ".join(s.name for s in cycle)
+            )
+        if stage in visited:
+            return
+        path.append(stage)
+        for dependency in config.get_dependencies(stage):
+            visit(dependency)
+        path.pop()
+        visited.add(stage)
+
+    for stage in config.stage_order:
+        visit(stage)
 
 
 def _get_default_configuration() -> StagesConfiguration:
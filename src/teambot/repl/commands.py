@@ -1,6 +1,6 @@
 """System commands for TeamBot REPL.
 
-Provides /help, /status, /history, /quit, /tasks, /models, /model commands.
+Provides /help, /status, /history, /quit, /tasks, /queue, /models, /model commands.
 """
 
 import importlib.metadata
@@ -78,7 +78,11 @@ Combined (parallel groups with dependencies):
 Task management:
   /tasks         - List all tasks
   /task <id>     - View task details
-  /cancel <id>   - Cancel a pending task"""
+  /queue         - Show per-agent queues and sessions
+  /cancel <id>   - Cancel a task (stops it if running)
+
+Each agent runs one task at a time; extra work for a busy agent queues
+in its lane, with foreground commands ahead of background (&) tasks."""
         )
 
     try:
@@ -100,7 +104,9 @@ Available commands:
   /model <a> <m> - Set model for agent in session
   /tasks         - List running/completed tasks
   /task <id>     - View task details
-  /cancel <id>   - Cancel pending task
+  /queue         - Show per-agent queues and sessions
+  /cancel <id>   - Cancel task and its dependents
+  /cache [clear] - Show response cache stats, or clear it
   /use-agent <id> - Set default agent for plain text input
   /reset-agent   - Reset default agent to config value
   /history       - Show command history
@@ -365,6 +371,18 @@ def handle_reset_agent(args: list[str], router: "AgentRouter | None" = None) ->
     return CommandResult(output=f"Default agent reset to {label} (from configuration).")
 
 
+def _format_duration(seconds: float) -> str:
+    """Format a duration as e.g. '45s', '3m 20s' or '1h 05m'."""
+    seconds = int(round(seconds))
+    if seconds < 60:
+        return f"{seconds}s"
+    minutes, seconds = divmod(seconds, 60)
+    if minutes < 60:
+        return f"{minutes}m {seconds:02d}s"
+    hours, minutes = divmod(minutes, 60)
+    return f"{hours}h {minutes:02d}m"
+
+
 def handle_tasks(args: list[str], executor: Optional["TaskExecutor"]) -> CommandResult:
     """Handle /tasks command.
 
@@ -416,6 +434,8 @@ def handle_tasks(args: list[str], executor: Optional["TaskExecutor"]) -> Command
 
         # Format status with icon and text
         status_text = task.status.name.replace("_", " ").title()
+        if task.result and task.result.timed_out:
+            status_icon, status_text = "⏱️", "Timed Out"
         # Truncate status text if needed (icon=1 + space=1 leaves 9 chars for text)
         if len(status_text) > 9:
             status_text = status_text[:8] + "…"
@@ -431,11 +451,134 @@ def handle_tasks(args: list[str], executor: Optional["TaskExecutor"]) -> Command
         lines.append(line)
 
     lines.append("")
+    timed_out = sum(1 for task in tasks if task.result and task.result.timed_out)
+    if timed_out:
+        lines.append(f"Timed out: {timed_out}")
+
+    if any(not task.status.is_terminal() for task in tasks):
+        critical_path = executor.get_critical_path()
+        if critical_path is not None:
+            steps = []
+            for task_id in critical_path.task_ids:
+                task = executor.get_task(task_id)
+                steps.append(f"#{task_id} @{task.agent_id}" if task else f"#{task_id}")
+            lines.append(
+                f"Critical path: {' -> '.join(steps)} "
+                f"(~{_format_duration(critical_path.remaining)} remaining)"
+            )
+            lines.append(f"Estimated completion: {critical_path.eta.strftime('%H:%M:%S')}")
+
     lines.append("Use: /task <id> to view details")
 
     return CommandResult(output="\n".join(lines))
 
 
+def handle_queue(args: list[str], executor: Optional["TaskExecutor"]) -> CommandResult:
+    """Handle /queue command.
+
+    Args:
+        args: Command arguments (unused).
+        executor: TaskExecutor with lane state.
+
+    Returns:
+        CommandResult with per-agent lane depths.
+    """
+    if executor is None:
+        return CommandResult(
+            output="Task executor not available.",
+            success=False,
+        )
+
+    lanes = executor.get_lane_stats()
+    pools = executor.get_session_pool_stats()
+
+    if not lanes and not pools:
+        return CommandResult(output="No agent lanes in use.")
+
+    lines = []
+    if lanes:
+        lines.extend(["Agent Lanes:", ""])
+        lines.append(f"  {'Agent':<12} {'Running':>9} {'Queued':>8} {'(fg/bg)':>9}")
+        lines.append(f"  {'-' * 12} {'-' * 9} {'-' * 8} {'-' * 9}")
+        for lane in lanes:
+            agent_id = f"@{lane.agent_id}"
+            running = f"{lane.running}/{lane.limit}"
+            split = f"{lane.queued_foreground}/{lane.queued_background}"
+            lines.append(f"  {agent_id:<12} {running:>9} {lane.queued:>8} {split:>9}")
+
+    if pools:
+        if lines:
+            lines.append("")
+        lines.extend(["Session Pools:", ""])
+        lines.append(f"  {'Agent':<12} {'Model':<18} {'In use':>8} {'Idle':>6} {'Waiting':>8}")
+        lines.append(f"  {'-' * 12} {'-' * 18} {'-' * 8} {'-' * 6} {'-' * 8}")
+        for pool in pools:
+            agent_id = f"@{pool.agent_id}"
+            model = pool.model or "default"
+            in_use = f"{pool.in_use}/{pool.max_sessions}"
+            lines.append(
+                f"  {agent_id:<12} {model:<18} {in_use:>8} {pool.idle:>6} {pool.waiting:>8}"
+            )
+
+    return CommandResult(output="\n".join(lines))
+
+
+def _format_size(size: int) -> str:
+    """Format a byte count for display."""
+    for unit in ("B", "KB", "MB"):
+        if size < 1024:
+            return f"{size:.0f} {unit}" if unit == "B" else f"{size:.1f} {unit}"
+        size /= 1024
+    return f"{size:.1f} GB"
+
+
+def handle_cache(args: list[str], executor: Optional["TaskExecutor"]) -> CommandResult:
+    """Handle /cache command.
+
+    Args:
+        args: Subcommand (``stats`` or ``clear``; defaults to ``stats``).
+        executor: TaskExecutor whose SDK client holds the response cache.
+
+    Returns:
+        CommandResult with cache usage or the number of entries cleared.
+    """
+    if executor is None:
+        return CommandResult(
+            output="Task executor not available.",
+            success=False,
+        )
+
+    subcommand = args[0] if args else "stats"
+    if subcommand not in ("stats", "clear"):
+        return CommandResult(
+            output="Usage: /cache [stats|clear]",
+            success=False,
+        )
+
+    cache = executor.get_response_cache()
+    if cache is None:
+        return CommandResult(
+            output='Response cache is disabled. Set "response_cache": {"enabled": true} '
+            "in teambot.json to enable it."
+        )
+
+    if subcommand == "clear":
+        count = cache.clear()
+        return CommandResult(output=f"Cleared {count} cached response(s).")
+
+    stats = cache.stats()
+    lines = [
+        "Response Cache:",
+        "",
+        f"  Entries:   {stats.entries}",
+        f"  Size:      {_format_size(stats.size_bytes)} / {_format_size(stats.max_bytes)}",
+        f"  Hits:      {stats.hits} ({stats.hit_rate:.0%})",
+        f"  Misses:    {stats.misses}",
+        f"  Evictions: {stats.evictions}",
+    ]
+    return CommandResult(output="\n".join(lines))
+
+
 def handle_task(args: list[str], executor: Optional["TaskExecutor"]) -> CommandResult:
     """Handle /task <id> command.
 
@@ -601,6 +744,8 @@ class SystemCommands:
             "exit": self.quit,  # Alias
             "tasks": self.tasks,
             "task": self.task,
+            "queue": self.queue,
+            "cache": self.cache,
             "cancel": self.cancel,
             "models": self.models,
             "model": self.model,
@@ -652,6 +797,14 @@ class SystemCommands:
         """Handle /task <id> command."""
         return handle_task(args, self._executor)
 
+    def queue(self, args: list[str]) -> CommandResult:
+        """Handle /queue command."""
+        return handle_queue(args, self._executor)
+
+    def cache(self, args: list[str]) -> CommandResult:
+        """Handle /cache command."""
+        return handle_cache(args, self._executor)
+
     def cancel(self, args: list[str]) -> CommandResult:
         """Handle /cancel <id> command."""
         return handle_cancel(args, self._executor)
@@ -50,7 +50,7 @@ class REPLLoop:
             config: Optional configuration dict with default_agent setting.
         """
         self._console = console or Console()
-        self._sdk_client = sdk_client or CopilotSDKClient()
+        self._sdk_client = sdk_client or CopilotSDKClient(config=config)
         self._config = config
 
         # Extract default agent from config if provided
@@ -233,6 +233,8 @@ class REPLLoop:
                 await self._sdk_client.start()
                 self._console.print("[green]✓ SDK connected[/green]")
                 self._sdk_connected = True
+                # Open agents' sessions while the user types the first command
+                self._sdk_client.start_prewarm()
             else:
                 self._console.print("[red]✗ Copilot SDK not installed[/red]")
                 self._console.print("[dim]Run: uv add github-copilot-sdk[/dim]")
@@ -414,12 +416,13 @@ async def run_interactive_mode(console: Console | None = None, config: dict | No
         # Use new Textual split-pane interface
         from teambot.repl.router import AgentRouter
 
-        sdk_client = CopilotSDKClient()
+        sdk_client = CopilotSDKClient(config=config)
 
         # Start SDK client
         try:
             if sdk_client.is_available():
                 await sdk_client.start()
+                sdk_client.start_prewarm()
         except Exception:
             pass  # Will show error when command is executed
 
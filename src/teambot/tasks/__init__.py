@@ -1,6 +1,6 @@
 """Tasks module for parallel execution."""
 
-from teambot.tasks.executor import ExecutionResult, TaskExecutor
+from teambot.tasks.executor import BatchResult, ExecutionResult, TaskExecutor
 from teambot.tasks.graph import CycleDetectedError, TaskGraph
 from teambot.tasks.manager import TaskManager
 from teambot.tasks.models import Task, TaskResult, TaskStatus
@@ -16,4 +16,5 @@ __all__ = [
     "TaskManager",
     "TaskExecutor",
     "ExecutionResult",
+    "BatchResult",
 ]
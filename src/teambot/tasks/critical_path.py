@@ -0,0 +1,182 @@
+"""Critical-path estimates for task graphs.
+
+Ready tasks are prioritized by the longest chain of work still waiting
+on them, so limited concurrency slots go to tasks that unblock the most
+downstream work. Each task's cost is estimated from how long the same
+agent took on previous tasks.
+"""
+
+from __future__ import annotations
+
+from collections.abc import Callable, Iterable, Mapping
+from dataclasses import dataclass
+from datetime import datetime, timedelta
+
+from teambot.tasks.graph import TaskGraph
+from teambot.tasks.models import Task
+
+# Estimate used before any task has completed
+DEFAULT_TASK_ESTIMATE = 60.0
+# Weight of the newest sample in the per-agent moving average
+LATENCY_SMOOTHING = 0.3
+
+
+class LatencyEstimator:
+    """Moving average of task durations per agent."""
+
+    def __init__(self, default: float = DEFAULT_TASK_ESTIMATE):
+        """Initialize estimator.
+
+        Args:
+            default: Seconds assumed before any task has completed.
+        """
+        self._default = default
+        self._averages: dict[str, float] = {}
+
+    def record(self, agent_id: str, seconds: float) -> None:
+        """Record how long a task took.
+
+        Args:
+            agent_id: Agent that ran the task.
+            seconds: Task duration.
+        """
+        previous = self._averages.get(agent_id)
+        if previous is None:
+            self._averages[agent_id] = seconds
+        else:
+            self._averages[agent_id] = previous + LATENCY_SMOOTHING * (seconds - previous)
+
+    def record_task(self, task: Task) -> None:
+        """Record the duration of a finished task, if it ran.
+
+        Args:
+            task: Task with started_at and completed_at set.
+        """
+        if task.started_at and task.completed_at:
+            self.record(task.agent_id, (task.completed_at - task.started_at).total_seconds())
+
+    def estimate(self, agent_id: str) -> float:
+        """Estimate how long a task for an agent will take.
+
+        Agents without history use the mean of the other agents' averages.
+
+        Args:
+            agent_id: Agent identifier.
+
+        Returns:
+            Estimated duration in seconds.
+        """
+        if agent_id in self._averages:
+            return self._averages[agent_id]
+        if self._averages:
+            return sum(self._averages.values()) / len(self._averages)
+        return self._default
+
+
+@dataclass
+class CriticalPath:
+    """Longest estimated chain of unfinished work.
+
+    Attributes:
+        task_ids: Tasks on the path, in execution order.
+        remaining: Estimated seconds until the path finishes.
+        eta: Estimated completion time of all unfinished tasks.
+    """
+
+    task_ids: list[str]
+    remaining: float
+    eta: datetime
+
+
+def remaining_work(
+    task_ids: Iterable[str],
+    graph: TaskGraph,
+    tasks: Mapping[str, Task],
+    estimate: Callable[[Task], float],
+) -> dict[str, float]:
+    """Compute the longest estimated path from each task to the end of the graph.
+
+    A task's value is its own estimate plus the largest value among its
+    dependents. Finished tasks count as zero.
+
+    Args:
+        task_ids: Tasks to compute values for.
+        graph: Dependency graph.
+        tasks: Task lookup by ID.
+        estimate: Estimated remaining seconds for a single task.
+
+    Returns:
+        Map of task_id -> seconds, covering task_ids and everything downstream.
+    """
+    memo: dict[str, float] = {}
+
+    for root in task_ids:
+        # Iterative post-order walk so long chains don't hit the recursion limit
+        stack: list[tuple[str, bool]] = [(root, False)]
+        while stack:
+            task_id, expanded = stack.pop()
+            if task_id in memo:
+                continue
+
+            task = tasks.get(task_id)
+            if task is None or task.status.is_terminal():
+                memo[task_id] = 0.0
+                continue
+
+            dependents = graph.get_dependents(task_id)
+            pending = [d for d in dependents if d not in memo]
+            if pending and not expanded:
+                stack.append((task_id, True))
+                stack.extend((d, False) for d in pending)
+                continue
+
+            downstream = max((memo[d] for d in dependents), default=0.0)
+            memo[task_id] = estimate(task) + downstream
+
+    return memo
+
+
+def find_critical_path(
+    graph: TaskGraph,
+    tasks: Mapping[str, Task],
+    estimate: Callable[[Task], float],
+    max_concurrent: int,
+    now: datetime | None = None,
+) -> CriticalPath | None:
+    """Find the longest chain of unfinished work and estimate completion.
+
+    The ETA is bounded below both by the critical path and by the total
+    remaining work spread over the available concurrency slots.
+
+    Args:
+        graph: Dependency graph.
+        tasks: Task lookup by ID.
+        estimate: Estimated remaining seconds for a single task.
+        max_concurrent: Tasks that can run at once.
+        now: Reference time for the ETA (default: current time).
+
+    Returns:
+        The critical path, or None if every task has finished.
+    """
+    unfinished = [tid for tid, task in tasks.items() if not task.status.is_terminal()]
+    if not unfinished:
+        return None
+
+    work = remaining_work(unfinished, graph, tasks, estimate)
+    current = max(unfinished, key=lambda tid: work[tid])
+    path = [current]
+    while True:
+        dependents = [d for d in graph.get_dependents(current) if work.get(d, 0.0) > 0]
+        if not dependents:
+            break
+        current = max(dependents, key=lambda tid: work[tid])
+        path.append(current)
+
+    remaining = work[path[0]]
+    total = sum(estimate(tasks[tid]) for tid in unfinished)
+    finish_in = max(remaining, total / max(max_concurrent, 1))
+    return CriticalPath(
+        task_ids=path,
+        remaining=remaining,
+        eta=(now or datetime.now()) + timedelta(seconds=finish_in),
+    )
@@ -4,17 +4,30 @@ from __future__ import annotations
 
 import asyncio
 import logging
-from collections.abc import Callable
+from collections.abc import AsyncIterator, Callable, Iterable
+from contextlib import aclosing, asynccontextmanager
 from dataclasses import dataclass, field
+from pathlib import Path
 from typing import TYPE_CHECKING
 
+from teambot.copilot.sdk_client import request_scope
 from teambot.notifications.config import create_event_bus_from_config
 from teambot.repl.parser import Command, CommandType
+from teambot.tasks.critical_path import CriticalPath
 from teambot.tasks.formatting import format_agent_header
-from teambot.tasks.manager import TaskManager
+from teambot.tasks.lanes import LanePriority, LaneStats
+from teambot.tasks.manager import DEFAULT_TASK_TIMEOUT, TaskManager, current_task_id
 from teambot.tasks.models import Task, TaskResult, TaskStatus
+from teambot.tasks.retention import (
+    DEFAULT_ARCHIVE_MAX_AGE,
+    DEFAULT_ARCHIVE_MAX_BYTES,
+    RetentionPolicy,
+    TaskArchive,
+)
 
 if TYPE_CHECKING:
+    from teambot.copilot.response_cache import ResponseCache
+    from teambot.copilot.session_pool import PoolStats
     from teambot.ui.agent_state import AgentStatusManager
 
 logger = logging.getLogger(__name__)
@@ -55,6 +68,44 @@ def truncate_for_notification(text: str, max_length: int = MAX_NOTIFICATION_LENG
     return text[:max_length] + TRUNCATION_SUFFIX
 
 
+def get_agent_concurrency(config: dict | None) -> dict[str, int]:
+    """Extract per-agent lane limits from configuration.
+
+    Args:
+        config: TeamBot configuration dict.
+
+    Returns:
+        Map of agent_id -> max concurrent tasks for agents that set one.
+    """
+    if not config:
+        return {}
+    return {
+        agent["id"]: agent["max_concurrent"]
+        for agent in config.get("agents", [])
+        if "id" in agent and "max_concurrent" in agent
+    }
+
+
+def get_task_archive(config: dict | None) -> TaskArchive | None:
+    """Get the archive for tasks evicted from memory.
+
+    Args:
+        config: TeamBot configuration dict.
+
+    Returns:
+        Archive under ``<teambot_dir>/tasks``, bounded by the
+        ``task_retention`` archive limits, or None without configuration.
+    """
+    if not config:
+        return None
+    section = config.get("task_retention", {})
+    return TaskArchive(
+        Path(config.get("teambot_dir", ".teambot")) / "tasks",
+        max_bytes=section.get("archive_max_bytes", DEFAULT_ARCHIVE_MAX_BYTES),
+        max_age=section.get("archive_max_age_seconds", DEFAULT_ARCHIVE_MAX_AGE),
+    )
+
+
 @dataclass
 class ExecutionResult:
     """Result from executing a command.
@@ -76,6 +127,19 @@ class ExecutionResult:
     error: str | None = None
 
 
+@dataclass
+class BatchResult:
+    """Result of one command submitted through execute_many().
+
+    Attributes:
+        index: Position of the command in the submitted batch.
+        result: Execution result for the command.
+    """
+
+    index: int
+    result: ExecutionResult
+
+
 class TaskExecutor:
     """Executes REPL commands using TaskManager.
 
@@ -85,13 +149,14 @@ class TaskExecutor:
     - Background execution (&)
     - Multi-agent fan-out (,)
     - Pipelines with dependencies (->)
+    - Batches of commands run as one task graph
     """
 
     def __init__(
         self,
         sdk_client,
         max_concurrent: int = 3,
-        default_timeout: float = 120.0,
+        default_timeout: float = DEFAULT_TASK_TIMEOUT,
         on_task_complete: Callable | None = None,
         on_task_started: Callable | None = None,
         on_streaming_chunk: Callable | None = None,
@@ -100,6 +165,7 @@ class TaskExecutor:
         on_pipeline_complete: Callable | None = None,
         agent_status_manager: AgentStatusManager | None = None,
         config: dict | None = None,
+        reference_timeout: float | None = None,
     ):
         """Initialize executor.
 
@@ -115,6 +181,10 @@ class TaskExecutor:
             on_pipeline_complete: Callback when pipeline completes (clears progress).
             agent_status_manager: Optional manager for agent status updates.
             config: Optional configuration dict for notification settings.
+            reference_timeout: Max seconds to wait for $ref agents (None = no limit).
+                Per-agent lane limits are read from ``max_concurrent`` on each
+                entry of ``config["agents"]``, and finished-task retention from
+                ``config["task_retention"]``.
         """
         self._sdk_client = sdk_client
         self._on_task_complete = on_task_complete
@@ -125,15 +195,20 @@ class TaskExecutor:
         self._on_pipeline_complete = on_pipeline_complete
         self._agent_status = agent_status_manager
         self._config = config
+        self._reference_timeout = reference_timeout
 
         # Create manager with our executor function
         self._manager = TaskManager(
             executor=self._execute_agent_task,
             max_concurrent=max_concurrent,
             default_timeout=default_timeout,
+            agent_concurrency=get_agent_concurrency(config),
+            retention=RetentionPolicy.from_config(config) if config else None,
+            archive=get_task_archive(config),
+            cancel_request=self._cancel_agent_request,
         )
 
-        # Track background task futures
+        # Track background task futures (removed once they finish)
         self._background_tasks: dict[str, asyncio.Task] = {}
 
     @property
@@ -141,6 +216,65 @@ class TaskExecutor:
         """Get total number of tasks."""
         return self._manager.task_count
 
+    def get_lane_stats(self) -> list[LaneStats]:
+        """Get queue depths of the per-agent execution lanes.
+
+        Returns:
+            LaneStats for every agent that has run or queued work.
+        """
+        return self._manager.lanes.get_stats()
+
+    def get_session_pool_stats(self) -> list[PoolStats]:
+        """Get utilization of the SDK client's per-agent session pools.
+
+        Returns:
+            PoolStats per agent and model, or an empty list if the client
+            does not pool sessions.
+        """
+        if not hasattr(self._sdk_client, "get_pool_stats"):
+            return []
+        return self._sdk_client.get_pool_stats()
+
+    def get_response_cache(self) -> ResponseCache | None:
+        """Get the SDK client's response cache.
+
+        Returns:
+            The cache, or None if the client does not cache responses.
+        """
+        return getattr(self._sdk_client, "response_cache", None)
+
+    @asynccontextmanager
+    async def lane_slot(self, agent_id: str, background: bool = False) -> AsyncIterator[None]:
+        """Hold a place in an agent's lane for work done outside the manager.
+
+        Used by callers that stream directly through the SDK client so they
+        still queue behind (and ahead of) managed tasks for the same agent.
+
+        Args:
+            agent_id: Agent identifier.
+            background: Whether the work is a background request.
+        """
+        priority = LanePriority.BACKGROUND if background else LanePriority.FOREGROUND
+        async with self._manager.lanes.slot(agent_id, priority):
+            yield
+
+    def _track_background(self, task_ids: list[str], bg_task: asyncio.Task) -> None:
+        """Remember the asyncio task running background work until it finishes.
+
+        Args:
+            task_ids: Tasks run by the asyncio task.
+            bg_task: The asyncio task.
+        """
+        for task_id in task_ids:
+            self._background_tasks[task_id] = bg_task
+
+        def forget(done: asyncio.Task) -> None:
+            for task_id in task_ids:
+                if self._background_tasks.get(task_id) is done:
+                    del self._background_tasks[task_id]
+
+        bg_task.add_done_callback(forget)
+
     def set_agent_status_manager(self, manager: AgentStatusManager) -> None:
         """Set the agent status manager for status updates.
 
@@ -229,6 +363,18 @@ class TaskExecutor:
             background=background,
         )
 
+    async def _cancel_agent_request(self, agent_id: str, task_id: str) -> None:
+        """Abort a task's in-flight SDK request.
+
+        Only the session serving the task is aborted, so the agent's other
+        tasks keep running.
+
+        Args:
+            agent_id: Agent running the task.
+            task_id: Task whose request to abort.
+        """
+        await self._sdk_client.cancel_current_request(agent_id, task_id)
+
     async def _execute_agent_task(
         self, agent_id: str, prompt: str, model: str | None = None
     ) -> str:
@@ -242,21 +388,23 @@ class TaskExecutor:
         Returns:
             Output from agent.
         """
-        # Check if SDK client supports streaming
-        if hasattr(self._sdk_client, "execute_streaming") and self._on_streaming_chunk:
-            # Use streaming with callback
-            def on_chunk(chunk: str):
-                self._on_streaming_chunk(agent_id, chunk)
-
-            # First ensure session is created with the model
-            if model:
-                await self._sdk_client.get_or_create_session(agent_id, model=model)
-            return await self._sdk_client.execute_streaming(agent_id, prompt, on_chunk)
-        else:
-            # Fall back to regular execute
-            if model:
-                await self._sdk_client.get_or_create_session(agent_id, model=model)
-            return await self._sdk_client.execute(agent_id, prompt)
+        # Tag the request with its task so cancelling the task aborts only it
+        with request_scope(current_task_id.get()):
+            # Check if SDK client supports streaming
+            if hasattr(self._sdk_client, "execute_streaming") and self._on_streaming_chunk:
+                # Use streaming with callback
+                def on_chunk(chunk: str):
+                    self._on_streaming_chunk(agent_id, chunk)
+
+                # First ensure session is created with the model
+                if model:
+                    await self._sdk_client.get_or_create_session(agent_id, model=model)
+                return await self._sdk_client.execute_streaming(agent_id, prompt, on_chunk)
+            else:
+                # Fall back to regular execute
+                if model:
+                    await self._sdk_client.get_or_create_session(agent_id, model=model)
+                return await self._sdk_client.execute(agent_id, prompt)
 
     async def execute(self, command: Command) -> ExecutionResult:
         """Execute a parsed command.
@@ -267,39 +415,249 @@ class TaskExecutor:
         Returns:
             ExecutionResult with output and status.
         """
-        if command.type != CommandType.AGENT:
+        error = self._validate_command(command)
+        if error:
+            return ExecutionResult(success=False, output="", error=error)
+
+        if command.is_pipeline:
+            return await self._execute_pipeline(command)
+        elif len(command.agent_ids) > 1:
+            return await self._execute_multiagent(command)
+        else:
+            return await self._execute_simple(command)
+
+    async def execute_many(self, commands: Iterable[Command]) -> AsyncIterator[BatchResult]:
+        """Execute a batch of commands as one combined task graph.
+
+        Tasks for every command are created up front. A ``$agent`` reference
+        to an agent run by an earlier command in the batch becomes a
+        dependency on that command's task, so its output is injected when
+        the task starts; references to agents outside the batch are waited
+        for once, before anything runs. All tasks then share one scheduler,
+        and each command's result is yielded as soon as its last task
+        settles. Tasks report their start and completion through the same
+        callbacks and agent status updates as execute().
+
+        Commands that address a pseudo-agent (``@notify``) run through
+        execute() after the graph has finished. A background marker only
+        lowers a command's lane priority; every command is awaited.
+
+        Args:
+            commands: Parsed commands, in submission order.
+
+        Yields:
+            BatchResult for each command, in completion order.
+        """
+        batch = list(commands)
+        runnable: list[int] = []
+        deferred: list[int] = []
+
+        for index, command in enumerate(batch):
+            error = self._validate_command(command) or self._validate_references(command.references)
+            if error:
+                yield BatchResult(index, ExecutionResult(success=False, output="", error=error))
+            elif any(is_pseudo_agent(a) for a in self._command_agent_ids(command)):
+                deferred.append(index)
+            else:
+                runnable.append(index)
+
+        # Agents produced inside the batch resolve statically; wait for the rest once
+        produced: set[str] = set()
+        external: dict[str, None] = {}
+        for index in runnable:
+            command = batch[index]
+            external.update((ref, None) for ref in command.references if ref not in produced)
+            produced.update(self._command_agent_ids(command))
+        wait_error = await self._wait_for_references(list(external)) if external else None
+
+        # agent_id -> task of the latest command in the batch that ran the agent
+        producers: dict[str, str] = {}
+        command_tasks: dict[int, list[str]] = {}
+        for index in runnable:
+            command = batch[index]
+            external_refs = [ref for ref in command.references if ref not in producers]
+            if external_refs and wait_error:
+                error_result = ExecutionResult(success=False, output="", error=wait_error)
+                yield BatchResult(index, error_result)
+                continue
+            command_tasks[index] = self._create_batch_tasks(command, producers, external_refs)
+
+        owners = {tid: index for index, tids in command_tasks.items() for tid in tids}
+        pending = {index: set(tids) for index, tids in command_tasks.items()}
+        # Tasks dispatched and not yet settled, for status updates
+        started: dict[str, Task] = {}
+
+        def on_start(task: Task) -> None:
+            started[task.id] = task
+            if self._on_task_started:
+                self._on_task_started(task)
+            self._status_running(task.agent_id, task.prompt[:40] if task.prompt else "")
+
+        try:
+            async with aclosing(self._manager.execute_tasks(owners, on_start)) as settled:
+                async for task in settled:
+                    if started.pop(task.id, None) is not None:
+                        if task.result is not None and task.result.success:
+                            self._status_completed(task.agent_id)
+                        else:
+                            self._status_failed(task.agent_id)
+                        self._status_idle(task.agent_id)
+                    if self._on_task_complete:
+                        self._on_task_complete(task, task.result)
+                    index = owners[task.id]
+                    pending[index].discard(task.id)
+                    if not pending[index]:
+                        result = self._collect_batch_result(batch[index], command_tasks[index])
+                        yield BatchResult(index, result)
+        finally:
+            # Batch abandoned: its running tasks were cancelled
+            for task in started.values():
+                self._status_failed(task.agent_id)
+                self._status_idle(task.agent_id)
+
+        for index in deferred:
+            yield BatchResult(index, await self.execute(batch[index]))
+
+    def _create_batch_tasks(
+        self, command: Command, producers: dict[str, str], external_refs: list[str]
+    ) -> list[str]:
+        """Create the tasks for one command of a batch.
+
+        Args:
+            command: Validated agent command without pseudo-agents.
+            producers: Map of agent_id -> latest batch task for that agent;
+                updated with the tasks created here.
+            external_refs: References to agents not produced by the batch,
+                injected into the prompt now.
+
+        Returns:
+            IDs of the created tasks.
+        """
+        ref_deps = list(
+            dict.fromkeys(producers[ref] for ref in command.references if ref in producers)
+        )
+        if command.is_pipeline and command.pipeline:
+            stages = [(stage.agent_ids, stage.content) for stage in command.pipeline]
+        else:
+            stages = [(command.agent_ids, command.content or "")]
+
+        task_ids: list[str] = []
+        dependencies = ref_deps
+        for stage_index, (agent_ids, content) in enumerate(stages):
+            prompt = content
+            if stage_index == 0 and external_refs:
+                prompt = self._inject_references(content, external_refs)
+
+            stage_task_ids = []
+            for agent_id in agent_ids:
+                task = self._manager.create_task(
+                    agent_id=agent_id,
+                    prompt=prompt,
+                    dependencies=list(dependencies),
+                    background=command.background,
+                    model=command.model,
+                )
+                stage_task_ids.append(task.id)
+                producers[agent_id] = task.id
+
+            task_ids.extend(stage_task_ids)
+            dependencies = stage_task_ids
+
+        return task_ids
+
+    def _collect_batch_result(self, command: Command, task_ids: list[str]) -> ExecutionResult:
+        """Build the result of a batch command whose tasks have all settled.
+
+        Args:
+            command: The command.
+            task_ids: Tasks created for the command.
+
+        Returns:
+            ExecutionResult shaped like execute() would return for the command.
+        """
+        tasks = [t for tid in task_ids if (t := self._manager.get_task(tid)) is not None]
+
+        if len(tasks) == 1 and not command.is_pipeline:
+            task = tasks[0]
+            result = task.result
             return ExecutionResult(
-                success=False,
-                output="",
-                error="Not an agent command",
+                success=result.success,
+                output=result.output if result.success else f"Error: {result.error}",
+                task_id=task.id,
+                task_ids=[task.id],
+                error=result.error if not result.success else None,
             )
 
-        # Validate all agent IDs before dispatch
-        from teambot.repl.router import AGENT_ALIASES, VALID_AGENTS
+        outputs = []
+        errors = []
+        all_success = True
+        for task in tasks:
+            header = format_agent_header(task.agent_id, task.id)
+            result = task.result
+            if result.success:
+                outputs.append(f"{header}\n{result.output}")
+                continue
+            all_success = False
+            if task.status == TaskStatus.SKIPPED:
+                outputs.append(f"{header}\n[{result.error}]")
+            else:
+                errors.append(f"@{task.agent_id}: {result.error}")
+                outputs.append(f"{header}\n[Failed: {result.error}]")
+
+        return ExecutionResult(
+            success=all_success,
+            output="\n\n".join(outputs),
+            task_ids=[t.id for t in tasks],
+            error="; ".join(errors) if errors else None,
+        )
 
-        all_agent_ids = []
+    @staticmethod
+    def _command_agent_ids(command: Command) -> list[str]:
+        """Get every agent a command addresses, across all pipeline stages."""
         if command.is_pipeline and command.pipeline:
-            for stage in command.pipeline:
-                all_agent_ids.extend(stage.agent_ids)
-        else:
-            all_agent_ids = list(command.agent_ids)
+            return [agent_id for stage in command.pipeline for agent_id in stage.agent_ids]
+        return list(command.agent_ids)
+
+    def _validate_command(self, command: Command) -> str | None:
+        """Check that a command is an agent command addressing known agents.
 
-        for agent_id in all_agent_ids:
+        Args:
+            command: Parsed command.
+
+        Returns:
+            Error message, or None if the command can be executed.
+        """
+        if command.type != CommandType.AGENT:
+            return "Not an agent command"
+
+        from teambot.repl.router import AGENT_ALIASES, VALID_AGENTS
+
+        for agent_id in self._command_agent_ids(command):
             canonical = AGENT_ALIASES.get(agent_id, agent_id)
             if canonical not in VALID_AGENTS:
                 valid_list = ", ".join(sorted(VALID_AGENTS))
-                return ExecutionResult(
-                    success=False,
-                    output="",
-                    error=f"Unknown agent: '{agent_id}'. Valid agents: {valid_list}",
-                )
+                return f"Unknown agent: '{agent_id}'. Valid agents: {valid_list}"
+        return None
 
-        if command.is_pipeline:
-            return await self._execute_pipeline(command)
-        elif len(command.agent_ids) > 1:
-            return await self._execute_multiagent(command)
-        else:
-            return await self._execute_simple(command)
+    @staticmethod
+    def _validate_references(references: list[str]) -> str | None:
+        """Check that every $ref names a known agent.
+
+        Args:
+            references: Referenced agent IDs.
+
+        Returns:
+            Error message, or None if all references are valid.
+        """
+        from teambot.repl.router import AGENT_ALIASES, VALID_AGENTS
+
+        invalid_refs = [
+            ref for ref in references if AGENT_ALIASES.get(ref, ref) not in VALID_AGENTS
+        ]
+        if invalid_refs:
+            valid_list = ", ".join(sorted(VALID_AGENTS))
+            return f"Unknown agent ref: ${invalid_refs[0]}. Valid: {valid_list}"
+        return None
 
     async def _execute_simple(self, command: Command) -> ExecutionResult:
         """Execute simple single-agent command.
@@ -315,21 +673,14 @@ class TaskExecutor:
         # Check for $ref dependencies
         if command.references:
             # Validate all referenced agents exist
-            from teambot.repl.router import AGENT_ALIASES, VALID_AGENTS
-
-            invalid_refs = [
-                ref for ref in command.references if AGENT_ALIASES.get(ref, ref) not in VALID_AGENTS
-            ]
-            if invalid_refs:
-                valid_list = ", ".join(sorted(VALID_AGENTS))
-                return ExecutionResult(
-                    success=False,
-                    output="",
-                    error=f"Unknown agent ref: ${invalid_refs[0]}. Valid: {valid_list}",
-                )
+            ref_error = self._validate_references(command.references)
+            if ref_error:
+                return ExecutionResult(success=False, output="", error=ref_error)
 
             # Wait for any referenced agents that are currently running
-            await self._wait_for_references(command.references)
+            wait_error = await self._wait_for_references(command.references)
+            if wait_error:
+                return ExecutionResult(success=False, output="", error=wait_error)
 
             # Build prompt with injected outputs
             prompt = self._inject_references(command.content, command.references)
@@ -351,7 +702,7 @@ class TaskExecutor:
         if command.background:
             # Start in background and return immediately
             bg_task = asyncio.create_task(self._run_task_with_callback(task.id))
-            self._background_tasks[task.id] = bg_task
+            self._track_background([task.id], bg_task)
 
             return ExecutionResult(
                 success=True,
@@ -386,18 +737,31 @@ class TaskExecutor:
                 error=result.error if not result.success else None,
             )
 
-    async def _wait_for_references(self, references: list[str]) -> None:
+    async def _wait_for_references(self, references: list[str]) -> str | None:
         """Wait for referenced agents to complete any running tasks.
 
+        Waits on each running task's completion event, so execution resumes
+        as soon as the last referenced task finishes.
+
         Args:
             references: List of agent IDs to wait for.
+
+        Returns:
+            None when all referenced agents are idle, or an error message if
+            the reference timeout expired first.
         """
-        for agent_id in references:
-            running_task = self._manager.get_running_task_for_agent(agent_id)
-            if running_task:
-                # Wait for the task to complete
-                while running_task.status == TaskStatus.RUNNING:
-                    await asyncio.sleep(0.1)
+        try:
+            await asyncio.wait_for(
+                asyncio.gather(*(self._manager.wait_for_agent(a) for a in references)),
+                timeout=self._reference_timeout,
+            )
+        except TimeoutError:
+            still_running = [
+                f"${a}" for a in references if self._manager.get_running_task_for_agent(a)
+            ]
+            logger.warning("Timed out waiting for references: %s", still_running)
+            return f"Timed out waiting for {', '.join(still_running)}"
+        return None
 
     def _inject_references(self, prompt: str, references: list[str]) -> str:
         """Inject referenced agent outputs into prompt.
@@ -458,21 +822,14 @@ class TaskExecutor:
         # Check for $ref dependencies
         if command.references:
             # Validate all referenced agents exist
-            from teambot.repl.router import AGENT_ALIASES, VALID_AGENTS
-
-            invalid_refs = [
-                ref for ref in command.references if AGENT_ALIASES.get(ref, ref) not in VALID_AGENTS
-            ]
-            if invalid_refs:
-                valid_list = ", ".join(sorted(VALID_AGENTS))
-                return ExecutionResult(
-                    success=False,
-                    output="",
-                    error=f"Unknown agent ref: ${invalid_refs[0]}. Valid: {valid_list}",
-                )
+            ref_error = self._validate_references(command.references)
+            if ref_error:
+                return ExecutionResult(success=False, output="", error=ref_error)
 
             # Wait for any referenced agents that are currently running
-            await self._wait_for_references(command.references)
+            wait_error = await self._wait_for_references(command.references)
+            if wait_error:
+                return ExecutionResult(success=False, output="", error=wait_error)
 
             # Build prompt with injected outputs
             prompt = self._inject_references(command.content, command.references)
@@ -500,7 +857,7 @@ class TaskExecutor:
             # Start all in background
             for task in tasks:
                 bg_task = asyncio.create_task(self._run_task_with_callback(task.id))
-                self._background_tasks[task.id] = bg_task
+                self._track_background([task.id], bg_task)
 
             return ExecutionResult(
                 success=True,
@@ -580,19 +937,12 @@ class TaskExecutor:
         # Handle $ref dependencies for the first stage
         if command.references:
             # Validate all referenced agents exist
-            from teambot.repl.router import AGENT_ALIASES, VALID_AGENTS
-
-            invalid_refs = [
-                ref for ref in command.references if AGENT_ALIASES.get(ref, ref) not in VALID_AGENTS
-            ]
-            if invalid_refs:
-                valid_list = ", ".join(sorted(VALID_AGENTS))
-                return ExecutionResult(
-                    success=False,
-                    output="",
-                    error=f"Unknown agent ref: ${invalid_refs[0]}. Valid: {valid_list}",
-                )
-            await self._wait_for_references(command.references)
+            ref_error = self._validate_references(command.references)
+            if ref_error:
+                return ExecutionResult(success=False, output="", error=ref_error)
+            wait_error = await self._wait_for_references(command.references)
+            if wait_error:
+                return ExecutionResult(success=False, output="", error=wait_error)
 
         all_task_ids: list[str] = []
         previous_task_ids: list[str] = []
@@ -644,8 +994,7 @@ class TaskExecutor:
             bg_task = asyncio.create_task(
                 self._run_pipeline_with_callback(all_task_ids, stage_task_map, total_stages)
             )
-            for task_id in all_task_ids:
-                self._background_tasks[task_id] = bg_task
+            self._track_background(all_task_ids, bg_task)
 
             return ExecutionResult(
                 success=True,
@@ -677,54 +1026,20 @@ class TaskExecutor:
                 if self._on_stage_change:
                     self._on_stage_change(stage_index + 1, total_stages, stage_agents)
 
-                # Execute real agent tasks in this stage
-                for task_id in stage_task_ids:
-                    task = self._manager.get_task(task_id)
-                    if not task:
-                        continue
+                # Execute real agent tasks in this stage concurrently
+                for task, result in await self._execute_stage(stage_task_ids):
+                    header = format_agent_header(task.agent_id, task.id)
 
-                    # Skip if already terminal (shouldn't happen in fresh pipeline)
-                    if task.status.is_terminal():
+                    # Already terminal (shouldn't happen in fresh pipeline)
+                    if result is None:
                         if task.result:
                             if task.result.success:
-                                header = format_agent_header(task.agent_id, task.id)
                                 final_outputs.append(f"{header}\n{task.result.output}")
                             else:
                                 all_success = False
                         continue
 
-                    # Notify task started
-                    if self._on_task_started:
-                        self._on_task_started(task)
-
-                    # Update status manager
-                    self._status_running(task.agent_id, task.prompt[:40] if task.prompt else "")
-
-                    try:
-                        # Execute the task
-                        result = await self._manager.execute_task(task_id)
-
-                        # Update status based on result
-                        if result.success:
-                            self._status_completed(task.agent_id)
-                        else:
-                            self._status_failed(task.agent_id)
-                    except asyncio.CancelledError:
-                        self._status_failed(task.agent_id)
-                        raise
-                    finally:
-                        self._status_idle(task.agent_id)
-
-                    # Notify task complete
-                    if self._on_task_complete:
-                        self._on_task_complete(task, result)
-
-                    # Emit intermediate output
-                    if self._on_stage_output and result.success:
-                        self._on_stage_output(task.agent_id, result.output)
-
                     # Collect output
-                    header = format_agent_header(task.agent_id, task.id)
                     if result.success:
                         final_outputs.append(f"{header}\n{result.output}")
                     else:
@@ -792,6 +1107,88 @@ class TaskExecutor:
                 result = self._manager.get_result(task_id)
                 self._on_task_complete(task, result)
 
+    async def _execute_stage(
+        self, stage_task_ids: list[str]
+    ) -> list[tuple[Task, TaskResult | None]]:
+        """Execute the tasks of one pipeline stage concurrently.
+
+        Tasks share the manager's concurrency slots. Intermediate outputs are
+        emitted in stage order, each as soon as it and every earlier task in
+        the stage have finished.
+
+        Args:
+            stage_task_ids: Task IDs belonging to the stage.
+
+        Returns:
+            (task, result) pairs in stage order. Result is None for tasks that
+            were already terminal before the stage started.
+        """
+        tasks = [t for tid in stage_task_ids if (t := self._manager.get_task(tid)) is not None]
+        runs = {
+            task.id: asyncio.create_task(self._execute_pipeline_task(task))
+            for task in tasks
+            if not task.status.is_terminal()
+        }
+
+        outcomes: list[tuple[Task, TaskResult | None]] = []
+        try:
+            for task in tasks:
+                run = runs.get(task.id)
+                if run is None:
+                    outcomes.append((task, None))
+                    continue
+
+                result = await run
+
+                # Emit intermediate output
+                if self._on_stage_output and result.success:
+                    self._on_stage_output(task.agent_id, result.output)
+
+                outcomes.append((task, result))
+        finally:
+            # Don't leave sibling tasks running if the stage is abandoned
+            for run in runs.values():
+                if not run.done():
+                    run.cancel()
+
+        return outcomes
+
+    async def _execute_pipeline_task(self, task: Task) -> TaskResult:
+        """Execute a single pipeline task with status and completion callbacks.
+
+        Args:
+            task: Task to execute.
+
+        Returns:
+            Task result.
+        """
+        # Notify task started
+        if self._on_task_started:
+            self._on_task_started(task)
+
+        # Update status manager
+        self._status_running(task.agent_id, task.prompt[:40] if task.prompt else "")
+
+        try:
+            result = await self._manager.execute_task_in_slot(task.id)
+
+            # Update status based on result
+            if result.success:
+                self._status_completed(task.agent_id)
+            else:
+                self._status_failed(task.agent_id)
+        except asyncio.CancelledError:
+            self._status_failed(task.agent_id)
+            raise
+        finally:
+            self._status_idle(task.agent_id)
+
+        # Notify task complete
+        if self._on_task_complete:
+            self._on_task_complete(task, result)
+
+        return result
+
     async def _run_pipeline_with_callback(
         self, task_ids: list[str], stage_task_map: dict[int, list[str]], total_stages: int
     ) -> None:
@@ -814,45 +1211,8 @@ class TaskExecutor:
                 if self._on_stage_change:
                     self._on_stage_change(stage_index + 1, total_stages, stage_agents)
 
-                # Execute tasks in this stage
-                for task_id in stage_task_ids:
-                    task = self._manager.get_task(task_id)
-                    if not task:
-                        continue
-
-                    # Skip if already terminal
-                    if task.status.is_terminal():
-                        continue
-
-                    # Notify task started
-                    if self._on_task_started:
-                        self._on_task_started(task)
-
-                    # Update status manager
-                    self._status_running(task.agent_id, task.prompt[:40] if task.prompt else "")
-
-                    try:
-                        # Execute the task
-                        result = await self._manager.execute_task(task_id)
-
-                        # Update status based on result
-                        if result.success:
-                            self._status_completed(task.agent_id)
-                        else:
-                            self._status_failed(task.agent_id)
-                    except asyncio.CancelledError:
-                        self._status_failed(task.agent_id)
-                        raise
-                    finally:
-                        self._status_idle(task.agent_id)
-
-                    # Notify task complete
-                    if self._on_task_complete:
-                        self._on_task_complete(task, result)
-
-                    # Emit intermediate output
-                    if self._on_stage_output and result.success:
-                        self._on_stage_output(task.agent_id, result.output)
+                # Execute tasks in this stage concurrently
+                await self._execute_stage(stage_task_ids)
         except Exception as e:
             # Log the exception to aid debugging
             logger.error("Pipeline execution failed with exception: %s", e, exc_info=True)
@@ -895,16 +1255,34 @@ class TaskExecutor:
     def cancel_task(self, task_id: str) -> bool:
         """Cancel a task.
 
+        A running task stops immediately: its coroutine is cancelled and the
+        agent's SDK request aborted. Dependents left without a live parent
+        are cancelled too, so the rest of a pipeline does not start. Status
+        updates and completion callbacks run as the task's caller unwinds.
+
         Args:
             task_id: Task to cancel.
 
         Returns:
             True if cancelled.
         """
-        # Also cancel the asyncio task if running
-        if task_id in self._background_tasks:
-            bg_task = self._background_tasks[task_id]
-            if not bg_task.done():
-                bg_task.cancel()
-
         return self._manager.cancel_task(task_id)
+
+    def get_critical_path(self) -> CriticalPath | None:
+        """Get the longest estimated chain of unfinished work.
+
+        Returns:
+            Critical path with remaining time and ETA, or None if idle.
+        """
+        return self._manager.get_critical_path()
+
+    def get_running_task_for_agent(self, agent_id: str) -> Task | None:
+        """Get the task currently running for an agent.
+
+        Args:
+            agent_id: Agent identifier.
+
+        Returns:
+            Running Task if found, else None.
+        """
+        return self._manager.get_running_task_for_agent(agent_id)
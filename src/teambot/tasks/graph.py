@@ -1,6 +1,6 @@
 """Task dependency graph with cycle detection."""
 
-from collections import defaultdict
+from collections import defaultdict, deque
 
 
 class CycleDetectedError(Exception):
@@ -17,6 +17,12 @@ class TaskGraph:
     - Ready task queries (no pending dependencies)
     - Topological ordering
     - Failure propagation
+
+    Readiness is maintained incrementally: each task keeps a counter of
+    dependencies that have not completed yet, and tasks whose counter
+    reaches zero join a live ready set. Adding a task and marking it
+    completed or failed therefore cost time proportional to the edges
+    touched rather than the size of the graph.
     """
 
     def __init__(self):
@@ -29,6 +35,10 @@ class TaskGraph:
         self._completed: set[str] = set()
         # Set of failed task IDs
         self._failed: set[str] = set()
+        # task_id -> number of dependencies not yet completed
+        self._in_degree: dict[str, int] = {}
+        # Tasks whose dependencies are all completed (dict used as ordered set)
+        self._ready: dict[str, None] = {}
 
     @property
     def task_count(self) -> int:
@@ -38,6 +48,8 @@ class TaskGraph:
     def add_task(self, task_id: str, dependencies: list[str]) -> None:
         """Add a task to the graph.
 
+        Re-adding an existing task replaces its dependencies.
+
         Args:
             task_id: Unique task identifier.
             dependencies: List of task IDs this task depends on.
@@ -49,59 +61,73 @@ class TaskGraph:
         if task_id in dependencies:
             raise CycleDetectedError(f"Task '{task_id}' cannot depend on itself")
 
-        # Temporarily add to check for cycles
-        old_deps = self._dependencies.get(task_id)
-        self._dependencies[task_id] = dependencies
-
-        # Update reverse edges
-        for dep_id in dependencies:
-            if task_id not in self._dependents[dep_id]:
-                self._dependents[dep_id].append(task_id)
-
-        # Check for cycles using DFS
-        if self._has_cycle():
-            # Rollback
-            if old_deps is None:
-                del self._dependencies[task_id]
-            else:
-                self._dependencies[task_id] = old_deps
-            for dep_id in dependencies:
-                if task_id in self._dependents[dep_id]:
-                    self._dependents[dep_id].remove(task_id)
+        if self._creates_cycle(task_id, dependencies):
             raise CycleDetectedError(
                 f"Adding task '{task_id}' with dependencies {dependencies} would create a cycle"
             )
 
-    def _has_cycle(self) -> bool:
-        """Check if graph has a cycle using DFS.
+        # Drop reverse edges from a previous definition of this task
+        for dep_id in self._dependencies.get(task_id, []):
+            if task_id in self._dependents[dep_id]:
+                self._dependents[dep_id].remove(task_id)
 
-        Returns:
-            True if cycle detected.
-        """
-        # States: 0 = unvisited, 1 = visiting, 2 = visited
-        state: dict[str, int] = defaultdict(int)
+        self._dependencies[task_id] = dependencies
 
-        def dfs(node: str) -> bool:
-            if state[node] == 1:  # Currently visiting -> cycle
-                return True
-            if state[node] == 2:  # Already fully visited
-                return False
+        unique_deps = set(dependencies)
+        for dep_id in unique_deps:
+            self._dependents[dep_id].append(task_id)
 
-            state[node] = 1  # Mark as visiting
+        self._in_degree[task_id] = sum(1 for dep_id in unique_deps if dep_id not in self._completed)
+        self._update_ready(task_id)
 
-            for dep in self._dependencies.get(node, []):
-                if dfs(dep):
-                    return True
+    def _creates_cycle(self, task_id: str, dependencies: list[str]) -> bool:
+        """Check whether giving a task these dependencies would create a cycle.
 
-            state[node] = 2  # Mark as visited
+        A cycle exists only if one of the new dependencies is reachable from
+        task_id through existing dependent edges, so the search starts at the
+        new node and never visits the rest of the graph.
+
+        Args:
+            task_id: Task being added.
+            dependencies: Proposed dependencies of the task.
+
+        Returns:
+            True if a cycle would be created.
+        """
+        if not dependencies or not self._dependents.get(task_id):
             return False
 
-        for task_id in self._dependencies:
-            if dfs(task_id):
-                return True
+        targets = set(dependencies)
+        visited: set[str] = {task_id}
+        stack = [task_id]
+
+        while stack:
+            current = stack.pop()
+            for dependent_id in self._dependents.get(current, []):
+                if dependent_id in targets:
+                    return True
+                if dependent_id not in visited:
+                    visited.add(dependent_id)
+                    stack.append(dependent_id)
 
         return False
 
+    def _update_ready(self, task_id: str) -> None:
+        """Add or remove a task from the ready set based on its state.
+
+        Args:
+            task_id: Task to re-evaluate.
+        """
+        if (
+            task_id in self._dependencies
+            and self._in_degree.get(task_id, 0) == 0
+            and task_id not in self._completed
+            and task_id not in self._failed
+        ):
+            self._ready[task_id] = None
+        else:
+            self._ready.pop(task_id, None)
+
     def get_dependencies(self, task_id: str) -> list[str]:
         """Get dependencies for a task.
 
@@ -132,18 +158,9 @@ class TaskGraph:
         - All its dependencies are completed
 
         Returns:
-            List of task IDs ready to run.
+            List of task IDs ready to run, in the order they became ready.
         """
-        ready = []
-        for task_id, deps in self._dependencies.items():
-            if task_id in self._completed or task_id in self._failed:
-                continue
-
-            # Check if all dependencies are completed
-            if all(dep_id in self._completed for dep_id in deps):
-                ready.append(task_id)
-
-        return ready
+        return list(self._ready)
 
     def mark_completed(self, task_id: str) -> None:
         """Mark a task as completed.
@@ -151,7 +168,15 @@ class TaskGraph:
         Args:
             task_id: Task that completed.
         """
+        if task_id in self._completed:
+            return
+
         self._completed.add(task_id)
+        self._ready.pop(task_id, None)
+
+        for dependent_id in self._dependents.get(task_id, []):
+            self._in_degree[dependent_id] -= 1
+            self._update_ready(dependent_id)
 
     def mark_failed(self, task_id: str) -> list[str]:
         """Mark a task as failed and determine which dependents to skip.
@@ -167,13 +192,14 @@ class TaskGraph:
             List of task IDs that should be skipped.
         """
         self._failed.add(task_id)
+        self._ready.pop(task_id, None)
 
         to_skip: list[str] = []
-        to_check = [task_id]
+        to_check = deque([task_id])
         checked: set[str] = set()
 
         while to_check:
-            current = to_check.pop(0)
+            current = to_check.popleft()
             if current in checked:
                 continue
             checked.add(current)
@@ -189,10 +215,36 @@ class TaskGraph:
                 if all_failed:
                     to_skip.append(dependent_id)
                     self._failed.add(dependent_id)
+                    self._ready.pop(dependent_id, None)
                     to_check.append(dependent_id)
 
         return to_skip
 
+    def remove_task(self, task_id: str) -> None:
+        """Forget a settled task.
+
+        Callers must only remove tasks whose dependents have all settled;
+        the task is also dropped from those dependents' dependency lists so
+        topological ordering stays consistent.
+
+        Args:
+            task_id: Task to remove.
+        """
+        for dep_id in set(self._dependencies.pop(task_id, [])):
+            dependents = self._dependents.get(dep_id)
+            if dependents and task_id in dependents:
+                dependents.remove(task_id)
+
+        for dependent_id in self._dependents.pop(task_id, []):
+            deps = self._dependencies.get(dependent_id)
+            if deps is not None:
+                self._dependencies[dependent_id] = [d for d in deps if d != task_id]
+
+        self._completed.discard(task_id)
+        self._failed.discard(task_id)
+        self._in_degree.pop(task_id, None)
+        self._ready.pop(task_id, None)
+
     def get_topological_order(self) -> list[str]:
         """Get tasks in topological order.
 
@@ -200,23 +252,17 @@ class TaskGraph:
             List of task IDs where dependencies come before dependents.
         """
         # Kahn's algorithm
-        in_degree: dict[str, int] = {tid: 0 for tid in self._dependencies}
-
-        for _task_id, deps in self._dependencies.items():
-            for dep_id in deps:
-                if dep_id in in_degree:
-                    pass  # dep exists
-                else:
-                    in_degree[dep_id] = 0
-
+        in_degree: dict[str, int] = {}
         for task_id, deps in self._dependencies.items():
-            in_degree[task_id] = len(deps)
+            for dep_id in deps:
+                in_degree.setdefault(dep_id, 0)
+            in_degree[task_id] = len(set(deps))
 
-        queue = [tid for tid, deg in in_degree.items() if deg == 0]
+        queue = deque(tid for tid, deg in in_degree.items() if deg == 0)
         result: list[str] = []
 
         while queue:
-            current = queue.pop(0)
+            current = queue.popleft()
             result.append(current)
 
             for dependent_id in self._dependents.get(current, []):
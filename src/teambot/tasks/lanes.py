@@ -0,0 +1,237 @@
+"""Per-agent execution lanes.
+
+Each agent talks to the model through a single ``teambot-<agent>`` SDK
+session, so two requests for the same agent must not run at the same
+time. A lane serializes work for one agent (or allows a configured number
+of concurrent requests) while lanes for different agents stay fully
+independent.
+
+Within a lane, queued work is served by priority class first
+(foreground REPL commands before background ``&`` tasks) and then in
+arrival order.
+"""
+
+import asyncio
+import heapq
+import itertools
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
+from enum import IntEnum
+
+
+class LanePriority(IntEnum):
+    """Priority class for work queued on a lane (lower runs first)."""
+
+    FOREGROUND = 0
+    BACKGROUND = 1
+
+
+@dataclass
+class LaneStats:
+    """Snapshot of a lane's load.
+
+    Attributes:
+        agent_id: Agent the lane belongs to.
+        limit: Maximum concurrent requests for the agent.
+        running: Requests currently holding the lane.
+        queued_foreground: Foreground requests waiting for the lane.
+        queued_background: Background requests waiting for the lane.
+    """
+
+    agent_id: str
+    limit: int
+    running: int
+    queued_foreground: int
+    queued_background: int
+
+    @property
+    def queued(self) -> int:
+        """Get total number of waiting requests."""
+        return self.queued_foreground + self.queued_background
+
+
+class PrioritySemaphore:
+    """Semaphore that admits waiters by priority (lower first), then FIFO."""
+
+    def __init__(self, limit: int = 1):
+        """Initialize semaphore.
+
+        Args:
+            limit: Maximum concurrent holders.
+        """
+        self.limit = limit
+        self._running = 0
+        self._waiters: list[tuple[float, int, asyncio.Future[None]]] = []
+        self._counter = itertools.count()
+
+    @property
+    def running(self) -> int:
+        """Get number of current holders."""
+        return self._running
+
+    def has_capacity(self) -> bool:
+        """Check if a new request would be admitted without waiting."""
+        return self._running < self.limit and not self._live_waiters()
+
+    def _live_waiters(self) -> list[tuple[float, int, asyncio.Future[None]]]:
+        return [w for w in self._waiters if not w[2].done()]
+
+    async def acquire(self, priority: float = 0) -> None:
+        """Wait for a place.
+
+        Args:
+            priority: Sort key of the request; lower values are admitted first.
+        """
+        if self.has_capacity():
+            self._running += 1
+            return
+
+        future: asyncio.Future[None] = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._waiters, (priority, next(self._counter), future))
+        try:
+            await future
+        except asyncio.CancelledError:
+            # The place may have been handed over just before cancellation
+            if future.done() and not future.cancelled():
+                self.release()
+            raise
+
+    def release(self) -> None:
+        """Give up a place and hand it to the next waiter."""
+        self._running -= 1
+        self._wake_waiters()
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._running < self.limit:
+            _, _, future = heapq.heappop(self._waiters)
+            if future.done():
+                continue  # Waiter was cancelled
+            self._running += 1
+            future.set_result(None)
+
+    @asynccontextmanager
+    async def slot(self, priority: float = 0) -> AsyncIterator[None]:
+        """Hold a place for the duration of the block.
+
+        Args:
+            priority: Sort key of the request; lower values are admitted first.
+        """
+        await self.acquire(priority)
+        try:
+            yield
+        finally:
+            self.release()
+
+
+class AgentLane(PrioritySemaphore):
+    """Priority-ordered admission control for a single agent."""
+
+    def __init__(self, agent_id: str, limit: int = 1):
+        """Initialize lane.
+
+        Args:
+            agent_id: Agent the lane belongs to.
+            limit: Maximum concurrent requests for the agent.
+        """
+        super().__init__(limit)
+        self.agent_id = agent_id
+
+    def stats(self) -> LaneStats:
+        """Get a snapshot of the lane's load.
+
+        Returns:
+            LaneStats for this lane.
+        """
+        waiting = self._live_waiters()
+        foreground = sum(1 for priority, _, _ in waiting if priority == LanePriority.FOREGROUND)
+        return LaneStats(
+            agent_id=self.agent_id,
+            limit=self.limit,
+            running=self._running,
+            queued_foreground=foreground,
+            queued_background=len(waiting) - foreground,
+        )
+
+
+class LaneScheduler:
+    """Set of per-agent lanes, created on first use."""
+
+    def __init__(self, default_limit: int = 1, limits: dict[str, int] | None = None):
+        """Initialize scheduler.
+
+        Args:
+            default_limit: Concurrent requests allowed per agent by default.
+            limits: Per-agent overrides of default_limit.
+        """
+        self._default_limit = default_limit
+        self._limits = dict(limits or {})
+        self._lanes: dict[str, AgentLane] = {}
+
+    def lane(self, agent_id: str) -> AgentLane:
+        """Get the lane for an agent, creating it if needed.
+
+        Args:
+            agent_id: Agent identifier.
+
+        Returns:
+            The agent's lane.
+        """
+        lane = self._lanes.get(agent_id)
+        if lane is None:
+            lane = AgentLane(agent_id, self._limits.get(agent_id, self._default_limit))
+            self._lanes[agent_id] = lane
+        return lane
+
+    def get_limit(self, agent_id: str) -> int:
+        """Get the concurrency limit for an agent.
+
+        Args:
+            agent_id: Agent identifier.
+
+        Returns:
+            Maximum concurrent requests for the agent.
+        """
+        return self._limits.get(agent_id, self._default_limit)
+
+    def set_limit(self, agent_id: str, limit: int) -> None:
+        """Change the concurrency limit for an agent.
+
+        Args:
+            agent_id: Agent identifier.
+            limit: New maximum concurrent requests (at least 1).
+
+        Raises:
+            ValueError: If limit is less than 1.
+        """
+        if limit < 1:
+            raise ValueError(f"Lane limit must be at least 1, got {limit}")
+        self._limits[agent_id] = limit
+        lane = self.lane(agent_id)
+        lane.limit = limit
+        lane._wake_waiters()
+
+    @asynccontextmanager
+    async def slot(
+        self, agent_id: str, priority: LanePriority = LanePriority.FOREGROUND
+    ) -> AsyncIterator[None]:
+        """Hold a place in an agent's lane for the duration of the block.
+
+        Args:
+            agent_id: Agent identifier.
+            priority: Priority class of the request.
+        """
+        lane = self.lane(agent_id)
+        await lane.acquire(priority)
+        try:
+            yield
+        finally:
+            lane.release()
+
+    def get_stats(self) -> list[LaneStats]:
+        """Get load snapshots for all lanes that have been used.
+
+        Returns:
+            LaneStats sorted by agent ID.
+        """
+        return [self._lanes[agent_id].stats() for agent_id in sorted(self._lanes)]
@@ -1,15 +1,40 @@
 """Task manager for parallel execution."""
 
 import asyncio
+import heapq
+import itertools
+import logging
 import uuid
-from collections.abc import Awaitable, Callable
-
+from collections import Counter, OrderedDict, defaultdict
+from collections.abc import AsyncIterator, Awaitable, Callable, Iterable
+from contextlib import aclosing
+from contextvars import ContextVar
+from datetime import datetime, timedelta
+
+from teambot.tasks.critical_path import (
+    CriticalPath,
+    LatencyEstimator,
+    find_critical_path,
+    remaining_work,
+)
 from teambot.tasks.graph import TaskGraph
-from teambot.tasks.models import Task, TaskResult, TaskStatus
+from teambot.tasks.lanes import LanePriority, LaneScheduler, PrioritySemaphore
+from teambot.tasks.models import DEFAULT_TASK_TIMEOUT, Task, TaskResult, TaskStatus
 from teambot.tasks.output_injector import OutputInjector
+from teambot.tasks.retention import RetentionPolicy, TaskArchive
+
+logger = logging.getLogger(__name__)
 
 # Type for the executor function
 ExecutorFn = Callable[[str, str, str | None], Awaitable[str]]
+# Type for the function aborting a task's in-flight request: (agent_id, task_id)
+CancelRequestFn = Callable[[str, str], Awaitable[object]]
+
+# ID of the task the executor function is running for, if any
+current_task_id: ContextVar[str | None] = ContextVar("teambot_current_task_id", default=None)
+
+# Upper bound on waiting for an aborted request before freeing its slot
+CANCEL_REQUEST_TIMEOUT = 5.0
 
 
 class TaskManager:
@@ -18,15 +43,24 @@ class TaskManager:
     Provides:
     - Task creation and tracking
     - Dependency-aware execution
-    - Concurrency limiting
+    - Concurrency limiting, with slots going first to tasks on the
+      longest estimated path of remaining work
+    - Per-task timeouts that abort the agent's request and free its slot
+    - Cancellation that stops in-flight requests and cascades to dependents
+    - Per-agent lanes so one agent's session never runs two tasks at once
     - Output injection between dependent tasks
+    - Bounded retention of finished tasks, with eviction to an archive
     """
 
     def __init__(
         self,
         executor: ExecutorFn | None = None,
         max_concurrent: int = 3,
-        default_timeout: float = 120.0,
+        default_timeout: float = DEFAULT_TASK_TIMEOUT,
+        agent_concurrency: dict[str, int] | None = None,
+        retention: RetentionPolicy | None = None,
+        archive: TaskArchive | None = None,
+        cancel_request: CancelRequestFn | None = None,
     ):
         """Initialize task manager.
 
@@ -34,8 +68,16 @@ class TaskManager:
             executor: Async function(agent_id, prompt) -> output.
             max_concurrent: Maximum concurrent tasks.
             default_timeout: Default timeout for tasks in seconds.
+            agent_concurrency: Per-agent concurrent task limits (default 1 each).
+            retention: Limits on finished tasks kept in memory (default unbounded).
+            archive: Where evicted tasks are written (None discards them).
+            cancel_request: Async function(agent_id, task_id) aborting the
+                task's in-flight request when it times out or is cancelled.
+                The executor function can read the task ID from
+                current_task_id.
         """
         self._executor = executor
+        self._cancel_request = cancel_request
         self._max_concurrent = max_concurrent
         self._default_timeout = default_timeout
 
@@ -44,20 +86,58 @@ class TaskManager:
         self._injector = OutputInjector()
         self._results: dict[str, TaskResult] = {}
         self._agent_results: dict[str, TaskResult] = {}  # agent_id -> latest result
-
-        # Semaphore for concurrency control
-        self._semaphore: asyncio.Semaphore | None = None
+        # agent_id -> most recently created task
+        self._latest_agent_tasks: dict[str, Task] = {}
+        # agent_id -> non-terminal tasks (pruned lazily on lookup)
+        self._active_agent_tasks: dict[str, dict[str, Task]] = {}
+
+        # Concurrency slots shared by execute_all() and execute_task_in_slot()
+        self._slots = PrioritySemaphore(max_concurrent)
+        # Per-agent task durations used for critical-path priorities
+        self._latency = LatencyEstimator()
+        # Per-agent lanes serializing work on each agent's session
+        self._lanes = LaneScheduler(limits=agent_concurrency)
+
+        self._retention = retention or RetentionPolicy()
+        self._archive = archive
+        # task_id -> output size of finished tasks, least recently used first
+        self._finished: OrderedDict[str, int] = OrderedDict()
+        self._retained_bytes = 0
+        self._evicted_count = 0
+        self._timeout_count = 0
+        # Eviction is deferred while execute_all()/execute_tasks() is scheduling
+        self._eviction_holds = 0
+
+        # task_id -> in-flight executor call, cancelled by cancel_task()
+        self._inflight: dict[str, asyncio.Task[str]] = {}
+        # Aborts scheduled for requests run outside the manager
+        self._pending_aborts: set[asyncio.Task[None]] = set()
 
     @property
     def max_concurrent(self) -> int:
         """Get max concurrent tasks."""
         return self._max_concurrent
 
+    @property
+    def lanes(self) -> LaneScheduler:
+        """Get the per-agent lane scheduler."""
+        return self._lanes
+
     @property
     def task_count(self) -> int:
-        """Get total number of tasks."""
+        """Get number of tasks held in memory."""
         return len(self._tasks)
 
+    @property
+    def timeout_count(self) -> int:
+        """Get number of tasks that failed by exceeding their timeout."""
+        return self._timeout_count
+
+    @property
+    def evicted_count(self) -> int:
+        """Get number of finished tasks evicted from memory."""
+        return self._evicted_count
+
     def create_task(
         self,
         agent_id: str,
@@ -93,24 +173,31 @@ class TaskManager:
             model=model,
         )
 
-        self._tasks[task_id] = task
         self._graph.add_task(task_id, deps)
+        self._tasks[task_id] = task
+        self._latest_agent_tasks[agent_id] = task
+        self._active_agent_tasks.setdefault(agent_id, {})[task_id] = task
 
         return task
 
     def get_task(self, task_id: str) -> Task | None:
         """Get a task by ID.
 
+        Tasks evicted from memory are loaded from the archive.
+
         Args:
             task_id: Task identifier.
 
         Returns:
             Task if found, None otherwise.
         """
-        return self._tasks.get(task_id)
+        task = self._tasks.get(task_id)
+        if task is None and self._archive is not None:
+            task = self._archive.load(task_id)
+        return task
 
     def list_tasks(self, status: TaskStatus | None = None) -> list[Task]:
-        """List tasks, optionally filtered by status.
+        """List tasks held in memory, optionally filtered by status.
 
         Args:
             status: Filter by this status (None for all).
@@ -128,12 +215,32 @@ class TaskManager:
     async def execute_task(self, task_id: str) -> TaskResult:
         """Execute a single task.
 
+        Waits for a place in the agent's lane first, so tasks for the same
+        agent run one after another.
+
         Args:
             task_id: Task to execute.
 
         Returns:
             Task result.
         """
+        task = self._get_executable_task(task_id)
+
+        async with self._lanes.slot(task.agent_id, self._lane_priority(task)):
+            return await self._run_task(task)
+
+    def _get_executable_task(self, task_id: str) -> Task:
+        """Look up a task and check that it can be executed.
+
+        Args:
+            task_id: Task to look up.
+
+        Returns:
+            The task.
+
+        Raises:
+            ValueError: If the task is unknown or no executor is configured.
+        """
         task = self._tasks.get(task_id)
         if not task:
             raise ValueError(f"Task not found: {task_id}")
@@ -141,30 +248,102 @@ class TaskManager:
         if self._executor is None:
             raise ValueError("No executor configured")
 
+        return task
+
+    @staticmethod
+    def _lane_priority(task: Task) -> LanePriority:
+        """Get the lane priority class for a task."""
+        return LanePriority.BACKGROUND if task.background else LanePriority.FOREGROUND
+
+    async def _run_task(self, task: Task) -> TaskResult:
+        """Run a task through the executor and record its outcome.
+
+        The executor call is bounded by ``task.timeout``. On expiry the
+        agent's request is aborted and the task fails as timed out, so its
+        lane and concurrency slot are released rather than held by a hung
+        agent. The call runs as its own asyncio task so cancel_task() can
+        stop it; the agent's request is then aborted before the slot is
+        given up.
+
+        Args:
+            task: Task to run.
+
+        Returns:
+            Task result.
+        """
+        # Cancelled (or otherwise settled) while queued
+        if task.status.is_terminal():
+            return task.result
+
+        task_id = task.id
+
         # Build prompt with injected parent outputs
         prompt = self._build_prompt(task)
 
         task.mark_running()
 
+        # The run copies the current context, so it sees its own task ID
+        token = current_task_id.set(task_id)
         try:
-            output = await self._executor(task.agent_id, prompt, task.model)
+            run = asyncio.ensure_future(self._executor(task.agent_id, prompt, task.model))
+        finally:
+            current_task_id.reset(token)
+        self._inflight[task_id] = run
+        try:
+            output = await asyncio.wait_for(run, timeout=task.timeout)
             task.mark_completed(output)
-            self._results[task_id] = task.result
-            self._agent_results[task.agent_id] = task.result  # Store by agent_id
+            self._record_result(task, by_agent=True)
             self._graph.mark_completed(task_id)
+        except TimeoutError:
+            logger.warning("Task %s timed out after %ss", task_id, task.timeout)
+            await self._abort_request(task)
+            task.mark_timed_out()
+            self._timeout_count += 1
+            self._record_failure(task)
+        except asyncio.CancelledError:
+            if task.status != TaskStatus.CANCELLED:
+                # Our caller was cancelled rather than the task itself
+                self._cancel(task)
+                await self._abort_request(task)
+                raise
+            await self._abort_request(task)
         except Exception as e:
             task.mark_failed(str(e))
-            self._results[task_id] = task.result
-            self._agent_results[task.agent_id] = task.result  # Store failed result too
-            # Mark dependents to skip
-            to_skip = self._graph.mark_failed(task_id)
-            for skip_id in to_skip:
-                skip_task = self._tasks.get(skip_id)
-                if skip_task:
-                    skip_task.mark_skipped(f"Parent task {task_id} failed")
-                    self._results[skip_id] = skip_task.result
-
-        return task.result
+            self._record_failure(task)
+        finally:
+            self._inflight.pop(task_id, None)
+
+        result = task.result
+        self._enforce_retention()
+        return result
+
+    def _record_failure(self, task: Task) -> None:
+        """Record a failed task and skip dependents left without a parent.
+
+        Args:
+            task: Task that failed.
+        """
+        self._record_result(task, by_agent=True)  # Store failed result too
+        for skip_id in self._graph.mark_failed(task.id):
+            skip_task = self._tasks.get(skip_id)
+            if skip_task:
+                skip_task.mark_skipped(f"Parent task {task.id} failed")
+                self._record_result(skip_task)
+
+    async def _abort_request(self, task: Task) -> None:
+        """Abort a task's in-flight request, waiting only briefly.
+
+        Args:
+            task: Task whose request to abort.
+        """
+        if self._cancel_request is None:
+            return
+        try:
+            await asyncio.wait_for(
+                self._cancel_request(task.agent_id, task.id), timeout=CANCEL_REQUEST_TIMEOUT
+            )
+        except Exception as e:
+            logger.warning("Could not abort request of task %s: %s", task.id, e)
 
     def _build_prompt(self, task: Task) -> str:
         """Build prompt with injected parent outputs.
@@ -193,54 +372,288 @@ class TaskManager:
     async def execute_all(self) -> list[TaskResult]:
         """Execute all tasks respecting dependencies and concurrency.
 
+        Tasks are dispatched from a ready queue: a task becomes ready once
+        every dependency has settled (completed, failed, skipped or
+        cancelled), and is launched as soon as a concurrency slot is free.
+        Independent branches therefore run in parallel, up to
+        ``max_concurrent`` at a time. When more tasks are ready than there
+        are free slots, the task heading the longest estimated chain of
+        remaining work (weighted by per-agent latency) goes first.
+
+        A task whose parents have all failed is skipped rather than run.
+
         Returns:
-            List of all task results.
+            List of task results in completion order. Use
+            get_ordered_results() for a dependency-ordered view.
         """
         if self._executor is None:
             raise ValueError("No executor configured")
 
-        self._semaphore = asyncio.Semaphore(self._max_concurrent)
+        return [
+            task.result
+            async for task in self._schedule(self._graph.get_topological_order())
+            if task.result
+        ]
 
-        # Get execution order
-        order = self._graph.get_topological_order()
+    async def execute_tasks(
+        self, task_ids: Iterable[str], on_start: Callable[[Task], None] | None = None
+    ) -> AsyncIterator[Task]:
+        """Execute a group of tasks under one scheduler, yielding each as it settles.
 
-        # Group tasks by dependency level for parallel execution
-        results: list[TaskResult] = []
+        Scheduling works as in execute_all(), restricted to task_ids, so a
+        caller that created many related tasks can run them as one graph and
+        handle each outcome as soon as it is known. Tasks already terminal
+        are yielded first. Closing the iterator early cancels tasks that are
+        still running.
+
+        Args:
+            task_ids: Tasks to run. Every unfinished dependency of these
+                tasks must be in the group too.
+            on_start: Called with each task as it is dispatched to run
+                (not for tasks skipped or already settled).
 
-        # Simple sequential execution respecting dependencies
-        # TODO: Optimize with parallel execution of independent tasks
-        for task_id in order:
+        Yields:
+            Each task once it has reached a terminal status.
+
+        Raises:
+            ValueError: If no executor is configured, or a task depends on an
+                unfinished task outside the group.
+        """
+        if self._executor is None:
+            raise ValueError("No executor configured")
+
+        group = list(dict.fromkeys(task_ids))
+        members = set(group)
+        for task_id in group:
             task = self._tasks.get(task_id)
-            if not task:
+            if task is None:
                 continue
+            for dep_id in task.dependencies:
+                dep = self._tasks.get(dep_id)
+                if dep_id not in members and dep is not None and not dep.status.is_terminal():
+                    raise ValueError(f"Task {task_id} depends on {dep_id} outside the group")
+
+        async with aclosing(self._schedule(group, on_start)) as scheduled:
+            async for task in scheduled:
+                yield task
+
+    async def _schedule(
+        self, task_ids: list[str], on_start: Callable[[Task], None] | None = None
+    ) -> AsyncIterator[Task]:
+        """Run tasks from a ready queue, yielding each once it settles.
+
+        Args:
+            task_ids: Tasks to run; dependencies outside this list are
+                treated as settled.
+            on_start: Called with each task as it is dispatched.
 
-            # Skip already completed/failed/skipped
+        Yields:
+            Tasks in the order they reached a terminal status.
+        """
+        # task_id -> number of dependencies that have not settled yet
+        unsettled: dict[str, int] = {}
+        for task_id in task_ids:
+            task = self._tasks.get(task_id)
+            if not task:
+                continue
             if task.status.is_terminal():
-                if task.result:
-                    results.append(task.result)
+                yield task
                 continue
-
-            # Wait for dependencies
-            if not task.is_ready(self._results):
-                # Check if should be skipped due to failed deps
-                deps_failed = all(
-                    self._results.get(d) and not self._results[d].success for d in task.dependencies
-                )
-                if deps_failed:
-                    task.mark_skipped("All parent tasks failed")
-                    self._results[task_id] = task.result
-                    results.append(task.result)
+            unsettled[task_id] = 0
+
+        for task_id in unsettled:
+            deps = set(self._tasks[task_id].dependencies)
+            unsettled[task_id] = sum(1 for dep_id in deps if dep_id in unsettled)
+
+        # task_id -> estimated seconds of work from the task to the end of the graph
+        priority = remaining_work(unsettled, self._graph, self._tasks, self._estimate)
+
+        # Ready tasks as (-priority, arrival, task_id): most downstream work first,
+        # then the task that became ready first
+        ready: list[tuple[float, int, str]] = []
+        arrival = itertools.count()
+        # agent_id -> ready entries set aside while the agent's lane is full
+        blocked: dict[str, list[tuple[float, int, str]]] = defaultdict(list)
+        running: dict[asyncio.Task[TaskResult], str] = {}
+        # agent_id -> tasks dispatched by this scheduler that are still running
+        agent_load: Counter[str] = Counter()
+
+        def make_ready(task_id: str) -> None:
+            heapq.heappush(ready, (-priority.get(task_id, 0.0), next(arrival), task_id))
+
+        def next_ready() -> str | None:
+            """Pop the highest-priority ready task whose agent lane has room."""
+            while ready:
+                entry = heapq.heappop(ready)
+                task = self._tasks[entry[2]]
+                if task.status.is_terminal() or agent_load[task.agent_id] < self._lanes.get_limit(
+                    task.agent_id
+                ):
+                    return entry[2]
+                blocked[task.agent_id].append(entry)
+            return None
+
+        def settle(task_id: str) -> None:
+            """Release dependents of a task that reached a terminal state."""
+            for dependent_id in self._graph.get_dependents(task_id):
+                if dependent_id in unsettled:
+                    unsettled[dependent_id] -= 1
+                    if unsettled[dependent_id] == 0:
+                        make_ready(dependent_id)
+
+        for task_id, count in unsettled.items():
+            if count == 0:
+                make_ready(task_id)
+
+        self._eviction_holds += 1
+        try:
+            while ready or running:
+                while ready and len(running) < self._max_concurrent:
+                    task_id = next_ready()
+                    if task_id is None:
+                        break  # Only busy agents have ready work
+                    del unsettled[task_id]
+                    task = self._tasks[task_id]
+
+                    # Already settled, e.g. skipped by a failed parent
+                    if task.status.is_terminal():
+                        settle(task_id)
+                        yield task
+                        continue
+
+                    if task.has_dependencies and self._all_dependencies_failed(task):
+                        self._skip_task(task, "All parent tasks failed")
+                        settle(task_id)
+                        yield task
+                        continue
+
+                    if on_start is not None:
+                        on_start(task)
+                    run = self.execute_task_in_slot(task_id, priority.get(task_id, 0.0))
+                    running[asyncio.create_task(run)] = task_id
+                    agent_load[task.agent_id] += 1
+
+                if not running:
                     continue
 
-            async with self._semaphore:
-                result = await self.execute_task(task_id)
-                results.append(result)
+                done, _ = await asyncio.wait(running, return_when=asyncio.FIRST_COMPLETED)
+                for future in done:
+                    task_id = running.pop(future)
+                    task = self._tasks[task_id]
+                    agent_load[task.agent_id] -= 1
+                    for entry in blocked.pop(task.agent_id, []):
+                        heapq.heappush(ready, entry)
+                    if future.cancelled() and not task.status.is_terminal():
+                        task.mark_cancelled()
+                        self._record_result(task)
+                    settle(task_id)
+                    yield task
+        finally:
+            # Don't leave orphaned work behind if the scheduler is cancelled or closed
+            for future in running:
+                future.cancel()
+            if running:
+                await asyncio.gather(*running, return_exceptions=True)
+            self._eviction_holds -= 1
+            self._enforce_retention()
+
+    async def execute_task_in_slot(self, task_id: str, priority: float | None = None) -> TaskResult:
+        """Execute a task while holding one of the manager's concurrency slots.
+
+        Callers running tasks outside execute_all() use this to stay within
+        ``max_concurrent``. The agent's lane is acquired before the slot, so
+        a task queued behind its own agent does not hold a slot that another
+        agent could use. When slots are scarce, waiting tasks with the most
+        estimated downstream work are admitted first.
+
+        Args:
+            task_id: Task to execute.
+            priority: Estimated seconds of downstream work, if already known.
+
+        Returns:
+            Task result.
+        """
+        task = self._get_executable_task(task_id)
+
+        async with self._lanes.slot(task.agent_id, self._lane_priority(task)):
+            # Only rank the task if it actually has to wait for a slot
+            if priority is None and not self._slots.has_capacity():
+                work = remaining_work([task.id], self._graph, self._tasks, self._estimate)
+                priority = work[task.id]
+            async with self._slots.slot(-(priority or 0.0)):
+                return await self._run_task(task)
+
+    def _all_dependencies_failed(self, task: Task) -> bool:
+        """Check whether every dependency of a task finished unsuccessfully.
+
+        Args:
+            task: Task whose dependencies to check.
+
+        Returns:
+            True if all dependencies have unsuccessful results.
+        """
+        return all(self._results.get(d) and not self._results[d].success for d in task.dependencies)
+
+    def _skip_task(self, task: Task, reason: str) -> None:
+        """Skip a task and propagate the skip to its dependents.
 
-        return results
+        Args:
+            task: Task to skip.
+            reason: Reason recorded on the task result.
+        """
+        task.mark_skipped(reason)
+        self._record_result(task)
+        for skip_id in self._graph.mark_failed(task.id):
+            skip_task = self._tasks.get(skip_id)
+            if skip_task and not skip_task.status.is_terminal():
+                skip_task.mark_skipped(f"Parent task {task.id} failed")
+                self._record_result(skip_task)
+
+    def _estimate(self, task: Task) -> float:
+        """Estimate a task's remaining run time from its agent's history.
+
+        Args:
+            task: Unfinished task.
+
+        Returns:
+            Estimated seconds until the task finishes.
+        """
+        estimate = self._latency.estimate(task.agent_id)
+        if task.status == TaskStatus.RUNNING and task.started_at:
+            estimate -= (datetime.now() - task.started_at).total_seconds()
+        return max(estimate, 0.0)
+
+    def get_critical_path(self) -> CriticalPath | None:
+        """Get the longest estimated chain of unfinished work.
+
+        Returns:
+            Critical path with remaining time and ETA, or None if every
+            task has finished.
+        """
+        return find_critical_path(
+            self._graph, self._tasks, self._estimate, max_concurrent=self._max_concurrent
+        )
+
+    def get_ordered_results(self) -> list[TaskResult]:
+        """Get available task results in dependency order.
+
+        Complements execute_all(), which returns results in completion order.
+
+        Returns:
+            Results ordered so that dependencies precede their dependents.
+        """
+        return [
+            self._results[task_id]
+            for task_id in self._graph.get_topological_order()
+            if task_id in self._results
+        ]
 
     def cancel_task(self, task_id: str) -> bool:
         """Cancel a task if possible.
 
+        A running task's executor call is cancelled and the agent's request
+        aborted. Dependents left without a live parent are cancelled too.
+
         Args:
             task_id: Task to cancel.
 
@@ -254,20 +667,173 @@ class TaskManager:
         if task.status.is_terminal():
             return False
 
-        task.mark_cancelled()
-        self._results[task_id] = task.result
+        was_running = task.status == TaskStatus.RUNNING
+        self._cancel(task)
+
+        run = self._inflight.get(task_id)
+        if run is not None:
+            run.cancel()  # _run_task() aborts the request before releasing the slot
+        elif was_running:
+            # Running outside the manager, e.g. streamed directly by the UI
+            self._schedule_abort(task)
+
+        self._enforce_retention()
         return True
 
+    def _cancel(self, task: Task) -> None:
+        """Mark a task cancelled and cascade to dependents without a live parent.
+
+        Args:
+            task: Task to cancel.
+        """
+        task.mark_cancelled()
+        self._record_result(task)
+        for dependent_id in self._graph.mark_failed(task.id):
+            dependent = self._tasks.get(dependent_id)
+            if dependent and not dependent.status.is_terminal():
+                dependent.mark_cancelled()
+                self._record_result(dependent)
+
+    def _schedule_abort(self, task: Task) -> None:
+        """Abort a task's request in the background.
+
+        Args:
+            task: Task whose request to abort.
+        """
+        try:
+            abort = asyncio.get_running_loop().create_task(self._abort_request(task))
+        except RuntimeError:
+            return  # No event loop, so nothing can be in flight
+        self._pending_aborts.add(abort)
+        abort.add_done_callback(self._pending_aborts.discard)
+
+    def record_result(self, task: Task) -> None:
+        """Record the outcome of a task that was run outside the manager.
+
+        The result becomes the agent's latest result for ``$ref`` lookups
+        and counts towards the retention limits.
+
+        Args:
+            task: Task that has reached a terminal status.
+        """
+        if task.result is None:
+            return
+        self._record_result(task, by_agent=True)
+        self._enforce_retention()
+
+    def _record_result(self, task: Task, by_agent: bool = False) -> None:
+        """Store a finished task's result and track it for retention.
+
+        Args:
+            task: Task that has reached a terminal status.
+            by_agent: Also store it as the agent's latest result.
+        """
+        self._results[task.id] = task.result
+        if by_agent:
+            self._agent_results[task.agent_id] = task.result
+        if task.status == TaskStatus.COMPLETED:
+            self._latency.record_task(task)
+
+        output = task.result.output
+        size = len(output.encode("utf-8")) if isinstance(output, str) else 0
+        self._retained_bytes += size - self._finished.pop(task.id, 0)
+        self._finished[task.id] = size
+
+    def _is_pinned(self, task: Task) -> bool:
+        """Check whether a finished task must stay in memory.
+
+        A task is pinned while its result is the agent's latest (the target
+        of ``$ref``) or while a dependent that has not settled still needs
+        its output injected.
+
+        Args:
+            task: Finished task.
+
+        Returns:
+            True if the task must not be evicted.
+        """
+        if self._agent_results.get(task.agent_id) is task.result:
+            return True
+
+        for dependent_id in self._graph.get_dependents(task.id):
+            dependent = self._tasks.get(dependent_id)
+            if dependent and not dependent.status.is_terminal():
+                return True
+        return False
+
+    def _enforce_retention(self) -> None:
+        """Evict finished tasks until the retention limits are met.
+
+        Least recently used tasks go first; with an age limit every
+        expired task is evicted regardless of position. Pinned tasks are
+        skipped.
+        """
+        policy = self._retention
+        if not policy.is_bounded or self._eviction_holds:
+            return
+
+        cutoff = None
+        if policy.max_age is not None:
+            cutoff = datetime.now() - timedelta(seconds=policy.max_age)
+
+        for task_id in list(self._finished):
+            over_limit = policy.is_exceeded(len(self._finished), self._retained_bytes)
+            if not over_limit and cutoff is None:
+                break
+
+            task = self._tasks[task_id]
+            expired = (
+                cutoff is not None and task.completed_at is not None and task.completed_at < cutoff
+            )
+            if (over_limit or expired) and not self._is_pinned(task):
+                self._evict(task)
+
+    def _evict(self, task: Task) -> None:
+        """Remove a finished task from memory, archiving it if possible.
+
+        Args:
+            task: Unpinned finished task.
+        """
+        if self._archive is not None:
+            self._archive.save(task)
+
+        del self._tasks[task.id]
+        self._results.pop(task.id, None)
+        self._retained_bytes -= self._finished.pop(task.id)
+        self._graph.remove_task(task.id)
+
+        if self._latest_agent_tasks.get(task.agent_id) is task:
+            del self._latest_agent_tasks[task.agent_id]
+        active = self._active_agent_tasks.get(task.agent_id)
+        if active:
+            active.pop(task.id, None)
+
+        self._evicted_count += 1
+        logger.debug("Evicted finished task %s from memory", task.id)
+
     def get_result(self, task_id: str) -> TaskResult | None:
         """Get result for a completed task.
 
+        Reading a result marks it as recently used. Results of tasks
+        evicted from memory are loaded from the archive.
+
         Args:
             task_id: Task identifier.
 
         Returns:
             TaskResult if available.
         """
-        return self._results.get(task_id)
+        result = self._results.get(task_id)
+        if result is not None:
+            if task_id in self._finished:
+                self._finished.move_to_end(task_id)
+            return result
+
+        if self._archive is not None:
+            task = self._archive.load(task_id)
+            if task is not None:
+                return task.result
+        return None
 
     def get_agent_result(self, agent_id: str) -> TaskResult | None:
         """Get latest result for an agent.
@@ -280,16 +846,60 @@ class TaskManager:
         """
         return self._agent_results.get(agent_id)
 
+    def get_latest_task_for_agent(self, agent_id: str) -> Task | None:
+        """Get the most recently created task for an agent.
+
+        Args:
+            agent_id: Agent identifier.
+
+        Returns:
+            Latest Task for agent, or None.
+        """
+        return self._latest_agent_tasks.get(agent_id)
+
     def get_running_task_for_agent(self, agent_id: str) -> Task | None:
         """Get currently running task for an agent.
 
+        Only the agent's own non-terminal tasks are inspected; tasks that
+        have since finished are dropped from the index.
+
         Args:
             agent_id: Agent identifier.
 
         Returns:
             Running Task if found, else None.
         """
-        for task in self._tasks.values():
-            if task.agent_id == agent_id and task.status == TaskStatus.RUNNING:
+        active = self._active_agent_tasks.get(agent_id)
+        if not active:
+            return None
+
+        for task_id in [tid for tid, t in active.items() if t.status.is_terminal()]:
+            del active[task_id]
+
+        for task in active.values():
+            if task.status == TaskStatus.RUNNING:
                 return task
         return None
+
+    async def wait_for_agent(
+        self, agent_id: str, timeout: float | None = None
+    ) -> TaskResult | None:
+        """Wait for an agent's running task to finish.
+
+        Resumes as soon as the task reaches a terminal status rather than
+        polling. Returns immediately if the agent has no running task.
+
+        Args:
+            agent_id: Agent identifier.
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            Latest result for the agent, or None if it has never run.
+
+        Raises:
+            TimeoutError: If the running task does not finish within timeout.
+        """
+        running_task = self.get_running_task_for_agent(agent_id)
+        if running_task:
+            await running_task.wait(timeout=timeout)
+        return self._agent_results.get(agent_id)
@@ -1,9 +1,13 @@
 """Task models for parallel execution."""
 
+import asyncio
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum, auto
 
+# Default per-task timeout, matching the SDK's own limit on a streamed response
+DEFAULT_TASK_TIMEOUT = 1800.0
+
 
 class TaskStatus(Enum):
     """Status of a task in the execution pipeline."""
@@ -40,6 +44,7 @@ class TaskResult:
         success: Whether the task succeeded.
         error: Error message if failed.
         completed_at: When the task completed.
+        timed_out: Whether the task failed by exceeding its timeout.
     """
 
     task_id: str
@@ -47,6 +52,7 @@ class TaskResult:
     success: bool
     error: str | None = None
     completed_at: datetime = field(default_factory=datetime.now)
+    timed_out: bool = False
 
 
 @dataclass
@@ -65,6 +71,9 @@ class Task:
         started_at: When task started running.
         completed_at: When task finished.
         model: AI model to use for this task.
+
+    Reaching a terminal status signals an internal completion event, so
+    callers can ``await task.wait()`` instead of polling ``status``.
     """
 
     id: str
@@ -72,12 +81,20 @@ class Task:
     prompt: str
     status: TaskStatus = TaskStatus.PENDING
     dependencies: list[str] = field(default_factory=list)
-    timeout: float = 120.0
+    timeout: float = DEFAULT_TASK_TIMEOUT
     background: bool = False
     result: TaskResult | None = None
     started_at: datetime | None = None
     completed_at: datetime | None = None
     model: str | None = None
+    _done: asyncio.Event = field(
+        default_factory=asyncio.Event, init=False, repr=False, compare=False
+    )
+
+    def __post_init__(self) -> None:
+        # Tasks restored in a terminal state (e.g. from an archive) are already done
+        if self.status.is_terminal():
+            self._done.set()
 
     @property
     def has_dependencies(self) -> bool:
@@ -102,6 +119,32 @@ class Task:
 
         return all(dep_id in completed_results for dep_id in self.dependencies)
 
+    @property
+    def is_done(self) -> bool:
+        """Check if the task has reached a terminal status.
+
+        Returns:
+            True once the task completed, failed, was skipped or cancelled.
+        """
+        return self._done.is_set()
+
+    async def wait(self, timeout: float | None = None) -> TaskResult | None:
+        """Wait until the task reaches a terminal status.
+
+        Cancelling the waiting coroutine does not affect the task itself.
+
+        Args:
+            timeout: Maximum seconds to wait (None waits indefinitely).
+
+        Returns:
+            The task result once available.
+
+        Raises:
+            TimeoutError: If the task is still running after timeout.
+        """
+        await asyncio.wait_for(self._done.wait(), timeout=timeout)
+        return self.result
+
     def mark_running(self) -> None:
         """Mark task as running."""
         self.status = TaskStatus.RUNNING
@@ -121,6 +164,7 @@ class Task:
             success=True,
             completed_at=self.completed_at,
         )
+        self._done.set()
 
     def mark_failed(self, error: str) -> None:
         """Mark task as failed.
@@ -137,6 +181,12 @@ class Task:
             error=error,
             completed_at=self.completed_at,
         )
+        self._done.set()
+
+    def mark_timed_out(self) -> None:
+        """Mark task as failed because it exceeded its timeout."""
+        self.mark_failed(f"Timed out after {self.timeout:g}s")
+        self.result.timed_out = True
 
     def mark_skipped(self, reason: str) -> None:
         """Mark task as skipped.
@@ -153,6 +203,7 @@ class Task:
             error=f"Skipped: {reason}",
             completed_at=self.completed_at,
         )
+        self._done.set()
 
     def mark_cancelled(self) -> None:
         """Mark task as cancelled."""
@@ -165,3 +216,4 @@ class Task:
             error="Cancelled by user",
             completed_at=self.completed_at,
         )
+        self._done.set()
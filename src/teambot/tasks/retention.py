@@ -0,0 +1,279 @@
+"""Retention of finished tasks and their outputs.
+
+Every task result carries the agent's full response, so a long interactive
+session would otherwise keep every response in memory. A RetentionPolicy
+bounds how many finished tasks (and output bytes) the TaskManager keeps;
+tasks evicted beyond that are written to a TaskArchive on disk and loaded
+back on demand, e.g. by ``/task <id>``. The archive is itself bounded by
+total size and entry age, oldest entries being pruned first.
+"""
+
+from __future__ import annotations
+
+import json
+import logging
+import time
+from collections import OrderedDict
+from collections.abc import Callable
+from dataclasses import dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any
+
+from teambot.tasks.models import DEFAULT_TASK_TIMEOUT, Task, TaskResult, TaskStatus
+
+logger = logging.getLogger(__name__)
+
+# Defaults applied when a configuration is loaded without a task_retention section
+DEFAULT_MAX_TASKS = 200
+DEFAULT_MAX_OUTPUT_BYTES = 16 * 1024 * 1024
+DEFAULT_ARCHIVE_MAX_BYTES = 64 * 1024 * 1024
+DEFAULT_ARCHIVE_MAX_AGE = 7 * 24 * 60 * 60
+
+
+@dataclass
+class RetentionPolicy:
+    """Limits on finished tasks kept in memory.
+
+    Limits apply only to terminal tasks; pending and running tasks are
+    never evicted. A limit of None disables that bound.
+
+    Attributes:
+        max_tasks: Maximum finished tasks kept in memory.
+        max_output_bytes: Maximum total size of retained outputs (UTF-8 bytes).
+        max_age: Seconds after completion before a task is evicted.
+    """
+
+    max_tasks: int | None = None
+    max_output_bytes: int | None = None
+    max_age: float | None = None
+
+    @property
+    def is_bounded(self) -> bool:
+        """Check if any limit is set."""
+        return (
+            self.max_tasks is not None
+            or self.max_output_bytes is not None
+            or self.max_age is not None
+        )
+
+    def is_exceeded(self, task_count: int, output_bytes: int) -> bool:
+        """Check if the count or size limit is exceeded.
+
+        Args:
+            task_count: Number of finished tasks retained.
+            output_bytes: Total size of retained outputs.
+
+        Returns:
+            True if either limit is exceeded.
+        """
+        if self.max_tasks is not None and task_count > self.max_tasks:
+            return True
+        return self.max_output_bytes is not None and output_bytes > self.max_output_bytes
+
+    @classmethod
+    def from_config(cls, config: dict | None) -> RetentionPolicy:
+        """Build a policy from the ``task_retention`` configuration section.
+
+        Args:
+            config: TeamBot configuration dict.
+
+        Returns:
+            Policy using configured values, falling back to the defaults.
+        """
+        section = (config or {}).get("task_retention", {})
+        return cls(
+            max_tasks=section.get("max_tasks", DEFAULT_MAX_TASKS),
+            max_output_bytes=section.get("max_output_bytes", DEFAULT_MAX_OUTPUT_BYTES),
+            max_age=section.get("max_age_seconds"),
+        )
+
+
+class TaskArchive:
+    """On-disk store for tasks evicted from memory.
+
+    Each task is written as ``<task_id>.json`` in the archive directory,
+    which is created on first use. An index of entries, oldest first, is
+    built from the directory on the first save; each save then prunes
+    entries beyond the size and age limits.
+    """
+
+    def __init__(
+        self,
+        directory: Path,
+        max_bytes: int | None = DEFAULT_ARCHIVE_MAX_BYTES,
+        max_age: float | None = DEFAULT_ARCHIVE_MAX_AGE,
+        clock: Callable[[], float] = time.time,
+    ):
+        """Initialize archive.
+
+        Args:
+            directory: Directory holding archived tasks.
+            max_bytes: Maximum total size of archived tasks (None for no limit).
+            max_age: Seconds after which an archived task is pruned (None for
+                no limit).
+            clock: Source of the current time (for testing).
+        """
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+        self._clock = clock
+        # task_id -> (modification time, file size), oldest first
+        self._index: OrderedDict[str, tuple[float, int]] | None = None
+        self._size = 0
+
+    def _path(self, task_id: str) -> Path | None:
+        # Task IDs are hex strings; refuse anything that could escape the directory
+        if not task_id or not task_id.isalnum():
+            return None
+        return self.directory / f"{task_id}.json"
+
+    def _load_index(self) -> OrderedDict[str, tuple[float, int]]:
+        if self._index is not None:
+            return self._index
+
+        entries: list[tuple[float, str, int]] = []
+        try:
+            for path in self.directory.glob("*.json"):
+                try:
+                    stat = path.stat()
+                except OSError:
+                    continue
+                entries.append((stat.st_mtime, path.stem, stat.st_size))
+        except OSError as e:
+            logger.warning("Could not read task archive %s: %s", self.directory, e)
+
+        entries.sort()
+        self._index = OrderedDict((key, (mtime, size)) for mtime, key, size in entries)
+        self._size = sum(size for _, size in self._index.values())
+        return self._index
+
+    def _remove(self, task_id: str) -> None:
+        index = self._load_index()
+        _, size = index.pop(task_id, (0.0, 0))
+        self._size -= size
+        path = self._path(task_id)
+        if path is not None:
+            try:
+                path.unlink(missing_ok=True)
+            except OSError as e:
+                logger.warning("Could not prune archived task %s: %s", task_id, e)
+
+    def _prune(self) -> None:
+        """Remove the oldest entries until the size and age limits are met."""
+        index = self._load_index()
+        cutoff = self._clock() - self.max_age if self.max_age is not None else None
+        while index:
+            task_id, (mtime, _) = next(iter(index.items()))
+            too_old = cutoff is not None and mtime < cutoff
+            too_big = self.max_bytes is not None and self._size > self.max_bytes
+            if not (too_old or too_big):
+                break
+            self._remove(task_id)
+
+    def save(self, task: Task) -> bool:
+        """Write a task and its result to the archive, pruning old entries.
+
+        Args:
+            task: Finished task to archive.
+
+        Returns:
+            True if the task was written.
+        """
+        path = self._path(task.id)
+        if path is None:
+            return False
+        data = json.dumps(_task_to_dict(task)).encode("utf-8")
+        index = self._load_index()
+        try:
+            self.directory.mkdir(parents=True, exist_ok=True)
+            path.write_bytes(data)
+        except OSError as e:
+            logger.warning("Could not archive task %s: %s", task.id, e)
+            return False
+
+        _, previous = index.pop(task.id, (0.0, 0))
+        self._size += len(data) - previous
+        index[task.id] = (self._clock(), len(data))
+        self._prune()
+        return task.id in index
+
+    def load(self, task_id: str) -> Task | None:
+        """Load an archived task.
+
+        Args:
+            task_id: Task identifier.
+
+        Returns:
+            The archived task, or None if it is not in the archive.
+        """
+        path = self._path(task_id)
+        if path is None or not path.exists():
+            return None
+        try:
+            return _task_from_dict(json.loads(path.read_text(encoding="utf-8")))
+        except (OSError, ValueError, KeyError) as e:
+            logger.warning("Could not load archived task %s: %s", task_id, e)
+            return None
+
+
+def _format_time(value: datetime | None) -> str | None:
+    return value.isoformat() if value else None
+
+
+def _parse_time(value: str | None) -> datetime | None:
+    return datetime.fromisoformat(value) if value else None
+
+
+def _task_to_dict(task: Task) -> dict[str, Any]:
+    result = task.result
+    return {
+        "id": task.id,
+        "agent_id": task.agent_id,
+        "prompt": task.prompt,
+        "status": task.status.name,
+        "dependencies": list(task.dependencies),
+        "timeout": task.timeout,
+        "background": task.background,
+        "model": task.model,
+        "started_at": _format_time(task.started_at),
+        "completed_at": _format_time(task.completed_at),
+        "result": {
+            "output": result.output,
+            "success": result.success,
+            "error": result.error,
+            "completed_at": _format_time(result.completed_at),
+            "timed_out": result.timed_out,
+        }
+        if result
+        else None,
+    }
+
+
+def _task_from_dict(data: dict[str, Any]) -> Task:
+    result_data = data.get("result")
+    result = None
+    if result_data is not None:
+        result = TaskResult(
+            task_id=data["id"],
+            output=result_data["output"],
+            success=result_data["success"],
+            error=result_data.get("error"),
+            timed_out=result_data.get("timed_out", False),
+        )
+        if result_data.get("completed_at"):
+            result.completed_at = _parse_time(result_data["completed_at"])
+
+    return Task(
+        id=data["id"],
+        agent_id=data["agent_id"],
+        prompt=data["prompt"],
+        status=TaskStatus[data["status"]],
+        dependencies=data.get("dependencies", []),
+        timeout=data.get("timeout", DEFAULT_TASK_TIMEOUT),
+        background=data.get("background", False),
+        result=result,
+        started_at=_parse_time(data.get("started_at")),
+        completed_at=_parse_time(data.get("completed_at")),
+        model=data.get("model"),
+    )
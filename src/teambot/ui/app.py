@@ -11,6 +11,7 @@ from textual.app import App, ComposeResult
 from textual.containers import Horizontal, Vertical
 from textual.widgets import Static
 
+from teambot.copilot.sdk_client import request_scope
 from teambot.repl.commands import SystemCommands
 from teambot.repl.parser import (
     Command,
@@ -229,21 +230,15 @@ class TeamBotApp(App):
                     output.write_streaming_chunk(agent_id, chunk)
 
                 try:
-                    result_text = await self._sdk_client.execute_streaming(
-                        agent_id, content, on_chunk
-                    )
-                    task.mark_completed(result_text)
-                    # Store result by agent_id for $ref lookups
-                    self._executor._manager._agent_results[agent_id] = task.result
-                    self._agent_status.set_completed(agent_id)
-                    output.finish_streaming(agent_id, success=True)
+                    # Queue behind any managed task already using this agent's session
+                    async with self._executor.lane_slot(agent_id):
+                        with request_scope(task.id):
+                            result_text = await self._sdk_client.execute_streaming(
+                                agent_id, content, on_chunk
+                            )
+                    self._settle_direct_task(task, output, result_text=result_text)
                 except Exception as e:
-                    task.mark_failed(str(e))
-                    # Store failed result too for $ref lookups
-                    self._executor._manager._agent_results[agent_id] = task.result
-                    self._agent_status.set_failed(agent_id)
-                    output.finish_streaming(agent_id, success=False)
-                    output.write_task_error(agent_id, str(e))
+                    self._settle_direct_task(task, output, error=e)
             else:
                 # Use executor for pipelines, references, and complex commands
                 result = await self._executor.execute(command)
@@ -270,6 +265,42 @@ class TeamBotApp(App):
             # Legacy compatibility
             self._running_agents.pop(agent_id, None)
 
+    def _settle_direct_task(
+        self,
+        task,
+        output,
+        result_text: str | None = None,
+        error: Exception | None = None,
+    ) -> None:
+        """Record the outcome of a task streamed directly through the SDK client.
+
+        The result is stored by agent_id for $ref lookups. A task cancelled
+        while streaming keeps its cancelled status.
+
+        Args:
+            task: Tracking task created for the stream.
+            output: OutputPane for displaying results.
+            result_text: Streamed response, if the stream finished.
+            error: Exception raised by the stream, if any.
+        """
+        agent_id = task.agent_id
+        if task.status.is_terminal():
+            # Cancelled with /cancel; the manager already recorded the result
+            output.finish_streaming(agent_id, success=False)
+            return
+
+        if error is None:
+            task.mark_completed(result_text)
+            self._executor._manager.record_result(task)
+            self._agent_status.set_completed(agent_id)
+            output.finish_streaming(agent_id, success=True)
+        else:
+            task.mark_failed(str(error))
+            self._executor._manager.record_result(task)
+            self._agent_status.set_failed(agent_id)
+            output.finish_streaming(agent_id, success=False)
+            output.write_task_error(agent_id, str(error))
+
     async def _handle_multiagent_streaming(self, command, output):
         """Handle multi-agent commands with parallel streaming.
 
@@ -301,15 +332,14 @@ class TeamBotApp(App):
                 output.write_streaming_chunk(agent_id, chunk)
 
             try:
-                result_text = await self._sdk_client.execute_streaming(agent_id, content, on_chunk)
-                task.mark_completed(result_text)
-                self._agent_status.set_completed(agent_id)
-                output.finish_streaming(agent_id, success=True)
+                async with self._executor.lane_slot(agent_id):
+                    with request_scope(task.id):
+                        result_text = await self._sdk_client.execute_streaming(
+                            agent_id, content, on_chunk
+                        )
+                self._settle_direct_task(task, output, result_text=result_text)
             except Exception as e:
-                task.mark_failed(str(e))
-                self._agent_status.set_failed(agent_id)
-                output.finish_streaming(agent_id, success=False)
-                output.write_task_error(agent_id, str(e))
+                self._settle_direct_task(task, output, error=e)
             finally:
                 self._agent_status.set_idle(agent_id)
                 self._running_agents.pop(agent_id, None)
@@ -418,8 +448,19 @@ class TeamBotApp(App):
 
             output.write_info(f"Cancelled {cancelled} streaming task(s)")
         else:
+            target = args[0].lstrip("#")
+            task = self._executor.get_task(target) if self._executor else None
+            if task is not None:
+                # Cancel specific task (and its dependents)
+                if self._executor.cancel_task(task.id):
+                    self._clean_up_cancelled_agent(task.agent_id, output)
+                    output.write_info(f"Cancelled task #{task.id}")
+                else:
+                    output.write_info(f"Could not cancel task {task.id} (already complete)")
+                return
+
             # Cancel specific agent
-            agent_id = args[0]
+            agent_id = target.lstrip("@")
             if await self._cancel_agent(agent_id, output):
                 output.write_info(f"Cancelled @{agent_id}")
             else:
@@ -428,6 +469,10 @@ class TeamBotApp(App):
     async def _cancel_agent(self, agent_id: str, output) -> bool:
         """Cancel streaming for a specific agent.
 
+        The agent's running task is cancelled through the executor, which
+        also aborts its SDK request; otherwise the request is aborted
+        directly.
+
         Args:
             agent_id: Agent to cancel.
             output: OutputPane for finishing streaming.
@@ -435,14 +480,29 @@ class TeamBotApp(App):
         Returns:
             True if cancelled successfully.
         """
-        if self._sdk_client and hasattr(self._sdk_client, "cancel_current_request"):
+        cancelled = False
+        running = self._executor.get_running_task_for_agent(agent_id) if self._executor else None
+        if running is not None:
+            cancelled = self._executor.cancel_task(running.id)
+        elif self._sdk_client and hasattr(self._sdk_client, "cancel_current_request"):
             cancelled = await self._sdk_client.cancel_current_request(agent_id)
-            if cancelled:
-                self._agent_status.set_idle(agent_id)
-                output.finish_streaming(agent_id, success=False)
-                self._running_agents.pop(agent_id, None)
-                return True
-        return False
+
+        if cancelled:
+            self._clean_up_cancelled_agent(agent_id, output)
+        return cancelled
+
+    def _clean_up_cancelled_agent(self, agent_id: str, output) -> None:
+        """Reset an agent's status and streaming output after cancellation.
+
+        Args:
+            agent_id: Agent whose work was cancelled.
+            output: OutputPane for finishing streaming.
+        """
+        if self._executor and self._executor.get_running_task_for_agent(agent_id):
+            return  # Agent still has other work in progress
+        self._agent_status.set_idle(agent_id)
+        output.finish_streaming(agent_id, success=False)
+        self._running_agents.pop(agent_id, None)
 
     def _get_status(self, output: OutputPane | None = None) -> str:
         """Get agent status including running and streaming tasks.
@@ -0,0 +1,253 @@
+"""Crash-safe persistence of workflow and orchestration state.
+
+State used to be saved by serializing all of it to one JSON file with a
+plain write after every change. Saves grew slower as a run accumulated
+stage output, and a crash in the middle of a write left a truncated file
+that could not be resumed.
+
+A StateJournal instead keeps a snapshot of the state plus an append-only
+journal of changes to it: each save appends one line with just the keys
+that changed. The snapshot is rewritten at checkpoints and after a number
+of journal entries, by writing a temporary file and renaming it over the
+old one, so it is always either the old or the new version. Loading reads
+the snapshot and replays the journal; a torn last line is ignored.
+
+Large text (stage output) goes into a ContentStore rather than the state
+itself: write-once files named by the hash of their content, which the
+state refers to by hash.
+"""
+
+from __future__ import annotations
+
+import copy
+import hashlib
+import json
+import logging
+import os
+import re
+import tempfile
+from pathlib import Path
+from typing import Any
+
+logger = logging.getLogger(__name__)
+
+# Journal entries after which the snapshot is rewritten and the journal emptied
+DEFAULT_COMPACT_EVERY = 50
+
+# Snapshot key recording the last journal entry the snapshot includes
+SEQ_KEY = "journal_seq"
+
+_DIGEST = re.compile(r"[0-9a-f]{64}")
+
+
+def write_atomic(path: Path, text: str) -> None:
+    """Replace a file's contents so that readers see either the old or new file.
+
+    Args:
+        path: File to write.
+        text: New contents.
+    """
+    fd, tmp = tempfile.mkstemp(dir=path.parent, prefix=f".{path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(text)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp, path)
+    except BaseException:
+        try:
+            os.unlink(tmp)
+        except OSError:
+            pass
+        raise
+
+
+class ContentStore:
+    """Write-once text files named by the SHA-256 of their content."""
+
+    def __init__(self, directory: Path):
+        """Initialize store.
+
+        Args:
+            directory: Directory holding the files (created on first write).
+        """
+        self.directory = directory
+
+    def put(self, text: str) -> str:
+        """Store text, unless identical text is already stored.
+
+        Args:
+            text: Text to store.
+
+        Returns:
+            Digest to retrieve the text with.
+        """
+        digest = hashlib.sha256(text.encode("utf-8")).hexdigest()
+        path = self.directory / f"{digest}.md"
+        if not path.exists():
+            self.directory.mkdir(parents=True, exist_ok=True)
+            write_atomic(path, text)
+        return digest
+
+    def get(self, digest: str) -> str | None:
+        """Get stored text.
+
+        Args:
+            digest: Digest returned by put().
+
+        Returns:
+            The text, or None if it is not stored.
+        """
+        if not _DIGEST.fullmatch(digest):
+            return None
+        try:
+            return (self.directory / f"{digest}.md").read_text(encoding="utf-8")
+        except OSError:
+            return None
+
+
+class StateJournal:
+    """A JSON-serializable state dict saved as a snapshot plus a journal of changes.
+
+    The journal lives next to the snapshot, with a ``.journal`` suffix.
+    Only one StateJournal should write a given snapshot at a time.
+    """
+
+    def __init__(self, snapshot_path: Path, compact_every: int = DEFAULT_COMPACT_EVERY):
+        """Initialize journal.
+
+        Args:
+            snapshot_path: Path of the snapshot file.
+            compact_every: Journal entries after which the snapshot is rewritten.
+        """
+        self.snapshot_path = snapshot_path
+        self.journal_path = snapshot_path.with_suffix(".journal")
+        self.compact_every = compact_every
+        self._saved: dict[str, Any] | None = None
+        self._seq = 0
+        self._entries = 0
+
+    def exists(self) -> bool:
+        """Check if any state has been saved."""
+        return self.snapshot_path.exists()
+
+    def modified_at(self) -> float:
+        """Get the time state was last saved (0 if never)."""
+        times = [p.stat().st_mtime for p in (self.snapshot_path, self.journal_path) if p.exists()]
+        return max(times, default=0.0)
+
+    def save(self, state: dict[str, Any], checkpoint: bool = False) -> None:
+        """Save state, appending only what changed since the last save.
+
+        Args:
+            state: Complete current state.
+            checkpoint: Rewrite the snapshot instead of appending to the journal.
+        """
+        if self._saved is None or checkpoint or self._entries >= self.compact_every:
+            self._write_snapshot(state)
+            return
+
+        entry = self._diff(self._saved, state)
+        if not entry:
+            return
+
+        self._seq += 1
+        entry["seq"] = self._seq
+        with open(self.journal_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(entry) + "\n")
+            f.flush()
+            os.fsync(f.fileno())
+        self._saved = copy.deepcopy(state)
+        self._entries += 1
+
+    def load(self) -> dict[str, Any] | None:
+        """Load the snapshot and replay the journal on top of it.
+
+        Returns:
+            The saved state, or None if there is none.
+
+        Raises:
+            json.JSONDecodeError: If the snapshot is not valid JSON.
+        """
+        if not self.snapshot_path.exists():
+            return None
+
+        state = json.loads(self.snapshot_path.read_text(encoding="utf-8"))
+        self._seq = state.pop(SEQ_KEY, 0)
+        self._entries = 0
+
+        torn = False
+        if self.journal_path.exists():
+            text = self.journal_path.read_text(encoding="utf-8")
+            # A save that was cut short leaves a last line without its newline
+            torn = bool(text) and not text.endswith("\n")
+            for line in text.splitlines():
+                try:
+                    entry = json.loads(line)
+                except json.JSONDecodeError:
+                    # A save was interrupted; everything before it is intact
+                    logger.warning(f"Ignoring incomplete entry at end of {self.journal_path}")
+                    torn = True
+                    break
+                if entry["seq"] <= self._seq:
+                    # Already in the snapshot (crashed before the journal was emptied)
+                    continue
+                self._apply(state, entry)
+                self._seq = entry["seq"]
+                self._entries += 1
+
+        if torn:
+            # Fold the intact entries into a new snapshot so later appends
+            # don't land after the torn line, where replay would never reach
+            self._write_snapshot(state)
+        else:
+            self._saved = copy.deepcopy(state)
+        return state
+
+    def _write_snapshot(self, state: dict[str, Any]) -> None:
+        """Rewrite the snapshot with the complete state and empty the journal."""
+        self.snapshot_path.parent.mkdir(parents=True, exist_ok=True)
+        write_atomic(self.snapshot_path, json.dumps({**state, SEQ_KEY: self._seq}, indent=2))
+        # Entries up to _seq are in the snapshot, so a crash here loses nothing
+        self.journal_path.unlink(missing_ok=True)
+        self._saved = copy.deepcopy(state)
+        self._entries = 0
+
+    @staticmethod
+    def _diff(old: dict[str, Any], new: dict[str, Any]) -> dict[str, Any]:
+        """Describe the changes from old to new as a journal entry."""
+        changed: dict[str, Any] = {}
+        extended: dict[str, list[Any]] = {}
+        for key, value in new.items():
+            previous = old.get(key)
+            if key in old and previous == value:
+                continue
+            if (
+                isinstance(previous, list)
+                and isinstance(value, list)
+                and len(value) > len(previous)
+                and value[: len(previous)] == previous
+            ):
+                # Growing history: record only the new items
+                extended[key] = value[len(previous) :]
+            else:
+                changed[key] = value
+
+        entry: dict[str, Any] = {}
+        if changed:
+            entry["set"] = changed
+        if extended:
+            entry["extend"] = extended
+        removed = [key for key in old if key not in new]
+        if removed:
+            entry["unset"] = removed
+        return entry
+
+    @staticmethod
+    def _apply(state: dict[str, Any], entry: dict[str, Any]) -> None:
+        """Apply a journal entry to a state."""
+        state.update(entry.get("set", {}))
+        for key, items in entry.get("extend", {}).items():
+            state.setdefault(key, []).extend(items)
+        for key in entry.get("unset", []):
+            state.pop(key, None)
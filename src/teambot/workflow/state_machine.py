@@ -9,6 +9,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import Any
 
+from teambot.workflow.journal import StateJournal
 from teambot.workflow.stages import (
     WorkflowStage,
     can_skip_stage,
@@ -92,6 +93,7 @@ class WorkflowStateMachine:
     def __init__(self, teambot_dir: Path, objective: str = ""):
         self.teambot_dir = teambot_dir
         self.state_file = teambot_dir / "workflow_state.json"
+        self._journal = StateJournal(self.state_file)
         self._state: WorkflowState | None = None
         self._objective = objective
 
@@ -121,7 +123,7 @@ class WorkflowStateMachine:
     def _load_state(self) -> WorkflowState:
         """Load state from file."""
         try:
-            data = json.loads(self.state_file.read_text())
+            data = self._journal.load()
             return WorkflowState.from_dict(data)
         except (json.JSONDecodeError, KeyError) as e:
             logger.error(f"Failed to load workflow state: {e}")
@@ -136,8 +138,8 @@ class WorkflowStateMachine:
         )
 
     def save_state(self) -> None:
-        """Save current state to file."""
-        self.state_file.write_text(json.dumps(self.state.to_dict(), indent=2))
+        """Save current state, appending the changes to the state journal."""
+        self._journal.save(self.state.to_dict())
         logger.debug(f"Workflow state saved to {self.state_file}")
 
     def can_transition_to(self, target_stage: WorkflowStage) -> bool:
@@ -222,3 +222,43 @@ class TestAgentRunnerContextHandling:
 
         # Should not raise
         runner._handle_message(context_msg)
+
+
+class TestAgentRunnerStreaming:
+    """Tests for streaming CLI output from tasks."""
+
+    def test_task_output_streamed_to_orchestrator(self, temp_teambot_dir):
+        """Output is forwarded as status updates while the task runs."""
+        from unittest.mock import AsyncMock, MagicMock
+
+        from teambot.agent_runner import AgentRunner
+        from teambot.copilot.client import CopilotResult
+        from teambot.messaging.protocol import AgentMessage, MessageType
+
+        async def execute_async(prompt, on_chunk=None):
+            on_chunk("Working on it\n")
+            on_chunk("Done\n")
+            return CopilotResult(success=True, output="Working on it\nDone\n", prompt=prompt)
+
+        copilot_client = MagicMock()
+        copilot_client.is_available.return_value = True
+        copilot_client.execute_async = AsyncMock(side_effect=execute_async)
+        copilot_client.worker_pool = None
+        main_queue: Queue[AgentMessage] = Queue()
+        runner = AgentRunner(
+            agent_id="builder-1",
+            persona="builder",
+            agent_queue=Queue(),
+            main_queue=main_queue,
+            teambot_dir=temp_teambot_dir,
+            copilot_client=copilot_client,
+        )
+
+        result = runner._execute_task({"task": "Implement feature X"})
+        runner.close()
+
+        messages = [main_queue.get(timeout=1) for _ in range(2)]
+        assert [m.type for m in messages] == [MessageType.STATUS_UPDATE] * 2
+        assert [m.payload["output"] for m in messages] == ["Working on it\n", "Done\n"]
+        assert result["status"] == "completed"
+        assert result["output"] == "Working on it\nDone\n"
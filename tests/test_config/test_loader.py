@@ -331,6 +331,81 @@ class TestAgentModelConfig:
         assert config["agents"][0].get("model") is None
 
 
+class TestAgentConcurrencyConfig:
+    """Tests for per-agent max_concurrent in config loader."""
+
+    def test_agent_with_max_concurrent(self, tmp_path):
+        """Agent with a positive max_concurrent loads successfully."""
+        from teambot.config.loader import ConfigLoader
+
+        config_data = {"agents": [{"id": "builder-1", "persona": "builder", "max_concurrent": 2}]}
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        config = ConfigLoader().load(config_file)
+
+        assert config["agents"][0]["max_concurrent"] == 2
+
+    @pytest.mark.parametrize("value", [0, -1, "2", True, 1.5])
+    def test_agent_with_invalid_max_concurrent_raises(self, tmp_path, value):
+        """Non-positive or non-integer max_concurrent raises ConfigError."""
+        from teambot.config.loader import ConfigError, ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "builder-1", "persona": "builder", "max_concurrent": value}]
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        with pytest.raises(ConfigError, match="max_concurrent"):
+            ConfigLoader().load(config_file)
+
+
+class TestTaskRetentionConfig:
+    """Tests for task_retention in config loader."""
+
+    def test_valid_task_retention(self, tmp_path):
+        """Positive limits and null load successfully."""
+        from teambot.config.loader import ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            "task_retention": {"max_tasks": 50, "max_output_bytes": None, "max_age_seconds": 3600},
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        config = ConfigLoader().load(config_file)
+
+        assert config["task_retention"]["max_tasks"] == 50
+
+    @pytest.mark.parametrize(
+        "retention",
+        [
+            [],
+            {"max_tasks": 0},
+            {"max_output_bytes": "1MB"},
+            {"max_tasks": True},
+            {"max_age_seconds": -5},
+            {"archive_max_bytes": 0},
+            {"archive_max_age_seconds": "1d"},
+        ],
+    )
+    def test_invalid_task_retention_raises(self, tmp_path, retention):
+        """Invalid retention limits raise ConfigError."""
+        from teambot.config.loader import ConfigError, ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            "task_retention": retention,
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        with pytest.raises(ConfigError, match="task_retention"):
+            ConfigLoader().load(config_file)
+
+
 class TestGlobalDefaultModel:
     """Tests for global default_model in config."""
 
@@ -626,3 +701,346 @@ class TestNotificationsConfigValidation:
         assert config["notifications"]["enabled"] is True
         # Default dry_run=False
         assert config["notifications"]["channels"][0]["dry_run"] is False
+
+
+class TestSessionPoolConfig:
+    """Tests for session pool sizes in config loader."""
+
+    def test_valid_session_pool(self, tmp_path):
+        """Global and per-agent pool sizes load successfully."""
+        from teambot.config.loader import ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "builder-1", "persona": "builder", "max_sessions": 3}],
+            "session_pool": {
+                "min_sessions": 0,
+                "max_sessions": 2,
+                "idle_timeout_seconds": None,
+                "max_live_sessions": 16,
+            },
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        config = ConfigLoader().load(config_file)
+
+        assert config["session_pool"]["max_sessions"] == 2
+
+    @pytest.mark.parametrize(
+        "session_pool",
+        [
+            [],
+            {"max_sessions": 0},
+            {"min_sessions": -1},
+            {"max_sessions": "2"},
+            {"min_sessions": 3, "max_sessions": 2},
+            {"idle_timeout_seconds": 0},
+            {"max_live_sessions": 0},
+            {"prewarm": "yes"},
+        ],
+    )
+    def test_invalid_session_pool_raises(self, tmp_path, session_pool):
+        """Invalid global pool sizes raise ConfigError."""
+        from teambot.config.loader import ConfigError, ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            "session_pool": session_pool,
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        with pytest.raises(ConfigError, match="session"):
+            ConfigLoader().load(config_file)
+
+    def test_invalid_agent_max_sessions_raises(self, tmp_path):
+        """Invalid per-agent pool size names the agent."""
+        from teambot.config.loader import ConfigError, ConfigLoader
+
+        config_data = {"agents": [{"id": "pm", "persona": "project_manager", "max_sessions": 0}]}
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        with pytest.raises(ConfigError, match="agent 'pm'"):
+            ConfigLoader().load(config_file)
+
+
+class TestResponseCacheConfig:
+    """Tests for response cache settings in config loader."""
+
+    def test_valid_response_cache(self, tmp_path):
+        """A complete response_cache section loads successfully."""
+        from teambot.config.loader import ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            "response_cache": {
+                "enabled": True,
+                "max_bytes": 1048576,
+                "ttl_seconds": None,
+                "workspace_fingerprint": True,
+            },
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        config = ConfigLoader().load(config_file)
+
+        assert config["response_cache"]["enabled"] is True
+
+    @pytest.mark.parametrize(
+        "response_cache",
+        [
+            [],
+            {"enabled": "yes"},
+            {"max_bytes": 0},
+            {"ttl_seconds": -1},
+            {"workspace_fingerprint": 1},
+        ],
+    )
+    def test_invalid_response_cache_raises(self, tmp_path, response_cache):
+        """Invalid response cache settings raise ConfigError."""
+        from teambot.config.loader import ConfigError, ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            "response_cache": response_cache,
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        with pytest.raises(ConfigError, match="response_cache"):
+            ConfigLoader().load(config_file)
+
+
+class TestStreamingConfig:
+    """Tests for streaming chunk coalescing in config loader."""
+
+    def test_valid_streaming(self, tmp_path):
+        """A complete streaming section loads successfully."""
+        from teambot.config.loader import ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            "streaming": {"coalesce_ms": 0, "coalesce_bytes": 512, "flush_on_newline": False},
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        config = ConfigLoader().load(config_file)
+
+        assert config["streaming"]["coalesce_bytes"] == 512
+
+    @pytest.mark.parametrize(
+        "streaming",
+        [
+            [],
+            {"coalesce_ms": -5},
+            {"coalesce_ms": "40"},
+            {"coalesce_bytes": 0},
+            {"flush_on_newline": "yes"},
+        ],
+    )
+    def test_invalid_streaming_raises(self, tmp_path, streaming):
+        """Invalid streaming settings raise ConfigError."""
+        from teambot.config.loader import ConfigError, ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            "streaming": streaming,
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        with pytest.raises(ConfigError, match="streaming"):
+            ConfigLoader().load(config_file)
+
+
+class TestTelemetryConfig:
+    """Tests for request telemetry settings in config loader."""
+
+    def test_valid_telemetry(self, tmp_path):
+        """A complete telemetry section loads successfully."""
+        from teambot.config.loader import ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            "telemetry": {"enabled": False, "max_bytes": 1024, "backups": 0},
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        config = ConfigLoader().load(config_file)
+
+        assert config["telemetry"]["enabled"] is False
+
+    @pytest.mark.parametrize(
+        "telemetry",
+        [[], {"enabled": 1}, {"max_bytes": 0}, {"backups": -1}],
+    )
+    def test_invalid_telemetry_raises(self, tmp_path, telemetry):
+        """Invalid telemetry settings raise ConfigError."""
+        from teambot.config.loader import ConfigError, ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            "telemetry": telemetry,
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        with pytest.raises(ConfigError, match="telemetry"):
+            ConfigLoader().load(config_file)
+
+
+class TestResilienceConfig:
+    """Tests for retry and circuit breaker settings in config loader."""
+
+    def test_valid_resilience(self, tmp_path):
+        """Complete retry and circuit_breaker sections load successfully."""
+        from teambot.config.loader import ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            "retry": {
+                "max_attempts": 4,
+                "base_delay_seconds": 0.5,
+                "max_delay_seconds": 20,
+                "jitter": 0.25,
+            },
+            "circuit_breaker": {
+                "failure_threshold": 3,
+                "reset_seconds": 30,
+                "fallback_models": {"claude-opus-4.5": "gpt-5"},
+            },
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        config = ConfigLoader().load(config_file)
+
+        assert config["circuit_breaker"]["fallback_models"] == {"claude-opus-4.5": "gpt-5"}
+
+    @pytest.mark.parametrize(
+        ("section", "value"),
+        [
+            ("retry", []),
+            ("retry", {"max_attempts": 0}),
+            ("retry", {"base_delay_seconds": -1}),
+            ("retry", {"jitter": 1.5}),
+            ("circuit_breaker", {"failure_threshold": 0}),
+            ("circuit_breaker", {"reset_seconds": 0}),
+            ("circuit_breaker", {"fallback_models": {"gpt-5": ""}}),
+            ("circuit_breaker", {"fallback_models": ["gpt-5"]}),
+        ],
+    )
+    def test_invalid_resilience_raises(self, tmp_path, section, value):
+        """Invalid retry and circuit_breaker settings raise ConfigError."""
+        from teambot.config.loader import ConfigError, ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            section: value,
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        with pytest.raises(ConfigError, match=section):
+            ConfigLoader().load(config_file)
+
+
+class TestTimeoutsConfig:
+    """Tests for request deadline settings in config loader."""
+
+    def test_valid_timeouts(self, tmp_path):
+        """timeouts section and per-agent deadlines load successfully."""
+        from teambot.config.loader import ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager", "timeout_seconds": 600}],
+            "timeouts": {"request_seconds": 1200, "inactivity_seconds": None},
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        config = ConfigLoader().load(config_file)
+
+        assert config["timeouts"]["request_seconds"] == 1200
+        assert config["agents"][0]["timeout_seconds"] == 600
+
+    @pytest.mark.parametrize(
+        "timeouts",
+        [[], {"request_seconds": 0}, {"inactivity_seconds": -5}, {"request_seconds": True}],
+    )
+    def test_invalid_timeouts_raises(self, tmp_path, timeouts):
+        """Invalid timeouts settings raise ConfigError."""
+        from teambot.config.loader import ConfigError, ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            "timeouts": timeouts,
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        with pytest.raises(ConfigError, match="timeouts"):
+            ConfigLoader().load(config_file)
+
+    def test_invalid_agent_timeout_raises(self, tmp_path):
+        """A non-positive agent deadline raises ConfigError."""
+        from teambot.config.loader import ConfigError, ConfigLoader
+
+        config_data = {"agents": [{"id": "pm", "persona": "project_manager", "timeout_seconds": 0}]}
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        with pytest.raises(ConfigError, match="timeout_seconds"):
+            ConfigLoader().load(config_file)
+
+
+class TestCLIPoolConfig:
+    """Tests for CLI worker pool settings in config loader."""
+
+    def test_valid_cli_pool(self, tmp_path):
+        """A complete cli_pool section loads successfully."""
+        from teambot.config.loader import ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            "cli_pool": {
+                "enabled": True,
+                "workers_per_directory": 3,
+                "max_requests_per_worker": 20,
+                "health_check_seconds": 30,
+            },
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        config = ConfigLoader().load(config_file)
+
+        assert config["cli_pool"]["workers_per_directory"] == 3
+
+    @pytest.mark.parametrize(
+        "cli_pool",
+        [
+            [],
+            {"enabled": "yes"},
+            {"workers_per_directory": 0},
+            {"max_requests_per_worker": 1.5},
+            {"health_check_seconds": -1},
+        ],
+    )
+    def test_invalid_cli_pool_raises(self, tmp_path, cli_pool):
+        """Invalid cli_pool settings raise ConfigError."""
+        from teambot.config.loader import ConfigError, ConfigLoader
+
+        config_data = {
+            "agents": [{"id": "pm", "persona": "project_manager"}],
+            "cli_pool": cli_pool,
+        }
+        config_file = tmp_path / "teambot.json"
+        config_file.write_text(json.dumps(config_data))
+
+        with pytest.raises(ConfigError, match="cli_pool"):
+            ConfigLoader().load(config_file)
@@ -0,0 +1,294 @@
+"""Tests for the pool of long-lived Copilot CLI workers."""
+
+import asyncio
+from pathlib import Path
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from teambot.copilot.cli_pool import (
+    CLIPoolConfig,
+    CLIWorkerError,
+    CLIWorkerPool,
+    get_cli_worker_pool,
+)
+from teambot.copilot.client import CopilotClient, CopilotConfig
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class FakeSession:
+    """SDK session that delivers events to subscribed handlers."""
+
+    def __init__(self):
+        self._handlers = []
+        self.send = AsyncMock()
+        self.destroy = AsyncMock()
+
+    def on(self, handler):
+        self._handlers.append(handler)
+        return lambda: self._handlers.remove(handler)
+
+    def fire_event(self, event_type, data=None):
+        for handler in list(self._handlers):
+            handler(SimpleNamespace(type=event_type, data=data))
+
+
+def _replying_session(*chunks: str, error: str | None = None) -> FakeSession:
+    """Session that streams a reply (or reports an error) when sent a prompt."""
+    session = FakeSession()
+
+    async def send(payload):
+        for chunk in chunks:
+            session.fire_event("ASSISTANT_MESSAGE_DELTA", SimpleNamespace(delta_content=chunk))
+        if error:
+            session.fire_event("SESSION_ERROR", SimpleNamespace(error_type="Error", message=error))
+        else:
+            session.fire_event("SESSION_IDLE")
+
+    session.send = AsyncMock(side_effect=send)
+    return session
+
+
+class FakeSDKClients:
+    """Factory of fake SDK clients that records what it created."""
+
+    def __init__(self, session_factory=lambda: _replying_session("Done")):
+        self.session_factory = session_factory
+        self.clients: list[MagicMock] = []
+
+    def __call__(self, options):
+        client = MagicMock()
+        client.options = options
+        client.start = AsyncMock()
+        client.stop = AsyncMock()
+        client.force_stop = AsyncMock()
+        client.ping = AsyncMock()
+        client.create_session = AsyncMock(side_effect=lambda config: self.session_factory())
+        self.clients.append(client)
+        return client
+
+
+async def _run(pool: CLIWorkerPool, directory: Path, prompt: str = "Plan it") -> str:
+    async with pool.worker(directory, "/usr/bin/copilot") as worker:
+        return await worker.run(prompt, {})
+
+
+class TestCLIWorkerPool:
+    """Tests for CLIWorkerPool."""
+
+    @pytest.mark.asyncio
+    async def test_worker_reused_across_requests(self, tmp_path):
+        """Sequential requests in one directory share one CLI process."""
+        clients = FakeSDKClients()
+        pool = CLIWorkerPool(client_factory=clients)
+
+        assert await _run(pool, tmp_path) == "Done"
+        assert await _run(pool, tmp_path) == "Done"
+
+        assert len(clients.clients) == 1
+        assert clients.clients[0].options == {"cli_path": "/usr/bin/copilot", "cwd": str(tmp_path)}
+        assert clients.clients[0].create_session.await_count == 2
+        assert pool.live_workers == 1
+
+    @pytest.mark.asyncio
+    async def test_session_runs_in_working_directory(self, tmp_path):
+        """Each prompt gets a streaming session in the worker's directory."""
+        clients = FakeSDKClients()
+        pool = CLIWorkerPool(client_factory=clients)
+
+        async with pool.worker(tmp_path, "copilot") as worker:
+            chunks = []
+            await worker.run("Plan it", {"model": "gpt-5"}, chunks.append)
+
+        config = clients.clients[0].create_session.await_args.args[0]
+        assert config == {"model": "gpt-5", "streaming": True, "working_directory": str(tmp_path)}
+        assert chunks == ["Done"]
+
+    @pytest.mark.asyncio
+    async def test_workers_per_directory(self, tmp_path):
+        """Each directory has its own workers, up to workers_per_directory at once."""
+        clients = FakeSDKClients()
+        pool = CLIWorkerPool(CLIPoolConfig(workers_per_directory=2), client_factory=clients)
+        in_use = 0
+        peak = 0
+
+        async def request(directory):
+            nonlocal in_use, peak
+            async with pool.worker(directory, "copilot"):
+                in_use += 1
+                peak = max(peak, in_use)
+                await asyncio.sleep(0.01)
+                in_use -= 1
+
+        await asyncio.gather(*(request(tmp_path / "a") for _ in range(5)))
+        assert peak == 2
+        assert len(clients.clients) == 2
+
+        await request(tmp_path / "b")
+        assert len(clients.clients) == 3
+
+    @pytest.mark.asyncio
+    async def test_recycled_after_max_requests(self, tmp_path):
+        """A worker is stopped after max_requests and replaced on next use."""
+        clients = FakeSDKClients()
+        pool = CLIWorkerPool(CLIPoolConfig(max_requests=2), client_factory=clients)
+
+        for _ in range(3):
+            await _run(pool, tmp_path)
+
+        assert len(clients.clients) == 2
+        clients.clients[0].stop.assert_awaited_once()
+        assert pool.recycled == 1
+
+    @pytest.mark.asyncio
+    async def test_recycled_on_error(self, tmp_path):
+        """A worker whose request fails is killed, not reused."""
+        clients = FakeSDKClients(lambda: _replying_session(error="Model overloaded"))
+        pool = CLIWorkerPool(client_factory=clients)
+
+        with pytest.raises(CLIWorkerError, match="Model overloaded"):
+            await _run(pool, tmp_path)
+
+        clients.clients[0].force_stop.assert_awaited_once()
+        assert pool.live_workers == 0
+
+    @pytest.mark.asyncio
+    async def test_idle_worker_health_checked(self, tmp_path):
+        """A worker idle past health_check_seconds is pinged; a dead one is replaced."""
+        clock = FakeClock()
+        clients = FakeSDKClients()
+        pool = CLIWorkerPool(
+            CLIPoolConfig(health_check_seconds=60), client_factory=clients, clock=clock
+        )
+        await _run(pool, tmp_path)
+
+        clock.now += 30
+        await _run(pool, tmp_path)
+        clients.clients[0].ping.assert_not_awaited()
+
+        clock.now += 61
+        await _run(pool, tmp_path)
+        clients.clients[0].ping.assert_awaited_once()
+        assert len(clients.clients) == 1
+
+        clients.clients[0].ping.side_effect = ConnectionError("CLI exited")
+        clock.now += 61
+        await _run(pool, tmp_path)
+        clients.clients[0].force_stop.assert_awaited_once()
+        assert len(clients.clients) == 2
+
+    @pytest.mark.asyncio
+    async def test_close_stops_idle_workers(self, tmp_path):
+        """close() stops every idle worker."""
+        clients = FakeSDKClients()
+        pool = CLIWorkerPool(client_factory=clients)
+        await _run(pool, tmp_path / "a")
+        await _run(pool, tmp_path / "b")
+
+        await pool.close()
+
+        assert all(c.stop.await_count == 1 for c in clients.clients)
+        assert pool.live_workers == 0
+
+    def test_get_cli_worker_pool(self):
+        """The pool is built from the cli_pool section when enabled."""
+        pool = get_cli_worker_pool({"cli_pool": {"enabled": True, "workers_per_directory": 4}})
+        assert pool.config.workers_per_directory == 4
+
+        assert get_cli_worker_pool({"cli_pool": {"enabled": False}}) is None
+
+    def test_disabled_by_default(self):
+        """Without an explicit enabled flag, prompts keep going to copilot -p."""
+        assert get_cli_worker_pool(None) is None
+        assert get_cli_worker_pool({"cli_pool": {"workers_per_directory": 4}}) is None
+
+
+class TestCopilotClientWithPool:
+    """Tests for CopilotClient sending prompts to pooled workers."""
+
+    @pytest.mark.asyncio
+    async def test_execute_async_uses_worker(self, tmp_path):
+        """Prompts are streamed from a pooled worker instead of a new process."""
+        clients = FakeSDKClients(lambda: _replying_session("Hello ", "world"))
+        client = CopilotClient(
+            working_dir=tmp_path,
+            config=CopilotConfig(model="gpt-5"),
+            worker_pool=CLIWorkerPool(client_factory=clients),
+        )
+        chunks = []
+
+        with (
+            patch("shutil.which", return_value="/usr/bin/copilot"),
+            patch("asyncio.create_subprocess_exec") as create_subprocess,
+        ):
+            result = await client.execute_async("Plan it", context="Ctx", on_chunk=chunks.append)
+
+        create_subprocess.assert_not_called()
+        assert result.success
+        assert result.output == "Hello world"
+        assert result.prompt == "Ctx\n\nPlan it"
+        assert chunks == ["Hello ", "world"]
+        config = clients.clients[0].create_session.await_args.args[0]
+        assert config["model"] == "gpt-5"
+        assert config["on_permission_request"]({}, {}) == {"kind": "approved"}
+
+    @pytest.mark.asyncio
+    async def test_additional_dirs_outside_working_dir_bypass_pool(self, tmp_path):
+        """Directories a worker session can't reach send the prompt to copilot -p."""
+        clients = FakeSDKClients(lambda: _replying_session("pooled"))
+        client = CopilotClient(
+            working_dir=tmp_path / "work",
+            config=CopilotConfig(additional_dirs=[str(tmp_path / "shared")]),
+            worker_pool=CLIWorkerPool(client_factory=clients),
+        )
+
+        with (
+            patch("shutil.which", return_value="/usr/bin/copilot"),
+            patch("asyncio.create_subprocess_exec", side_effect=FileNotFoundError) as create,
+        ):
+            await client.execute_async("Plan it")
+
+        assert "--add-dir" in create.call_args.args
+        assert clients.clients == []
+
+    @pytest.mark.asyncio
+    async def test_additional_dirs_inside_working_dir_use_pool(self, tmp_path):
+        """The working directory itself (as AgentRunner passes it) stays pooled."""
+        clients = FakeSDKClients(lambda: _replying_session("pooled"))
+        client = CopilotClient(
+            working_dir=tmp_path,
+            config=CopilotConfig(additional_dirs=[str(tmp_path)]),
+            worker_pool=CLIWorkerPool(client_factory=clients),
+        )
+
+        with patch("shutil.which", return_value="/usr/bin/copilot"):
+            result = await client.execute_async("Plan it")
+
+        assert result.output == "pooled"
+
+    @pytest.mark.asyncio
+    async def test_worker_timeout_returns_failed_result(self, tmp_path):
+        """A request still running at the timeout fails and its worker is killed."""
+        clients = FakeSDKClients(FakeSession)  # never replies
+        client = CopilotClient(
+            working_dir=tmp_path,
+            config=CopilotConfig(timeout=0.05),
+            worker_pool=CLIWorkerPool(client_factory=clients),
+        )
+
+        with patch("shutil.which", return_value="/usr/bin/copilot"):
+            result = await client.execute_async("Plan it")
+
+        assert not result.success
+        assert result.error == "Timeout after 0.05 seconds"
+        clients.clients[0].force_stop.assert_awaited_once()
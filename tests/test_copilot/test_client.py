@@ -0,0 +1,287 @@
+"""Tests for asynchronous Copilot CLI execution."""
+
+import asyncio
+import errno
+import logging
+import os
+import subprocess
+import sys
+import time
+from pathlib import Path
+from unittest.mock import patch
+
+import pytest
+
+from teambot.copilot.client import CopilotClient, CopilotConfig, PromptSizeHistogram
+
+
+def _python(script: str) -> list[str]:
+    """Command running a Python script in place of the Copilot CLI."""
+    return [sys.executable, "-c", script]
+
+
+def _process_gone(pid: int) -> bool:
+    """Check if a process has exited (an unreaped zombie counts as exited)."""
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return True
+    status = Path(f"/proc/{pid}/status")
+    return status.exists() and "State:\tZ" in status.read_text()
+
+
+class TestExecuteAsync:
+    """Tests for CopilotClient.execute_async."""
+
+    @pytest.mark.asyncio
+    async def test_streams_output_while_running(self):
+        """Output reaches on_chunk before the CLI exits."""
+        client = CopilotClient()
+        script = (
+            "import sys, time; sys.stdout.write('one\\n'); sys.stdout.flush();"
+            "time.sleep(0.3); print('two')"
+        )
+        chunks = []
+        exited_at = []
+
+        def on_chunk(chunk):
+            chunks.append((time.monotonic(), chunk))
+
+        with patch.object(client, "_build_command", return_value=_python(script)):
+            result = await client.execute_async("Plan it", on_chunk=on_chunk)
+            exited_at.append(time.monotonic())
+
+        assert result.success
+        assert result.output == "one\ntwo\n"
+        assert "".join(chunk for _, chunk in chunks) == result.output
+        assert chunks[0][1] == "one\n"
+        assert exited_at[0] - chunks[0][0] >= 0.2
+
+    @pytest.mark.asyncio
+    async def test_failure_captures_stderr(self):
+        """A non-zero exit is reported with the CLI's stderr."""
+        client = CopilotClient()
+        script = "import sys; print('partial'); sys.stderr.write('boom'); sys.exit(3)"
+
+        with patch.object(client, "_build_command", return_value=_python(script)):
+            result = await client.execute_async("Plan it", context="Context")
+
+        assert not result.success
+        assert result.exit_code == 3
+        assert result.error == "boom"
+        assert result.output == "partial\n"
+        assert result.prompt == "Context\n\nPlan it"
+
+    @pytest.mark.asyncio
+    async def test_timeout_kills_cli(self):
+        """A CLI still running at the timeout is killed; partial output is kept."""
+        client = CopilotClient(config=CopilotConfig(timeout=0.3))
+        script = "import time; print('started', flush=True); time.sleep(30)"
+
+        start = time.monotonic()
+        with patch.object(client, "_build_command", return_value=_python(script)):
+            result = await client.execute_async("Plan it")
+
+        assert time.monotonic() - start < 5
+        assert not result.success
+        assert result.exit_code == -1
+        assert result.error == "Timeout after 0.3 seconds"
+        assert result.output == "started\n"
+
+    @pytest.mark.asyncio
+    @pytest.mark.skipif(not hasattr(os, "killpg"), reason="process groups are POSIX-only")
+    async def test_cancel_kills_process_group(self):
+        """Cancelling the call kills the CLI and the processes it started."""
+        client = CopilotClient()
+        script = (
+            "import subprocess, sys, time;"
+            "child = subprocess.Popen([sys.executable, '-c', 'import time; time.sleep(30)']);"
+            "print(child.pid, flush=True); time.sleep(30)"
+        )
+        started = asyncio.Event()
+        pids = []
+
+        def on_chunk(chunk):
+            pids.append(int(chunk))
+            started.set()
+
+        with patch.object(client, "_build_command", return_value=_python(script)):
+            task = asyncio.create_task(client.execute_async("Plan it", on_chunk=on_chunk))
+            await asyncio.wait_for(started.wait(), timeout=10)
+            task.cancel()
+            with pytest.raises(asyncio.CancelledError):
+                await task
+
+        for _ in range(50):
+            if _process_gone(pids[0]):
+                break
+            await asyncio.sleep(0.05)
+        assert _process_gone(pids[0])
+
+    @pytest.mark.asyncio
+    async def test_runs_concurrently(self):
+        """Several calls on one event loop run at the same time."""
+        client = CopilotClient()
+        script = "import time; time.sleep(0.5); print('done')"
+
+        start = time.monotonic()
+        with patch.object(client, "_build_command", return_value=_python(script)):
+            results = await asyncio.gather(*(client.execute_async(f"Task {i}") for i in range(4)))
+
+        assert all(r.output == "done\n" for r in results)
+        assert time.monotonic() - start < 1.5
+
+    @pytest.mark.asyncio
+    async def test_cli_not_found(self, tmp_path):
+        """A missing executable is reported as a failed result."""
+        client = CopilotClient()
+
+        with patch.object(client, "_build_command", return_value=[str(tmp_path / "copilot")]):
+            result = await client.execute_async("Plan it")
+
+        assert not result.success
+        assert result.error == "Copilot CLI not found in PATH"
+
+
+# Prints how the prompt arrived and its length
+TRANSPORT_SCRIPT = (
+    "import os, sys; a = sys.argv[1:]\n"
+    "if '--add-dir' in a:\n"
+    "    path = os.path.join(a[a.index('--add-dir') + 1], 'prompt.md')\n"
+    "    print('file', len(open(path, encoding='utf-8').read()), path)\n"
+    "else:\n"
+    "    print('argv', len(a[0]))\n"
+)
+
+
+def _transport_client(
+    max_argv_prompt_bytes: int = 1024, allow_all_tools: bool = True
+) -> CopilotClient:
+    """Client whose CLI reports how it received the prompt."""
+    client = CopilotClient(
+        config=CopilotConfig(
+            max_argv_prompt_bytes=max_argv_prompt_bytes, allow_all_tools=allow_all_tools
+        )
+    )
+    client._build_command = lambda prompt: [*_python(TRANSPORT_SCRIPT), prompt]
+    return client
+
+
+class TestPromptTransport:
+    """Tests for passing large prompts to the CLI in a file."""
+
+    @pytest.mark.asyncio
+    async def test_small_prompt_on_command_line(self):
+        """Prompts up to the threshold are passed as an argument."""
+        result = await _transport_client().execute_async("x" * 1024)
+
+        assert result.output == "argv 1024\n"
+
+    @pytest.mark.asyncio
+    async def test_large_prompt_in_file(self):
+        """Larger prompts are read from a private file removed afterwards."""
+        result = await _transport_client().execute_async("x" * 1025, context="é" * 100)
+
+        transport, length, path = result.output.split()
+        assert (transport, int(length)) == ("file", 1127)
+        assert not Path(path).exists()
+        assert not Path(path).parent.exists()
+
+    def test_large_prompt_in_file_sync(self):
+        """The blocking execute uses the same transport."""
+        result = _transport_client().execute("x" * 2000)
+
+        assert result.output.startswith("file 2000 ")
+
+    @pytest.mark.asyncio
+    async def test_falls_back_to_file_when_argv_too_long(self):
+        """A prompt the OS rejects as too long is retried in a file."""
+        client = _transport_client(max_argv_prompt_bytes=1 << 20)
+        launch = asyncio.create_subprocess_exec
+        calls = []
+
+        async def fake_exec(*cmd, **kwargs):
+            calls.append(cmd)
+            if len(calls) == 1:
+                raise OSError(errno.E2BIG, "Argument list too long")
+            return await launch(*cmd, **kwargs)
+
+        with patch("asyncio.create_subprocess_exec", side_effect=fake_exec):
+            result = await client.execute_async("x" * 5000)
+
+        assert result.success
+        assert result.output.startswith("file 5000 ")
+        assert len(calls) == 2
+
+    def test_falls_back_to_file_when_argv_too_long_sync(self):
+        """The blocking execute retries in a file as well."""
+        client = _transport_client(max_argv_prompt_bytes=1 << 20)
+        run = subprocess.run
+
+        def fake_run(cmd, **kwargs):
+            if "--add-dir" not in cmd:
+                raise OSError(errno.E2BIG, "Argument list too long")
+            return run(cmd, **kwargs)
+
+        with patch("subprocess.run", side_effect=fake_run):
+            result = client.execute("x" * 5000)
+
+        assert result.output.startswith("file 5000 ")
+
+    @pytest.mark.asyncio
+    async def test_no_file_without_tools(self):
+        """Without tools the CLI can't read a prompt file, so prompts stay on argv."""
+        result = await _transport_client(allow_all_tools=False).execute_async("x" * 2000)
+
+        assert result.output == "argv 2000\n"
+
+    @pytest.mark.asyncio
+    async def test_too_large_without_tools(self):
+        """A prompt the OS rejects fails clearly when the file transport is unavailable."""
+        client = _transport_client(allow_all_tools=False)
+        rejected = OSError(errno.E2BIG, "Argument list too long")
+
+        with patch("asyncio.create_subprocess_exec", side_effect=rejected) as launch:
+            result = await client.execute_async("x" * 5000)
+
+        assert launch.call_count == 1
+        assert not result.success
+        assert result.error == (
+            "Prompt of 5000 bytes is too large for the command line (Argument list too long); "
+            "larger prompts are passed in a file, which requires allow_all_tools"
+        )
+
+    def test_too_large_without_tools_sync(self):
+        """The blocking execute reports the same error."""
+        client = _transport_client(allow_all_tools=False)
+        rejected = OSError(errno.E2BIG, "Argument list too long")
+
+        with patch("subprocess.run", side_effect=rejected) as run:
+            result = client.execute("x" * 5000)
+
+        assert run.call_count == 1
+        assert not result.success
+        assert result.error.startswith("Prompt of 5000 bytes is too large")
+
+    @pytest.mark.asyncio
+    async def test_logs_size_histogram(self, caplog):
+        """Prompt sizes are summarized in debug logs."""
+        with caplog.at_level(logging.DEBUG, logger="teambot.copilot.client"):
+            await _transport_client().execute_async("x" * 3000)
+
+        assert "Prompt of 3000 bytes via file; prompt sizes: " in caplog.text
+
+
+class TestPromptSizeHistogram:
+    """Tests for PromptSizeHistogram."""
+
+    def test_buckets(self):
+        """Sizes are counted in the first bucket that holds them."""
+        histogram = PromptSizeHistogram()
+        for size in (10, 1024, 1025, 70000, 5 << 20):
+            histogram.record(size, "argv" if size < 2000 else "file")
+
+        assert histogram.counts == [2, 1, 0, 0, 1, 0, 1]
+        assert str(histogram) == (
+            "<=1K:2 <=4K:1 <=16K:0 <=64K:0 <=256K:1 <=1024K:0 >1024K:1 (argv:3 file:2)"
+        )
@@ -0,0 +1,123 @@
+"""Tests for streamed chunk coalescing."""
+
+import asyncio
+
+import pytest
+
+from teambot.copilot.coalescer import ChunkCoalescer, CoalescingConfig
+
+
+class TestCoalescingConfig:
+    """Tests for CoalescingConfig."""
+
+    def test_defaults(self):
+        """Coalescing is on by default."""
+        config = CoalescingConfig.from_config(None)
+        assert config.enabled
+        assert config.window_ms == 40
+        assert config.flush_on_newline
+
+    def test_from_config(self):
+        """Values come from the streaming section; a zero window disables it."""
+        config = CoalescingConfig.from_config(
+            {"streaming": {"coalesce_ms": 0, "coalesce_bytes": 10, "flush_on_newline": False}}
+        )
+        assert not config.enabled
+        assert config.max_bytes == 10
+        assert not config.flush_on_newline
+
+
+class TestChunkCoalescer:
+    """Tests for ChunkCoalescer."""
+
+    @pytest.mark.asyncio
+    async def test_flushes_after_window(self):
+        """Chunks within the window are delivered together once it passes."""
+        received: list[str] = []
+        coalescer = ChunkCoalescer(received.append, CoalescingConfig(window_ms=10))
+
+        coalescer.feed("Hel")
+        coalescer.feed("lo")
+        assert received == []
+
+        await asyncio.sleep(0.05)
+        assert received == ["Hello"]
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_newline(self):
+        """A chunk ending a line flushes the buffer right away."""
+        received: list[str] = []
+        coalescer = ChunkCoalescer(received.append, CoalescingConfig(window_ms=1000))
+
+        coalescer.feed("line")
+        coalescer.feed(" one\nline")
+        coalescer.feed(" two")
+
+        assert received == ["line one\nline"]
+        coalescer.close()
+        assert received == ["line one\nline", " two"]
+
+    @pytest.mark.asyncio
+    async def test_newline_flush_can_be_disabled(self):
+        """Without flush_on_newline, newlines are buffered like other text."""
+        received: list[str] = []
+        config = CoalescingConfig(window_ms=1000, flush_on_newline=False)
+        coalescer = ChunkCoalescer(received.append, config)
+
+        coalescer.feed("a\n")
+        assert received == []
+        coalescer.close()
+        assert received == ["a\n"]
+
+    @pytest.mark.asyncio
+    async def test_flushes_on_byte_threshold(self):
+        """Reaching max_bytes flushes without waiting for the window."""
+        received: list[str] = []
+        coalescer = ChunkCoalescer(received.append, CoalescingConfig(window_ms=1000, max_bytes=4))
+
+        coalescer.feed("ab")
+        coalescer.feed("é")  # Two bytes in UTF-8
+        coalescer.feed("c")
+
+        assert received == ["abé"]
+        coalescer.close()
+
+    @pytest.mark.asyncio
+    async def test_close_cancels_timer(self):
+        """Nothing is delivered after close()."""
+        received: list[str] = []
+        coalescer = ChunkCoalescer(received.append, CoalescingConfig(window_ms=10))
+
+        coalescer.feed("x")
+        coalescer.close()
+        await asyncio.sleep(0.05)
+
+        assert received == ["x"]
+        assert coalescer.chunks_in == 1
+        assert coalescer.chunks_out == 1
+
+    @pytest.mark.asyncio
+    async def test_preserves_order_and_content(self):
+        """Many deltas arrive in order with nothing lost."""
+        received: list[str] = []
+        coalescer = ChunkCoalescer(received.append, CoalescingConfig(window_ms=1000))
+        deltas = [f"tok{i} " + ("\n" if i % 25 == 24 else "") for i in range(100)]
+
+        for delta in deltas:
+            coalescer.feed(delta)
+        coalescer.close()
+
+        assert "".join(received) == "".join(deltas)
+        assert len(received) == 4
+
+    @pytest.mark.asyncio
+    async def test_ignores_empty_chunks(self):
+        """Empty chunks are not counted or delivered."""
+        received: list[str] = []
+        coalescer = ChunkCoalescer(received.append)
+
+        coalescer.feed("")
+        coalescer.close()
+
+        assert received == []
+        assert coalescer.chunks_in == 0
@@ -0,0 +1,230 @@
+"""Tests for the SDK retry policy and circuit breakers."""
+
+import asyncio
+
+import pytest
+
+from teambot.copilot.resilience import (
+    CircuitBreaker,
+    CircuitBreakerConfig,
+    CircuitState,
+    RequestTimeouts,
+    RetryPolicy,
+    is_retryable,
+    timeout_scope,
+)
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestIsRetryable:
+    """Tests for the default error classifier."""
+
+    @pytest.mark.parametrize(
+        "message",
+        [
+            "JSON-RPC Error -32603: Session not found: teambot-pm",
+            "Send failed: Rate limit exceeded",
+            "rate_limit_exceeded: slow down",
+            "HTTP 429 Too Many Requests",
+            "Request timed out after 120s",
+            "503 Service Unavailable",
+            "model is overloaded",
+            "Connection reset by peer",
+        ],
+    )
+    def test_transient_errors(self, message):
+        """Rate limits, timeouts, overload and dropped connections are retried."""
+        assert is_retryable(Exception(message))
+
+    @pytest.mark.parametrize(
+        "error",
+        [
+            Exception("Invalid prompt"),
+            Exception("Request aborted"),
+            Exception("Not authenticated"),
+            asyncio.CancelledError(),
+        ],
+    )
+    def test_permanent_errors(self, error):
+        """Bad requests, aborts and cancellation are not retried."""
+        assert not is_retryable(error)
+
+    def test_builtin_transient_types(self):
+        """Timeout and connection errors are retried whatever their message."""
+        assert is_retryable(TimeoutError())
+        assert is_retryable(ConnectionResetError())
+
+
+class TestRetryPolicy:
+    """Tests for RetryPolicy."""
+
+    def test_exponential_backoff_capped(self):
+        """Delays double per attempt up to max_delay."""
+        policy = RetryPolicy(base_delay=1.0, max_delay=5.0, jitter=0)
+
+        assert [policy.delay(n) for n in range(1, 5)] == [1.0, 2.0, 4.0, 5.0]
+
+    def test_jitter_shortens_delay(self):
+        """Jitter removes up to its fraction of the delay."""
+        policy = RetryPolicy(base_delay=2.0, jitter=0.5)
+
+        assert policy.delay(1, rand=lambda: 0.0) == 2.0
+        assert policy.delay(1, rand=lambda: 0.999) == pytest.approx(1.001)
+
+    def test_should_retry_honours_attempts_and_classifier(self):
+        """Retries stop at max_attempts and for non-retryable errors."""
+        policy = RetryPolicy(max_attempts=3)
+        transient = Exception("Rate limit exceeded")
+
+        assert policy.should_retry(transient, 2)
+        assert not policy.should_retry(transient, 3)
+        assert not policy.should_retry(Exception("Invalid prompt"), 1)
+
+    def test_custom_classifier(self):
+        """A classifier can be plugged in."""
+        policy = RetryPolicy(classifier=lambda e: isinstance(e, KeyError))
+
+        assert policy.should_retry(KeyError("x"), 1)
+        assert not policy.should_retry(Exception("Rate limit exceeded"), 1)
+
+    def test_from_config(self):
+        """Settings come from the retry section, with defaults otherwise."""
+        policy = RetryPolicy.from_config({"retry": {"max_attempts": 5, "jitter": 0}})
+
+        assert policy.max_attempts == 5
+        assert policy.jitter == 0
+        assert policy.base_delay == RetryPolicy().base_delay
+        assert RetryPolicy.from_config(None) == RetryPolicy()
+
+
+class TestCircuitBreaker:
+    """Tests for CircuitBreaker."""
+
+    def test_opens_after_consecutive_failures(self):
+        """The breaker opens on the threshold-th consecutive failure."""
+        breaker = CircuitBreaker(failure_threshold=3, clock=FakeClock())
+
+        assert not breaker.record_failure()
+        assert not breaker.record_failure()
+        assert breaker.record_failure()
+        assert breaker.state is CircuitState.OPEN
+        assert not breaker.allow()
+
+    def test_success_resets_failure_count(self):
+        """Only consecutive failures count."""
+        breaker = CircuitBreaker(failure_threshold=2, clock=FakeClock())
+
+        breaker.record_failure()
+        assert not breaker.record_success()
+        assert not breaker.record_failure()
+        assert breaker.state is CircuitState.CLOSED
+
+    def test_half_open_allows_one_trial(self):
+        """After the cool-down one trial is let through at a time."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        assert breaker.retry_after == 30
+
+        clock.now += 30
+        assert breaker.state is CircuitState.HALF_OPEN
+        assert breaker.allow()
+        assert not breaker.allow()
+
+    def test_successful_trial_closes(self):
+        """A successful trial closes the breaker."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now += 30
+        breaker.allow()
+
+        assert breaker.record_success()
+        assert breaker.state is CircuitState.CLOSED
+        assert breaker.allow()
+
+    def test_failed_trial_restarts_cool_down(self):
+        """A failed trial keeps the breaker open for another cool-down."""
+        clock = FakeClock()
+        breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30, clock=clock)
+        breaker.record_failure()
+        clock.now += 30
+        breaker.allow()
+
+        assert not breaker.record_failure()
+        clock.now += 29
+        assert breaker.state is CircuitState.OPEN
+
+
+class TestCircuitBreakerConfig:
+    """Tests for CircuitBreakerConfig."""
+
+    def test_from_config(self):
+        """Settings and fallbacks come from the circuit_breaker section."""
+        config = CircuitBreakerConfig.from_config(
+            {
+                "circuit_breaker": {
+                    "failure_threshold": 2,
+                    "fallback_models": {"claude-opus-4.5": "gpt-5", "default": "gpt-5-mini"},
+                }
+            }
+        )
+
+        assert config.failure_threshold == 2
+        assert config.fallback_for("claude-opus-4.5") == "gpt-5"
+        assert config.fallback_for(None) == "gpt-5-mini"
+        assert config.fallback_for("gpt-5") is None
+
+
+class TestRequestTimeouts:
+    """Tests for request deadlines."""
+
+    def test_from_config(self):
+        """Deadlines come from the timeouts section and agent entries."""
+        timeouts = RequestTimeouts.from_config(
+            {
+                "timeouts": {"request_seconds": 300, "inactivity_seconds": None},
+                "agents": [{"id": "builder-1", "timeout_seconds": 900}, {"id": "pm"}],
+            }
+        )
+
+        assert timeouts.default == 300
+        assert timeouts.inactivity is None
+        assert timeouts.agents == {"builder-1": 900}
+
+    @pytest.mark.asyncio
+    async def test_most_specific_deadline_wins(self):
+        """Call timeout beats the stage scope, which beats agent and default."""
+        timeouts = RequestTimeouts(default=100, agents={"builder-1": 200})
+
+        assert timeouts.deadline_for("pm").seconds == 100
+        assert timeouts.deadline_for("builder-1").seconds == 200
+        with timeout_scope(50):
+            assert timeouts.deadline_for("builder-1").seconds == 50
+            assert timeouts.deadline_for("builder-1", timeout=10).seconds == 10
+            with timeout_scope(None):
+                assert timeouts.deadline_for("pm").seconds == 50
+        assert timeouts.deadline_for("pm").seconds == 100
+
+    @pytest.mark.asyncio
+    async def test_no_deadline(self):
+        """A null default leaves requests without a deadline."""
+        assert RequestTimeouts(default=None).deadline_for("pm") is None
+
+    @pytest.mark.asyncio
+    async def test_deadline_counts_down(self):
+        """remaining() shrinks as time passes."""
+        deadline = RequestTimeouts().deadline_for("pm", timeout=0.05)
+
+        await asyncio.sleep(0.06)
+
+        assert deadline.remaining() < 0
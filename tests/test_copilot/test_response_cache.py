@@ -0,0 +1,181 @@
+"""Tests for the on-disk response cache."""
+
+import subprocess
+from pathlib import Path
+
+from teambot.copilot.response_cache import (
+    ResponseCache,
+    get_response_cache,
+    make_key,
+    normalize_prompt,
+    workspace_fingerprint,
+)
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+class TestCacheKey:
+    """Tests for cache keys."""
+
+    def test_normalize_prompt_ignores_insignificant_whitespace(self):
+        """Line endings, trailing spaces and surrounding blank lines don't matter."""
+        assert normalize_prompt("\nline one  \r\nline two\t\n\n") == "line one\nline two"
+
+    def test_same_request_same_key(self):
+        """Equivalent prompts produce the same key."""
+        assert make_key("pm", "gpt-5", "Plan it\n") == make_key("pm", "gpt-5", "Plan it")
+
+    def test_key_covers_agent_model_and_fingerprint(self):
+        """Each key component changes the key."""
+        base = make_key("pm", "gpt-5", "Plan it", "abc")
+        assert make_key("ba", "gpt-5", "Plan it", "abc") != base
+        assert make_key("pm", "claude-opus-4.5", "Plan it", "abc") != base
+        assert make_key("pm", "gpt-5", "Plan it", "def") != base
+        assert make_key("pm", "gpt-5", "Plan it") != base
+
+    def test_workspace_fingerprint_tracks_changes(self, tmp_path: Path):
+        """Fingerprint changes when a tracked file is modified."""
+        git = ["git", "-c", "user.email=t@example.com", "-c", "user.name=t"]
+        subprocess.run([*git, "init", "-q"], cwd=tmp_path, check=True)
+        (tmp_path / "a.txt").write_text("one")
+        subprocess.run([*git, "add", "a.txt"], cwd=tmp_path, check=True)
+        subprocess.run([*git, "commit", "-qm", "init"], cwd=tmp_path, check=True)
+
+        before = workspace_fingerprint(tmp_path)
+        assert before == workspace_fingerprint(tmp_path)
+
+        (tmp_path / "a.txt").write_text("two")
+        assert workspace_fingerprint(tmp_path) != before
+
+    def test_workspace_fingerprint_outside_git(self, tmp_path: Path):
+        """No fingerprint outside a git repository."""
+        assert workspace_fingerprint(tmp_path) is None
+
+
+class TestResponseCache:
+    """Tests for ResponseCache."""
+
+    def test_put_and_get(self, tmp_path: Path):
+        """Stored responses are returned and counted as hits."""
+        cache = ResponseCache(tmp_path / "cache")
+        key = make_key("pm", None, "Plan it")
+
+        assert cache.get(key) is None
+        assert cache.put(key, "The plan", "pm", None)
+        assert cache.get(key) == "The plan"
+
+        stats = cache.stats()
+        assert stats.entries == 1
+        assert stats.hits == 1
+        assert stats.misses == 1
+        assert stats.hit_rate == 0.5
+
+    def test_survives_restart(self, tmp_path: Path):
+        """A new cache instance reads entries written by an earlier one."""
+        key = make_key("pm", None, "Plan it")
+        ResponseCache(tmp_path).put(key, "The plan", "pm", None)
+
+        cache = ResponseCache(tmp_path)
+        assert cache.get(key) == "The plan"
+        assert cache.stats().size_bytes == (tmp_path / f"{key}.json").stat().st_size
+
+    def test_expired_entry_is_removed(self, tmp_path: Path):
+        """Entries older than the TTL miss and are deleted."""
+        clock = FakeClock()
+        cache = ResponseCache(tmp_path, ttl=60, clock=clock)
+        key = make_key("pm", None, "Plan it")
+        cache.put(key, "The plan", "pm", None)
+
+        clock.now += 61
+        assert cache.get(key) is None
+        assert not (tmp_path / f"{key}.json").exists()
+        assert cache.stats().evictions == 1
+
+    def test_evicts_least_recently_used(self, tmp_path: Path):
+        """Exceeding max_bytes evicts the entry used longest ago."""
+        # A fixed clock keeps every entry the same size
+        clock = FakeClock()
+        keys = [make_key("pm", None, f"Prompt {i}") for i in range(3)]
+        probe = ResponseCache(tmp_path / "probe", clock=clock)
+        probe.put(keys[0], "x" * 100, "pm", None)
+        entry_size = probe.stats().size_bytes
+
+        cache = ResponseCache(tmp_path / "cache", max_bytes=entry_size * 2, clock=clock)
+        cache.put(keys[0], "x" * 100, "pm", None)
+        cache.put(keys[1], "y" * 100, "pm", None)
+        cache.get(keys[0])  # keys[1] is now least recently used
+        cache.put(keys[2], "z" * 100, "pm", None)
+
+        assert cache.get(keys[1]) is None
+        assert cache.get(keys[0]) is not None
+        assert cache.get(keys[2]) is not None
+        assert cache.stats().entries == 2
+
+    def test_oversized_response_not_stored(self, tmp_path: Path):
+        """A response larger than the whole cache is not stored."""
+        cache = ResponseCache(tmp_path, max_bytes=10)
+        assert not cache.put(make_key("pm", None, "Plan it"), "x" * 100, "pm", None)
+        assert cache.stats().entries == 0
+
+    def test_unreadable_entry_is_discarded(self, tmp_path: Path):
+        """A corrupt entry counts as a miss and is removed."""
+        key = make_key("pm", None, "Plan it")
+        (tmp_path / f"{key}.json").write_text("not json")
+
+        cache = ResponseCache(tmp_path)
+        assert cache.get(key) is None
+        assert cache.stats().entries == 0
+
+    def test_rejects_path_like_keys(self, tmp_path: Path):
+        """Keys that could escape the directory are refused."""
+        cache = ResponseCache(tmp_path / "cache")
+        assert not cache.put("../evil", "x", "pm", None)
+        assert cache.get("../evil") is None
+
+    def test_clear(self, tmp_path: Path):
+        """clear() removes every entry and reports how many."""
+        cache = ResponseCache(tmp_path)
+        for i in range(3):
+            cache.put(make_key("pm", None, f"Prompt {i}"), "answer", "pm", None)
+
+        assert cache.clear() == 3
+        assert cache.stats().entries == 0
+        assert cache.stats().size_bytes == 0
+        assert list(tmp_path.glob("*.json")) == []
+
+
+class TestGetResponseCache:
+    """Tests for building the cache from configuration."""
+
+    def test_disabled_by_default(self):
+        """No cache without an enabled response_cache section."""
+        assert get_response_cache(None) is None
+        assert get_response_cache({"agents": []}) is None
+        assert get_response_cache({"response_cache": {"enabled": False}}) is None
+
+    def test_enabled(self, tmp_path: Path):
+        """Configured limits and directory are used."""
+        config = {
+            "teambot_dir": str(tmp_path),
+            "response_cache": {
+                "enabled": True,
+                "max_bytes": 1024,
+                "ttl_seconds": None,
+                "workspace_fingerprint": True,
+            },
+        }
+
+        cache = get_response_cache(config)
+
+        assert cache.directory == tmp_path / "cache"
+        assert cache.max_bytes == 1024
+        assert cache.ttl is None
+        assert cache.workspace == Path.cwd()
@@ -452,6 +452,118 @@ description: Reviewer Agent
             assert "<persona>" not in result
 
 
+class TestCopilotSDKClientPersonaOnce:
+    """Tests for sending the persona once per session."""
+
+    @staticmethod
+    def _loader(tmp_path: Path):
+        from teambot.copilot.agent_loader import AgentLoader
+
+        agents_dir = tmp_path / ".github" / "agents"
+        agents_dir.mkdir(parents=True)
+        (agents_dir / "builder-1.agent.md").write_text(
+            "---\nname: builder-1\ndescription: Builder\n---\n\nYou are a careful builder."
+        )
+        return AgentLoader(repo_root=tmp_path)
+
+    @staticmethod
+    def _client_sessions(mock_sdk_client, fail_first_send: bool = False):
+        """Make create_session return sessions that finish each send immediately."""
+        from types import SimpleNamespace
+
+        sent: list[tuple[str, str]] = []
+
+        async def create(config):
+            session = MagicMock()
+            session.session_id = config["session_id"]
+            handlers = []
+
+            def on(handler):
+                handlers.append(handler)
+                return lambda: handlers.remove(handler)
+
+            async def send(message):
+                if fail_first_send and not sent:
+                    sent.append((session.session_id, "<failed>"))
+                    raise Exception("Session not found: " + session.session_id)
+                sent.append((session.session_id, message["prompt"]))
+                for handler in list(handlers):
+                    handler(SimpleNamespace(type="SESSION_IDLE", data=None))
+
+            session.on = on
+            session.send = send
+            return session
+
+        mock_sdk_client.create_session = AsyncMock(side_effect=create)
+        return sent
+
+    @pytest.mark.asyncio
+    async def test_persona_sent_on_first_prompt_only(self, mock_sdk_client, tmp_path: Path):
+        """Later prompts on the same session omit the persona and count the savings."""
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        sent = self._client_sessions(mock_sdk_client)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            with patch(
+                "teambot.copilot.sdk_client.get_agent_loader", return_value=self._loader(tmp_path)
+            ):
+                client = CopilotSDKClient()
+                await client.start()
+
+                await client.execute_streaming("builder-1", "First task")
+                await client.execute_streaming("builder-1", "Second task")
+
+                full = client._build_prompt_with_persona("builder-1", "Second task")
+
+        assert "<persona>" in sent[0][1]
+        assert sent[1][1] == "Second task"
+        assert client.persona_bytes_saved == len(full.encode()) - len(b"Second task")
+
+    @pytest.mark.asyncio
+    async def test_persona_resent_after_session_recreated(self, mock_sdk_client, tmp_path: Path):
+        """A session recreated after 'session not found' gets the persona again."""
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        sent = self._client_sessions(mock_sdk_client, fail_first_send=True)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            with patch(
+                "teambot.copilot.sdk_client.get_agent_loader", return_value=self._loader(tmp_path)
+            ):
+                client = CopilotSDKClient()
+                await client.start()
+
+                await client.execute_streaming("builder-1", "Task")
+
+        assert mock_sdk_client.create_session.call_count == 2
+        assert "<persona>" in sent[1][1]
+        assert client.persona_bytes_saved == 0
+
+    @pytest.mark.asyncio
+    async def test_persona_resent_after_model_change(self, mock_sdk_client, tmp_path: Path):
+        """Switching the agent's model starts a session that gets the persona."""
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        sent = self._client_sessions(mock_sdk_client)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            with patch(
+                "teambot.copilot.sdk_client.get_agent_loader", return_value=self._loader(tmp_path)
+            ):
+                client = CopilotSDKClient()
+                await client.start()
+
+                await client.execute_streaming("builder-1", "First task")
+                await client.get_or_create_session("builder-1", model="gpt-5")
+                await client.execute_streaming("builder-1", "Second task")
+
+        assert "<persona>" in sent[0][1]
+        assert "<persona>" in sent[1][1]
+        # The old model's session was destroyed, so the new one reuses its ID
+        assert mock_sdk_client.create_session.call_count == 2
+
+
 class TestCopilotSDKClientModel:
     """Tests for model support in SDK client."""
 
@@ -557,6 +669,129 @@ class TestCopilotSDKClientModel:
                 assert configs[1].get("model") == "claude-opus-4.5"
 
 
+class TestCopilotSDKClientSessionPool:
+    """Tests for concurrent requests on pooled sessions."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_requests_use_separate_sessions(self, mock_sdk_client):
+        """Two requests for one agent run at once on different sessions."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        release = asyncio.Event()
+        used: list[str] = []
+
+        async def create(config):
+            session = MagicMock()
+            session.session_id = config["session_id"]
+            handlers = []
+
+            def on(handler):
+                handlers.append(handler)
+                return lambda: handlers.remove(handler)
+
+            async def send(message):
+                used.append(session.session_id)
+                await release.wait()
+                for handler in list(handlers):
+                    handler(SimpleNamespace(type="SESSION_IDLE", data=None))
+
+            session.on = on
+            session.send = send
+            return session
+
+        mock_sdk_client.create_session = AsyncMock(side_effect=create)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(
+                config={"agents": [{"id": "builder-1", "persona": "builder", "max_sessions": 2}]}
+            )
+            await client.start()
+
+            runs = [
+                asyncio.create_task(client.execute_streaming("builder-1", f"task {i}"))
+                for i in range(2)
+            ]
+            await asyncio.sleep(0.01)
+            stats = client.get_pool_stats()
+            release.set()
+            await asyncio.gather(*runs)
+
+            assert sorted(used) == ["teambot-builder-1", "teambot-builder-1-2"]
+            assert stats[0].in_use == 2
+
+    @pytest.mark.asyncio
+    async def test_cancel_request_aborts_only_its_session(self, mock_sdk_client):
+        """Cancelling one of an agent's concurrent requests leaves the other running."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from teambot.copilot.sdk_client import CopilotSDKClient, SDKClientError, request_scope
+
+        sessions = {}
+        prompts = {}
+        emitters = {}
+
+        async def create(config):
+            session = MagicMock()
+            session.session_id = config["session_id"]
+            handlers = []
+
+            def on(handler):
+                handlers.append(handler)
+                return lambda: handlers.remove(handler)
+
+            def emit(event_type):
+                for handler in list(handlers):
+                    handler(SimpleNamespace(type=event_type, data=None))
+
+            async def send(message):
+                prompts[session.session_id] = message["prompt"]
+
+            async def abort():
+                emit("ABORT")
+
+            session.on = on
+            session.send = send
+            session.abort = AsyncMock(side_effect=abort)
+            sessions[session.session_id] = session
+            emitters[session.session_id] = emit
+            return session
+
+        mock_sdk_client.create_session = AsyncMock(side_effect=create)
+
+        async def run(task_id):
+            with request_scope(task_id):
+                return await client.execute_streaming("builder-1", f"do {task_id}")
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(
+                config={"agents": [{"id": "builder-1", "persona": "builder", "max_sessions": 2}]}
+            )
+            await client.start()
+
+            first = asyncio.create_task(run("task-1"))
+            second = asyncio.create_task(run("task-2"))
+            await asyncio.sleep(0.01)
+
+            assert await client.cancel_current_request("builder-1", "task-1")
+            with pytest.raises(SDKClientError, match="aborted"):
+                await asyncio.wait_for(first, timeout=1.0)
+
+            aborted = [s for s in sessions.values() if s.abort.await_count]
+            assert len(aborted) == 1
+            assert "do task-1" in prompts[aborted[0].session_id]
+            assert not second.done()
+
+            (other,) = (sid for sid in sessions if sid != aborted[0].session_id)
+            emitters[other]("SESSION_IDLE")
+            assert await asyncio.wait_for(second, timeout=1.0) == ""
+            # Nothing is left registered once the requests finish
+            assert not await client.cancel_current_request("builder-1", "task-2")
+
+
 class TestResolveModel:
     """Tests for model resolution logic."""
 
@@ -804,7 +1039,7 @@ class TestCopilotSDKClientSessionRetry:
 
             session = MagicMock()
             session._handlers = []
-            session.send = AsyncMock(side_effect=Exception("Rate limit exceeded"))
+            session.send = AsyncMock(side_effect=Exception("Invalid prompt"))
             session.destroy = AsyncMock()
 
             def on(handler):
@@ -821,7 +1056,7 @@ class TestCopilotSDKClientSessionRetry:
             client = CopilotSDKClient()
             await client.start()
 
-            with pytest.raises(SDKClientError, match="Send failed: Rate limit exceeded"):
+            with pytest.raises(SDKClientError, match="Send failed: Invalid prompt"):
                 await client.execute_streaming("pm", "Hello")
 
             # Should only have tried to create session once (no retry)
@@ -900,7 +1135,7 @@ class TestCopilotSDKClientSessionRetry:
 
             # Second session also fails but with a different error
             second_session = MagicMock()
-            second_session.send_and_wait = AsyncMock(side_effect=Exception("Rate limit exceeded"))
+            second_session.send_and_wait = AsyncMock(side_effect=Exception("Invalid prompt"))
             second_session.destroy = AsyncMock()
 
             call_count = [0]
@@ -917,7 +1152,7 @@ class TestCopilotSDKClientSessionRetry:
             client = CopilotSDKClient()
             await client.start()
 
-            with pytest.raises(SDKClientError, match="SDK error: Rate limit exceeded"):
+            with pytest.raises(SDKClientError, match="SDK error: Invalid prompt"):
                 await client.execute("pm", "Create a plan")
 
             assert mock_client.create_session.call_count == 2
@@ -940,7 +1175,7 @@ class TestCopilotSDKClientSessionRetry:
 
             # Session raises a non-session-not-found error
             session = MagicMock()
-            session.send_and_wait = AsyncMock(side_effect=Exception("Rate limit exceeded"))
+            session.send_and_wait = AsyncMock(side_effect=Exception("Invalid prompt"))
             session.destroy = AsyncMock()
 
             mock_client.create_session = AsyncMock(return_value=session)
@@ -949,7 +1184,7 @@ class TestCopilotSDKClientSessionRetry:
             client = CopilotSDKClient()
             await client.start()
 
-            with pytest.raises(SDKClientError, match="SDK error: Rate limit exceeded"):
+            with pytest.raises(SDKClientError, match="SDK error: Invalid prompt"):
                 await client.execute("pm", "Create a plan")
 
             # Should only have tried to create session once (no retry)
@@ -963,21 +1198,26 @@ class TestCopilotSDKClientSessionRetry:
             Exception("JSON-RPC Error -32603: Session not found: teambot-pm")
         )
         assert CopilotSDKClient._is_session_not_found(Exception("session not found"))
-        assert not CopilotSDKClient._is_session_not_found(Exception("Rate limit exceeded"))
+        assert not CopilotSDKClient._is_session_not_found(Exception("Invalid prompt"))
         assert not CopilotSDKClient._is_session_not_found(Exception("Timeout error"))
 
-    def test_invalidate_session_removes_from_cache(self):
-        """Test _invalidate_session removes session from cache."""
+    @pytest.mark.asyncio
+    async def test_invalidate_session_removes_from_cache(self, mock_sdk_client):
+        """Test _invalidate_session forgets only the given agent's sessions."""
         from teambot.copilot.sdk_client import CopilotSDKClient
 
-        client = CopilotSDKClient()
-        client._sessions["teambot-pm"] = MagicMock()
-        client._sessions["teambot-builder-1"] = MagicMock()
+        mock_sdk_client.create_session = AsyncMock(side_effect=lambda config: MagicMock())
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient()
+            await client.start()
+            pm_session = await client.get_or_create_session("pm")
+            builder_session = await client.get_or_create_session("builder-1")
 
-        client._invalidate_session("pm")
+            client._invalidate_session("pm")
 
-        assert "teambot-pm" not in client._sessions
-        assert "teambot-builder-1" in client._sessions
+            assert await client.get_or_create_session("pm") is not pm_session
+            assert await client.get_or_create_session("builder-1") is builder_session
 
     def test_invalidate_session_noop_if_not_cached(self):
         """Test _invalidate_session is safe when session not in cache."""
@@ -986,3 +1226,594 @@ class TestCopilotSDKClientSessionRetry:
         client = CopilotSDKClient()
         # Should not raise
         client._invalidate_session("nonexistent")
+
+
+class TestCopilotSDKClientResponseCache:
+    """Tests for answering requests from the response cache."""
+
+    @staticmethod
+    def _config(tmp_path: Path) -> dict:
+        return {"teambot_dir": str(tmp_path), "response_cache": {"enabled": True}}
+
+    @staticmethod
+    def _replying_session(mock_sdk_client, mock_streaming_session, chunks: list[str]):
+        """Make the session stream the given chunks for every send."""
+        from types import SimpleNamespace
+
+        async def send(message):
+            for chunk in chunks:
+                mock_streaming_session.fire_event(
+                    "ASSISTANT_MESSAGE_DELTA", SimpleNamespace(delta_content=chunk)
+                )
+            mock_streaming_session.fire_event("SESSION_IDLE")
+
+        mock_streaming_session.send = AsyncMock(side_effect=send)
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+
+    def test_cache_disabled_by_default(self):
+        """Without response_cache configured, there is no cache."""
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        assert CopilotSDKClient().response_cache is None
+        assert CopilotSDKClient(config={"agents": []}).response_cache is None
+
+    @pytest.mark.asyncio
+    async def test_repeat_request_replayed_from_cache(
+        self, mock_sdk_client, mock_streaming_session, tmp_path: Path
+    ):
+        """A repeated request is not sent again; its reply is replayed via on_chunk."""
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        self._replying_session(mock_sdk_client, mock_streaming_session, ["Line one\n", "two"])
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(config=self._config(tmp_path))
+            await client.start()
+
+            first = await client.execute_streaming("pm", "Plan it")
+            replayed: list[str] = []
+            second = await client.execute_streaming("pm", "Plan it  \n", replayed.append)
+
+        assert first == second == "Line one\ntwo"
+        assert replayed == ["Line one\n", "two"]
+        assert mock_streaming_session.send.await_count == 1
+        assert client.response_cache.stats().hits == 1
+
+    @pytest.mark.asyncio
+    async def test_cache_keyed_by_model(
+        self, mock_sdk_client, mock_streaming_session, tmp_path: Path
+    ):
+        """Switching the agent's model misses the cache."""
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        self._replying_session(mock_sdk_client, mock_streaming_session, ["answer"])
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(config=self._config(tmp_path))
+            await client.start()
+
+            await client.execute_streaming("pm", "Plan it")
+            await client.get_or_create_session("pm", model="gpt-5")
+            await client.execute_streaming("pm", "Plan it")
+
+        assert mock_streaming_session.send.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_failed_request_not_cached(
+        self, mock_sdk_client, mock_streaming_session, tmp_path: Path
+    ):
+        """Errors are not cached; the next request is sent again."""
+        from teambot.copilot.sdk_client import CopilotSDKClient, SDKClientError
+
+        mock_streaming_session.send = AsyncMock(side_effect=Exception("boom"))
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(config=self._config(tmp_path))
+            await client.start()
+
+            for _ in range(2):
+                with pytest.raises(SDKClientError):
+                    await client.execute_streaming("pm", "Plan it")
+
+        assert mock_streaming_session.send.await_count == 2
+        assert client.response_cache.stats().entries == 0
+
+    @pytest.mark.asyncio
+    async def test_blocking_mode_uses_cache(
+        self, mock_sdk_client, mock_streaming_session, tmp_path: Path, monkeypatch
+    ):
+        """Blocking (non-streaming) requests are cached too."""
+        from types import SimpleNamespace
+
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        monkeypatch.setenv("TEAMBOT_STREAMING", "false")
+        mock_streaming_session.send_and_wait = AsyncMock(
+            return_value=SimpleNamespace(data=SimpleNamespace(content="blocking answer"))
+        )
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(config=self._config(tmp_path))
+            await client.start()
+
+            assert await client.execute("pm", "Plan it") == "blocking answer"
+            assert await client.execute("pm", "Plan it") == "blocking answer"
+
+        assert mock_streaming_session.send_and_wait.await_count == 1
+
+
+class TestCopilotSDKClientTelemetry:
+    """Tests for per-request telemetry."""
+
+    @pytest.mark.asyncio
+    async def test_streaming_request_recorded(
+        self, mock_sdk_client, mock_streaming_session, tmp_path: Path
+    ):
+        """A streamed request is written to the telemetry file with its stage."""
+        import json
+        from types import SimpleNamespace
+
+        from teambot.copilot.sdk_client import CopilotSDKClient
+        from teambot.copilot.telemetry import get_registry, stage_scope
+
+        async def send(message):
+            for chunk in ["Hello ", "world"]:
+                mock_streaming_session.fire_event(
+                    "ASSISTANT_MESSAGE_DELTA", SimpleNamespace(delta_content=chunk)
+                )
+            mock_streaming_session.fire_event("SESSION_IDLE")
+
+        mock_streaming_session.send = AsyncMock(side_effect=send)
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+        requests_before = get_registry().counter("requests", agent="pm", model="default")
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(config={"teambot_dir": str(tmp_path)})
+            await client.start()
+            with stage_scope("SPEC"):
+                await client.execute_streaming("pm", "Write the spec")
+
+        lines = (tmp_path / "telemetry" / "requests.jsonl").read_text().splitlines()
+        record = json.loads(lines[-1])
+        assert record["agent_id"] == "pm"
+        assert record["stage"] == "SPEC"
+        assert record["chunks"] == 2
+        assert record["output_bytes"] == len("Hello world")
+        assert record["time_to_first_delta"] is not None
+        assert record["error"] is None
+        assert get_registry().counter("requests", agent="pm", model="default") == (
+            requests_before + 1
+        )
+
+    @pytest.mark.asyncio
+    async def test_failed_request_recorded(
+        self, mock_sdk_client, mock_streaming_session, tmp_path: Path
+    ):
+        """A failed request is recorded with its error."""
+        import json
+
+        from teambot.copilot.sdk_client import CopilotSDKClient, SDKClientError
+
+        mock_streaming_session.send = AsyncMock(side_effect=Exception("boom"))
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(config={"teambot_dir": str(tmp_path)})
+            await client.start()
+            with pytest.raises(SDKClientError):
+                await client.execute_streaming("pm", "Write the spec")
+
+        record = json.loads((tmp_path / "telemetry" / "requests.jsonl").read_text())
+        assert "boom" in record["error"]
+
+
+class TestCopilotSDKClientResilience:
+    """Tests for retries and circuit breakers."""
+
+    @staticmethod
+    def _failing_send(session, failures: int, message: str = "Rate limit exceeded"):
+        """Make session.send fail a number of times, then stream a reply."""
+        from types import SimpleNamespace
+
+        calls = []
+
+        async def send(payload):
+            calls.append(payload)
+            if len(calls) <= failures:
+                raise Exception(message)
+            session.fire_event("ASSISTANT_MESSAGE_DELTA", SimpleNamespace(delta_content="Done"))
+            session.fire_event("SESSION_IDLE")
+
+        session.send = AsyncMock(side_effect=send)
+        return calls
+
+    @pytest.mark.asyncio
+    async def test_transient_error_retried_with_backoff(
+        self, mock_sdk_client, mock_streaming_session
+    ):
+        """A rate limit is retried and reported through the event callback."""
+        from teambot.copilot.resilience import RetryPolicy
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        calls = self._failing_send(mock_streaming_session, failures=2)
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+        events = []
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(retry_policy=RetryPolicy(base_delay=0.001, jitter=0))
+            client.set_event_callback(lambda event_type, data: events.append((event_type, data)))
+            await client.start()
+            result = await client.execute_streaming("pm", "Plan it")
+
+        assert result == "Done"
+        assert len(calls) == 3
+        retries = [data for event_type, data in events if event_type == "sdk_retry"]
+        assert [r["attempt"] for r in retries] == [2, 3]
+        assert "Rate limit exceeded" in retries[0]["error"]
+
+    @pytest.mark.asyncio
+    async def test_gives_up_after_max_attempts(self, mock_sdk_client, mock_streaming_session):
+        """The last error is raised once attempts are used up."""
+        from teambot.copilot.resilience import RetryPolicy
+        from teambot.copilot.sdk_client import CopilotSDKClient, SDKClientError
+
+        calls = self._failing_send(mock_streaming_session, failures=5)
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(retry_policy=RetryPolicy(max_attempts=2, base_delay=0))
+            await client.start()
+            with pytest.raises(SDKClientError, match="Rate limit exceeded"):
+                await client.execute_streaming("pm", "Plan it")
+
+        assert len(calls) == 2
+
+    @pytest.mark.asyncio
+    async def test_no_retry_after_output_streamed(self, mock_sdk_client, mock_streaming_session):
+        """A request that failed mid-stream is not retried, so output isn't repeated."""
+        from types import SimpleNamespace
+
+        from teambot.copilot.resilience import RetryPolicy
+        from teambot.copilot.sdk_client import CopilotSDKClient, SDKClientError
+
+        async def send(payload):
+            mock_streaming_session.fire_event(
+                "ASSISTANT_MESSAGE_DELTA", SimpleNamespace(delta_content="Partial\n")
+            )
+            mock_streaming_session.fire_event(
+                "SESSION_ERROR", SimpleNamespace(error_type="rate_limit", message="slow down")
+            )
+
+        mock_streaming_session.send = AsyncMock(side_effect=send)
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+        chunks = []
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(retry_policy=RetryPolicy(base_delay=0))
+            await client.start()
+            with pytest.raises(SDKClientError, match="rate_limit"):
+                await client.execute_streaming("pm", "Plan it", chunks.append)
+
+        assert chunks == ["Partial\n"]
+        assert mock_streaming_session.send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_fails_fast(self, mock_sdk_client, mock_streaming_session):
+        """Once a model's breaker opens, requests fail without reaching the SDK."""
+        from teambot.copilot.sdk_client import CircuitOpenError, CopilotSDKClient, SDKClientError
+
+        calls = self._failing_send(mock_streaming_session, failures=10)
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+        config = {"retry": {"max_attempts": 1}, "circuit_breaker": {"failure_threshold": 2}}
+        events = []
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(config=config)
+            client.set_event_callback(lambda event_type, data: events.append((event_type, data)))
+            await client.start()
+            for _ in range(2):
+                with pytest.raises(SDKClientError, match="Rate limit"):
+                    await client.execute_streaming("pm", "Plan it")
+            with pytest.raises(CircuitOpenError) as exc_info:
+                await client.execute_streaming("pm", "Plan it")
+
+        assert len(calls) == 2
+        assert exc_info.value.model is None
+        assert (
+            "circuit_open",
+            {
+                "model": "default",
+                "failures": 2,
+                "reset_seconds": 60.0,
+                "fallback": None,
+            },
+        ) in events
+
+    @pytest.mark.asyncio
+    async def test_open_circuit_falls_back_to_configured_model(
+        self, mock_sdk_client, mock_streaming_session
+    ):
+        """With a fallback configured, requests move to it without changing the agent's model."""
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        calls = self._failing_send(mock_streaming_session, failures=1)
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+        config = {
+            "retry": {"max_attempts": 1},
+            "circuit_breaker": {"failure_threshold": 1, "fallback_models": {"default": "gpt-5"}},
+        }
+        events = []
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(config=config)
+            client.set_event_callback(lambda event_type, data: events.append(event_type))
+            await client.start()
+            with pytest.raises(Exception, match="Rate limit"):
+                await client.execute_streaming("pm", "Plan it")
+            first = await client.execute_streaming("pm", "Plan it")
+            second = await client.execute_streaming("pm", "Plan it")
+
+        assert first == second == "Done"
+        assert len(calls) == 3
+        session_config = mock_sdk_client.create_session.call_args.args[0]
+        assert session_config["model"] == "gpt-5"
+        assert client._pool.current_model("pm") is None
+        assert events == ["circuit_open", "model_fallback"]
+
+    @pytest.mark.asyncio
+    async def test_expired_session_does_not_count_towards_breaker(
+        self, mock_sdk_client, mock_streaming_session
+    ):
+        """Session-not-found errors are retried at once and leave the breaker closed."""
+        from teambot.copilot.resilience import CircuitState
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        self._failing_send(mock_streaming_session, failures=1, message="Session not found: x")
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(config={"circuit_breaker": {"failure_threshold": 1}})
+            await client.start()
+            assert await client.execute_streaming("pm", "Plan it") == "Done"
+
+        assert client._breaker(None).state is CircuitState.CLOSED
+
+
+class TestCopilotSDKClientPrewarm:
+    """Tests for pre-warming agent sessions."""
+
+    @pytest.mark.asyncio
+    async def test_prewarm_creates_sessions_concurrently(self, mock_sdk_client):
+        """Sessions of several agents are created at the same time."""
+        import asyncio
+
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        in_flight = 0
+        peak = 0
+
+        async def create_session(config):
+            nonlocal in_flight, peak
+            in_flight += 1
+            peak = max(peak, in_flight)
+            await asyncio.sleep(0.01)
+            in_flight -= 1
+            return MagicMock(destroy=AsyncMock())
+
+        mock_sdk_client.create_session = AsyncMock(side_effect=create_session)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient()
+            await client.start()
+            opened = await client.prewarm(["pm", "ba", "writer", "pm"])
+
+        assert opened == 3
+        assert peak == 3
+        assert {s.agent_id for s in client.get_pool_stats()} == {"pm", "ba", "writer"}
+
+    @pytest.mark.asyncio
+    async def test_prewarm_failures_are_not_raised(self, mock_sdk_client):
+        """A session that can't be opened is left for the first request."""
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        mock_sdk_client.create_session = AsyncMock(side_effect=Exception("unavailable"))
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient()
+            await client.start()
+            assert await client.prewarm(["pm"]) == 0
+
+        assert client.get_pool_stats()[0].idle == 0
+
+    @pytest.mark.asyncio
+    async def test_prewarm_disabled_by_config(self, mock_sdk_client):
+        """session_pool.prewarm false turns pre-warming off."""
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(config={"session_pool": {"prewarm": False}})
+            await client.start()
+            assert await client.prewarm(["pm"]) == 0
+            assert client.start_prewarm() is None
+
+        mock_sdk_client.create_session.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_first_request_reuses_prewarmed_session(
+        self, mock_sdk_client, mock_streaming_session, mock_event_types
+    ):
+        """A request without a model runs on the session warmed at startup."""
+        import asyncio
+
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        async def send_and_idle(message):
+            for handler in mock_streaming_session._handlers:
+                await asyncio.sleep(0)
+                handler(MagicMock(type=mock_event_types.SESSION_IDLE))
+
+        mock_streaming_session.send = AsyncMock(side_effect=send_and_idle)
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+        config = {
+            "default_model": "gpt-5",
+            "agents": [{"id": "pm", "model": "claude-opus-4.5"}, {"id": "ba"}],
+        }
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(config=config)
+            await client.start()
+            assert await client.start_prewarm() == 2
+            await client.execute_streaming("pm", "Plan it")
+
+        assert mock_sdk_client.create_session.call_count == 2
+        calls = mock_sdk_client.create_session.call_args_list
+        assert sorted(c.args[0]["session_id"] for c in calls) == ["teambot-ba", "teambot-pm"]
+        mock_streaming_session.send.assert_awaited_once()
+
+
+class TestCopilotSDKClientTimeouts:
+    """Tests for request deadlines and the inactivity timeout."""
+
+    @pytest.mark.asyncio
+    async def test_deadline_aborts_request(self, mock_sdk_client, mock_streaming_session):
+        """A stream still running at its deadline is aborted and not retried."""
+        import asyncio
+
+        from teambot.copilot.sdk_client import CopilotSDKClient, SDKTimeoutError
+
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient()
+            await client.start()
+            with pytest.raises(SDKTimeoutError, match="timed out after 0.05s") as exc_info:
+                await client.execute_streaming("pm", "Plan it", timeout=0.05)
+
+        assert exc_info.value.kind == SDKTimeoutError.DEADLINE
+        mock_streaming_session.abort.assert_awaited_once()
+        assert mock_streaming_session.send.await_count == 1
+        # The session isn't reused, and is destroyed so its late events go nowhere
+        await asyncio.sleep(0)
+        mock_streaming_session.destroy.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_execute_timeout_enforced_when_streaming(
+        self, mock_sdk_client, mock_streaming_session
+    ):
+        """execute() passes its timeout on to the streaming request."""
+        from teambot.copilot.sdk_client import CopilotSDKClient, SDKTimeoutError
+
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient()
+            await client.start()
+            with pytest.raises(SDKTimeoutError):
+                await client.execute("pm", "Plan it", timeout=0.05)
+
+        mock_streaming_session.abort.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_stalled_stream_aborted(self, mock_sdk_client, mock_streaming_session):
+        """A stream without events for inactivity_seconds is aborted."""
+        from teambot.copilot.sdk_client import CopilotSDKClient, SDKTimeoutError
+
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+        config = {"timeouts": {"inactivity_seconds": 0.05}, "retry": {"max_attempts": 1}}
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(config=config)
+            await client.start()
+            with pytest.raises(SDKTimeoutError, match="No response from 'pm'") as exc_info:
+                await client.execute_streaming("pm", "Plan it")
+
+        assert exc_info.value.kind == SDKTimeoutError.INACTIVITY
+        mock_streaming_session.abort.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_events_keep_stream_alive(self, mock_sdk_client, mock_streaming_session):
+        """A slow stream that keeps sending events is not treated as stalled."""
+        import asyncio
+        from types import SimpleNamespace
+
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        async def stream():
+            for word in ("one ", "two ", "three"):
+                await asyncio.sleep(0.03)
+                mock_streaming_session.fire_event(
+                    "ASSISTANT_MESSAGE_DELTA", SimpleNamespace(delta_content=word)
+                )
+            mock_streaming_session.fire_event("SESSION_IDLE")
+
+        tasks = []
+        mock_streaming_session.send = AsyncMock(
+            side_effect=lambda payload: tasks.append(asyncio.create_task(stream()))
+        )
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(config={"timeouts": {"inactivity_seconds": 0.06}})
+            await client.start()
+            result = await client.execute_streaming("pm", "Plan it")
+
+        assert result == "one two three"
+        mock_streaming_session.abort.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_stalled_stream_retried_on_fresh_session(
+        self, mock_sdk_client, mock_streaming_session
+    ):
+        """A stalled attempt is retried, and its session is not reused."""
+        from types import SimpleNamespace
+
+        from teambot.copilot.resilience import RetryPolicy
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        calls = []
+
+        async def send(payload):
+            calls.append(payload)
+            if len(calls) > 1:
+                mock_streaming_session.fire_event(
+                    "ASSISTANT_MESSAGE_DELTA", SimpleNamespace(delta_content="Done")
+                )
+                mock_streaming_session.fire_event("SESSION_IDLE")
+
+        mock_streaming_session.send = AsyncMock(side_effect=send)
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient(
+                config={"timeouts": {"inactivity_seconds": 0.05}},
+                retry_policy=RetryPolicy(base_delay=0),
+            )
+            await client.start()
+            assert await client.execute_streaming("pm", "Plan it") == "Done"
+
+        assert len(calls) == 2
+        assert mock_sdk_client.create_session.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_blocking_timeout_aborts_request(
+        self, mock_sdk_client, mock_streaming_session, monkeypatch
+    ):
+        """In blocking mode the deadline is passed to the SDK and enforced by abort."""
+        from teambot.copilot.sdk_client import CopilotSDKClient, SDKTimeoutError
+
+        monkeypatch.setenv("TEAMBOT_STREAMING", "false")
+        mock_streaming_session.send_and_wait = AsyncMock(side_effect=TimeoutError())
+        mock_sdk_client.create_session = AsyncMock(return_value=mock_streaming_session)
+
+        with patch("teambot.copilot.sdk_client.CopilotClient", return_value=mock_sdk_client):
+            client = CopilotSDKClient()
+            await client.start()
+            with pytest.raises(SDKTimeoutError, match="timed out after 30s"):
+                await client.execute("pm", "Plan it", timeout=30)
+
+        timeout = mock_streaming_session.send_and_wait.await_args.kwargs["timeout"]
+        assert 29 < timeout <= 30
+        mock_streaming_session.abort.assert_awaited_once()
+        assert mock_streaming_session.send_and_wait.await_count == 1
@@ -35,7 +35,8 @@ class TestExecuteStreaming:
             mock_client.get_auth_status = AsyncMock(return_value={"isAuthenticated": True})
             MockClient.return_value = mock_client
 
-            client = CopilotSDKClient()
+            # Coalescing off: every delta is passed on as it arrives
+            client = CopilotSDKClient(config={"streaming": {"coalesce_ms": 0}})
             await client.start()
 
             # Schedule events to fire after send() is called
@@ -254,7 +255,8 @@ class TestExecuteStreaming:
             mock_client.get_auth_status = AsyncMock(return_value={"isAuthenticated": True})
             MockClient.return_value = mock_client
 
-            client = CopilotSDKClient()
+            # Coalescing off: every delta is passed on as it arrives
+            client = CopilotSDKClient(config={"streaming": {"coalesce_ms": 0}})
             await client.start()
 
             async def fire_events():
@@ -469,3 +471,78 @@ class TestCancelRequest:
             result = await client.cancel_current_request("pm")
 
             assert result is False
+
+
+class TestStreamingCoalescing:
+    """Tests for coalescing deltas before on_chunk."""
+
+    @pytest.mark.asyncio
+    async def test_deltas_coalesced_by_line(
+        self, mock_streaming_session, mock_event_types, mock_event_data
+    ):
+        """Deltas are delivered once per line, with the tail flushed on completion."""
+        from teambot.copilot.sdk_client import CopilotSDKClient
+
+        chunks_received = []
+
+        with patch("teambot.copilot.sdk_client.CopilotClient") as MockClient:
+            mock_client = MagicMock()
+            mock_client.start = AsyncMock()
+            mock_client.stop = AsyncMock()
+            mock_client.create_session = AsyncMock(return_value=mock_streaming_session)
+            mock_client.get_auth_status = AsyncMock(return_value={"isAuthenticated": True})
+            MockClient.return_value = mock_client
+
+            client = CopilotSDKClient(config={"streaming": {"coalesce_ms": 1000}})
+            await client.start()
+
+            async def fire_events():
+                await asyncio.sleep(0.01)
+                for delta in ["Hel", "lo\n", "Wor", "ld", "!"]:
+                    mock_streaming_session.fire_event(
+                        mock_event_types.ASSISTANT_MESSAGE_DELTA,
+                        mock_event_data.delta(delta),
+                    )
+                mock_streaming_session.fire_event(mock_event_types.SESSION_IDLE, None)
+
+            asyncio.create_task(fire_events())
+
+            result = await client.execute_streaming("pm", "Test", chunks_received.append)
+
+        assert chunks_received == ["Hello\n", "World!"]
+        assert result == "Hello\nWorld!"
+
+
+class TestEventKind:
+    """Tests for SDK event type dispatch."""
+
+    def test_classifies_strings_and_enums(self):
+        """String and enum event types map to the same kinds."""
+        from enum import Enum
+
+        from teambot.copilot.sdk_client import EventKind, event_kind
+
+        class FakeEventType(Enum):
+            DELTA = "assistant.message_delta"
+            REASONING = "assistant.reasoning_delta"
+            IDLE = "session.idle"
+
+        assert event_kind("ASSISTANT_MESSAGE_DELTA") is EventKind.DELTA
+        assert event_kind(FakeEventType.DELTA) is EventKind.DELTA
+        assert event_kind(FakeEventType.REASONING) is None
+        assert event_kind(FakeEventType.IDLE) is EventKind.IDLE
+        assert event_kind("session.error") is EventKind.ERROR
+        assert event_kind("ABORT") is EventKind.ABORT
+        assert event_kind("tool.execution_start") is None
+
+    def test_event_type_normalized_once(self):
+        """Repeated event types are looked up without re-classifying."""
+        from teambot.copilot import sdk_client
+
+        with patch.object(
+            sdk_client, "_classify_event_type", wraps=sdk_client._classify_event_type
+        ) as classify:
+            for _ in range(3):
+                sdk_client.event_kind("benchmark.custom_event")
+
+        assert classify.call_count == 1
@@ -0,0 +1,428 @@
+"""Tests for the per-agent SDK session pool."""
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+
+from teambot.copilot.session_pool import PoolLimits, SessionPool, SessionPoolConfig
+
+
+def _factory():
+    """Session factory recording the IDs it was asked to create."""
+    created: list[tuple[str, str, str | None]] = []
+
+    async def create(session_id, agent_id, model):
+        created.append((session_id, agent_id, model))
+        session = MagicMock()
+        session.session_id = session_id
+        session.destroy = AsyncMock()
+        session.abort = AsyncMock()
+        return session
+
+    return create, created
+
+
+def _pool(max_sessions=2, min_sessions=1):
+    create, created = _factory()
+    config = SessionPoolConfig(defaults=PoolLimits(min_sessions, max_sessions))
+    return SessionPool(create, config), created
+
+
+class TestSessionPoolConfig:
+    """Tests for SessionPoolConfig.from_config."""
+
+    def test_defaults_without_config(self):
+        """One session per agent when nothing is configured."""
+        config = SessionPoolConfig.from_config(None)
+
+        assert config.limits_for("pm") == PoolLimits(min_sessions=1, max_sessions=1)
+
+    def test_global_and_agent_limits(self):
+        """Agent entries override the session_pool defaults."""
+        config = SessionPoolConfig.from_config(
+            {
+                "session_pool": {"min_sessions": 0, "max_sessions": 2},
+                "agents": [
+                    {"id": "pm"},
+                    {"id": "builder-1", "max_sessions": 4, "min_sessions": 2},
+                ],
+            }
+        )
+
+        assert config.limits_for("pm") == PoolLimits(min_sessions=0, max_sessions=2)
+        assert config.limits_for("builder-1") == PoolLimits(min_sessions=2, max_sessions=4)
+
+    def test_max_concurrent_raises_max_sessions(self):
+        """An agent allowed several concurrent tasks gets as many sessions."""
+        config = SessionPoolConfig.from_config(
+            {"agents": [{"id": "builder-1", "max_concurrent": 3}]}
+        )
+
+        assert config.limits_for("builder-1").max_sessions == 3
+
+    def test_eviction_settings(self):
+        """Idle timeout and live-session cap come from the session_pool section."""
+        assert SessionPoolConfig.from_config(None).idle_timeout == 30 * 60
+
+        config = SessionPoolConfig.from_config(
+            {"session_pool": {"idle_timeout_seconds": None, "max_live_sessions": 8}}
+        )
+
+        assert config.idle_timeout is None
+        assert config.max_live_sessions == 8
+
+
+class TestSessionPool:
+    """Tests for SessionPool checkout and checkin."""
+
+    @pytest.mark.asyncio
+    async def test_checkout_reuses_returned_session(self):
+        """A returned session is handed to the next request."""
+        pool, created = _pool()
+
+        first = await pool.checkout("pm")
+        pool.checkin(first)
+        second = await pool.checkout("pm")
+
+        assert second is first
+        assert len(created) == 1
+
+    @pytest.mark.asyncio
+    async def test_concurrent_checkouts_get_distinct_sessions(self):
+        """Requests running at once each get their own session."""
+        pool, created = _pool(max_sessions=2)
+
+        first = await pool.checkout("pm")
+        second = await pool.checkout("pm")
+
+        assert first.session is not second.session
+        assert [c[0] for c in created] == ["teambot-pm", "teambot-pm-2"]
+
+    @pytest.mark.asyncio
+    async def test_checkout_waits_when_full(self):
+        """A request beyond max_sessions waits for a session to be returned."""
+        pool, created = _pool(max_sessions=1)
+        first = await pool.checkout("pm")
+
+        waiting = asyncio.create_task(pool.checkout("pm"))
+        await asyncio.sleep(0)
+        assert not waiting.done()
+        assert pool.get_stats()[0].waiting == 1
+
+        pool.checkin(first)
+        second = await waiting
+
+        assert second is first
+        assert len(created) == 1
+
+    @pytest.mark.asyncio
+    async def test_min_sessions_opened_on_first_use(self):
+        """The first checkout opens min_sessions sessions at once."""
+        pool, created = _pool(max_sessions=4, min_sessions=3)
+
+        await pool.checkout("pm")
+
+        stats = pool.get_stats()[0]
+        assert len(created) == 3
+        assert (stats.in_use, stats.idle) == (1, 2)
+
+    @pytest.mark.asyncio
+    async def test_models_use_separate_sub_pools(self):
+        """Sessions for different models are kept apart."""
+        pool, created = _pool()
+
+        gpt = await pool.checkout("pm", model="gpt-5")
+        pool.checkin(gpt)
+        claude = await pool.checkout("pm", model="claude-opus-4.5")
+
+        assert claude is not gpt
+        assert [c[2] for c in created] == ["gpt-5", "claude-opus-4.5"]
+        assert [(s.model, s.idle) for s in pool.get_stats()] == [
+            ("claude-opus-4.5", 0),
+            ("gpt-5", 1),
+        ]
+
+    @pytest.mark.asyncio
+    async def test_unnamed_model_uses_agent_current_model(self):
+        """Requests without a model go to the model last named for the agent."""
+        pool, created = _pool()
+        await pool.get("pm", model="gpt-5")
+
+        lease = await pool.checkout("pm")
+
+        assert lease.model == "gpt-5"
+        assert len(created) == 1
+
+    @pytest.mark.asyncio
+    async def test_broken_session_replaced(self):
+        """A discarded session is replaced, reusing its session ID once destroyed."""
+        pool, created = _pool(max_sessions=1)
+
+        with pytest.raises(RuntimeError):
+            async with pool.session("pm", is_broken=lambda e: True):
+                raise RuntimeError("Session not found")
+
+        lease = await pool.checkout("pm")
+
+        assert len(created) == 2
+        assert lease.session_id == "teambot-pm"
+
+    @pytest.mark.asyncio
+    async def test_broken_session_destroyed_before_id_reused(self):
+        """A discarded session is destroyed, and its ID waits until it is gone."""
+        pool, created = _pool(max_sessions=1)
+        lease = await pool.checkout("pm")
+        destroyed = asyncio.Event()
+        lease.session.destroy = AsyncMock(side_effect=destroyed.wait)
+
+        pool.discard(lease)
+        replacement = await pool.checkout("pm")
+
+        lease.session.destroy.assert_awaited_once()
+        assert replacement.session_id == "teambot-pm-2"
+
+        destroyed.set()
+        await asyncio.sleep(0)
+        pool.discard(replacement)
+        await asyncio.sleep(0)
+        assert (await pool.checkout("pm")).session_id == "teambot-pm"
+
+    @pytest.mark.asyncio
+    async def test_other_errors_return_session(self):
+        """Errors that don't break the session return it to the pool."""
+        pool, created = _pool()
+
+        with pytest.raises(RuntimeError):
+            async with pool.session("pm", is_broken=lambda e: False):
+                raise RuntimeError("Rate limit")
+
+        assert pool.get_stats()[0].idle == 1
+
+    @pytest.mark.asyncio
+    async def test_utilization(self):
+        """Stats report the fraction of capacity checked out."""
+        pool, _ = _pool(max_sessions=4)
+        await pool.checkout("pm")
+
+        assert pool.get_stats()[0].utilization == 0.25
+
+    @pytest.mark.asyncio
+    async def test_close_destroys_sessions(self):
+        """Closing the pool destroys idle and checked-out sessions."""
+        pool, _ = _pool()
+        busy = await pool.checkout("pm")
+        idle = await pool.checkout("ba")
+        pool.checkin(idle)
+
+        await pool.close()
+
+        busy.session.destroy.assert_awaited_once()
+        idle.session.destroy.assert_awaited_once()
+        assert pool.get_stats() == []
+
+
+class TestSessionWarming:
+    """Tests for opening sessions ahead of requests."""
+
+    @pytest.mark.asyncio
+    async def test_warm_opens_min_sessions_idle(self):
+        """Warming opens min_sessions sessions that the next checkout reuses."""
+        pool, created = _pool(max_sessions=3, min_sessions=2)
+
+        assert await pool.warm("pm") == 2
+        assert pool.get_stats()[0].idle == 2
+
+        await pool.checkout("pm")
+        assert len(created) == 2
+
+    @pytest.mark.asyncio
+    async def test_warm_skips_agents_with_sessions(self):
+        """An agent that already has sessions is not warmed again."""
+        pool, created = _pool(min_sessions=0)
+
+        assert await pool.warm("pm") == 1
+        assert await pool.warm("pm") == 0
+        assert len(created) == 1
+
+    @pytest.mark.asyncio
+    async def test_warm_keeps_agent_model(self):
+        """Warming another model's sessions doesn't switch the agent's model."""
+        pool, created = _pool()
+
+        await pool.warm("pm", model="gpt-5")
+
+        assert created == [("teambot-pm", "pm", "gpt-5")]
+        assert pool.current_model("pm") is None
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self, now: float = 1000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _evicting_pool(idle_timeout=60.0, max_live_sessions=None, min_sessions=1):
+    create, created = _factory()
+    clock = FakeClock()
+    config = SessionPoolConfig(
+        defaults=PoolLimits(min_sessions, 2),
+        idle_timeout=idle_timeout,
+        max_live_sessions=max_live_sessions,
+    )
+    return SessionPool(create, config, clock=clock), created, clock
+
+
+async def _settle():
+    """Let background destroy tasks run."""
+    for _ in range(3):
+        await asyncio.sleep(0)
+
+
+class TestSessionEviction:
+    """Tests for idle-timeout and live-session-cap eviction."""
+
+    @pytest.mark.asyncio
+    async def test_idle_sessions_evicted_after_timeout(self):
+        """Sessions unused for the idle timeout are destroyed in the background."""
+        pool, _, clock = _evicting_pool(idle_timeout=60)
+        lease = await pool.checkout("pm")
+        pool.checkin(lease)
+
+        clock.now += 59
+        assert pool.evict_idle() == 0
+        clock.now += 1
+        assert pool.evict_idle() == 1
+        await _settle()
+
+        lease.session.destroy.assert_awaited_once()
+        assert pool.get_stats() == []
+        assert pool.live_sessions == 0
+        assert pool.evictions == 1
+
+    @pytest.mark.asyncio
+    async def test_busy_sessions_never_evicted(self):
+        """A checked-out session survives the idle timeout."""
+        pool, _, clock = _evicting_pool(idle_timeout=60)
+        lease = await pool.checkout("pm")
+
+        clock.now += 3600
+        assert pool.evict_idle() == 0
+        lease.session.destroy.assert_not_awaited()
+
+    @pytest.mark.asyncio
+    async def test_next_use_warm_starts_fresh_session(self):
+        """After eviction the agent gets a new session with its persona unsent."""
+        pool, created, clock = _evicting_pool(idle_timeout=60, min_sessions=2)
+        first = await pool.checkout("pm")
+        first.persona_sent = True
+        pool.checkin(first)
+        clock.now += 60
+        pool.evict_idle()
+        await _settle()
+
+        again = await pool.checkout("pm")
+
+        assert again is not first
+        assert not again.persona_sent
+        # min_sessions are reopened, reusing the freed session IDs
+        assert [c[0] for c in created[2:]] == ["teambot-pm", "teambot-pm-2"]
+
+    @pytest.mark.asyncio
+    async def test_session_id_not_reused_until_destroyed(self):
+        """A new session doesn't take the ID of one still being destroyed."""
+        pool, created, clock = _evicting_pool(idle_timeout=60)
+        lease = await pool.checkout("pm")
+        destroyed = asyncio.Event()
+        lease.session.destroy = AsyncMock(side_effect=destroyed.wait)
+        pool.checkin(lease)
+        clock.now += 60
+        pool.evict_idle()
+
+        await pool.checkout("pm")
+        assert created[-1][0] == "teambot-pm-2"
+
+        destroyed.set()
+        await _settle()
+        await pool.checkout("pm")
+        assert created[-1][0] == "teambot-pm"
+
+    @pytest.mark.asyncio
+    async def test_invalidate_destroys_sessions(self):
+        """Invalidated sessions are destroyed now, or when returned if checked out."""
+        pool, _ = _pool(max_sessions=2)
+        busy = await pool.checkout("pm")
+        idle = await pool.checkout("pm")
+        pool.checkin(idle)
+
+        pool.invalidate("pm")
+        await _settle()
+
+        idle.session.destroy.assert_awaited_once()
+        busy.session.destroy.assert_not_awaited()
+
+        pool.checkin(busy)
+        await _settle()
+
+        busy.session.destroy.assert_awaited_once()
+        assert pool.live_sessions == 0
+
+    @pytest.mark.asyncio
+    async def test_model_switch_destroys_old_model_sessions(self):
+        """Switching an agent's model destroys its sessions for the old model."""
+        pool, created = _pool()
+        old = await pool.get("pm", model="gpt-5")
+
+        await pool.get("pm", model="claude-opus-4.5")
+
+        old.destroy.assert_awaited_once()
+        assert [(s.model, s.idle) for s in pool.get_stats()] == [("claude-opus-4.5", 1)]
+        # The old session's ID is free again
+        assert [c[0] for c in created] == ["teambot-pm", "teambot-pm"]
+
+    @pytest.mark.asyncio
+    async def test_cap_evicts_least_recently_used(self):
+        """Opening a session over the cap evicts the longest-idle session."""
+        pool, _, clock = _evicting_pool(max_live_sessions=2)
+        pm = await pool.checkout("pm")
+        ba = await pool.checkout("ba")
+        pool.checkin(pm)
+        clock.now += 1
+        pool.checkin(ba)
+
+        await pool.checkout("writer")
+        await _settle()
+
+        pm.session.destroy.assert_awaited_once()
+        ba.session.destroy.assert_not_awaited()
+        assert pool.live_sessions == 2
+        assert [s.agent_id for s in pool.get_stats()] == ["ba", "writer"]
+
+    @pytest.mark.asyncio
+    async def test_cap_exceeded_when_all_sessions_busy(self):
+        """Busy sessions are not evicted to honour the cap."""
+        pool, _, _ = _evicting_pool(max_live_sessions=1)
+        pm = await pool.checkout("pm")
+
+        await pool.checkout("ba")
+
+        pm.session.destroy.assert_not_awaited()
+        assert pool.live_sessions == 2
+
+    @pytest.mark.asyncio
+    async def test_background_sweep(self):
+        """start_eviction() sweeps idle sessions periodically until close()."""
+        create, _ = _factory()
+        pool = SessionPool(create, SessionPoolConfig(idle_timeout=0.01))
+        lease = await pool.checkout("pm")
+        pool.checkin(lease)
+
+        pool.start_eviction()
+        await asyncio.sleep(1.1)  # Sweep interval is at least one second
+
+        lease.session.destroy.assert_awaited_once()
+        await pool.close()
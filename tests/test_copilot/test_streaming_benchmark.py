@@ -0,0 +1,99 @@
+"""Benchmarks for per-event overhead of SDK streaming."""
+
+import gc
+import time
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from teambot.copilot.sdk_client import CopilotSDKClient
+
+DELTAS = 100_000
+
+
+class FakeStreamingSession:
+    """Session that streams a fixed list of events for every send."""
+
+    def __init__(self, events: list[SimpleNamespace]):
+        self._events = events
+        self._handlers: list = []
+        self.session_id = "bench-session"
+
+    def on(self, handler):
+        self._handlers.append(handler)
+        return lambda: self._handlers.remove(handler)
+
+    async def send(self, message):
+        for handler in list(self._handlers):
+            for event in self._events:
+                handler(event)
+
+
+def _events(count: int) -> list[SimpleNamespace]:
+    """Build ``count`` delta events (a newline every 20) followed by SESSION_IDLE."""
+    events = [
+        SimpleNamespace(
+            type="assistant.message_delta",
+            data=SimpleNamespace(delta_content="tok\n" if i % 20 == 19 else "tok "),
+        )
+        for i in range(count)
+    ]
+    events.append(SimpleNamespace(type="session.idle", data=None))
+    return events
+
+
+async def _stream(client: CopilotSDKClient, chunks: list[str]) -> tuple[float, str]:
+    start = time.perf_counter()
+    result = await client.execute_streaming("pm", "Benchmark", chunks.append)
+    return time.perf_counter() - start, result
+
+
+async def _run(config: dict, runs: int = 3) -> tuple[float, str, int]:
+    """Stream DELTAS deltas through a client; return best time, result and chunk count."""
+    session = FakeStreamingSession(_events(DELTAS))
+    sdk = MagicMock()
+    sdk.start = AsyncMock()
+    sdk.get_auth_status = AsyncMock(return_value={"isAuthenticated": True})
+    sdk.create_session = AsyncMock(return_value=session)
+
+    with patch("teambot.copilot.sdk_client.CopilotClient", return_value=sdk):
+        client = CopilotSDKClient(config=config)
+        await client.start()
+
+        # Collector pauses dominate the noise at this scale
+        gc.disable()
+        try:
+            best = float("inf")
+            for _ in range(runs):
+                chunks: list[str] = []
+                elapsed, result = await _stream(client, chunks)
+                best = min(best, elapsed)
+        finally:
+            gc.enable()
+    return best, result, len(chunks)
+
+
+@pytest.mark.slow
+class TestStreamingBenchmark:
+    """Per-event overhead of streaming 100k deltas through the SDK client."""
+
+    @pytest.mark.asyncio
+    async def test_100k_deltas_per_event_overhead(self):
+        """Test each delta costs a few microseconds end to end, coalesced or not."""
+        raw, raw_result, raw_chunks = await _run({"streaming": {"coalesce_ms": 0}})
+        coalesced, result, chunks = await _run({})
+
+        expected = "".join("tok\n" if i % 20 == 19 else "tok " for i in range(DELTAS))
+        assert raw_result == result == expected
+        assert raw_chunks == DELTAS
+        # One chunk per line instead of one per delta
+        assert chunks == DELTAS // 20
+
+        per_event_raw = raw / DELTAS * 1e6
+        per_event = coalesced / DELTAS * 1e6
+        print(f"\nper delta: raw {per_event_raw:.2f}us, coalesced {per_event:.2f}us")
+        # Generous bounds: regressions to per-event string parsing and
+        # eager logging land well above these on any CI machine.
+        assert per_event_raw < 20, f"{per_event_raw:.2f}us per delta"
+        assert per_event < 20, f"{per_event:.2f}us per delta"
@@ -0,0 +1,193 @@
+"""Tests for request telemetry."""
+
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+
+from teambot.copilot.telemetry import (
+    Histogram,
+    MetricsRegistry,
+    RequestMetrics,
+    RequestTrace,
+    TelemetryLog,
+    current_stage,
+    get_telemetry_log,
+    stage_scope,
+)
+
+
+def _metrics(**overrides) -> RequestMetrics:
+    values = {
+        "agent_id": "pm",
+        "model": "gpt-5",
+        "stage": "SPEC",
+        "started_at": 0.0,
+        "session_wait": 0.1,
+        "time_to_first_delta": 1.0,
+        "duration": 3.0,
+        "chunks": 10,
+        "output_bytes": 800,
+    }
+    values.update(overrides)
+    return RequestMetrics(**values)
+
+
+class TestStageScope:
+    """Tests for stage tagging."""
+
+    def test_scope_sets_and_restores(self):
+        """The stage applies inside the block only."""
+        assert current_stage() is None
+        with stage_scope("SPEC"):
+            assert current_stage() == "SPEC"
+            with stage_scope("PLAN"):
+                assert current_stage() == "PLAN"
+            assert current_stage() == "SPEC"
+        assert current_stage() is None
+
+    @pytest.mark.asyncio
+    async def test_scope_is_per_task(self):
+        """Concurrent stages each see their own tag."""
+
+        async def run(stage: str) -> str | None:
+            with stage_scope(stage):
+                await asyncio.sleep(0)
+                return RequestTrace("pm", None).finish("ok").stage
+
+        assert await asyncio.gather(run("SPEC"), run("PLAN")) == ["SPEC", "PLAN"]
+
+
+class TestRequestTrace:
+    """Tests for RequestTrace."""
+
+    def test_streamed_request(self):
+        """Timings, chunk count and size come from the trace and response."""
+        trace = RequestTrace("pm", None, stage="SPEC")
+        trace.session_acquired("gpt-5")
+        trace.first_delta()
+        trace.chunks = 3
+        metrics = trace.finish("héllo")
+
+        assert metrics.model == "gpt-5"
+        assert metrics.stage == "SPEC"
+        assert 0 <= metrics.session_wait <= metrics.time_to_first_delta <= metrics.duration
+        assert metrics.chunks == 3
+        assert metrics.output_bytes == 6
+        assert metrics.error is None
+
+    def test_single_piece_response(self):
+        """A reply without deltas counts as one chunk arriving at the end."""
+        metrics = RequestTrace("pm", "gpt-5").finish("answer", cached=True)
+
+        assert metrics.chunks == 1
+        assert metrics.time_to_first_delta == metrics.duration
+        assert metrics.cached
+
+    def test_failed_request(self):
+        """Errors are recorded by message or type."""
+        assert RequestTrace("pm", None).finish(error=RuntimeError("boom")).error == "boom"
+        assert RequestTrace("pm", None).finish(error=TimeoutError()).error == "TimeoutError"
+
+    def test_tokens_per_second(self):
+        """Throughput is estimated over the time after the first delta."""
+        assert _metrics().tokens_per_second == 800 / 4 / 2.0
+        assert _metrics(output_bytes=0).tokens_per_second is None
+
+
+class TestHistogram:
+    """Tests for Histogram."""
+
+    def test_summary(self):
+        """Count, mean, extremes and bucketed quantiles."""
+        histogram = Histogram((1.0, 2.0, 5.0))
+        for value in (0.5, 1.5, 1.5, 4.0, 9.0):
+            histogram.observe(value)
+
+        assert histogram.counts == [1, 2, 1, 1]
+        assert histogram.mean == pytest.approx(3.3)
+        assert histogram.quantile(0.5) == 2.0
+        assert histogram.quantile(1.0) == 9.0
+        assert histogram.to_dict()["min"] == 0.5
+
+    def test_empty(self):
+        """An empty histogram has no statistics."""
+        assert Histogram().quantile(0.5) is None
+        assert Histogram().mean is None
+
+
+class TestMetricsRegistry:
+    """Tests for MetricsRegistry."""
+
+    def test_record_request(self):
+        """Requests are aggregated per agent and model."""
+        registry = MetricsRegistry()
+        registry.record_request(_metrics())
+        registry.record_request(_metrics(duration=5.0))
+        registry.record_request(_metrics(model="claude-opus-4.5"))
+
+        duration = registry.histogram("duration_seconds", agent="pm", model="gpt-5")
+        assert duration.count == 2
+        assert registry.counter("requests", agent="pm", model="gpt-5") == 2
+        assert registry.counter("output_bytes", agent="pm", model="claude-opus-4.5") == 800
+
+    def test_errors_and_cache_hits_not_in_latency(self):
+        """Failed and cached requests are counted but not timed."""
+        registry = MetricsRegistry()
+        registry.record_request(_metrics(error="boom"))
+        registry.record_request(_metrics(cached=True))
+
+        assert registry.counter("request_errors", agent="pm", model="gpt-5") == 1
+        assert registry.counter("requests_cached", agent="pm", model="gpt-5") == 1
+        assert registry.histogram("duration_seconds", agent="pm", model="gpt-5").count == 0
+
+    def test_snapshot(self):
+        """The snapshot lists histograms and counters with tags."""
+        registry = MetricsRegistry()
+        registry.record_request(_metrics(model=None))
+
+        snapshot = registry.snapshot()
+        names = {entry["name"] for entry in snapshot}
+        assert {"duration_seconds", "first_delta_seconds", "tokens_per_second"} <= names
+        assert all(entry["tags"] == {"agent": "pm", "model": "default"} for entry in snapshot)
+
+        registry.reset()
+        assert registry.snapshot() == []
+
+
+class TestTelemetryLog:
+    """Tests for the rolling telemetry file."""
+
+    def test_appends_jsonl(self, tmp_path: Path):
+        """Each request is one JSON line."""
+        log = TelemetryLog(tmp_path / "telemetry" / "requests.jsonl")
+        log.write(_metrics())
+        log.write(_metrics(agent_id="ba"))
+
+        lines = log.path.read_text().splitlines()
+        assert [json.loads(line)["agent_id"] for line in lines] == ["pm", "ba"]
+        assert json.loads(lines[0])["tokens_per_second"] == 100.0
+
+    def test_rotates_when_full(self, tmp_path: Path):
+        """A full file is rotated, keeping the configured number of backups."""
+        line_size = len(json.dumps(_metrics().to_dict())) + 1
+        log = TelemetryLog(tmp_path / "requests.jsonl", max_bytes=line_size * 2, backups=2)
+        for _ in range(7):
+            log.write(_metrics())
+
+        assert len(log.path.read_text().splitlines()) == 1
+        assert (tmp_path / "requests.jsonl.1").exists()
+        assert (tmp_path / "requests.jsonl.2").exists()
+        assert not (tmp_path / "requests.jsonl.3").exists()
+
+    def test_from_config(self, tmp_path: Path):
+        """Loaded configurations log under teambot_dir unless disabled."""
+        assert get_telemetry_log(None) is None
+        assert get_telemetry_log({"agents": []}) is None
+
+        log = get_telemetry_log({"teambot_dir": str(tmp_path)})
+        assert log.path == tmp_path / "telemetry" / "requests.jsonl"
+
+        disabled = {"teambot_dir": str(tmp_path), "telemetry": {"enabled": False}}
+        assert get_telemetry_log(disabled) is None
@@ -388,3 +388,57 @@ class TestCustomMessageTemplate:
         )
         result = templates.render(event)
         assert "This is a test notification with multiple words" in result
+
+
+class TestResilienceTemplates:
+    """Tests for retry and circuit breaker event templates."""
+
+    @pytest.fixture
+    def templates(self) -> MessageTemplates:
+        return MessageTemplates()
+
+    def test_render_sdk_retry(self, templates: MessageTemplates) -> None:
+        """Retry shows the agent, attempt and error."""
+        event = NotificationEvent(
+            event_type="sdk_retry",
+            data={
+                "agent_id": "pm",
+                "model": "gpt-5",
+                "attempt": 2,
+                "max_attempts": 3,
+                "delay": 1.5,
+                "error": "Rate limit <exceeded>",
+            },
+        )
+        result = templates.render(event)
+        assert "Retrying pm" in result
+        assert "Attempt 2/3 in 1.5s" in result
+        assert "Rate limit &lt;exceeded&gt;" in result
+
+    def test_render_circuit_open_with_fallback(self, templates: MessageTemplates) -> None:
+        """An open circuit names the fallback model."""
+        event = NotificationEvent(
+            event_type="circuit_open",
+            data={"model": "claude-opus-4.5", "failures": 5, "fallback": "gpt-5"},
+        )
+        result = templates.render(event)
+        assert "Circuit open: claude-opus-4.5" in result
+        assert "5 consecutive failures, using gpt-5" in result
+
+    def test_render_circuit_open_without_fallback(self, templates: MessageTemplates) -> None:
+        """Without a fallback the cool-down is shown."""
+        event = NotificationEvent(
+            event_type="circuit_open",
+            data={"model": "gpt-5", "failures": 5, "fallback": None, "reset_seconds": 60.0},
+        )
+        result = templates.render(event)
+        assert "failing fast for 60s" in result
+
+    def test_render_model_fallback(self, templates: MessageTemplates) -> None:
+        """Fallback names both models."""
+        event = NotificationEvent(
+            event_type="model_fallback",
+            data={"agent_id": "pm", "model": "claude-opus-4.5", "fallback": "gpt-5"},
+        )
+        result = templates.render(event)
+        assert "falling back from claude-opus-4.5 to gpt-5" in result
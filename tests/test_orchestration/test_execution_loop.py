@@ -236,6 +236,27 @@ class TestExecutionLoopStatePersistence:
         assert WorkflowStage.SPEC in loop.stage_outputs
         assert "Feature specification" in loop.stage_outputs[WorkflowStage.SPEC]
 
+    def test_resume_replays_journal(self, objective_file: Path, teambot_dir: Path) -> None:
+        """Saves after the snapshot are journaled and replayed on resume."""
+        loop = ExecutionLoop(objective_path=objective_file, config={}, teambot_dir=teambot_dir)
+        loop._save_state()
+        snapshot = (loop.teambot_dir / "orchestration_state.json").read_text()
+
+        loop.current_stage = WorkflowStage.PLAN
+        loop.completed_stages = {WorkflowStage.SETUP, WorkflowStage.SPEC}
+        loop.stage_outputs[WorkflowStage.SPEC] = "Feature specification content"
+        loop._save_state()
+
+        # The second save only appended to the journal
+        assert (loop.teambot_dir / "orchestration_state.json").read_text() == snapshot
+        assert (loop.teambot_dir / "orchestration_state.journal").exists()
+
+        resumed = ExecutionLoop.resume(loop.teambot_dir, {})
+
+        assert resumed.current_stage == WorkflowStage.PLAN
+        assert resumed.completed_stages == {WorkflowStage.SETUP, WorkflowStage.SPEC}
+        assert resumed.stage_outputs[WorkflowStage.SPEC] == "Feature specification content"
+
     def test_resume_from_root_dir_finds_feature_state(
         self, objective_file: Path, teambot_dir: Path
     ) -> None:
@@ -476,36 +497,90 @@ class TestExecutionLoopStatePersistence:
 
 
 class TestExecutionLoopStageProgression:
-    """Tests for stage progression logic."""
+    """Tests for stage scheduling."""
 
-    def test_get_next_stage_follows_order(self, objective_file: Path, teambot_dir: Path) -> None:
-        """_get_next_stage follows the configured stage order."""
+    def test_ready_stages_follow_dependencies(
+        self, objective_file: Path, teambot_dir: Path
+    ) -> None:
+        """A stage becomes ready once every stage it depends on has completed."""
         loop = ExecutionLoop(
             objective_path=objective_file,
             config={},
             teambot_dir=teambot_dir,
         )
 
-        # Use the loop's actual stage order from config
-        stage_order = loop.stages_config.stage_order
-        for i, stage in enumerate(stage_order[:-1]):
-            next_stage = loop._get_next_stage(stage)
-            assert next_stage == stage_order[i + 1]
+        assert loop._ready_stages([]) == [WorkflowStage.SETUP]
+
+        loop.completed_stages = loop._stages_completed_before(WorkflowStage.SPEC_REVIEW)
+        assert loop._ready_stages([]) == [WorkflowStage.SPEC_REVIEW]
 
-    def test_get_next_stage_returns_complete_at_end(
+        # SPEC_REVIEW is followed by the RESEARCH / TEST_STRATEGY parallel group
+        loop.completed_stages.add(WorkflowStage.SPEC_REVIEW)
+        assert loop._ready_stages([]) == [WorkflowStage.RESEARCH, WorkflowStage.TEST_STRATEGY]
+        assert loop._ready_stages([WorkflowStage.RESEARCH]) == [WorkflowStage.TEST_STRATEGY]
+
+    def test_ready_stages_wait_for_busy_agents(
         self, objective_file: Path, teambot_dir: Path
     ) -> None:
-        """_get_next_stage returns COMPLETE for last stage."""
+        """Stages sharing an agent don't run at the same time."""
         loop = ExecutionLoop(
             objective_path=objective_file,
             config={},
             teambot_dir=teambot_dir,
         )
+        loop.stages_config.stages[WorkflowStage.TEST_STRATEGY].work_agent = "builder-1"
+        loop.completed_stages = loop._stages_completed_before(WorkflowStage.RESEARCH)
+
+        assert loop._ready_stages([]) == [WorkflowStage.RESEARCH]
+        assert loop._ready_stages([WorkflowStage.RESEARCH]) == []
+
+    def test_stages_completed_before(self, objective_file: Path, teambot_dir: Path) -> None:
+        """Stages before a position in the order count as completed."""
+        loop = ExecutionLoop(
+            objective_path=objective_file,
+            config={},
+            teambot_dir=teambot_dir,
+        )
+        order = loop.stages_config.stage_order
+
+        assert loop._stages_completed_before(WorkflowStage.SETUP) == set()
+        assert loop._stages_completed_before(WorkflowStage.PLAN) == set(
+            order[: order.index(WorkflowStage.PLAN)]
+        )
+        assert loop._stages_completed_before(WorkflowStage.COMPLETE) == set(order[:-1])
+
+    @pytest.mark.asyncio
+    async def test_independent_stages_overlap(
+        self, objective_file: Path, teambot_dir_with_spec: Path
+    ) -> None:
+        """Stages declared independent with depends_on run concurrently."""
+        import asyncio
+
+        loop = ExecutionLoop(
+            objective_path=objective_file,
+            config={},
+            teambot_dir=teambot_dir_with_spec,
+        )
+        # PLAN no longer waits for the RESEARCH / TEST_STRATEGY group
+        loop.stages_config.stages[WorkflowStage.PLAN].depends_on = [WorkflowStage.SPEC_REVIEW]
+        loop.current_stage = WorkflowStage.RESEARCH
+        active: list[str] = []
+        overlap: list[set[str]] = []
+
+        async def execute_streaming(agent_id, prompt, on_chunk=None):
+            active.append(agent_id)
+            overlap.append(set(active))
+            await asyncio.sleep(0.01)
+            active.remove(agent_id)
+            return "VERIFIED_APPROVED: Work completed successfully."
+
+        client = AsyncMock()
+        client.execute_streaming.side_effect = execute_streaming
+        result = await loop.run(client)
 
-        # POST_REVIEW -> COMPLETE
-        assert loop._get_next_stage(WorkflowStage.POST_REVIEW) == WorkflowStage.COMPLETE
-        # COMPLETE -> COMPLETE
-        assert loop._get_next_stage(WorkflowStage.COMPLETE) == WorkflowStage.COMPLETE
+        assert result == ExecutionResult.COMPLETE
+        assert {"builder-1", "builder-2", "pm"} in overlap
+        assert loop.completed_stages == set(loop.stages_config.stage_order[:-1])
 
 
 class TestExecutionLoopContextBuilding:
@@ -566,7 +641,7 @@ class TestExecutionLoopReviewOutputs:
     async def test_review_stage_outputs_stored_in_state(
         self, objective_file: Path, teambot_dir_with_spec: Path
     ) -> None:
-        """Review stage outputs are stored in orchestration_state.json."""
+        """Review stage outputs are stored alongside orchestration_state.json."""
         loop = ExecutionLoop(
             objective_path=objective_file,
             config={},
@@ -583,10 +658,11 @@ class TestExecutionLoopReviewOutputs:
         state_file = loop.teambot_dir / "orchestration_state.json"
         state = json.loads(state_file.read_text())
 
-        # Verify review stage outputs are in state
-        stage_outputs = state.get("stage_outputs", {})
-        assert "SPEC_REVIEW" in stage_outputs
-        assert "APPROVED" in stage_outputs["SPEC_REVIEW"]
+        # Verify review stage outputs are referenced from state
+        refs = state.get("stage_output_refs", {})
+        assert "SPEC_REVIEW" in refs
+        output_file = loop.teambot_dir / "outputs" / f"{refs['SPEC_REVIEW']}.md"
+        assert "APPROVED" in output_file.read_text()
 
     @pytest.mark.asyncio
     async def test_all_review_stages_stored(
@@ -606,11 +682,11 @@ class TestExecutionLoopReviewOutputs:
 
         state_file = loop.teambot_dir / "orchestration_state.json"
         state = json.loads(state_file.read_text())
-        stage_outputs = state.get("stage_outputs", {})
+        refs = state.get("stage_output_refs", {})
 
         # Check all review stages are stored
         for review_stage in REVIEW_STAGES:
-            assert review_stage.name in stage_outputs, f"Missing output for {review_stage.name}"
+            assert review_stage.name in refs, f"Missing output for {review_stage.name}"
 
 
 class TestPromptTemplateLoading:
@@ -875,105 +951,108 @@ class TestParallelGroupExecution:
             stages_config=config,
         )
 
-    def test_get_parallel_group_for_stage_returns_group(
-        self, loop_with_parallel_groups: ExecutionLoop
-    ) -> None:
-        """Returns parallel group when stage is first in group."""
-        # RESEARCH is first stage in post_spec_review group
-        group = loop_with_parallel_groups._get_parallel_group_for_stage(WorkflowStage.RESEARCH)
-
-        assert group is not None
-        assert group.name == "post_spec_review"
-        assert WorkflowStage.RESEARCH in group.stages
-        assert WorkflowStage.TEST_STRATEGY in group.stages
-
-    def test_get_parallel_group_for_stage_returns_none_for_non_first(
+    def test_get_parallel_group_returns_group_of_each_member(
         self, loop_with_parallel_groups: ExecutionLoop
     ) -> None:
-        """Returns None for stages that are not first in parallel group."""
-        # TEST_STRATEGY is second in the group, should not trigger parallel execution
-        group = loop_with_parallel_groups._get_parallel_group_for_stage(WorkflowStage.TEST_STRATEGY)
+        """Every stage in a parallel group belongs to it."""
+        stages_config = loop_with_parallel_groups.stages_config
 
-        assert group is None
+        for stage in (WorkflowStage.RESEARCH, WorkflowStage.TEST_STRATEGY):
+            group = stages_config.get_parallel_group(stage)
+            assert group is not None
+            assert group.name == "post_spec_review"
 
-    def test_get_parallel_group_for_stage_returns_none_for_non_parallel(
+    def test_get_parallel_group_returns_none_for_non_parallel(
         self, loop_with_parallel_groups: ExecutionLoop
     ) -> None:
         """Returns None for stages not in any parallel group."""
-        group = loop_with_parallel_groups._get_parallel_group_for_stage(WorkflowStage.SPEC)
-
-        assert group is None
+        stages_config = loop_with_parallel_groups.stages_config
+        assert stages_config.get_parallel_group(WorkflowStage.SPEC) is None
 
     @pytest.mark.asyncio
-    async def test_execute_parallel_group_runs_all_stages(
+    async def test_parallel_group_stages_run_concurrently(
         self, loop_with_parallel_groups: ExecutionLoop, mock_sdk_client: AsyncMock
     ) -> None:
-        """Parallel group execution runs all stages in the group."""
-        loop_with_parallel_groups.sdk_client = mock_sdk_client
-        loop_with_parallel_groups.review_iterator = None  # Not needed for work stages
+        """Stages of a parallel group are in progress at the same time."""
+        import asyncio
 
-        group = loop_with_parallel_groups.stages_config.parallel_groups[0]
-        progress_events: list[tuple[str, dict]] = []
+        started: dict[str, asyncio.Event] = {
+            "builder-1": asyncio.Event(),
+            "builder-2": asyncio.Event(),
+        }
 
-        success = await loop_with_parallel_groups._execute_parallel_group(
-            group=group,
-            on_progress=lambda e, d: progress_events.append((e, d)),
-        )
+        async def execute_streaming(agent_id, prompt, on_chunk=None):
+            if agent_id in started:
+                # Each group stage only finishes once the other one has started
+                started[agent_id].set()
+                await asyncio.wait_for(
+                    asyncio.gather(*(event.wait() for event in started.values())), 1
+                )
+            return "VERIFIED_APPROVED: Work completed successfully."
+
+        mock_sdk_client.execute_streaming.side_effect = execute_streaming
+        loop_with_parallel_groups.current_stage = WorkflowStage.RESEARCH
 
-        assert success is True
-        # Both stages should have outputs
+        result = await loop_with_parallel_groups.run(mock_sdk_client)
+
+        assert result == ExecutionResult.COMPLETE
         assert WorkflowStage.RESEARCH in loop_with_parallel_groups.stage_outputs
         assert WorkflowStage.TEST_STRATEGY in loop_with_parallel_groups.stage_outputs
 
     @pytest.mark.asyncio
-    async def test_execute_parallel_group_reports_progress(
+    async def test_parallel_group_reports_progress(
         self, loop_with_parallel_groups: ExecutionLoop, mock_sdk_client: AsyncMock
     ) -> None:
-        """Parallel group execution sends progress events."""
-        loop_with_parallel_groups.sdk_client = mock_sdk_client
-
-        group = loop_with_parallel_groups.stages_config.parallel_groups[0]
+        """Parallel group execution sends group and stage progress events."""
+        loop_with_parallel_groups.current_stage = WorkflowStage.RESEARCH
         progress_events: list[tuple[str, dict]] = []
 
-        await loop_with_parallel_groups._execute_parallel_group(
-            group=group,
+        await loop_with_parallel_groups.run(
+            mock_sdk_client,
             on_progress=lambda e, d: progress_events.append((e, d)),
         )
 
-        event_types = [e[0] for e in progress_events]
-        assert "parallel_group_start" in event_types
-        assert "parallel_group_complete" in event_types
+        group_events = [(e, d) for e, d in progress_events if e.startswith("parallel_")]
+        assert group_events[0] == (
+            "parallel_group_start",
+            {"group": "post_spec_review", "stages": ["RESEARCH", "TEST_STRATEGY"]},
+        )
+        assert group_events[-1] == (
+            "parallel_group_complete",
+            {"group": "post_spec_review", "all_success": True},
+        )
+        assert [e for e, _ in group_events].count("parallel_stage_complete") == 2
 
     @pytest.mark.asyncio
-    async def test_execute_parallel_group_handles_failure(
+    async def test_parallel_group_failure_lets_other_stages_finish(
         self, loop_with_parallel_groups: ExecutionLoop, mock_sdk_client: AsyncMock
     ) -> None:
-        """Parallel group allows all stages to complete even if one fails."""
-        # Make RESEARCH fail
-        call_count = 0
-
-        async def fail_then_succeed(*args, **kwargs):
-            nonlocal call_count
-            call_count += 1
-            if call_count == 1:  # First call (RESEARCH)
+        """A failing group stage doesn't cancel the others, then stops execution."""
+
+        async def execute_streaming(agent_id, prompt, on_chunk=None):
+            if agent_id == "builder-1":  # RESEARCH
                 raise RuntimeError("Simulated failure")
             return "VERIFIED_APPROVED: Work completed."
 
-        mock_sdk_client.execute_streaming.side_effect = fail_then_succeed
-        loop_with_parallel_groups.sdk_client = mock_sdk_client
-
-        group = loop_with_parallel_groups.stages_config.parallel_groups[0]
+        mock_sdk_client.execute_streaming.side_effect = execute_streaming
+        loop_with_parallel_groups.current_stage = WorkflowStage.RESEARCH
         progress_events: list[tuple[str, dict]] = []
 
-        success = await loop_with_parallel_groups._execute_parallel_group(
-            group=group,
-            on_progress=lambda e, d: progress_events.append((e, d)),
-        )
+        with pytest.raises(RuntimeError, match="Simulated failure"):
+            await loop_with_parallel_groups.run(
+                mock_sdk_client,
+                on_progress=lambda e, d: progress_events.append((e, d)),
+            )
 
-        # Overall should fail, but both stages should have been attempted
-        assert success is False
-        # Check that group status tracks failure
-        assert loop_with_parallel_groups.parallel_group_status.get("post_spec_review") is not None
+        stages = loop_with_parallel_groups.parallel_group_status["post_spec_review"]["stages"]
+        assert stages["RESEARCH"] == {"status": "failed", "error": "Simulated failure"}
+        assert stages["TEST_STRATEGY"]["status"] == "completed"
+        assert WorkflowStage.PLAN not in loop_with_parallel_groups.stage_outputs
+        assert loop_with_parallel_groups.current_stage == WorkflowStage.RESEARCH
+        assert (
+            "parallel_group_complete",
+            {"group": "post_spec_review", "all_success": False},
+        ) in progress_events
 
     @pytest.mark.asyncio
     async def test_run_executes_parallel_group_and_skips_to_plan(
@@ -1009,6 +1088,92 @@ class TestParallelGroupExecution:
         assert "PLAN" in stage_changes
 
 
+class TestSessionPrewarming:
+    """Tests for pre-warming sessions of upcoming stages."""
+
+    @pytest.fixture
+    def loop(self, objective_file: Path, teambot_dir_with_spec: Path) -> ExecutionLoop:
+        """Create ExecutionLoop instance with feature spec."""
+        return ExecutionLoop(
+            objective_path=objective_file,
+            config={},
+            teambot_dir=teambot_dir_with_spec,
+            max_hours=8.0,
+        )
+
+    def _agents(self, loop: ExecutionLoop, *stages: WorkflowStage) -> set[str]:
+        return {
+            agent
+            for stage in stages
+            for agent in loop.stages_config.get_stage_agents(stage).values()
+            if agent
+        }
+
+    @pytest.mark.asyncio
+    async def test_warms_current_and_next_stage_agents(
+        self, loop: ExecutionLoop, mock_sdk_client: AsyncMock
+    ) -> None:
+        """Each stage warms its own agents and those of the stage after it."""
+        await loop.run(mock_sdk_client)
+
+        warmed = set(mock_sdk_client.prewarm.call_args_list[0].args[0])
+        assert warmed == self._agents(loop, WorkflowStage.SETUP, WorkflowStage.BUSINESS_PROBLEM)
+
+    @pytest.mark.asyncio
+    async def test_parallel_group_warms_gate_agents(
+        self, objective_file: Path, teambot_dir_with_spec: Path, mock_sdk_client: AsyncMock
+    ) -> None:
+        """A parallel group stage warms the gate stage that waits for the group."""
+        import asyncio
+
+        loop = ExecutionLoop(
+            objective_path=objective_file,
+            config={},
+            teambot_dir=teambot_dir_with_spec,
+        )
+        group = loop.stages_config.parallel_groups[0]
+        loop.sdk_client = mock_sdk_client
+        loop.completed_stages = loop._stages_completed_before(group.stages[0])
+        loop._running_stages = set(group.stages)
+
+        loop._warm_ahead(group.stages[0])
+        await asyncio.gather(*loop._warming)
+
+        warmed = set(mock_sdk_client.prewarm.await_args.args[0])
+        assert warmed == self._agents(loop, group.stages[0], group.before)
+
+
+class TestStageTimeouts:
+    """Tests for per-stage request deadlines."""
+
+    @pytest.mark.asyncio
+    async def test_stage_timeout_applies_to_its_requests(
+        self, objective_file: Path, teambot_dir_with_spec: Path, mock_sdk_client: AsyncMock
+    ) -> None:
+        """Requests made for a stage get the stage's timeout_seconds as deadline."""
+        from teambot.copilot.resilience import RequestTimeouts
+
+        loop = ExecutionLoop(
+            objective_path=objective_file,
+            config={},
+            teambot_dir=teambot_dir_with_spec,
+        )
+        loop.sdk_client = mock_sdk_client
+        loop.stages_config.stages[WorkflowStage.RESEARCH].timeout_seconds = 42
+        deadlines = []
+
+        async def execute_streaming(agent_id, prompt, on_chunk=None):
+            deadlines.append(RequestTimeouts().deadline_for(agent_id).seconds)
+            return "Research done"
+
+        mock_sdk_client.execute_streaming.side_effect = execute_streaming
+
+        await loop._execute_work_stage(WorkflowStage.RESEARCH, None)
+        await loop._execute_work_stage(WorkflowStage.TEST_STRATEGY, None)
+
+        assert deadlines == [42, 1800.0]
+
+
 class TestStatePersistenceWithParallelGroups:
     """Tests for state persistence with parallel group status (TDD)."""
 
@@ -1165,13 +1330,39 @@ class TestStatePersistenceWithParallelGroups:
         loop = ExecutionLoop.resume(teambot_dir_with_spec, {})
         loop.stages_config = load_stages_config()
 
-        # Check that filter_incomplete_stages correctly identifies TEST_STRATEGY
-        group = loop.stages_config.parallel_groups[0]
-        incomplete = loop._filter_incomplete_stages(group)
+        # Only TEST_STRATEGY is left to run before the group's gate stage
+        loop.completed_stages = loop._stages_completed_before(loop.current_stage)
+        assert WorkflowStage.RESEARCH in loop.completed_stages
+        assert loop._ready_stages([]) == [WorkflowStage.TEST_STRATEGY]
+
+        started: list[str] = []
+
+        def on_progress(event: str, data: dict) -> None:
+            if event == "stage_changed":
+                started.append(data["stage"])
+
+        await loop.run(mock_sdk_client, on_progress=on_progress)
+
+        assert started[0] == "TEST_STRATEGY"
+        assert "RESEARCH" not in started
+
+    def test_save_and_resume_completed_stages(
+        self, objective_file: Path, teambot_dir: Path
+    ) -> None:
+        """Per-stage completion survives a save and resume."""
+        loop = ExecutionLoop(
+            objective_path=objective_file,
+            config={},
+            teambot_dir=teambot_dir,
+        )
+        loop.completed_stages = {WorkflowStage.SETUP, WorkflowStage.RESEARCH}
+        loop._save_state()
+
+        state = json.loads((loop.teambot_dir / "orchestration_state.json").read_text())
+        assert state["completed_stages"] == ["SETUP", "RESEARCH"]
 
-        assert len(incomplete) == 1
-        assert WorkflowStage.TEST_STRATEGY in incomplete
-        assert WorkflowStage.RESEARCH not in incomplete  # Already completed
+        resumed = ExecutionLoop.resume(teambot_dir, {})
+        assert resumed.completed_stages == {WorkflowStage.SETUP, WorkflowStage.RESEARCH}
 
 
 class TestOrchestrationLifecycleEvents:
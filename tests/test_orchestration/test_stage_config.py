@@ -200,6 +200,29 @@ class TestParseConfiguration:
 
         assert config.work_to_review_mapping[WorkflowStage.SPEC] == WorkflowStage.SPEC_REVIEW
 
+    def test_parse_stage_timeout(self) -> None:
+        """A stage's timeout_seconds is parsed; stages default to no deadline."""
+        data = {
+            "stages": {
+                "SPEC": {"name": "Spec", "timeout_seconds": 900},
+                "PLAN": {"name": "Plan"},
+            },
+            "stage_order": ["SPEC", "PLAN"],
+        }
+
+        config = _parse_configuration(data)
+
+        assert config.stages[WorkflowStage.SPEC].timeout_seconds == 900
+        assert config.stages[WorkflowStage.PLAN].timeout_seconds is None
+
+    @pytest.mark.parametrize("timeout", [0, -1, "10", True])
+    def test_parse_invalid_stage_timeout_raises_error(self, timeout) -> None:
+        """A non-positive or non-numeric timeout_seconds raises ValueError."""
+        data = {"stages": {"SPEC": {"name": "Spec", "timeout_seconds": timeout}}}
+
+        with pytest.raises(ValueError, match="Invalid timeout_seconds for stage SPEC"):
+            _parse_configuration(data)
+
 
 class TestStagesConfiguration:
     """Tests for StagesConfiguration methods."""
@@ -580,3 +603,67 @@ parallel_groups:
         config = _get_default_configuration()
         assert hasattr(config, "parallel_groups")
         assert isinstance(config.parallel_groups, list)
+
+
+class TestStageDependencies:
+    """Tests for stage dependencies."""
+
+    def _data(self, **depends_on: list[str]) -> dict:
+        names = ["SETUP", "SPEC", "RESEARCH", "TEST_STRATEGY", "PLAN", "COMPLETE"]
+        stages = {name: {"name": name} for name in names}
+        for name, dependencies in depends_on.items():
+            stages[name]["depends_on"] = dependencies
+        return {"stages": stages, "stage_order": names}
+
+    def test_default_depends_on_earlier_stages(self) -> None:
+        """Without depends_on a stage waits for every stage before it."""
+        config = _parse_configuration(self._data())
+
+        assert config.stages[WorkflowStage.PLAN].depends_on is None
+        assert config.get_dependencies(WorkflowStage.SETUP) == []
+        assert config.get_dependencies(WorkflowStage.RESEARCH) == [
+            WorkflowStage.SETUP,
+            WorkflowStage.SPEC,
+        ]
+
+    def test_parse_depends_on(self) -> None:
+        """Declared dependencies replace the stage order."""
+        config = _parse_configuration(self._data(RESEARCH=["SPEC"], TEST_STRATEGY=["SPEC"]))
+
+        assert config.get_dependencies(WorkflowStage.RESEARCH) == [WorkflowStage.SPEC]
+        assert config.get_dependencies(WorkflowStage.TEST_STRATEGY) == [WorkflowStage.SPEC]
+        assert WorkflowStage.RESEARCH in config.get_dependencies(WorkflowStage.PLAN)
+
+    def test_parallel_group_stages_depend_on_trigger(self) -> None:
+        """A parallel group is the same as its stages depending on its 'after' stage."""
+        data = self._data()
+        data["parallel_groups"] = {
+            "research": {"after": "SPEC", "stages": ["RESEARCH", "TEST_STRATEGY"], "before": "PLAN"}
+        }
+
+        config = _parse_configuration(data)
+
+        assert config.get_dependencies(WorkflowStage.TEST_STRATEGY) == [WorkflowStage.SPEC]
+        assert {WorkflowStage.RESEARCH, WorkflowStage.TEST_STRATEGY} <= set(
+            config.get_dependencies(WorkflowStage.PLAN)
+        )
+
+    def test_unknown_dependency_raises_error(self) -> None:
+        """depends_on must name known stages."""
+        with pytest.raises(ValueError, match="Unknown stage in depends_on for stage PLAN"):
+            _parse_configuration(self._data(PLAN=["NOPE"]))
+
+    def test_depends_on_must_be_list(self) -> None:
+        """depends_on must be a list."""
+        with pytest.raises(ValueError, match="Invalid depends_on for stage PLAN"):
+            _parse_configuration(self._data(PLAN="SPEC"))
+
+    def test_dependency_outside_stage_order_raises_error(self) -> None:
+        """A stage can't depend on a stage that never runs."""
+        with pytest.raises(ValueError, match="IMPLEMENTATION, which is not in stage_order"):
+            _parse_configuration(self._data(PLAN=["IMPLEMENTATION"]))
+
+    def test_cycle_raises_error(self) -> None:
+        """Circular dependencies are rejected."""
+        with pytest.raises(ValueError, match="cycle: SPEC -> PLAN -> SPEC"):
+            _parse_configuration(self._data(SPEC=["PLAN"]))
@@ -2,13 +2,18 @@
 
 from unittest.mock import MagicMock
 
+from teambot.copilot.response_cache import ResponseCache, make_key
+from teambot.copilot.session_pool import PoolStats
 from teambot.repl.commands import (
     SystemCommands,
+    handle_cache,
     handle_cancel,
     handle_help,
+    handle_queue,
     handle_task,
     handle_tasks,
 )
+from teambot.tasks.lanes import LaneStats
 from teambot.tasks.models import Task, TaskResult, TaskStatus
 
 
@@ -62,6 +67,55 @@ class TestHandleTasks:
         assert "Plan the feature" in result.output
         assert "Build it" in result.output
 
+    def test_timed_out_tasks_counted(self):
+        """Test timed-out tasks are flagged and counted."""
+        hung = Task(id="1", agent_id="pm", prompt="Plan", timeout=30.0)
+        hung.mark_timed_out()
+        executor = MagicMock()
+        executor.list_tasks.return_value = [
+            hung,
+            Task(id="2", agent_id="ba", prompt="Analyze", status=TaskStatus.COMPLETED),
+        ]
+
+        result = handle_tasks([], executor)
+
+        assert "Timed Out" in result.output
+        assert "Timed out: 1" in result.output
+
+    def test_critical_path_shown(self):
+        """Test the critical path and ETA are shown while work is pending."""
+        from datetime import datetime
+
+        from teambot.tasks.critical_path import CriticalPath
+
+        tasks = {
+            "1": Task(id="1", agent_id="pm", prompt="Plan", status=TaskStatus.RUNNING),
+            "2": Task(id="2", agent_id="ba", prompt="Analyze", dependencies=["1"]),
+        }
+        executor = MagicMock()
+        executor.list_tasks.return_value = list(tasks.values())
+        executor.get_task.side_effect = tasks.get
+        executor.get_critical_path.return_value = CriticalPath(
+            task_ids=["1", "2"], remaining=200.0, eta=datetime(2026, 1, 1, 14, 32, 5)
+        )
+
+        result = handle_tasks([], executor)
+
+        assert "Critical path: #1 @pm -> #2 @ba (~3m 20s remaining)" in result.output
+        assert "Estimated completion: 14:32:05" in result.output
+
+    def test_critical_path_hidden_when_all_finished(self):
+        """Test no critical path is shown when every listed task has finished."""
+        executor = MagicMock()
+        executor.list_tasks.return_value = [
+            Task(id="1", agent_id="pm", prompt="Plan", status=TaskStatus.COMPLETED),
+        ]
+
+        result = handle_tasks([], executor)
+
+        assert "Critical path" not in result.output
+        executor.get_critical_path.assert_not_called()
+
     def test_filter_by_status(self):
         """Test filtering tasks by status."""
         executor = MagicMock()
@@ -182,6 +236,127 @@ class TestHandleCancel:
         assert "Could not cancel" in result.output
 
 
+class TestHandleQueue:
+    """Tests for /queue command."""
+
+    def test_no_executor(self):
+        """Test error when no executor."""
+        result = handle_queue([], None)
+        assert not result.success
+        assert "not available" in result.output
+
+    def test_no_lanes(self):
+        """Test when no agent has run yet."""
+        executor = MagicMock()
+        executor.get_lane_stats.return_value = []
+        executor.get_session_pool_stats.return_value = []
+
+        result = handle_queue([], executor)
+        assert result.success
+        assert "No agent lanes" in result.output
+
+    def test_shows_lane_depths(self):
+        """Test lane depths are listed per agent."""
+        executor = MagicMock()
+        executor.get_lane_stats.return_value = [
+            LaneStats("ba", limit=1, running=0, queued_foreground=0, queued_background=0),
+            LaneStats("pm", limit=1, running=1, queued_foreground=1, queued_background=2),
+        ]
+        executor.get_session_pool_stats.return_value = []
+
+        result = handle_queue([], executor)
+        assert result.success
+        pm_line = next(line for line in result.output.splitlines() if "@pm" in line)
+        assert "1/1" in pm_line
+        assert "3" in pm_line
+        assert "1/2" in pm_line
+
+    def test_shows_session_pool_utilization(self):
+        """Test session pool usage is listed per agent and model."""
+        executor = MagicMock()
+        executor.get_lane_stats.return_value = []
+        executor.get_session_pool_stats.return_value = [
+            PoolStats("builder-1", model="gpt-5", in_use=2, idle=1, waiting=3, max_sessions=3),
+        ]
+
+        result = handle_queue([], executor)
+        assert result.success
+        assert "Session Pools" in result.output
+        line = next(line for line in result.output.splitlines() if "@builder-1" in line)
+        assert "gpt-5" in line
+        assert "2/3" in line
+
+    def test_dispatch_queue(self):
+        """Test dispatching /queue."""
+        executor = MagicMock()
+        executor.get_lane_stats.return_value = []
+        executor.get_session_pool_stats.return_value = []
+
+        cmds = SystemCommands(executor=executor)
+        result = cmds.dispatch("queue", [])
+
+        assert result.success
+
+
+class TestHandleCache:
+    """Tests for /cache command."""
+
+    @staticmethod
+    def _executor(cache):
+        executor = MagicMock()
+        executor.get_response_cache.return_value = cache
+        return executor
+
+    def test_no_executor(self):
+        """Test error when no executor."""
+        result = handle_cache([], None)
+        assert not result.success
+        assert "not available" in result.output
+
+    def test_cache_disabled(self):
+        """Test hint when response caching is not enabled."""
+        result = handle_cache(["stats"], self._executor(None))
+        assert result.success
+        assert "disabled" in result.output
+
+    def test_stats(self, tmp_path):
+        """Test stats show entries and hit counts."""
+        cache = ResponseCache(tmp_path)
+        key = make_key("pm", None, "Plan it")
+        cache.put(key, "The plan", "pm", None)
+        cache.get(key)
+
+        result = handle_cache([], self._executor(cache))
+
+        assert result.success
+        assert "Entries:   1" in result.output
+        assert "Hits:      1 (100%)" in result.output
+
+    def test_clear(self, tmp_path):
+        """Test clear empties the cache."""
+        cache = ResponseCache(tmp_path)
+        cache.put(make_key("pm", None, "Plan it"), "The plan", "pm", None)
+
+        result = handle_cache(["clear"], self._executor(cache))
+
+        assert result.success
+        assert "Cleared 1" in result.output
+        assert cache.stats().entries == 0
+
+    def test_unknown_subcommand(self):
+        """Test usage error for unknown subcommands."""
+        result = handle_cache(["purge"], self._executor(None))
+        assert not result.success
+        assert "Usage" in result.output
+
+    def test_dispatch_cache(self):
+        """Test dispatching /cache."""
+        cmds = SystemCommands(executor=self._executor(None))
+        result = cmds.dispatch("cache", ["stats"])
+
+        assert result.success
+
+
 class TestSystemCommandsTaskIntegration:
     """Tests for SystemCommands with task executor."""
 
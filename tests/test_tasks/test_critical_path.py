@@ -0,0 +1,143 @@
+"""Tests for critical-path estimates."""
+
+from datetime import datetime, timedelta
+
+from teambot.tasks.critical_path import (
+    DEFAULT_TASK_ESTIMATE,
+    LatencyEstimator,
+    find_critical_path,
+    remaining_work,
+)
+from teambot.tasks.graph import TaskGraph
+from teambot.tasks.models import Task
+
+
+def _build(edges: dict[str, list[str]], agents: dict[str, str] | None = None):
+    """Build a graph and task map from task_id -> dependencies."""
+    graph = TaskGraph()
+    tasks = {}
+    for task_id, deps in edges.items():
+        graph.add_task(task_id, deps)
+        agent = (agents or {}).get(task_id, "pm")
+        tasks[task_id] = Task(id=task_id, agent_id=agent, prompt="p", dependencies=deps)
+    return graph, tasks
+
+
+class TestLatencyEstimator:
+    """Tests for LatencyEstimator."""
+
+    def test_default_without_history(self):
+        """Unknown agents use the default estimate when nothing has run."""
+        assert LatencyEstimator().estimate("pm") == DEFAULT_TASK_ESTIMATE
+
+    def test_first_sample_sets_average(self):
+        """The first sample becomes the agent's estimate."""
+        estimator = LatencyEstimator()
+        estimator.record("pm", 10.0)
+
+        assert estimator.estimate("pm") == 10.0
+
+    def test_moving_average(self):
+        """Later samples move the estimate towards the new value."""
+        estimator = LatencyEstimator()
+        estimator.record("pm", 10.0)
+        estimator.record("pm", 20.0)
+
+        assert 10.0 < estimator.estimate("pm") < 20.0
+
+    def test_unknown_agent_uses_mean_of_others(self):
+        """Agents without history use the mean of other agents."""
+        estimator = LatencyEstimator()
+        estimator.record("pm", 10.0)
+        estimator.record("ba", 30.0)
+
+        assert estimator.estimate("writer") == 20.0
+
+    def test_record_task(self):
+        """Task durations are taken from started_at/completed_at."""
+        estimator = LatencyEstimator()
+        task = Task(id="t1", agent_id="pm", prompt="p")
+        task.started_at = datetime(2026, 1, 1, 12, 0, 0)
+        task.completed_at = datetime(2026, 1, 1, 12, 0, 42)
+
+        estimator.record_task(task)
+
+        assert estimator.estimate("pm") == 42.0
+
+
+class TestRemainingWork:
+    """Tests for remaining_work."""
+
+    def test_chain_sums_estimates(self):
+        """A chain's head carries the whole chain's work."""
+        graph, tasks = _build({"a": [], "b": ["a"], "c": ["b"]})
+
+        work = remaining_work(["a"], graph, tasks, lambda t: 10.0)
+
+        assert work == {"a": 30.0, "b": 20.0, "c": 10.0}
+
+    def test_branches_take_longest(self):
+        """A task's value follows its longest downstream branch."""
+        graph, tasks = _build(
+            {"root": [], "slow": ["root"], "fast": ["root"]},
+            agents={"slow": "builder-1", "fast": "pm", "root": "pm"},
+        )
+
+        def estimate(task: Task) -> float:
+            return 50.0 if task.agent_id == "builder-1" else 5.0
+
+        work = remaining_work(["root"], graph, tasks, estimate)
+
+        assert work["root"] == 55.0
+
+    def test_finished_tasks_count_as_zero(self):
+        """Completed tasks add no remaining work."""
+        graph, tasks = _build({"a": [], "b": ["a"]})
+        tasks["b"].mark_completed("done")
+
+        work = remaining_work(["a"], graph, tasks, lambda t: 10.0)
+
+        assert work["a"] == 10.0
+
+    def test_long_chain_does_not_recurse(self):
+        """Very long chains are handled without hitting the recursion limit."""
+        edges = {"t0": []}
+        for i in range(1, 5000):
+            edges[f"t{i}"] = [f"t{i - 1}"]
+        graph, tasks = _build(edges)
+
+        work = remaining_work(["t0"], graph, tasks, lambda t: 1.0)
+
+        assert work["t0"] == 5000.0
+
+
+class TestFindCriticalPath:
+    """Tests for find_critical_path."""
+
+    def test_follows_longest_chain(self):
+        """The path starts at the head of the longest chain."""
+        graph, tasks = _build({"a": [], "b": ["a"], "c": ["b"], "x": []})
+        now = datetime(2026, 1, 1, 12, 0, 0)
+
+        path = find_critical_path(graph, tasks, lambda t: 10.0, max_concurrent=4, now=now)
+
+        assert path.task_ids == ["a", "b", "c"]
+        assert path.remaining == 30.0
+        assert path.eta == now + timedelta(seconds=30)
+
+    def test_eta_bounded_by_concurrency(self):
+        """Many independent tasks on few slots push the ETA out."""
+        graph, tasks = _build({f"t{i}": [] for i in range(6)})
+        now = datetime(2026, 1, 1, 12, 0, 0)
+
+        path = find_critical_path(graph, tasks, lambda t: 10.0, max_concurrent=2, now=now)
+
+        assert path.remaining == 10.0
+        assert path.eta == now + timedelta(seconds=30)
+
+    def test_none_when_all_finished(self):
+        """No path is returned once every task has finished."""
+        graph, tasks = _build({"a": []})
+        tasks["a"].mark_completed("done")
+
+        assert find_critical_path(graph, tasks, lambda t: 10.0, max_concurrent=1) is None
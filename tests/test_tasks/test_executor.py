@@ -531,6 +531,91 @@ class TestTaskExecutorBasic:
         mock_sdk.execute.assert_called_once()
 
 
+class TestTaskExecutorTimeout:
+    """Tests for task timeouts through the executor."""
+
+    @pytest.mark.asyncio
+    async def test_timeout_aborts_sdk_request(self):
+        """Test that a timed-out task aborts the agent's SDK request."""
+        import asyncio
+
+        async def hang(agent_id, prompt):
+            await asyncio.Event().wait()
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = hang
+
+        executor = TaskExecutor(sdk_client=mock_sdk, default_timeout=0.05)
+        result = await executor.execute(parse_command("@pm Create a plan"))
+
+        assert not result.success
+        assert "Timed out" in result.error
+        mock_sdk.cancel_current_request.assert_awaited_once_with("pm", result.task_id)
+
+
+class TestTaskExecutorCancel:
+    """Tests for cancelling tasks through the executor."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_background_task_aborts_sdk_request(self):
+        """Test cancelling a running background task stops it and aborts the request."""
+        import asyncio
+
+        from teambot.copilot.sdk_client import _request_key
+
+        started = asyncio.Event()
+        request_keys = []
+
+        async def hang(agent_id, prompt):
+            request_keys.append(_request_key.get())
+            started.set()
+            await asyncio.Event().wait()
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = hang
+        on_complete = MagicMock()
+
+        executor = TaskExecutor(sdk_client=mock_sdk, on_task_complete=on_complete)
+        result = await executor.execute(parse_command("@pm Create a plan &"))
+        bg_task = executor._background_tasks[result.task_id]
+        await started.wait()
+
+        assert executor.cancel_task(result.task_id)
+        await asyncio.wait_for(bg_task, timeout=1.0)
+
+        assert executor.get_task(result.task_id).status == TaskStatus.CANCELLED
+        # The request was tagged with its task, and only that task's request aborted
+        assert request_keys == [result.task_id]
+        mock_sdk.cancel_current_request.assert_awaited_once_with("pm", result.task_id)
+        on_complete.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_cancel_pipeline_stage_cancels_later_stages(self):
+        """Test cancelling a running pipeline stage cancels the stages after it."""
+        import asyncio
+
+        started = asyncio.Event()
+
+        async def hang(agent_id, prompt):
+            started.set()
+            await asyncio.Event().wait()
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = hang
+
+        executor = TaskExecutor(sdk_client=mock_sdk)
+        result = await executor.execute(parse_command("@pm Plan -> @ba Analyze -> @writer Doc &"))
+        first_id, *rest = result.task_ids
+        bg_task = executor._background_tasks[first_id]
+        await started.wait()
+
+        executor.cancel_task(first_id)
+        await asyncio.wait_for(bg_task, timeout=1.0)
+
+        assert all(executor.get_task(t).status == TaskStatus.CANCELLED for t in result.task_ids)
+        mock_sdk.cancel_current_request.assert_awaited_once_with("pm", first_id)
+
+
 class TestTaskExecutorBackground:
     """Tests for background task execution."""
 
@@ -575,6 +660,37 @@ class TestTaskExecutorBackground:
         task = executor.get_task(result.task_id)
         assert task is not None
 
+    @pytest.mark.asyncio
+    async def test_finished_background_task_is_forgotten(self):
+        """Test that finished background futures are dropped from tracking."""
+        import asyncio
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = AsyncMock(return_value="Done")
+
+        executor = TaskExecutor(sdk_client=mock_sdk)
+        result = await executor.execute(parse_command("@pm Create a plan &"))
+
+        assert result.task_id in executor._background_tasks
+        await executor._background_tasks[result.task_id]
+        await asyncio.sleep(0)
+
+        assert executor._background_tasks == {}
+
+    def test_retention_configured_from_config(self, tmp_path):
+        """Test that config enables retention with an archive in teambot_dir."""
+        mock_sdk = AsyncMock()
+        config = {
+            "teambot_dir": str(tmp_path),
+            "agents": [],
+            "task_retention": {"max_tasks": 10},
+        }
+
+        executor = TaskExecutor(sdk_client=mock_sdk, config=config)
+
+        assert executor._manager._retention.max_tasks == 10
+        assert executor._manager._archive.directory == tmp_path / "tasks"
+
 
 class TestTaskExecutorMultiAgent:
     """Tests for multi-agent fan-out."""
@@ -721,6 +837,89 @@ class TestTaskExecutorPipeline:
         # Builder should not have been called - only pm
         assert call_count["count"] == 1
 
+    @pytest.mark.asyncio
+    async def test_pipeline_stage_agents_run_concurrently(self):
+        """Test that agents within a stage overlap instead of running in turn."""
+        import asyncio
+
+        running = 0
+        max_running = 0
+
+        async def slow_execute(agent_id, prompt):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return f"{agent_id} output"
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = slow_execute
+
+        executor = TaskExecutor(sdk_client=mock_sdk)
+        cmd = parse_command("@builder-1,builder-2 Build -> @reviewer Review")
+
+        result = await executor.execute(cmd)
+
+        assert result.success
+        assert max_running == 2
+        # Output order still follows the stage definition
+        assert result.output.index("builder-1 output") < result.output.index("builder-2 output")
+
+    @pytest.mark.asyncio
+    async def test_pipeline_stage_respects_max_concurrent(self):
+        """Test that stage concurrency is bounded by the manager limit."""
+        import asyncio
+
+        running = 0
+        max_running = 0
+
+        async def slow_execute(agent_id, prompt):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return "Done"
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = slow_execute
+
+        executor = TaskExecutor(sdk_client=mock_sdk, max_concurrent=1)
+        cmd = parse_command("@builder-1,builder-2 Build -> @reviewer Review")
+
+        await executor.execute(cmd)
+
+        assert max_running == 1
+
+    @pytest.mark.asyncio
+    async def test_background_pipeline_stage_agents_run_concurrently(self):
+        """Test that background pipelines also run stage agents concurrently."""
+        import asyncio
+
+        running = 0
+        max_running = 0
+        done = asyncio.Event()
+
+        async def slow_execute(agent_id, prompt):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.05)
+            running -= 1
+            return "Done"
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = slow_execute
+
+        executor = TaskExecutor(sdk_client=mock_sdk, on_pipeline_complete=done.set)
+        cmd = parse_command("@builder-1,builder-2 Build -> @reviewer Review &")
+
+        await executor.execute(cmd)
+        await asyncio.wait_for(done.wait(), timeout=1.0)
+
+        assert max_running == 2
+
 
 class TestTaskExecutorStatus:
     """Tests for task status reporting."""
@@ -1055,6 +1254,34 @@ class TestExecutorReferences:
         pm_start_idx = call_order.index("pm_start")
         assert ba_end_idx < pm_start_idx
 
+    @pytest.mark.asyncio
+    async def test_reference_timeout_returns_error(self):
+        """Test that waiting on a stalled reference honours the timeout."""
+        import asyncio
+
+        release = asyncio.Event()
+
+        async def tracked_execute(agent_id, prompt):
+            if agent_id == "ba":
+                await release.wait()
+            return f"{agent_id} output"
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = tracked_execute
+
+        executor = TaskExecutor(sdk_client=mock_sdk, reference_timeout=0.05)
+
+        await executor.execute(parse_command("@ba Analyze &"))
+        await asyncio.sleep(0)
+
+        result = await executor.execute(parse_command("@pm Summarize $ba"))
+
+        assert not result.success
+        assert "$ba" in result.error
+
+        release.set()
+        await asyncio.sleep(0)
+
     @pytest.mark.asyncio
     async def test_reference_with_background(self):
         """Test reference parsing with background operator."""
@@ -1317,6 +1544,30 @@ class TestPipelineStageCallbacks:
         # Should have completed both tasks
         assert sorted(completed_tasks) == ["ba", "pm"]
 
+    @pytest.mark.asyncio
+    async def test_concurrent_stage_emits_outputs_in_stage_order(self):
+        """Test stage outputs keep stage order even if later agents finish first."""
+        import asyncio
+
+        async def execute(agent_id, prompt):
+            await asyncio.sleep(0.05 if agent_id == "builder-1" else 0.0)
+            return f"{agent_id} output"
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = execute
+
+        stage_outputs = []
+
+        executor = TaskExecutor(
+            sdk_client=mock_sdk,
+            on_stage_output=lambda agent_id, output: stage_outputs.append(agent_id),
+        )
+
+        cmd = parse_command("@builder-1,builder-2 Build -> @reviewer Review")
+        await executor.execute(cmd)
+
+        assert stage_outputs == ["builder-1", "builder-2", "reviewer"]
+
     @pytest.mark.asyncio
     async def test_multiagent_stage_emits_all_agents(self):
         """Test that multi-agent stage reports all agents in stage change."""
@@ -1617,3 +1868,177 @@ class TestTaskExecutorAgentValidation:
 
         assert not result.success
         assert "ba, builder-1, builder-2, notify, pm, reviewer, writer" in result.error
+
+
+class TestTaskExecutorBatch:
+    """Tests for execute_many() batch submission."""
+
+    @staticmethod
+    async def _collect(executor, lines):
+        commands = [parse_command(line) for line in lines]
+        return [item async for item in executor.execute_many(commands)]
+
+    @pytest.mark.asyncio
+    async def test_yields_result_per_command(self):
+        """Every command in the batch gets a result."""
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = AsyncMock(side_effect=lambda agent_id, prompt: f"{agent_id} done")
+        executor = TaskExecutor(sdk_client=mock_sdk)
+
+        items = await self._collect(executor, ["@pm Plan", "@ba Analyze", "@writer Document"])
+
+        by_index = {item.index: item.result for item in items}
+        assert sorted(by_index) == [0, 1, 2]
+        assert by_index[0].success
+        assert by_index[1].output == "ba done"
+        assert by_index[2].task_id is not None
+
+    @pytest.mark.asyncio
+    async def test_notifies_task_start_and_status(self):
+        """Batch tasks report start, completion and agent status like execute() does."""
+        from teambot.ui.agent_state import AgentState, AgentStatusManager
+
+        running_during_call = []
+        status_manager = AgentStatusManager()
+
+        async def execute(agent_id, prompt):
+            running_during_call.append(status_manager.get(agent_id).state)
+            return f"{agent_id} done"
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = AsyncMock(side_effect=execute)
+        started, completed = [], []
+        executor = TaskExecutor(
+            sdk_client=mock_sdk,
+            on_task_started=lambda task: started.append(task.agent_id),
+            on_task_complete=lambda task, result: completed.append(task.agent_id),
+            agent_status_manager=status_manager,
+        )
+
+        await self._collect(executor, ["@pm Plan", "@ba Analyze $pm"])
+
+        assert started == ["pm", "ba"]
+        assert sorted(completed) == ["ba", "pm"]
+        assert running_during_call == [AgentState.RUNNING, AgentState.RUNNING]
+        assert status_manager.get("pm").state == AgentState.IDLE
+        assert status_manager.get("ba").state == AgentState.IDLE
+
+    @pytest.mark.asyncio
+    async def test_reference_to_batch_command_becomes_dependency(self):
+        """A $ref to an earlier command waits for it and receives its output."""
+        prompts = {}
+
+        async def execute(agent_id, prompt):
+            prompts[agent_id] = prompt
+            return f"{agent_id} output"
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = AsyncMock(side_effect=execute)
+        executor = TaskExecutor(sdk_client=mock_sdk)
+
+        items = await self._collect(executor, ["@pm Plan", "@ba Review $pm"])
+
+        by_index = {item.index: item.result for item in items}
+        ba_task = executor.get_task(by_index[1].task_id)
+        assert ba_task.dependencies == [by_index[0].task_id]
+        assert "pm output" in prompts["ba"]
+
+    @pytest.mark.asyncio
+    async def test_reference_outside_batch_uses_latest_result(self):
+        """A $ref to an agent not in the batch injects its existing result."""
+        prompts = {}
+
+        async def execute(agent_id, prompt):
+            prompts[agent_id] = prompt
+            return f"{agent_id} output"
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = AsyncMock(side_effect=execute)
+        executor = TaskExecutor(sdk_client=mock_sdk)
+        await executor.execute(parse_command("@pm Plan"))
+
+        items = await self._collect(executor, ["@ba Review $pm"])
+
+        ba_task = executor.get_task(items[0].result.task_id)
+        assert ba_task.dependencies == []
+        assert "pm output" in prompts["ba"]
+
+    @pytest.mark.asyncio
+    async def test_results_stream_in_completion_order(self):
+        """A fast command is yielded before a slow one submitted earlier."""
+        import asyncio
+
+        async def execute(agent_id, prompt):
+            if agent_id == "pm":
+                await asyncio.sleep(0.05)
+            return f"{agent_id} done"
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = AsyncMock(side_effect=execute)
+        executor = TaskExecutor(sdk_client=mock_sdk)
+
+        items = await self._collect(executor, ["@pm Slow", "@ba Fast"])
+
+        assert [item.index for item in items] == [1, 0]
+
+    @pytest.mark.asyncio
+    async def test_failed_reference_skips_dependent(self):
+        """A command whose only referenced batch task failed is skipped."""
+
+        async def execute(agent_id, prompt):
+            if agent_id == "pm":
+                raise RuntimeError("boom")
+            return "ok"
+
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = AsyncMock(side_effect=execute)
+        executor = TaskExecutor(sdk_client=mock_sdk)
+
+        items = await self._collect(executor, ["@pm Plan", "@ba Review $pm"])
+
+        by_index = {item.index: item.result for item in items}
+        assert not by_index[0].success
+        assert not by_index[1].success
+        assert executor.get_task(by_index[1].task_id).status == TaskStatus.SKIPPED
+
+    @pytest.mark.asyncio
+    async def test_invalid_command_does_not_block_batch(self):
+        """Invalid commands fail individually while the rest run."""
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = AsyncMock(return_value="done")
+        executor = TaskExecutor(sdk_client=mock_sdk)
+
+        items = await self._collect(executor, ["@fake-agent Do it", "@pm Plan"])
+
+        by_index = {item.index: item.result for item in items}
+        assert "Unknown agent: 'fake-agent'" in by_index[0].error
+        assert by_index[1].success
+
+    @pytest.mark.asyncio
+    async def test_pipeline_and_fan_out_in_batch(self):
+        """Pipelines and multi-agent commands run inside the combined graph."""
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = AsyncMock(side_effect=lambda agent_id, prompt: f"{agent_id} done")
+        executor = TaskExecutor(sdk_client=mock_sdk)
+
+        items = await self._collect(executor, ["@pm Plan -> @ba Analyze", "@writer,reviewer Go"])
+
+        by_index = {item.index: item.result for item in items}
+        assert len(by_index[0].task_ids) == 2
+        assert "ba done" in by_index[0].output
+        assert "writer done" in by_index[1].output
+        assert "reviewer done" in by_index[1].output
+        ba_task = executor.get_task(by_index[0].task_ids[1])
+        assert ba_task.dependencies == [by_index[0].task_ids[0]]
+
+    @pytest.mark.asyncio
+    async def test_pseudo_agent_commands_run_last(self):
+        """Commands for @notify run after the task graph has finished."""
+        mock_sdk = AsyncMock()
+        mock_sdk.execute = AsyncMock(return_value="done")
+        executor = TaskExecutor(sdk_client=mock_sdk)
+
+        items = await self._collect(executor, ["@notify Starting", "@pm Plan"])
+
+        assert [item.index for item in items] == [1, 0]
+        assert items[1].result.success
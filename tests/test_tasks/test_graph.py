@@ -207,3 +207,95 @@ class TestTaskGraphFailureHandling:
 
         # Now both parents failed, t3 should be skipped
         assert "t3" in to_skip
+
+
+class TestTaskGraphIncrementalReadiness:
+    """Tests for the incrementally maintained ready set."""
+
+    def test_ready_set_follows_completion(self):
+        """Test dependents join the ready set once all parents complete."""
+        graph = TaskGraph()
+        graph.add_task("a", [])
+        graph.add_task("b", [])
+        graph.add_task("c", ["a", "b"])
+
+        graph.mark_completed("a")
+        assert graph.get_ready_tasks() == ["b"]
+
+        graph.mark_completed("b")
+        assert graph.get_ready_tasks() == ["c"]
+
+    def test_mark_completed_twice_is_idempotent(self):
+        """Test repeated completion does not double-decrement dependents."""
+        graph = TaskGraph()
+        graph.add_task("a", [])
+        graph.add_task("b", [])
+        graph.add_task("c", ["a", "b"])
+
+        graph.mark_completed("a")
+        graph.mark_completed("a")
+
+        assert "c" not in graph.get_ready_tasks()
+
+    def test_task_added_after_dependency_completed(self):
+        """Test a task whose dependencies already completed is ready at once."""
+        graph = TaskGraph()
+        graph.add_task("a", [])
+        graph.mark_completed("a")
+
+        graph.add_task("b", ["a"])
+
+        assert graph.get_ready_tasks() == ["b"]
+
+    def test_failed_and_skipped_tasks_leave_ready_set(self):
+        """Test failure removes the task and skipped dependents from ready."""
+        graph = TaskGraph()
+        graph.add_task("a", [])
+        graph.add_task("b", ["a"])
+        graph.add_task("c", [])
+
+        graph.mark_failed("a")
+
+        assert graph.get_ready_tasks() == ["c"]
+
+    def test_forward_reference_cycle_detected(self):
+        """Test a cycle through a not-yet-defined dependency is detected."""
+        graph = TaskGraph()
+        graph.add_task("b", ["a"])
+        graph.add_task("c", ["b"])
+
+        with pytest.raises(CycleDetectedError):
+            graph.add_task("a", ["c"])
+
+        # The rejected definition leaves the graph untouched
+        assert graph.task_count == 2
+        assert graph.get_dependents("c") == []
+
+    def test_readd_task_replaces_dependencies(self):
+        """Test re-adding a task rewires its edges."""
+        graph = TaskGraph()
+        graph.add_task("a", [])
+        graph.add_task("b", [])
+        graph.add_task("c", ["a"])
+
+        graph.add_task("c", ["b"])
+
+        assert graph.get_dependents("a") == []
+        assert graph.get_dependents("b") == ["c"]
+        graph.mark_completed("b")
+        assert "c" in graph.get_ready_tasks()
+
+    def test_remove_settled_task(self):
+        """Test removing a settled task detaches it from the graph."""
+        graph = TaskGraph()
+        graph.add_task("a", [])
+        graph.add_task("b", ["a"])
+        graph.mark_completed("a")
+        graph.mark_completed("b")
+
+        graph.remove_task("a")
+
+        assert graph.task_count == 1
+        assert graph.get_dependencies("b") == []
+        assert graph.get_dependents("a") == []
+        assert graph.get_topological_order() == ["b"]
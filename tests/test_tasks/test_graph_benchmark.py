@@ -0,0 +1,63 @@
+"""Benchmarks for TaskGraph build and drain scaling."""
+
+import gc
+import time
+
+import pytest
+
+from teambot.tasks.graph import TaskGraph
+
+
+def _build_and_drain(size: int) -> float:
+    """Build a mixed chain/fan-out graph of ``size`` tasks and drain it.
+
+    Args:
+        size: Number of tasks in the graph.
+
+    Returns:
+        Elapsed wall-clock seconds.
+    """
+    start = time.perf_counter()
+
+    graph = TaskGraph()
+    graph.add_task("t0", [])
+    for i in range(1, size):
+        # Every task depends on its predecessor; every tenth also fans in
+        # from the task ten positions back.
+        deps = [f"t{i - 1}"]
+        if i >= 10 and i % 10 == 0:
+            deps.append(f"t{i - 10}")
+        graph.add_task(f"t{i}", deps)
+
+    drained = 0
+    while ready := graph.get_ready_tasks():
+        for task_id in ready:
+            graph.mark_completed(task_id)
+            drained += 1
+
+    assert drained == size
+    return time.perf_counter() - start
+
+
+def _best_of(runs: int, size: int) -> float:
+    # Collector pauses dominate the noise at this scale
+    gc.disable()
+    try:
+        return min(_build_and_drain(size) for _ in range(runs))
+    finally:
+        gc.enable()
+
+
+@pytest.mark.slow
+class TestTaskGraphBenchmark:
+    """Scaling benchmarks for TaskGraph."""
+
+    def test_10k_graph_builds_and_drains_in_linear_time(self):
+        """Test doubling the graph size roughly doubles build+drain time."""
+        small = _best_of(5, 5_000)
+        large = _best_of(5, 10_000)
+
+        # Linear scaling gives a ratio near 2; a quadratic implementation
+        # is at 4 or above.
+        assert large / small < 3.5, f"5k: {small:.4f}s, 10k: {large:.4f}s"
+        assert large < 1.0
@@ -0,0 +1,148 @@
+"""Tests for per-agent execution lanes."""
+
+import asyncio
+
+import pytest
+
+from teambot.tasks.lanes import AgentLane, LanePriority, LaneScheduler
+
+
+class TestAgentLane:
+    """Tests for a single agent lane."""
+
+    @pytest.mark.asyncio
+    async def test_acquire_within_limit(self):
+        """Requests under the limit are admitted immediately."""
+        lane = AgentLane("pm", limit=2)
+
+        await lane.acquire()
+        await lane.acquire()
+
+        assert lane.running == 2
+        assert not lane.has_capacity()
+
+    @pytest.mark.asyncio
+    async def test_release_hands_over_to_waiter(self):
+        """Releasing the lane admits the next waiter."""
+        lane = AgentLane("pm")
+        await lane.acquire()
+
+        waiter = asyncio.create_task(lane.acquire())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+        assert lane.stats().queued_foreground == 1
+
+        lane.release()
+        await waiter
+
+        assert lane.running == 1
+
+    @pytest.mark.asyncio
+    async def test_foreground_served_before_background(self):
+        """Foreground waiters jump ahead of earlier background waiters."""
+        lane = AgentLane("pm")
+        await lane.acquire()
+        order = []
+
+        async def request(name, priority):
+            await lane.acquire(priority)
+            order.append(name)
+            lane.release()
+
+        bg = asyncio.create_task(request("bg", LanePriority.BACKGROUND))
+        await asyncio.sleep(0)
+        fg = asyncio.create_task(request("fg", LanePriority.FOREGROUND))
+        await asyncio.sleep(0)
+
+        stats = lane.stats()
+        assert (stats.queued_foreground, stats.queued_background) == (1, 1)
+
+        lane.release()
+        await asyncio.gather(bg, fg)
+
+        assert order == ["fg", "bg"]
+
+    @pytest.mark.asyncio
+    async def test_cancelled_waiter_is_skipped(self):
+        """A cancelled waiter does not consume the lane."""
+        lane = AgentLane("pm")
+        await lane.acquire()
+
+        cancelled = asyncio.create_task(lane.acquire())
+        await asyncio.sleep(0)
+        cancelled.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await cancelled
+
+        assert lane.stats().queued == 0
+        lane.release()
+
+        assert lane.running == 0
+        assert lane.has_capacity()
+
+
+class TestLaneScheduler:
+    """Tests for the lane scheduler."""
+
+    @pytest.mark.asyncio
+    async def test_different_agents_run_concurrently(self):
+        """Lanes for different agents are independent."""
+        scheduler = LaneScheduler()
+        running = 0
+        max_running = 0
+
+        async def work(agent_id):
+            nonlocal running, max_running
+            async with scheduler.slot(agent_id):
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(work("pm"), work("ba"), work("writer"))
+
+        assert max_running == 3
+
+    @pytest.mark.asyncio
+    async def test_same_agent_serialized(self):
+        """Requests for the same agent run one at a time by default."""
+        scheduler = LaneScheduler()
+        running = 0
+        max_running = 0
+
+        async def work():
+            nonlocal running, max_running
+            async with scheduler.slot("pm"):
+                running += 1
+                max_running = max(max_running, running)
+                await asyncio.sleep(0.01)
+                running -= 1
+
+        await asyncio.gather(work(), work(), work())
+
+        assert max_running == 1
+
+    def test_per_agent_limits(self):
+        """Per-agent limits override the default."""
+        scheduler = LaneScheduler(limits={"builder-1": 2})
+
+        assert scheduler.get_limit("builder-1") == 2
+        assert scheduler.get_limit("pm") == 1
+
+    def test_set_limit_rejects_zero(self):
+        """Lane limits must be positive."""
+        scheduler = LaneScheduler()
+
+        with pytest.raises(ValueError):
+            scheduler.set_limit("pm", 0)
+
+    @pytest.mark.asyncio
+    async def test_get_stats_sorted_by_agent(self):
+        """Stats are reported for used lanes in agent order."""
+        scheduler = LaneScheduler()
+        async with scheduler.slot("reviewer"):
+            async with scheduler.slot("ba"):
+                stats = scheduler.get_stats()
+
+        assert [s.agent_id for s in stats] == ["ba", "reviewer"]
+        assert all(s.running == 1 for s in stats)
@@ -162,7 +162,7 @@ class TestTaskManagerConcurrency:
         running_count = 0
         max_running = 0
 
-        async def slow_exec(agent_id, prompt):
+        async def slow_exec(agent_id, prompt, model=None):
             nonlocal running_count, max_running
             running_count += 1
             max_running = max(max_running, running_count)
@@ -182,6 +182,153 @@ class TestTaskManagerConcurrency:
         # Should never exceed max_concurrent
         assert max_running <= 2
 
+    @pytest.mark.asyncio
+    async def test_execute_all_runs_independent_tasks_in_parallel(self):
+        """Test that independent tasks fill the available slots."""
+        import asyncio
+
+        running_count = 0
+        max_running = 0
+
+        async def slow_exec(agent_id, prompt, model=None):
+            nonlocal running_count, max_running
+            running_count += 1
+            max_running = max(max_running, running_count)
+            await asyncio.sleep(0.05)
+            running_count -= 1
+            return "done"
+
+        manager = TaskManager(executor=slow_exec, max_concurrent=3)
+        for agent_id in ("pm", "ba", "writer"):
+            manager.create_task(agent_id, "Task")
+
+        results = await manager.execute_all()
+
+        assert max_running == 3
+        assert all(r.success for r in results)
+
+    @pytest.mark.asyncio
+    async def test_execute_all_fan_out_takes_longest_branch(self):
+        """Test that a dependent starts as soon as its own parent finishes."""
+        import asyncio
+
+        delays = {"pm": 0.0, "builder-1": 0.05, "builder-2": 0.3, "reviewer": 0.0}
+        started: list[str] = []
+
+        async def exec_fn(agent_id, prompt, model=None):
+            started.append(agent_id)
+            await asyncio.sleep(delays[agent_id])
+            return f"{agent_id} done"
+
+        manager = TaskManager(executor=exec_fn, max_concurrent=3)
+        root = manager.create_task("pm", "Plan")
+        fast = manager.create_task("builder-1", "Fast", dependencies=[root.id])
+        manager.create_task("builder-2", "Slow", dependencies=[root.id])
+        manager.create_task("reviewer", "Review fast", dependencies=[fast.id])
+
+        await manager.execute_all()
+
+        # reviewer is released by builder-1 while builder-2 is still running
+        assert started.index("reviewer") == 3
+        assert all(t.status == TaskStatus.COMPLETED for t in manager.list_tasks())
+
+    @pytest.mark.asyncio
+    async def test_execute_all_returns_completion_order(self):
+        """Test results are in completion order with an ordered view."""
+        import asyncio
+
+        async def exec_fn(agent_id, prompt, model=None):
+            await asyncio.sleep(0.1 if agent_id == "ba" else 0.0)
+            return f"{agent_id} done"
+
+        manager = TaskManager(executor=exec_fn)
+        t1 = manager.create_task("ba", "Slow")
+        t2 = manager.create_task("pm", "Fast")
+
+        results = await manager.execute_all()
+        ordered = manager.get_ordered_results()
+
+        assert [r.task_id for r in results] == [t2.id, t1.id]
+        assert [r.task_id for r in ordered] == [t1.id, t2.id]
+
+
+class TestTaskManagerTimeout:
+    """Tests for per-task timeout enforcement."""
+
+    @staticmethod
+    def _hanging_executor(hang_agent: str):
+        import asyncio
+
+        async def execute(agent_id, prompt, model=None):
+            if agent_id == hang_agent:
+                await asyncio.Event().wait()
+            return f"{agent_id} done"
+
+        return execute
+
+    @pytest.mark.asyncio
+    async def test_task_times_out(self):
+        """Task exceeding its timeout fails as timed out and aborts the request."""
+        cancel_request = AsyncMock()
+        manager = TaskManager(executor=self._hanging_executor("pm"), cancel_request=cancel_request)
+        task = manager.create_task("pm", "hang", timeout=0.05)
+
+        result = await manager.execute_task(task.id)
+
+        assert task.status == TaskStatus.FAILED
+        assert result.timed_out
+        assert "Timed out" in result.error
+        assert manager.timeout_count == 1
+        assert manager.get_agent_result("pm") is result
+        cancel_request.assert_awaited_once_with("pm", task.id)
+
+    @pytest.mark.asyncio
+    async def test_default_timeout_applies(self):
+        """Tasks without an explicit timeout use the manager default."""
+        manager = TaskManager(executor=self._hanging_executor("pm"), default_timeout=0.05)
+        task = manager.create_task("pm", "hang")
+
+        result = await manager.execute_task(task.id)
+
+        assert result.timed_out
+
+    @pytest.mark.asyncio
+    async def test_timeout_skips_dependents(self):
+        """Dependents of a timed-out task are skipped."""
+        manager = TaskManager(executor=self._hanging_executor("pm"))
+        parent = manager.create_task("pm", "hang", timeout=0.05)
+        child = manager.create_task("ba", "analyze", dependencies=[parent.id])
+
+        await manager.execute_all()
+
+        assert parent.result.timed_out
+        assert child.status == TaskStatus.SKIPPED
+
+    @pytest.mark.asyncio
+    async def test_timeout_releases_slot(self):
+        """A hung task does not keep its concurrency slot."""
+        manager = TaskManager(executor=self._hanging_executor("pm"), max_concurrent=1)
+        hung = manager.create_task("pm", "hang", timeout=0.05)
+        other = manager.create_task("ba", "analyze")
+
+        await manager.execute_all()
+
+        assert hung.result.timed_out
+        assert other.status == TaskStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_failing_abort_does_not_block(self):
+        """Errors while aborting the request still fail the task."""
+        manager = TaskManager(
+            executor=self._hanging_executor("pm"),
+            cancel_request=AsyncMock(side_effect=RuntimeError("no session")),
+        )
+        task = manager.create_task("pm", "hang", timeout=0.05)
+
+        result = await manager.execute_task(task.id)
+
+        assert result.timed_out
+
 
 class TestTaskManagerDependencyFailure:
     """Tests for dependency failure handling."""
@@ -229,6 +376,42 @@ class TestTaskManagerDependencyFailure:
         # t3 should still run with partial results
         assert t3.status == TaskStatus.COMPLETED
 
+    @pytest.mark.asyncio
+    async def test_skip_propagates_through_chain(self):
+        """Test that a failure skips the whole downstream chain."""
+
+        async def failing_exec(agent_id, prompt, model=None):
+            if agent_id == "pm":
+                raise Exception("PM failed")
+            return "done"
+
+        manager = TaskManager(executor=failing_exec)
+        t1 = manager.create_task("pm", "Plan")
+        t2 = manager.create_task("ba", "Analyze", dependencies=[t1.id])
+        t3 = manager.create_task("writer", "Document", dependencies=[t2.id])
+        t4 = manager.create_task("reviewer", "Review")
+
+        results = await manager.execute_all()
+
+        assert t2.status == TaskStatus.SKIPPED
+        assert t3.status == TaskStatus.SKIPPED
+        assert t4.status == TaskStatus.COMPLETED
+        assert len(results) == 4
+
+    @pytest.mark.asyncio
+    async def test_cancel_cascades_when_all_parents_cancelled(self):
+        """Test that a task whose parents were all cancelled never runs."""
+        mock_executor = AsyncMock(return_value="done")
+        manager = TaskManager(executor=mock_executor)
+        t1 = manager.create_task("pm", "Plan")
+        t2 = manager.create_task("ba", "Analyze", dependencies=[t1.id])
+        manager.cancel_task(t1.id)
+
+        await manager.execute_all()
+
+        assert t2.status == TaskStatus.CANCELLED
+        mock_executor.assert_not_called()
+
 
 class TestTaskManagerCancel:
     """Tests for task cancellation."""
@@ -266,6 +449,92 @@ class TestTaskManagerCancel:
         assert task.status == TaskStatus.COMPLETED
 
 
+class TestTaskManagerCancelInFlight:
+    """Tests for cancelling tasks that are already running."""
+
+    @staticmethod
+    def _hanging_manager(**kwargs):
+        import asyncio
+
+        started = asyncio.Event()
+
+        async def execute(agent_id, prompt, model=None):
+            started.set()
+            await asyncio.Event().wait()
+
+        return TaskManager(executor=execute, **kwargs), started
+
+    @pytest.mark.asyncio
+    async def test_cancel_stops_running_task(self):
+        """Cancelling a running task stops its executor call and aborts the request."""
+        import asyncio
+
+        cancel_request = AsyncMock()
+        manager, started = self._hanging_manager(cancel_request=cancel_request)
+        task = manager.create_task("pm", "Plan")
+        run = asyncio.create_task(manager.execute_task(task.id))
+        await started.wait()
+
+        assert manager.cancel_task(task.id)
+        result = await asyncio.wait_for(run, timeout=1.0)
+
+        assert task.status == TaskStatus.CANCELLED
+        assert result is task.result
+        cancel_request.assert_awaited_once_with("pm", task.id)
+        assert manager.lanes.lane("pm").running == 0
+
+    @pytest.mark.asyncio
+    async def test_cancel_cascades_to_dependents(self):
+        """Dependents of a cancelled running task are cancelled and never run."""
+        import asyncio
+
+        manager, started = self._hanging_manager(cancel_request=AsyncMock())
+        parent = manager.create_task("pm", "Plan")
+        child = manager.create_task("ba", "Analyze", dependencies=[parent.id])
+        grandchild = manager.create_task("writer", "Document", dependencies=[child.id])
+        run = asyncio.create_task(manager.execute_all())
+        await started.wait()
+
+        manager.cancel_task(parent.id)
+        await asyncio.wait_for(run, timeout=1.0)
+
+        assert child.status == TaskStatus.CANCELLED
+        assert grandchild.status == TaskStatus.CANCELLED
+
+    @pytest.mark.asyncio
+    async def test_cancelled_caller_settles_task(self):
+        """Cancelling the caller marks the task cancelled and aborts the request."""
+        import asyncio
+
+        cancel_request = AsyncMock()
+        manager, started = self._hanging_manager(cancel_request=cancel_request)
+        task = manager.create_task("pm", "Plan")
+        run = asyncio.create_task(manager.execute_task(task.id))
+        await started.wait()
+
+        run.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await run
+
+        assert task.status == TaskStatus.CANCELLED
+        cancel_request.assert_awaited_once_with("pm", task.id)
+
+    @pytest.mark.asyncio
+    async def test_cancel_externally_run_task_aborts_request(self):
+        """Tasks run outside the manager still get their request aborted."""
+        import asyncio
+
+        cancel_request = AsyncMock()
+        manager = TaskManager(cancel_request=cancel_request)
+        task = manager.create_task("pm", "Plan")
+        task.mark_running()
+
+        assert manager.cancel_task(task.id)
+        await asyncio.gather(*manager._pending_aborts)
+
+        cancel_request.assert_awaited_once_with("pm", task.id)
+
+
 class TestAgentResults:
     """Tests for agent result storage and retrieval."""
 
@@ -364,3 +633,506 @@ class TestAgentResults:
         assert result is not None
         assert not result.success
         assert "Task failed" in result.error
+
+
+class TestAgentTaskIndex:
+    """Tests for the per-agent task index and completion waits."""
+
+    def test_get_latest_task_for_agent(self):
+        """Test the most recently created task is indexed per agent."""
+        manager = TaskManager()
+        manager.create_task(agent_id="ba", prompt="First")
+        second = manager.create_task(agent_id="ba", prompt="Second")
+        manager.create_task(agent_id="pm", prompt="Other")
+
+        assert manager.get_latest_task_for_agent("ba") is second
+        assert manager.get_latest_task_for_agent("writer") is None
+
+    def test_running_task_found_behind_newer_pending_task(self):
+        """Test a running task is found even if a newer task is pending."""
+        manager = TaskManager()
+        first = manager.create_task(agent_id="ba", prompt="First")
+        manager.create_task(agent_id="ba", prompt="Second")
+        first.mark_running()
+
+        assert manager.get_running_task_for_agent("ba") is first
+
+    @pytest.mark.asyncio
+    async def test_wait_for_agent_resumes_on_completion(self):
+        """Test waiting on an agent resumes when its task finishes."""
+        import asyncio
+
+        release = asyncio.Event()
+
+        async def gated_exec(agent_id, prompt, model=None):
+            await release.wait()
+            return "ba output"
+
+        manager = TaskManager(executor=gated_exec)
+        task = manager.create_task(agent_id="ba", prompt="Analyze")
+        runner = asyncio.create_task(manager.execute_task(task.id))
+        await asyncio.sleep(0)
+
+        waiter = asyncio.create_task(manager.wait_for_agent("ba"))
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        release.set()
+        result = await waiter
+        await runner
+
+        assert result.output == "ba output"
+
+    @pytest.mark.asyncio
+    async def test_wait_for_agent_timeout(self):
+        """Test waiting on an agent raises after the timeout."""
+        manager = TaskManager()
+        task = manager.create_task(agent_id="ba", prompt="Analyze")
+        task.mark_running()
+
+        with pytest.raises(TimeoutError):
+            await manager.wait_for_agent("ba", timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_idle_agent_returns_latest_result(self):
+        """Test waiting on an idle agent returns immediately."""
+        mock_executor = AsyncMock(return_value="Done")
+        manager = TaskManager(executor=mock_executor)
+        task = manager.create_task(agent_id="ba", prompt="Analyze")
+        await manager.execute_task(task.id)
+
+        result = await manager.wait_for_agent("ba", timeout=0.01)
+
+        assert result.output == "Done"
+
+
+class TestTaskManagerLanes:
+    """Tests for per-agent lanes in the task manager."""
+
+    @pytest.mark.asyncio
+    async def test_same_agent_tasks_never_overlap(self):
+        """Test concurrent execute_task calls for one agent are serialized."""
+        import asyncio
+
+        running: dict[str, int] = {}
+        max_running: dict[str, int] = {}
+
+        async def slow_exec(agent_id, prompt, model=None):
+            running[agent_id] = running.get(agent_id, 0) + 1
+            max_running[agent_id] = max(max_running.get(agent_id, 0), running[agent_id])
+            await asyncio.sleep(0.02)
+            running[agent_id] -= 1
+            return "done"
+
+        manager = TaskManager(executor=slow_exec, max_concurrent=5)
+        tasks = [manager.create_task(a, "Work") for a in ("pm", "pm", "ba", "ba")]
+
+        await asyncio.gather(*(manager.execute_task(t.id) for t in tasks))
+
+        assert max_running == {"pm": 1, "ba": 1}
+
+    @pytest.mark.asyncio
+    async def test_execute_all_fills_slots_with_other_agents(self):
+        """Test queued work for a busy agent does not block other agents."""
+        import asyncio
+
+        started: list[str] = []
+
+        async def slow_exec(agent_id, prompt, model=None):
+            started.append(agent_id)
+            await asyncio.sleep(0.02)
+            return "done"
+
+        manager = TaskManager(executor=slow_exec, max_concurrent=2)
+        manager.create_task("pm", "First")
+        manager.create_task("pm", "Second")
+        manager.create_task("ba", "Other")
+
+        await manager.execute_all()
+
+        # ba takes the second slot instead of the queued pm task
+        assert started[:2] == ["pm", "ba"]
+
+    @pytest.mark.asyncio
+    async def test_agent_concurrency_override(self):
+        """Test per-agent concurrency allows parallel tasks for one agent."""
+        import asyncio
+
+        running = 0
+        max_running = 0
+
+        async def slow_exec(agent_id, prompt, model=None):
+            nonlocal running, max_running
+            running += 1
+            max_running = max(max_running, running)
+            await asyncio.sleep(0.02)
+            running -= 1
+            return "done"
+
+        manager = TaskManager(executor=slow_exec, agent_concurrency={"builder-1": 2})
+        manager.create_task("builder-1", "A")
+        manager.create_task("builder-1", "B")
+
+        await manager.execute_all()
+
+        assert max_running == 2
+
+    @pytest.mark.asyncio
+    async def test_cancelled_while_queued_does_not_run(self):
+        """Test a task cancelled while waiting for its lane never executes."""
+        import asyncio
+
+        release = asyncio.Event()
+        calls: list[str] = []
+
+        async def gated_exec(agent_id, prompt, model=None):
+            calls.append(prompt)
+            await release.wait()
+            return "done"
+
+        manager = TaskManager(executor=gated_exec)
+        first = manager.create_task("pm", "First")
+        second = manager.create_task("pm", "Second")
+
+        runs = [asyncio.create_task(manager.execute_task(t.id)) for t in (first, second)]
+        await asyncio.sleep(0)
+        manager.cancel_task(second.id)
+        release.set()
+        await asyncio.gather(*runs)
+
+        assert calls == ["First"]
+        assert second.status == TaskStatus.CANCELLED
+
+
+class TestTaskManagerExecuteTasks:
+    """Tests for running a group of tasks with execute_tasks()."""
+
+    @pytest.mark.asyncio
+    async def test_yields_tasks_as_they_settle(self):
+        """Tasks are yielded once settled, dependencies before dependents."""
+        manager = TaskManager(executor=AsyncMock(return_value="ok"))
+        first = manager.create_task("pm", "Plan")
+        second = manager.create_task("ba", "Analyze", dependencies=[first.id])
+
+        settled = [task.id async for task in manager.execute_tasks([first.id, second.id])]
+
+        assert settled == [first.id, second.id]
+        assert second.status == TaskStatus.COMPLETED
+
+    @pytest.mark.asyncio
+    async def test_only_runs_group(self):
+        """Tasks outside the group are left alone."""
+        executor = AsyncMock(return_value="ok")
+        manager = TaskManager(executor=executor)
+        inside = manager.create_task("pm", "Plan")
+        outside = manager.create_task("ba", "Analyze")
+
+        [task async for task in manager.execute_tasks([inside.id])]
+
+        assert outside.status == TaskStatus.PENDING
+        executor.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_rejects_unfinished_dependency_outside_group(self):
+        """A dependency outside the group that has not finished is an error."""
+        manager = TaskManager(executor=AsyncMock(return_value="ok"))
+        parent = manager.create_task("pm", "Plan")
+        child = manager.create_task("ba", "Analyze", dependencies=[parent.id])
+
+        with pytest.raises(ValueError, match="outside the group"):
+            [task async for task in manager.execute_tasks([child.id])]
+
+    @pytest.mark.asyncio
+    async def test_closing_early_cancels_running(self):
+        """Closing the iterator cancels tasks that are still running."""
+        import asyncio
+
+        async def execute(agent_id, prompt, model=None):
+            if agent_id == "ba":
+                await asyncio.sleep(10)
+            return "ok"
+
+        manager = TaskManager(executor=execute)
+        fast = manager.create_task("pm", "Fast")
+        slow = manager.create_task("ba", "Slow")
+
+        results = manager.execute_tasks([fast.id, slow.id])
+        settled = await results.__anext__()
+        await results.aclose()
+
+        assert settled is fast
+        assert slow.status == TaskStatus.CANCELLED
+
+
+class TestTaskManagerCriticalPath:
+    """Tests for critical-path priority scheduling."""
+
+    @staticmethod
+    def _recording_executor(order: list[str]):
+        async def execute(agent_id, prompt, model=None):
+            order.append(prompt)
+            return prompt
+
+        return execute
+
+    @pytest.mark.asyncio
+    async def test_longest_chain_runs_first(self):
+        """With one slot, the head of the longest chain goes before a lone task."""
+        order: list[str] = []
+        manager = TaskManager(executor=self._recording_executor(order), max_concurrent=1)
+        manager.create_task("writer", "lone")
+        head = manager.create_task("pm", "head")
+        middle = manager.create_task("ba", "middle", dependencies=[head.id])
+        manager.create_task("reviewer", "tail", dependencies=[middle.id])
+
+        await manager.execute_all()
+
+        assert order[0] == "head"
+
+    @pytest.mark.asyncio
+    async def test_agent_latency_weights_priority(self):
+        """A slow agent's lone task outranks a short chain of fast tasks."""
+        order: list[str] = []
+        manager = TaskManager(executor=self._recording_executor(order), max_concurrent=1)
+        manager._latency.record("builder-1", 300.0)
+        manager._latency.record("pm", 5.0)
+        manager._latency.record("ba", 5.0)
+        first = manager.create_task("pm", "fast-1")
+        manager.create_task("ba", "fast-2", dependencies=[first.id])
+        manager.create_task("builder-1", "slow")
+
+        await manager.execute_all()
+
+        assert order[0] == "slow"
+
+    @pytest.mark.asyncio
+    async def test_completed_tasks_update_latency(self):
+        """Completed tasks feed the per-agent latency estimate."""
+        manager = TaskManager(executor=AsyncMock(return_value="ok"))
+        task = manager.create_task("pm", "Plan")
+
+        await manager.execute_task(task.id)
+
+        assert manager._latency.estimate("pm") < 1.0
+
+    @pytest.mark.asyncio
+    async def test_slot_waiters_ordered_by_downstream_work(self):
+        """Tasks waiting for a slot are admitted by downstream work."""
+        import asyncio
+
+        release = asyncio.Event()
+        order: list[str] = []
+
+        async def execute(agent_id, prompt, model=None):
+            order.append(prompt)
+            if prompt == "blocker":
+                await release.wait()
+            return prompt
+
+        manager = TaskManager(executor=execute, max_concurrent=1)
+        blocker = manager.create_task("pm", "blocker")
+        lone = manager.create_task("ba", "lone")
+        head = manager.create_task("writer", "head")
+        manager.create_task("reviewer", "tail", dependencies=[head.id])
+
+        runs = [asyncio.create_task(manager.execute_task_in_slot(blocker.id))]
+        await asyncio.sleep(0)
+        runs.append(asyncio.create_task(manager.execute_task_in_slot(lone.id)))
+        runs.append(asyncio.create_task(manager.execute_task_in_slot(head.id)))
+        await asyncio.sleep(0)
+        release.set()
+        await asyncio.gather(*runs)
+
+        assert order == ["blocker", "head", "lone"]
+
+    def test_get_critical_path(self):
+        """The critical path covers the longest unfinished chain."""
+        manager = TaskManager()
+        manager.create_task("writer", "lone")
+        head = manager.create_task("pm", "head")
+        tail = manager.create_task("ba", "tail", dependencies=[head.id])
+
+        path = manager.get_critical_path()
+
+        assert path.task_ids == [head.id, tail.id]
+        assert path.remaining > 0
+
+    def test_no_critical_path_when_idle(self):
+        """No critical path once every task has finished."""
+        manager = TaskManager()
+        task = manager.create_task("pm", "Plan")
+        task.mark_completed("done")
+
+        assert manager.get_critical_path() is None
+
+
+class TestTaskManagerRetention:
+    """Tests for bounded retention of finished tasks."""
+
+    @staticmethod
+    def _manager(tmp_path, **limits):
+        from teambot.tasks.retention import RetentionPolicy, TaskArchive
+
+        return TaskManager(
+            executor=AsyncMock(side_effect=lambda agent, prompt, model=None: f"{agent}: {prompt}"),
+            retention=RetentionPolicy(**limits),
+            archive=TaskArchive(tmp_path),
+        )
+
+    @pytest.mark.asyncio
+    async def test_unbounded_by_default(self):
+        """Without a policy every finished task stays in memory."""
+        manager = TaskManager(executor=AsyncMock(return_value="ok"))
+
+        for i in range(5):
+            task = manager.create_task(f"agent-{i}", "work")
+            await manager.execute_task(task.id)
+
+        assert manager.task_count == 5
+        assert manager.evicted_count == 0
+
+    @pytest.mark.asyncio
+    async def test_evicts_least_recently_used_beyond_max_tasks(self, tmp_path):
+        """Oldest unused finished tasks are evicted past max_tasks."""
+        manager = self._manager(tmp_path, max_tasks=2)
+        tasks = []
+        for agent in ["a", "b", "c"]:
+            task = manager.create_task(agent, "work")
+            await manager.execute_task(task.id)
+            tasks.append(task)
+            # Replace each agent's $ref target so earlier tasks are unpinned
+            follow_up = manager.create_task(agent, "more")
+            await manager.execute_task(follow_up.id)
+
+        # Only the three pinned follow-ups remain; over the limit, but pinned
+        assert manager.task_count == 3
+        assert manager.evicted_count == 3
+        assert all(manager.get_result(t.id) is not None for t in tasks)
+
+    @pytest.mark.asyncio
+    async def test_reading_result_refreshes_recency(self, tmp_path):
+        """A result that was just read is evicted after less recent ones."""
+        manager = self._manager(tmp_path, max_tasks=2)
+        first = manager.create_task("pm", "first")
+        second = manager.create_task("pm", "second")
+        await manager.execute_task(first.id)
+        await manager.execute_task(second.id)
+
+        manager.get_result(first.id)
+        third = manager.create_task("pm", "third")
+        await manager.execute_task(third.id)
+
+        assert manager.get_task(first.id) is first
+        assert manager.get_task(second.id) is not second  # Loaded from archive
+        assert manager.get_task(second.id).result.output == "pm: second"
+
+    @pytest.mark.asyncio
+    async def test_evicts_beyond_max_output_bytes(self):
+        """Outputs are evicted once their total size exceeds the byte limit."""
+        from teambot.tasks.retention import RetentionPolicy
+
+        manager = TaskManager(
+            executor=AsyncMock(return_value="x" * 100),
+            retention=RetentionPolicy(max_output_bytes=250),
+        )
+
+        for _ in range(5):
+            task = manager.create_task("pm", "work")
+            await manager.execute_task(task.id)
+
+        assert manager.task_count == 2
+        assert manager.evicted_count == 3
+
+    @pytest.mark.asyncio
+    async def test_evicts_expired_tasks(self, tmp_path):
+        """Tasks older than max_age are evicted even under the count limit."""
+        from datetime import datetime, timedelta
+
+        manager = self._manager(tmp_path, max_tasks=100, max_age=60)
+        old = manager.create_task("pm", "old")
+        await manager.execute_task(old.id)
+        old.completed_at = datetime.now() - timedelta(seconds=120)
+
+        new = manager.create_task("pm", "new")
+        await manager.execute_task(new.id)
+
+        assert old.id not in {t.id for t in manager.list_tasks()}
+        assert manager.get_result(old.id).output == "pm: old"
+
+    @pytest.mark.asyncio
+    async def test_latest_agent_result_is_pinned(self, tmp_path):
+        """The agent's latest result stays in memory for $ref lookups."""
+        manager = self._manager(tmp_path, max_tasks=1)
+        pm_task = manager.create_task("pm", "plan")
+        await manager.execute_task(pm_task.id)
+        ba_task = manager.create_task("ba", "analyze")
+        await manager.execute_task(ba_task.id)
+
+        assert manager.get_task(pm_task.id) is pm_task
+        assert manager.get_agent_result("pm") is pm_task.result
+        assert manager.evicted_count == 0
+
+    @pytest.mark.asyncio
+    async def test_tasks_with_pending_dependents_are_pinned(self, tmp_path):
+        """A parent is kept while a dependent still needs its output."""
+        manager = self._manager(tmp_path, max_tasks=1)
+        parent = manager.create_task("pm", "plan")
+        child = manager.create_task("ba", "analyze", dependencies=[parent.id])
+        await manager.execute_task(parent.id)
+        # Make the parent's result no longer the agent's latest
+        other = manager.create_task("pm", "other")
+        await manager.execute_task(other.id)
+
+        assert manager.get_task(parent.id) is parent
+
+        await manager.execute_task(child.id)
+
+        prompt = manager._executor.call_args_list[-1].args[1]
+        assert "pm: plan" in prompt
+        assert parent.id not in {t.id for t in manager.list_tasks()}
+
+    @pytest.mark.asyncio
+    async def test_execute_all_defers_eviction_until_done(self, tmp_path):
+        """Eviction waits until execute_all() has settled every task."""
+        manager = self._manager(tmp_path, max_tasks=1)
+        root = manager.create_task("pm", "root")
+        for agent in ["ba", "writer", "reviewer"]:
+            manager.create_task(agent, "leaf", dependencies=[root.id])
+
+        results = await manager.execute_all()
+
+        assert len(results) == 4
+        assert all(r.success for r in results)
+        assert manager.evicted_count == 0  # Every task is its agent's latest result
+
+    @pytest.mark.asyncio
+    async def test_evicted_task_without_archive_is_forgotten(self):
+        """Without an archive evicted tasks can no longer be looked up."""
+        from teambot.tasks.retention import RetentionPolicy
+
+        manager = TaskManager(
+            executor=AsyncMock(return_value="ok"), retention=RetentionPolicy(max_tasks=1)
+        )
+        first = manager.create_task("pm", "first")
+        await manager.execute_task(first.id)
+        second = manager.create_task("pm", "second")
+        await manager.execute_task(second.id)
+
+        assert manager.get_task(first.id) is None
+        assert manager.get_result(first.id) is None
+
+    def test_record_result_for_external_task(self, tmp_path):
+        """Tasks run outside the manager become the agent's latest result."""
+        manager = self._manager(tmp_path, max_tasks=1)
+        first = manager.create_task("pm", "first")
+        first.mark_running()
+        first.mark_completed("one")
+        manager.record_result(first)
+        second = manager.create_task("pm", "second")
+        second.mark_running()
+        second.mark_completed("two")
+        manager.record_result(second)
+
+        assert manager.get_agent_result("pm") is second.result
+        assert manager.get_result(first.id).output == "one"  # From archive
+        assert manager.evicted_count == 1
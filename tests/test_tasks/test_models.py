@@ -1,8 +1,11 @@
 """Tests for Task dataclass and TaskStatus."""
 
+import asyncio
 from datetime import datetime
 
-from teambot.tasks.models import Task, TaskResult, TaskStatus
+import pytest
+
+from teambot.tasks.models import DEFAULT_TASK_TIMEOUT, Task, TaskResult, TaskStatus
 
 
 class TestTaskStatus:
@@ -43,7 +46,7 @@ class TestTask:
         assert task.prompt == "Create a plan"
         assert task.status == TaskStatus.PENDING
         assert task.dependencies == []
-        assert task.timeout == 120.0
+        assert task.timeout == DEFAULT_TASK_TIMEOUT
         assert task.result is None
 
     def test_task_creation_full(self):
@@ -179,3 +182,68 @@ class TestTaskModel:
         """Task.model defaults to None."""
         task = Task(id="t1", agent_id="pm", prompt="test")
         assert task.model is None
+
+
+class TestTaskTimedOut:
+    """Tests for marking tasks as timed out."""
+
+    def test_mark_timed_out(self):
+        """Timed-out task fails with a timeout reason."""
+        task = Task(id="t1", agent_id="pm", prompt="test", timeout=30.0)
+        task.mark_running()
+
+        task.mark_timed_out()
+
+        assert task.status == TaskStatus.FAILED
+        assert task.result.timed_out
+        assert not task.result.success
+        assert task.result.error == "Timed out after 30s"
+        assert task.is_done
+
+    def test_failed_task_is_not_timed_out(self):
+        """Ordinary failures are not flagged as timeouts."""
+        task = Task(id="t1", agent_id="pm", prompt="test")
+        task.mark_failed("boom")
+
+        assert not task.result.timed_out
+
+
+class TestTaskCompletionWait:
+    """Tests for awaiting task completion."""
+
+    @pytest.mark.asyncio
+    async def test_wait_resumes_on_completion(self):
+        """Waiters resume as soon as the task completes."""
+        task = Task(id="t1", agent_id="pm", prompt="test")
+        task.mark_running()
+
+        waiter = asyncio.create_task(task.wait())
+        await asyncio.sleep(0)
+        assert not waiter.done()
+
+        task.mark_completed("done")
+        result = await waiter
+
+        assert task.is_done
+        assert result.output == "done"
+
+    @pytest.mark.asyncio
+    async def test_wait_returns_immediately_when_terminal(self):
+        """Waiting on a finished task returns its result at once."""
+        task = Task(id="t1", agent_id="pm", prompt="test")
+        task.mark_cancelled()
+
+        result = await task.wait(timeout=0.01)
+
+        assert result.error == "Cancelled by user"
+
+    @pytest.mark.asyncio
+    async def test_wait_timeout(self):
+        """Waiting on a running task honours the timeout."""
+        task = Task(id="t1", agent_id="pm", prompt="test")
+        task.mark_running()
+
+        with pytest.raises(TimeoutError):
+            await task.wait(timeout=0.01)
+
+        assert task.status == TaskStatus.RUNNING
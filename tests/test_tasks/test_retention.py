@@ -0,0 +1,179 @@
+"""Tests for task retention policy and archive."""
+
+import os
+from datetime import datetime
+
+from teambot.tasks.executor import get_task_archive
+from teambot.tasks.models import Task, TaskStatus
+from teambot.tasks.retention import (
+    DEFAULT_MAX_OUTPUT_BYTES,
+    DEFAULT_MAX_TASKS,
+    RetentionPolicy,
+    TaskArchive,
+)
+
+
+class FakeClock:
+    """Manually advanced time source."""
+
+    def __init__(self, now: float = 1_000_000.0):
+        self.now = now
+
+    def __call__(self) -> float:
+        return self.now
+
+
+def _finished_task(task_id: str) -> Task:
+    task = Task(id=task_id, agent_id="pm", prompt="Plan")
+    task.mark_completed("The plan")
+    return task
+
+
+class TestRetentionPolicy:
+    """Tests for RetentionPolicy."""
+
+    def test_default_policy_is_unbounded(self):
+        """Default policy sets no limits."""
+        policy = RetentionPolicy()
+
+        assert not policy.is_bounded
+        assert not policy.is_exceeded(10_000, 10**9)
+
+    def test_is_exceeded_by_count(self):
+        """Count limit is exceeded only above max_tasks."""
+        policy = RetentionPolicy(max_tasks=2)
+
+        assert not policy.is_exceeded(2, 0)
+        assert policy.is_exceeded(3, 0)
+
+    def test_is_exceeded_by_bytes(self):
+        """Size limit is exceeded only above max_output_bytes."""
+        policy = RetentionPolicy(max_output_bytes=100)
+
+        assert not policy.is_exceeded(1, 100)
+        assert policy.is_exceeded(1, 101)
+
+    def test_from_config_defaults(self):
+        """Missing section falls back to default limits."""
+        policy = RetentionPolicy.from_config({"agents": []})
+
+        assert policy.max_tasks == DEFAULT_MAX_TASKS
+        assert policy.max_output_bytes == DEFAULT_MAX_OUTPUT_BYTES
+        assert policy.max_age is None
+
+    def test_from_config_overrides(self):
+        """Configured values override defaults; null disables a limit."""
+        policy = RetentionPolicy.from_config(
+            {"task_retention": {"max_tasks": 5, "max_output_bytes": None, "max_age_seconds": 60}}
+        )
+
+        assert policy.max_tasks == 5
+        assert policy.max_output_bytes is None
+        assert policy.max_age == 60
+
+
+class TestTaskArchive:
+    """Tests for TaskArchive."""
+
+    def test_round_trip(self, tmp_path):
+        """Archived task loads back with its result."""
+        archive = TaskArchive(tmp_path / "tasks")
+        task = Task(id="abc123", agent_id="pm", prompt="Plan", dependencies=["dep1"], model="gpt-5")
+        task.mark_running()
+        task.mark_completed("The plan")
+
+        assert archive.save(task)
+        loaded = archive.load("abc123")
+
+        assert loaded is not None
+        assert loaded.agent_id == "pm"
+        assert loaded.status == TaskStatus.COMPLETED
+        assert loaded.dependencies == ["dep1"]
+        assert loaded.model == "gpt-5"
+        assert loaded.started_at == task.started_at
+        assert loaded.result.output == "The plan"
+        assert loaded.result.success
+        assert loaded.is_done
+
+    def test_round_trip_failed_task(self, tmp_path):
+        """Failed task keeps its error."""
+        archive = TaskArchive(tmp_path)
+        task = Task(id="f00", agent_id="ba", prompt="Analyze")
+        task.mark_failed("boom")
+
+        archive.save(task)
+        loaded = archive.load("f00")
+
+        assert loaded.status == TaskStatus.FAILED
+        assert loaded.result.error == "boom"
+        assert isinstance(loaded.result.completed_at, datetime)
+
+    def test_load_missing_returns_none(self, tmp_path):
+        """Unknown task ID returns None."""
+        assert TaskArchive(tmp_path).load("missing") is None
+
+    def test_rejects_path_like_ids(self, tmp_path):
+        """IDs that could escape the archive directory are refused."""
+        archive = TaskArchive(tmp_path / "tasks")
+        (tmp_path / "secret.json").write_text("{}")
+
+        assert archive.load("../secret") is None
+
+    def test_load_corrupt_file_returns_none(self, tmp_path):
+        """Unreadable archive entry returns None."""
+        (tmp_path / "bad.json").write_text("not json")
+
+        assert TaskArchive(tmp_path).load("bad") is None
+
+    def test_prunes_oldest_beyond_size(self, tmp_path):
+        """Saving beyond max_bytes deletes the oldest archived tasks."""
+        clock = FakeClock()
+        probe = TaskArchive(tmp_path / "probe")
+        probe.save(_finished_task("a0"))
+        entry_size = (tmp_path / "probe" / "a0.json").stat().st_size
+
+        archive = TaskArchive(tmp_path / "tasks", max_bytes=entry_size * 2, clock=clock)
+        for task_id in ("a1", "a2", "a3"):
+            clock.now += 1
+            archive.save(_finished_task(task_id))
+
+        assert archive.load("a1") is None
+        assert archive.load("a2") is not None
+        assert archive.load("a3") is not None
+
+    def test_prunes_expired_entries(self, tmp_path):
+        """Tasks older than max_age are deleted on the next save."""
+        clock = FakeClock()
+        archive = TaskArchive(tmp_path, max_bytes=None, max_age=60, clock=clock)
+        archive.save(_finished_task("old"))
+
+        clock.now += 61
+        archive.save(_finished_task("new"))
+
+        assert not (tmp_path / "old.json").exists()
+        assert archive.load("new") is not None
+
+    def test_prunes_entries_left_by_earlier_sessions(self, tmp_path):
+        """Files already in the directory count towards the limits."""
+        stale = tmp_path / "stale.json"
+        stale.write_text("{}")
+        os.utime(stale, (0, 0))
+
+        TaskArchive(tmp_path, max_age=60).save(_finished_task("fresh"))
+
+        assert not stale.exists()
+        assert (tmp_path / "fresh.json").exists()
+
+    def test_get_task_archive_limits_from_config(self, tmp_path):
+        """Archive limits come from the task_retention section."""
+        config = {
+            "teambot_dir": str(tmp_path),
+            "task_retention": {"archive_max_bytes": 1024, "archive_max_age_seconds": None},
+        }
+
+        archive = get_task_archive(config)
+
+        assert archive.directory == tmp_path / "tasks"
+        assert archive.max_bytes == 1024
+        assert archive.max_age is None
+        assert get_task_archive({}) is None
@@ -163,3 +163,51 @@ class TestAppRouterWiring:
         router = AgentRouter(default_agent="pm")
         app = TeamBotApp(router=router)
         assert app._agent_status.get_default_agent() == "pm"
+
+
+class TestAppCancel:
+    """Tests for /cancel in the UI."""
+
+    @pytest.mark.asyncio
+    async def test_cancel_direct_stream_by_task_id(self):
+        """Cancelling a streamed task by ID aborts it and keeps it cancelled."""
+        import asyncio
+        from unittest.mock import AsyncMock
+
+        from teambot.repl.parser import parse_command
+        from teambot.tasks.executor import TaskExecutor
+        from teambot.tasks.models import TaskStatus
+        from teambot.ui.app import TeamBotApp
+
+        aborted = asyncio.Event()
+
+        async def stream(agent_id, prompt, on_chunk):
+            await aborted.wait()
+            raise RuntimeError("Request aborted")
+
+        async def abort(agent_id, request_key=None):
+            aborted.set()
+            return True
+
+        mock_sdk = MagicMock()
+        mock_sdk.execute_streaming = stream
+        mock_sdk.cancel_current_request = AsyncMock(side_effect=abort)
+        executor = TaskExecutor(sdk_client=mock_sdk)
+
+        app = TeamBotApp(executor=executor, sdk_client=mock_sdk)
+        async with app.run_test():
+            output = app.query_one("#output")
+            run = asyncio.create_task(
+                app._handle_agent_command(parse_command("@pm Plan it"), output)
+            )
+            await asyncio.sleep(0.05)
+            task = executor.get_running_task_for_agent("pm")
+            assert task is not None
+
+            await app._handle_cancel_command([task.id], output)
+            await asyncio.wait_for(run, timeout=1.0)
+
+            assert task.status == TaskStatus.CANCELLED
+            mock_sdk.cancel_current_request.assert_awaited_once_with("pm", task.id)
+            assert "pm" not in output.get_streaming_agents()
+            assert app._agent_status.get("pm").state.name == "IDLE"
@@ -0,0 +1,187 @@
+"""Tests for state journal persistence."""
+
+import json
+from pathlib import Path
+
+import pytest
+
+from teambot.workflow.journal import ContentStore, StateJournal, write_atomic
+
+
+class TestWriteAtomic:
+    """Tests for write_atomic."""
+
+    def test_replaces_file_without_leftovers(self, tmp_path: Path):
+        """The file gets the new contents and no temporary file remains."""
+        path = tmp_path / "state.json"
+        path.write_text("old")
+
+        write_atomic(path, "new")
+
+        assert path.read_text() == "new"
+        assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+    def test_failed_write_keeps_old_file(self, tmp_path: Path, monkeypatch):
+        """If the rename fails the old file is untouched and the temp file removed."""
+        path = tmp_path / "state.json"
+        path.write_text("old")
+
+        def fail(src, dst):
+            raise OSError("disk full")
+
+        monkeypatch.setattr("teambot.workflow.journal.os.replace", fail)
+        with pytest.raises(OSError):
+            write_atomic(path, "new")
+
+        assert path.read_text() == "old"
+        assert [p.name for p in tmp_path.iterdir()] == ["state.json"]
+
+
+class TestContentStore:
+    """Tests for ContentStore."""
+
+    def test_put_and_get(self, tmp_path: Path):
+        """Stored text is returned by its digest."""
+        store = ContentStore(tmp_path / "outputs")
+        digest = store.put("Spec content")
+
+        assert store.get(digest) == "Spec content"
+        assert (tmp_path / "outputs" / f"{digest}.md").exists()
+
+    def test_identical_text_stored_once(self, tmp_path: Path):
+        """The same text maps to the same file."""
+        store = ContentStore(tmp_path)
+        assert store.put("same") == store.put("same")
+        assert store.put("other") != store.put("same")
+        assert len(list(tmp_path.glob("*.md"))) == 2
+
+    def test_unknown_or_invalid_digest(self, tmp_path: Path):
+        """Missing and path-like digests return None."""
+        store = ContentStore(tmp_path)
+        assert store.get("0" * 64) is None
+        assert store.get("../secret") is None
+
+
+class TestStateJournal:
+    """Tests for StateJournal."""
+
+    def test_first_save_writes_snapshot(self, tmp_path: Path):
+        """The first save writes a full snapshot and no journal."""
+        journal = StateJournal(tmp_path / "state.json")
+        journal.save({"stage": "SETUP"})
+
+        assert json.loads((tmp_path / "state.json").read_text())["stage"] == "SETUP"
+        assert not journal.journal_path.exists()
+
+    def test_later_saves_append_changes(self, tmp_path: Path):
+        """Later saves append only changed keys and new list items."""
+        journal = StateJournal(tmp_path / "state.json")
+        journal.save({"stage": "SETUP", "history": [1], "big": "x" * 1000, "old": 1})
+        journal.save({"stage": "SPEC", "history": [1, 2], "big": "x" * 1000})
+
+        entries = [json.loads(line) for line in journal.journal_path.read_text().splitlines()]
+        assert entries == [
+            {"set": {"stage": "SPEC"}, "extend": {"history": [2]}, "unset": ["old"], "seq": 1}
+        ]
+
+    def test_unchanged_state_appends_nothing(self, tmp_path: Path):
+        """Saving the same state twice writes no entry."""
+        journal = StateJournal(tmp_path / "state.json")
+        journal.save({"stage": "SETUP"})
+        journal.save({"stage": "SETUP"})
+
+        assert not journal.journal_path.exists()
+
+    def test_in_place_mutation_is_detected(self, tmp_path: Path):
+        """Changes to a dict that was saved before are still journaled."""
+        journal = StateJournal(tmp_path / "state.json")
+        state = {"groups": {"a": "pending"}}
+        journal.save(state)
+        state["groups"]["a"] = "done"
+        journal.save(state)
+
+        assert StateJournal(tmp_path / "state.json").load() == {"groups": {"a": "done"}}
+
+    def test_load_replays_journal(self, tmp_path: Path):
+        """Loading applies journal entries on top of the snapshot."""
+        journal = StateJournal(tmp_path / "state.json")
+        journal.save({"stage": "SETUP", "history": []})
+        journal.save({"stage": "SPEC", "history": ["SETUP"]})
+        journal.save({"stage": "PLAN", "history": ["SETUP", "SPEC"]})
+
+        assert StateJournal(tmp_path / "state.json").load() == {
+            "stage": "PLAN",
+            "history": ["SETUP", "SPEC"],
+        }
+
+    def test_load_continues_journal(self, tmp_path: Path):
+        """A loaded journal keeps appending after the replayed entries."""
+        journal = StateJournal(tmp_path / "state.json")
+        journal.save({"stage": "SETUP"})
+        journal.save({"stage": "SPEC"})
+
+        resumed = StateJournal(tmp_path / "state.json")
+        resumed.load()
+        resumed.save({"stage": "PLAN"})
+
+        assert StateJournal(tmp_path / "state.json").load() == {"stage": "PLAN"}
+        assert len(resumed.journal_path.read_text().splitlines()) == 2
+
+    def test_torn_entry_is_ignored(self, tmp_path: Path):
+        """An incomplete last line (crash during a save) is skipped."""
+        journal = StateJournal(tmp_path / "state.json")
+        journal.save({"stage": "SETUP"})
+        journal.save({"stage": "SPEC"})
+        with open(journal.journal_path, "a") as f:
+            f.write('{"set": {"stage": "PL')
+
+        assert StateJournal(tmp_path / "state.json").load() == {"stage": "SPEC"}
+
+    def test_saves_after_torn_entry_are_kept(self, tmp_path: Path):
+        """Resuming after a torn entry doesn't lose the saves that follow."""
+        journal = StateJournal(tmp_path / "state.json")
+        journal.save({"a": 1})
+        journal.save({"a": 2})
+        with open(journal.journal_path, "a") as f:
+            f.write('{"set": {"a": 9')
+
+        resumed = StateJournal(tmp_path / "state.json")
+        assert resumed.load() == {"a": 2}
+        resumed.save({"a": 3})
+        resumed.save({"a": 4})
+
+        assert StateJournal(tmp_path / "state.json").load() == {"a": 4}
+
+    def test_checkpoint_rewrites_snapshot(self, tmp_path: Path):
+        """A checkpoint folds the journal into the snapshot."""
+        journal = StateJournal(tmp_path / "state.json")
+        journal.save({"stage": "SETUP"})
+        journal.save({"stage": "SPEC"})
+        journal.save({"stage": "COMPLETE"}, checkpoint=True)
+
+        assert not journal.journal_path.exists()
+        assert StateJournal(tmp_path / "state.json").load() == {"stage": "COMPLETE"}
+
+    def test_compacts_after_entries(self, tmp_path: Path):
+        """The snapshot is rewritten once compact_every entries accumulate."""
+        journal = StateJournal(tmp_path / "state.json", compact_every=2)
+        for i in range(4):
+            journal.save({"count": i})
+
+        # Snapshot at 0, entries for 1 and 2, snapshot at 3
+        assert not journal.journal_path.exists()
+        assert StateJournal(tmp_path / "state.json").load() == {"count": 3}
+
+    def test_entries_already_in_snapshot_are_skipped(self, tmp_path: Path):
+        """Entries left over from a crash before the journal was removed are not reapplied."""
+        path = tmp_path / "state.json"
+        path.write_text(json.dumps({"history": ["a", "b"], "journal_seq": 1}))
+        path.with_suffix(".journal").write_text(
+            json.dumps({"extend": {"history": ["b"]}, "seq": 1}) + "\n"
+        )
+
+        assert StateJournal(path).load() == {"history": ["a", "b"]}
+
+    def test_load_without_state(self, tmp_path: Path):
+        """Loading returns None when nothing was saved."""
+        assert StateJournal(tmp_path / "state.json").load() is None
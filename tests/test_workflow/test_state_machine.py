@@ -263,3 +263,19 @@ class TestWorkflowStateMachine:
         machine2 = WorkflowStateMachine(teambot_dir)
         assert machine2.current_stage == WorkflowStage.SPEC
         assert machine2.state.objective == "Test"
+
+    def test_later_saves_are_journaled(self, teambot_dir):
+        """Saves after the first append to the journal and are replayed on load."""
+        machine1 = WorkflowStateMachine(teambot_dir, objective="Test")
+        machine1.save_state()
+        machine1.transition_to(WorkflowStage.SPEC)
+        machine1.transition_to(WorkflowStage.SPEC_REVIEW)
+        machine1.save_state()
+
+        assert (teambot_dir / "workflow_state.journal").exists()
+
+        machine2 = WorkflowStateMachine(teambot_dir)
+        assert machine2.current_stage == WorkflowStage.SPEC_REVIEW
+        assert [h.stage for h in machine2.state.history] == [
+            h.stage for h in machine1.state.history
+        ]